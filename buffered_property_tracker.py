@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Buffered Property Tracker
+Write-behind front of IndividualPropertyTracker for the PDP workers.
+Success marks, failure marks and scraped-property records (quality score and
+detail row) go on a bounded queue; one writer thread coalesces them into
+executemany transactions every `batch_size` items or `flush_interval_ms`, so
+scraper threads (and the async engine's event loop) never wait on SQLite.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from itertools import groupby
+from typing import Any, Dict, List, Optional
+
+from individual_property_tracking_system import IndividualPropertyTracker
+from property_tracking_operations import MARK_SCRAPED_SQL, MARK_FAILED_SQL, TRACK_SCRAPED_SQL, PROPERTY_DETAILS_SQL
+from sqlite_connection_manager import get_connection
+
+_STOP = object()
+
+
+class BufferedPropertyTracker:
+    """
+    IndividualPropertyTracker whose tracking writes are queued for a writer thread
+    """
+
+    def __init__(self, tracker: Optional[IndividualPropertyTracker] = None, batch_size: int = 50,
+                 flush_interval_ms: float = 500, max_queue: int = 1000, logger=None):
+        """
+        Initialize buffered tracker
+
+        Args:
+            tracker: Tracker the writes go to and reads are delegated to (default: a new one)
+            batch_size: Queued writes per transaction
+            flush_interval_ms: Longest time a write waits for its batch to fill
+            max_queue: Queued writes before callers block (back-pressure on a stalled database)
+            logger: Logger instance
+        """
+        self.tracker = tracker or IndividualPropertyTracker()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval_ms) / 1000.0
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_queue))
+        self._stats_lock = threading.Lock()
+        self._flush_latencies: deque = deque(maxlen=1000)
+        self.stats = {
+            'enqueued': 0,
+            'written': 0,
+            'failed_writes': 0,
+            'transactions': 0,
+            'queue_full_waits': 0,
+            'max_queue_depth': 0
+        }
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name='tracking-writer', daemon=True)
+        self._writer.start()
+        # Queued marks are written when the interpreter exits without close()
+        atexit.register(self.close)
+
+    def __getattr__(self, name: str):
+        # Everything not buffered (sessions, statistics, normalize_url, ...) is the tracker's
+        if name == 'tracker':
+            raise AttributeError(name)
+        return getattr(self.tracker, name)
+
+    # Buffered writes (return once queued)
+
+    def mark_property_scraped(self, property_url: str, session_id: int | None = None) -> bool:
+        """Queue a success mark (see IndividualPropertyTracker.mark_property_scraped)"""
+        if self._closed:
+            return self.tracker.mark_property_scraped(property_url, session_id)
+        return self._enqueue(('scraped', property_url, session_id))
+
+    def mark_property_failed(self, property_url: str, session_id: int | None = None) -> bool:
+        """Queue a failure mark (see IndividualPropertyTracker.mark_property_failed)"""
+        if self._closed:
+            return self.tracker.mark_property_failed(property_url, session_id)
+        return self._enqueue(('failed', property_url, session_id))
+
+    def track_scraped_property(self, property_url: str, property_data: Dict[str, Any],
+                               session_id: int, quality_score: float = None) -> bool:
+        """Queue a scraped property record; the quality score is computed on the writer thread"""
+        if self._closed:
+            return self.tracker.track_scraped_property(property_url, property_data, session_id, quality_score)
+        return self._enqueue(('tracked', property_url, session_id, property_data, quality_score))
+
+    # Reads see every write queued before them
+
+    def is_property_scraped(self, property_url: str, session_id: int | None = None) -> bool:
+        self.flush()
+        return self.tracker.is_property_scraped(property_url, session_id)
+
+    def lookup_scrape_records(self, property_urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        self.flush()
+        return self.tracker.lookup_scrape_records(property_urls)
+
+    def filter_urls_for_scraping(self, property_urls: List[str], force_rescrape: bool = False,
+                                 quality_threshold: float = None) -> Dict[str, Any]:
+        self.flush()
+        return self.tracker.filter_urls_for_scraping(property_urls, force_rescrape, quality_threshold)
+
+    def get_scraping_statistics(self, session_id: int = None) -> Dict[str, Any]:
+        self.flush()
+        return self.tracker.get_scraping_statistics(session_id)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write everything queued so far
+
+        Returns:
+            False if the writer did not get there within `timeout` seconds
+        """
+        if self._closed or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 30.0):
+        """Flush queued writes and stop the writer (later writes go straight to the tracker)"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(timeout)
+        # Writes and flush requests that raced with the stop
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not _STOP:
+                self._write([item])
+        atexit.unregister(self.close)
+        stats = self.get_statistics()
+        if stats['enqueued']:
+            self.logger.info(f"[TRACKING] Writer stopped: {stats}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Queue depth, write counts and per-transaction flush latency (ms)"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+            latencies = sorted(self._flush_latencies)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['flush_ms'] = {
+            'avg': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            'p95': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2) if latencies else 0.0,
+            'max': round(latencies[-1], 2) if latencies else 0.0
+        }
+        return stats
+
+    def _enqueue(self, item: tuple) -> bool:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._stats_lock:
+                self.stats['queue_full_waits'] += 1
+            self._queue.put(item)  # The writer is max_queue writes behind: wait for it
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self.stats['enqueued'] += 1
+            self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], depth)
+        return True
+
+    def _run(self):
+        pending: List[tuple] = []
+        deadline = 0.0
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()) if pending else None)
+            except queue.Empty:
+                self._write(pending)  # Oldest write waited flush_interval
+                pending = []
+                continue
+
+            if item is _STOP:
+                self._write(pending)
+                return
+            if isinstance(item, threading.Event):
+                self._write(pending)
+                pending = []
+                item.set()
+                continue
+
+            if not pending:
+                deadline = time.monotonic() + self.flush_interval
+            pending.append(item)
+            if len(pending) >= self.batch_size:
+                self._write(pending)
+                pending = []
+
+    def _write(self, items: List[tuple]):
+        """
+        One transaction for a batch; consecutive writes of a kind share an executemany.
+        A failed batch is retried row by row, so only the offending write is lost.
+        """
+        if not items:
+            return
+        start = time.perf_counter()
+        operations = self.tracker.operations
+        records = []  # (kind, row, url) in queue order
+        skipped = 0
+        for item in items:
+            kind = item[0]
+            try:
+                if kind == 'tracked':
+                    _, url, session_id, property_data, quality_score = item
+                    records.append((kind, operations.tracking_rows(url, property_data, session_id, quality_score), url))
+                else:
+                    records.append((kind, operations.mark_row(item[1], item[2]), item[1]))
+            except Exception as e:
+                skipped += 1
+                self.logger.error(f"[TRACKING] Dropped {kind} write for {item[1]}: {e}")
+        batches = [(kind, [row for _, row, _ in group]) for kind, group in groupby(records, key=lambda record: record[0])]
+
+        connection = None
+        transactions = 1
+        written, failed = 0, len(items)
+        try:
+            connection = get_connection(self.tracker.db_manager.db_path)
+            for kind, rows in batches:
+                self._execute(connection, kind, rows)
+            connection.commit()
+            written, failed = len(records), skipped
+            operations.stats['total_urls_processed'] += sum(1 for kind, _, _ in records if kind == 'tracked')
+        except Exception as e:
+            # The writer thread must survive (flush() waits on it)
+            if connection is not None:
+                connection.rollback()
+                self.logger.warning(f"[TRACKING] Batch of {len(items)} tracking writes failed ({e}) - "
+                                    f"retrying them one by one")
+                written, failed = self._write_rows(connection, records)
+                failed += skipped
+                transactions += len(records)
+            else:
+                self.logger.error(f"[TRACKING] Batch of {len(items)} tracking writes failed: {e}")
+        finally:
+            if connection is not None:
+                connection.close()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._stats_lock:
+            self.stats['written'] += written
+            self.stats['failed_writes'] += failed
+            self.stats['transactions'] += transactions
+            self._flush_latencies.append(elapsed_ms)
+
+    def _write_rows(self, connection, records: List[tuple]):
+        """Each write in its own transaction; returns (written, failed)"""
+        written = failed = 0
+        for kind, row, url in records:
+            try:
+                self._execute(connection, kind, [row])
+                connection.commit()
+                written += 1
+                if kind == 'tracked':
+                    self.tracker.operations.stats['total_urls_processed'] += 1
+            except Exception as e:
+                connection.rollback()
+                failed += 1
+                self.logger.error(f"[TRACKING] Dropped {kind} write for {url}: {e}")
+        return written, failed
+
+    @staticmethod
+    def _execute(connection, kind: str, rows: List[Any]):
+        if kind == 'tracked':
+            connection.executemany(TRACK_SCRAPED_SQL, [scraped for scraped, _ in rows])
+            connection.executemany(PROPERTY_DETAILS_SQL, [details for _, details in rows])
+        else:
+            connection.executemany(MARK_SCRAPED_SQL if kind == 'scraped' else MARK_FAILED_SQL, rows)
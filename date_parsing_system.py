@@ -5,13 +5,16 @@ Create robust parser for 'today', 'X hours ago', 'X days ago' text patterns.
 Based on empirical research findings from MagicBricks.
 """
 
-import re
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import json
 from pathlib import Path
 
+from scraper.regex_registry import DATE_PATTERNS, DATE_PATTERN_TABLE, findall_item
+from sqlite_connection_manager import get_connection
+from property_keys import property_key
+
 
 class DateParsingSystem:
     """
@@ -24,36 +27,10 @@ class DateParsingSystem:
         self.db_path = db_path
         self.connection = None
         
-        # Date patterns discovered through research
-        self.date_patterns = [
-            # Hours ago patterns
-            (r'(\d+)\s+hours?\s+ago', 'hours_ago', 1.0),
-            (r'Posted:?\s*(\d+)\s+hours?\s+ago', 'posted_hours_ago', 1.0),
-            
-            # Days ago patterns  
-            (r'(\d+)\s+days?\s+ago', 'days_ago', 1.0),
-            (r'Posted:?\s*(\d+)\s+days?\s+ago', 'posted_days_ago', 1.0),
-            
-            # Weeks ago patterns
-            (r'(\d+)\s+weeks?\s+ago', 'weeks_ago', 1.0),
-            (r'Posted:?\s*(\d+)\s+weeks?\s+ago', 'posted_weeks_ago', 1.0),
-            
-            # Months ago patterns
-            (r'(\d+)\s+months?\s+ago', 'months_ago', 0.9),
-            (r'Posted:?\s*(\d+)\s+months?\s+ago', 'posted_months_ago', 0.9),
-            
-            # Today patterns
-            (r'\btoday\b', 'today', 1.0),
-            (r'Posted:?\s*today', 'posted_today', 1.0),
-            
-            # Yesterday patterns
-            (r'\byesterday\b', 'yesterday', 1.0),
-            (r'Posted:?\s*yesterday', 'posted_yesterday', 1.0),
-            
-            # Absolute date patterns (lower confidence)
-            (r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})', 'absolute_date', 0.7),
-            (r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{2,4})', 'month_date', 0.8)
-        ]
+        # Date patterns discovered through research, compiled once in the
+        # shared registry (DATE_PATTERNS holds the pattern/type/confidence table)
+        self.date_patterns = DATE_PATTERNS
+        self.date_pattern_table = DATE_PATTERN_TABLE
         
         # Parsing statistics
         self.parsing_stats = {
@@ -69,7 +46,7 @@ class DateParsingSystem:
         """Connect to database"""
         
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connection = get_connection(self.db_path)
             return True
         except Exception as e:
             print(f"[ERROR] Database connection failed: {str(e)}")
@@ -104,39 +81,40 @@ class DateParsingSystem:
             # Clean text for better matching
             cleaned_text = text.strip().lower()
             
-            # Try each pattern in order of confidence
-            for pattern, pattern_type, confidence in self.date_patterns:
-                matches = re.findall(pattern, cleaned_text, re.IGNORECASE)
+            # First pattern (in table order) that matches; search stops at the
+            # first occurrence instead of collecting every match with findall
+            found = self.date_pattern_table.first(cleaned_text)
+            if found:
+                index, match = found
+                pattern, pattern_type, confidence = self.date_patterns[index]
+                match_data = findall_item(match)
+
+                parse_result['pattern_matched'] = pattern
+                parse_result['pattern_type'] = pattern_type
+                parse_result['confidence_score'] = confidence
                 
-                if matches:
-                    parse_result['pattern_matched'] = pattern
-                    parse_result['pattern_type'] = pattern_type
-                    parse_result['confidence_score'] = confidence
-                    
-                    # Update statistics
-                    self.parsing_stats['pattern_usage'][pattern_type] = \
-                        self.parsing_stats['pattern_usage'].get(pattern_type, 0) + 1
-                    
-                    # Parse based on pattern type
-                    parsed_datetime = self._parse_by_pattern_type(
-                        pattern_type, matches[0], extraction_date
-                    )
-                    
-                    if parsed_datetime:
-                        parse_result['parsed_datetime'] = parsed_datetime
-                        parse_result['success'] = True
-                        self.parsing_stats['successful_parses'] += 1
-                        
-                        # Extract numeric value if applicable
-                        if pattern_type in ['hours_ago', 'posted_hours_ago', 'days_ago', 'posted_days_ago',
-                                          'weeks_ago', 'posted_weeks_ago', 'months_ago', 'posted_months_ago']:
-                            if isinstance(matches[0], str) and matches[0].isdigit():
-                                parse_result['numeric_value'] = int(matches[0])
-                            elif isinstance(matches[0], tuple) and len(matches[0]) > 0:
-                                if str(matches[0][0]).isdigit():
-                                    parse_result['numeric_value'] = int(matches[0][0])
+                # Update statistics
+                self.parsing_stats['pattern_usage'][pattern_type] = \
+                    self.parsing_stats['pattern_usage'].get(pattern_type, 0) + 1
+                
+                # Parse based on pattern type
+                parsed_datetime = self._parse_by_pattern_type(
+                    pattern_type, match_data, extraction_date
+                )
+                
+                if parsed_datetime:
+                    parse_result['parsed_datetime'] = parsed_datetime
+                    parse_result['success'] = True
+                    self.parsing_stats['successful_parses'] += 1
                     
-                    break
+                    # Extract numeric value if applicable
+                    if pattern_type in ['hours_ago', 'posted_hours_ago', 'days_ago', 'posted_days_ago',
+                                      'weeks_ago', 'posted_weeks_ago', 'months_ago', 'posted_months_ago']:
+                        if isinstance(match_data, str) and match_data.isdigit():
+                            parse_result['numeric_value'] = int(match_data)
+                        elif isinstance(match_data, tuple) and len(match_data) > 0:
+                            if str(match_data[0]).isdigit():
+                                parse_result['numeric_value'] = int(match_data[0])
             
             if not parse_result['success']:
                 parse_result['error'] = 'No matching date patterns found'
@@ -262,11 +240,12 @@ class DateParsingSystem:
                 
                 cursor.execute('''
                     INSERT INTO property_posting_dates 
-                    (property_url, posting_date_text, parsed_posting_date, extraction_date, 
+                    (property_url, property_key, posting_date_text, parsed_posting_date, extraction_date, 
                      confidence_score, parsing_method, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     property_url,
+                    property_key(property_url),
                     result['raw_text'],
                     result['parsed_datetime'],
                     result['extraction_date'],
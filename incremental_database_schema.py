@@ -10,6 +10,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+from property_keys import migrate_property_keys
 
 
 class IncrementalDatabaseSchema:
@@ -72,6 +73,7 @@ class IncrementalDatabaseSchema:
                 CREATE TABLE IF NOT EXISTS property_urls_seen (
                     url_id INTEGER PRIMARY KEY AUTOINCREMENT,
                     property_url TEXT UNIQUE NOT NULL,
+                    property_key INTEGER,  -- canonical key (property_keys.property_key)
                     first_seen_date DATETIME NOT NULL,
                     last_seen_date DATETIME NOT NULL,
                     seen_count INTEGER DEFAULT 1,
@@ -89,6 +91,7 @@ class IncrementalDatabaseSchema:
                 CREATE TABLE IF NOT EXISTS property_posting_dates (
                     posting_id INTEGER PRIMARY KEY AUTOINCREMENT,
                     property_url TEXT NOT NULL,
+                    property_key INTEGER,
                     posting_date_text TEXT NOT NULL,
                     parsed_posting_date DATETIME,
                     extraction_date DATETIME NOT NULL,
@@ -132,6 +135,9 @@ class IncrementalDatabaseSchema:
             ''')
             
             self.connection.commit()
+
+            # URL lookups go through property_key (UNIQUE in property_urls_seen)
+            migrate_property_keys(self.connection, ['property_urls_seen', 'property_posting_dates'])
             print("[SUCCESS] All incremental tables created successfully")
             return True
             
@@ -197,13 +203,11 @@ class IncrementalDatabaseSchema:
             
             # Indexes for fast URL lookups
             indexes = [
-                ('idx_property_urls_url', 'property_urls_seen', 'property_url'),
                 ('idx_property_urls_first_seen', 'property_urls_seen', 'first_seen_date'),
                 ('idx_property_urls_city', 'property_urls_seen', 'city'),
                 
                 # Indexes for date-based queries
                 ('idx_posting_dates_parsed', 'property_posting_dates', 'parsed_posting_date'),
-                ('idx_posting_dates_url', 'property_posting_dates', 'property_url'),
                 
                 # Indexes for session tracking
                 ('idx_sessions_start_time', 'scrape_sessions', 'start_timestamp'),
@@ -225,6 +229,10 @@ class IncrementalDatabaseSchema:
                     print(f"   [SUCCESS] Created index: {index_name}")
                 except Exception as e:
                     print(f"   ⚠️ Index {index_name} might already exist: {str(e)}")
+
+            # Superseded by the property_key indexes (and the UNIQUE(property_url) autoindex)
+            for index_name in ('idx_property_urls_url', 'idx_posting_dates_url'):
+                cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
             
             self.connection.commit()
             print("[SUCCESS] Performance indexes created successfully")
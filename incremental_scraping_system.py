@@ -17,6 +17,7 @@ from date_parsing_system import DateParsingSystem
 from smart_stopping_logic import SmartStoppingLogic
 from url_tracking_system import URLTrackingSystem
 from user_mode_options import UserModeOptions, ScrapingMode
+from sqlite_connection_manager import get_connection
 
 
 class IncrementalScrapingSystem:
@@ -166,7 +167,7 @@ class IncrementalScrapingSystem:
         
         try:
             # Update session with final results
-            connection = sqlite3.connect(self.db_path)
+            connection = get_connection(self.db_path)
             cursor = connection.cursor()
             
             cursor.execute('''
@@ -15,8 +15,9 @@ Maintains 100% backward compatibility with original interface.
 from typing import List, Dict, Any
 from property_database_manager import PropertyDatabaseManager
 from property_quality_scorer import PropertyQualityScorer
-from property_tracking_operations import PropertyTrackingOperations
+from property_tracking_operations import PropertyTrackingOperations, MARK_SCRAPED_SQL, MARK_FAILED_SQL
 from property_statistics import PropertyStatistics
+from property_keys import property_key
 
 
 class IndividualPropertyTracker:
@@ -78,20 +79,22 @@ class IndividualPropertyTracker:
         """Filter URLs and determine which need scraping (delegates to operations)"""
         return self.operations.filter_urls_for_scraping(property_urls, force_rescrape, quality_threshold)
 
+    def lookup_scrape_records(self, property_urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Previous scrape records of many URLs in one query (delegates to operations)"""
+        return self.operations.lookup_scrape_records(property_urls)
+
     def is_property_scraped(self, property_url: str, session_id: int | None = None) -> bool:
         """Backward-compatible check: has this property URL already been scraped?"""
         if not self.db_manager.connect_db():
             return False
         try:
             cursor = self.db_manager.connection.cursor()
-            normalized_url = self.normalize_url(property_url)
-            url_hash = self.generate_url_hash(normalized_url)
             cursor.execute(
                 '''
                 SELECT extraction_success FROM individual_properties_scraped
-                WHERE url_hash = ? OR property_url = ?
+                WHERE property_key = ?
                 ''',
-                (url_hash, normalized_url)
+                (property_key(self.normalize_url(property_url)),)
             )
             row = cursor.fetchone()
             return bool(row and (row[0] == 1 or row[0] is True))
@@ -102,40 +105,17 @@ class IndividualPropertyTracker:
 
     def mark_property_scraped(self, property_url: str, session_id: int | None = None) -> bool:
         """Backward-compatible mark: record that this URL has been scraped (minimal upsert)."""
+        return self._write_mark(MARK_SCRAPED_SQL, property_url, session_id)
+
+    def mark_property_failed(self, property_url: str, session_id: int | None = None) -> bool:
+        """Record a page that yielded no data after all retries (due for re-scraping)."""
+        return self._write_mark(MARK_FAILED_SQL, property_url, session_id)
+
+    def _write_mark(self, sql: str, property_url: str, session_id: int | None) -> bool:
         if not self.db_manager.connect_db():
             return False
         try:
-            cursor = self.db_manager.connection.cursor()
-            from datetime import datetime
-            normalized_url = self.normalize_url(property_url)
-            url_hash = self.generate_url_hash(normalized_url)
-            now = datetime.now()
-            # Check existing
-            cursor.execute(
-                '''SELECT 1 FROM individual_properties_scraped WHERE url_hash = ? OR property_url = ?''',
-                (url_hash, normalized_url)
-            )
-            exists = cursor.fetchone() is not None
-            if exists:
-                cursor.execute(
-                    '''
-                    UPDATE individual_properties_scraped
-                    SET scraped_at = ?, scraping_session_id = COALESCE(?, scraping_session_id),
-                        extraction_success = 1, updated_at = ?
-                    WHERE url_hash = ? OR property_url = ?
-                    ''',
-                    (now, session_id, now, url_hash, normalized_url)
-                )
-            else:
-                cursor.execute(
-                    '''
-                    INSERT INTO individual_properties_scraped
-                    (property_url, property_id, url_hash, scraped_at, scraping_session_id,
-                     data_quality_score, extraction_success, retry_count, updated_at)
-                    VALUES (?, NULL, ?, ?, ?, 0.0, 1, 0, ?)
-                    ''',
-                    (normalized_url, url_hash, now, session_id, now)
-                )
+            self.db_manager.connection.execute(sql, self.operations.mark_row(property_url, session_id))
             self.db_manager.connection.commit()
             return True
         except Exception:
@@ -31,7 +31,9 @@ from date_parsing_system import DateParsingSystem
 from smart_stopping_logic import SmartStoppingLogic
 from url_tracking_system import URLTrackingSystem
 from individual_property_tracking_system import IndividualPropertyTracker
+from buffered_property_tracker import BufferedPropertyTracker
 from behavior_mimicry import BehaviorMimicry
+from performance_profiler import PerformanceProfiler
 
 # Import refactored scraper modules
 from scraper import (
@@ -39,9 +41,60 @@ from scraper import (
     BotDetectionHandler,
     ExportManager,
     DataValidator,
-    IndividualPropertyScraper
+    IndividualPropertyScraper,
+    DriverPool,
+    DomCardExtractor,
+    SelectorRanker,
+    AsyncPdpEngine,
+    ListingPipeline,
+    ProcessExtractionPool,
+    HttpListingFetcher,
+    SessionBroker,
+    SessionRecovery,
+    DriverSupervisor,
+    NetworkTimingRecorder,
+    InterceptionPolicy
 )
 from scraper.ua_rotation import get_next_user_agent
+from scraper.pacing import SegmentPacer
+from scraper.listing_slicer import ListingSlicer
+from scraper.network_timing import enable_performance_logging
+from scraper.process_extraction import find_listing_cards, parse_listing_cards, extract_page_records
+
+# Listing card selectors in priority order; the first yielding LISTING_CARD_MIN_COUNT wins
+LISTING_CARD_SELECTORS = [
+    '.mb-srp__card',  # Updated: removed div prefix for broader matching
+    '.mb-srp__list',  # Updated: actual class name found in HTML
+    'li.mb-srp__list__item',  # Keep as fallback
+    'div.mb-srp__card',  # Keep as fallback
+    'div.SRPTuple__cardWrap',
+    'div.SRPTuple__card',
+    'div.SRPTuple__tupleWrap',
+    'article[class*="SRPTuple"]',
+    'div[data-id][data-listingid]',
+]
+LISTING_CARD_FALLBACK_SELECTOR = '.mb-srp__card, .mb-srp__list, div.SRPTuple__card, li.mb-srp__list__item'
+# Lowered threshold from 10 to 5 to be more inclusive
+LISTING_CARD_MIN_COUNT = 5
+
+# Benign request headers set on Chrome (via CDP) and sent by the HTTP listing fetcher
+REALISTIC_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Returns the first selector (in priority order) present in the DOM, or null
+LISTING_CONTAINER_PROBE_JS = """
+const selectors = arguments[0] || [];
+for (const sel of selectors) {
+    try {
+        if (document.querySelector(sel)) { return sel; }
+    } catch (e) {}
+}
+return null;
+"""
 
 
 class IntegratedMagicBricksScraper:
@@ -57,6 +110,12 @@ class IntegratedMagicBricksScraper:
         self.driver = None
         self.properties = []
 
+        # Pre-launched browsers shared by scrapers that run one after another or side by
+        # side (set by the multi-city runners); the leased member goes back on close()
+        self.warm_driver_pool = None
+        self._pool_member = None
+        self._pool_pages_at_lease = 0
+
         # Setup custom configuration
         self.config = self._setup_default_config()
         if custom_config:
@@ -87,6 +146,16 @@ class IntegratedMagicBricksScraper:
             'stop_reason': None
         }
 
+        # Listing container wait tracking
+        self.listing_wait_stats = {
+            'waits': 0,
+            'timeouts': 0,
+            'total_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+            'selector_hits': {},
+            'last_wait': None
+        }
+
         # Anti-scraping enhancement variables
         self.bot_detection_count = 0
         self.last_detection_time = None
@@ -112,6 +181,16 @@ class IntegratedMagicBricksScraper:
         # Setup logging
         self.setup_logging()
 
+        if incremental_enabled and self.config.get('tracking_write_behind', True):
+            # PDP success/failure marks and detail rows are written in batches by one thread
+            self.individual_tracker = BufferedPropertyTracker(
+                self.individual_tracker,
+                batch_size=self.config.get('tracking_flush_items', 50),
+                flush_interval_ms=self.config.get('tracking_flush_ms', 500),
+                max_queue=self.config.get('tracking_queue_size', 1000),
+                logger=self.logger
+            )
+
         # Setup date parser (always needed for comprehensive data)
         if not hasattr(self, 'date_parser') or self.date_parser is None:
             self.date_parser = DateParsingSystem()
@@ -119,10 +198,93 @@ class IntegratedMagicBricksScraper:
         # Setup premium selectors for enhanced extraction
         self.premium_selectors = self._setup_premium_selectors()
 
+        # Learned selector order for listing card fields
+        self.selector_ranker = None
+        if self.config.get('selector_learning', True):
+            self.selector_ranker = SelectorRanker(
+                db_path=self.config.get('selector_stats_db'),
+                reorder_interval=self.config.get('selector_reorder_interval', 200),
+                prune_after=self.config.get('selector_prune_after', 50),
+                logger=self.logger
+            )
+            if self.config.get('reset_selector_stats', False):
+                self.selector_ranker.reset()
+
         # Initialize refactored modules
         self.property_extractor = PropertyExtractor(
             premium_selectors=self.premium_selectors,
             date_parser=self.date_parser,
+            logger=self.logger,
+            parser_engine=self.config.get('parser_engine', 'html.parser'),
+            selector_ranker=self.selector_ranker
+        )
+        self.property_extractor.css.compile_all(LISTING_CARD_SELECTORS + [LISTING_CARD_FALLBACK_SELECTOR])
+
+        # Card-region slicing ahead of the HTML parse (listing_html_slicing)
+        self.listing_slicer = ListingSlicer(logger=self.logger)
+        self.last_listing_parse = None
+
+        # Fetch/process/persist pipeline for listing pages (listing_pipeline)
+        self.listing_pipeline = None
+
+        # Browser memory supervision: RSS sampled every few pages, recycled between pages
+        # when over the limit or page budget (memory curve and recycles go to the profiler)
+        self.profiler = PerformanceProfiler()
+        self.driver_supervisor = DriverSupervisor(
+            sample_every=self.config.get('driver_rss_sample_pages', 10),
+            max_rss_mb=self.config.get('driver_rss_limit_mb', 1500) or None,
+            max_pages=self.config.get('driver_max_pages', 500) or None,
+            profiler=self.profiler,
+            logger=self.logger
+        )
+
+        # Network records per browser navigation (network_timing)
+        self.network_timing = NetworkTimingRecorder(logger=self.logger) if self.config.get('network_timing') else None
+
+        # P0-3: Declarative request blocking profiles ('listing', 'pdp'), applied once per browser session
+        self.interception_policy = InterceptionPolicy(
+            profiles=self.config.get('interception_profiles'),
+            enabled=self.config.get('resource_blocking', True),
+            logger=self.logger
+        )
+
+        # Tiered browser recovery: fresh tab + cleared storage first, full relaunch last
+        self.session_recovery = SessionRecovery(
+            max_soft_resets=self.config.get('max_soft_resets', 2),
+            prepare_tab=self._prepare_browser_tab,
+            logger=self.logger
+        )
+
+        # Chrome's cookies and user agent exported into one pooled HTTP session, shared by
+        # the listing fetcher ('http' mode) and the async PDP engine
+        self.session_broker = SessionBroker(
+            headers=REALISTIC_HEADERS,
+            pool_size=max(4, self.config.get('pdp_async_concurrency', 8)),
+            refresh_callback=self._refresh_browser_credentials,
+            min_refresh_interval=self.config.get('session_refresh_interval', 30),
+            logger=self.logger
+        )
+
+        # Listing page fetch statistics for both modes; also the HTTP fetch when
+        # listing_fetch_mode == 'http'
+        self.listing_fetcher = HttpListingFetcher(
+            timeout=self.config.get('http_fetch_timeout', 20),
+            broker=self.session_broker,
+            logger=self.logger
+        )
+        self._listing_user_agent = None
+
+        # Extraction worker processes (listing_extraction_backend == 'process'); a pool
+        # handed in by the multi-city runner is shared and not shut down here
+        self.extraction_pool = None
+        self._owns_extraction_pool = False
+
+        # In-browser card extraction (used when listing_extraction_engine == 'dom')
+        self.dom_card_extractor = DomCardExtractor(
+            field_spec=self.property_extractor.get_card_field_spec(),
+            card_selectors=LISTING_CARD_SELECTORS,
+            fallback_selector=LISTING_CARD_FALLBACK_SELECTOR,
+            min_cards=LISTING_CARD_MIN_COUNT,
             logger=self.logger
         )
 
@@ -176,6 +338,73 @@ class IntegratedMagicBricksScraper:
             'concurrent_pages': 4,  # Default concurrent pages for individual scraping
             'max_concurrent_pages': 8,  # Maximum allowed concurrent pages
             'concurrent_enabled': True,  # Enable concurrent scraping by default
+            'pdp_driver_pool': False,  # One Chrome per concurrent PDP worker (sized by concurrent_pages)
+            'warm_driver_pool': True,  # Multi-city runs lease pre-launched browsers instead of one cold start per city
+            'driver_lease_timeout': 120,  # Seconds to wait for a warm browser before launching one
+            'driver_max_age_minutes': 30,  # Recycle a pooled browser after this age (0 disables)
+            'driver_max_pages': 500,  # Recycle a browser after this many pages (0 disables)
+            'driver_rss_limit_mb': 1500,  # Recycle a browser whose chromedriver+Chrome RSS reaches this (0 disables)
+            'driver_rss_sample_pages': 10,  # Pages between RSS samples of a browser
+            # Per-navigation network records (TTFB, DOM ready, bytes, requests, blocked) from
+            # Chrome's performance log, reported as per-session percentiles
+            'network_timing': False,
+            'resource_blocking': True,  # Apply the interception profiles (False: block nothing, for A/B runs)
+            # Per-page-kind overrides of the blocking profiles, e.g.
+            # {'pdp': {'resource_types': ['image', 'font', 'media'], 'domains': [...], 'patterns': [...]}}
+            'interception_profiles': {},
+            'max_soft_resets': 2,  # Soft resets (fresh tab, cleared storage) of one session before a full relaunch
+            'pdp_segment_rate': 0.5,  # PDP requests/second allowed per locality segment
+            'pdp_segment_burst': 2,  # Token-bucket capacity per segment
+            'pdp_global_rate': 2.0,  # PDP requests/second across all segments (0 disables)
+            # PDP fetch engine: 'browser' drives Chrome, 'async' fetches over HTTP with asyncio
+            # (Chrome only for pages that need JavaScript or keep failing over HTTP)
+            'pdp_fetch_engine': 'browser',
+            'pdp_async_concurrency': 8,  # PDP requests in flight across all segments
+            'pdp_segment_concurrency': 1,  # PDP requests in flight per locality segment
+            # PDP tracking writes go through a write-behind queue drained by one writer thread
+            'tracking_write_behind': True,
+            'tracking_flush_items': 50,  # Queued writes per transaction
+            'tracking_flush_ms': 500,  # Longest wait of a queued write before its batch is committed
+            'tracking_queue_size': 1000,  # Queued writes before PDP workers block (stalled database)
+
+            # Listing card extraction engine: 'bs4' parses page_source, 'dom' extracts
+            # raw card fields in the browser with one script (falls back to bs4)
+            'listing_extraction_engine': 'bs4',
+            # HTML parser for listing/PDP pages: 'html.parser', 'lxml' or 'lxml-native'
+            'parser_engine': 'html.parser',
+            # Parse only the SRP card region of listing pages (full parse if it falls short)
+            'listing_html_slicing': True,
+            # Move selectors that never hit behind the others (statistics persisted in selector_stats)
+            'selector_learning': True,
+            'selector_stats_db': 'magicbricks_enhanced.db',
+            'selector_reorder_interval': 200,  # Field lookups between order updates
+            'selector_prune_after': 50,  # Attempts without a hit before a selector moves to the end
+            'reset_selector_stats': False,  # Forget the learned order at startup (after site markup changes)
+            # Overlap listing page fetches with parse/extract/validate and persistence
+            'listing_pipeline': True,
+            'listing_pipeline_workers': 1,  # Parse/extract threads (one keeps up with the page delay)
+            'listing_queue_size': 2,  # Fetched pages waiting for a worker before the fetcher blocks
+            # Listing extraction backend: 'thread' extracts in this process, 'process' ships page
+            # HTML to a pool of worker processes (also shared across cities in multi-city runs)
+            'listing_extraction_backend': 'thread',
+            'extraction_processes': 0,  # Worker processes for the 'process' backend (0 = all cores)
+            # Listing page fetch: 'browser' navigates Chrome, 'http' fetches SRP HTML over a keep-alive
+            # session with Chrome's headers and cookies (Chrome per page on bot pages / missing cards)
+            'listing_fetch_mode': 'browser',
+            'http_fetch_timeout': 20,
+            'session_refresh_interval': 30,  # Minimum seconds between browser refreshes of the HTTP session
+
+            # Listing container wait (first matching selector wins)
+            'listing_wait_timeout': 8,  # Overall budget in seconds, not per selector
+            'listing_wait_poll': 0.2,
+            'listing_wait_selectors': [
+                '[class*="mb-srp"]',
+                '[class*="propertyCard"]',
+                '[class*="property-card"]',
+                '[class*="SRPTuple"]',
+                '[class*="result"]',
+                'div[data-id]',
+            ],
 
             # City-specific delays (REDUCED for better performance)
             'city_delays': {
@@ -387,71 +616,15 @@ class IntegratedMagicBricksScraper:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                chrome_options = Options()
-
-                if self.headless:
-                    chrome_options.add_argument("--headless")
-
-                # Enhanced stability options
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument("--disable-gpu")
-
-                # P2-1: Viewport randomization (anti-fingerprinting)
-                if self.config.get('randomize_viewport', True):
-                    import random
-                    width = random.randint(1870, 1970)  # 1920 ± 50
-                    height = random.randint(1030, 1130)  # 1080 ± 50
-                    chrome_options.add_argument(f"--window-size={width},{height}")
-                    self.logger.info(f"[P2-1] Randomized viewport: {width}x{height}")
+                warm_driver = self._lease_warm_driver() if self._pool_member is None else None
+                if warm_driver is not None:
+                    # Launched and health-checked by the pool already
+                    self.driver = warm_driver
                 else:
-                    chrome_options.add_argument("--window-size=1920,1080")
-
-                # P0-2: Eager page load strategy (30-40% speed improvement)
-                page_load_strategy = self.config.get('page_load_strategy', 'eager')
-                chrome_options.page_load_strategy = page_load_strategy
-                self.logger.info(f"[P0-2] Page load strategy: {page_load_strategy}")
-
-                # Enhanced anti-detection measures (CRITICAL for individual property pages)
-                chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                chrome_options.add_experimental_option('useAutomationExtension', False)
-
-                # User agent rotation (centralized policy)
-                ua = get_next_user_agent()
-                chrome_options.add_argument(f'--user-agent={ua}')
-
-                # Performance optimizations (but keep JavaScript enabled for individual pages)
-                chrome_options.add_argument("--disable-extensions")
-                chrome_options.add_argument("--disable-plugins")
-                chrome_options.add_argument("--disable-images")  # Faster loading
-                # NOTE: JavaScript is ENABLED for individual property page compatibility
-                
-                # Performance optimizations
-                chrome_options.add_argument("--memory-pressure-off")
-                chrome_options.add_argument("--max_old_space_size=4096")
-                
-                # Create WebDriver with timeout
-                self.driver = webdriver.Chrome(options=chrome_options)
-                
-                # Set timeouts
-                self.driver.implicitly_wait(10)
-                self.driver.set_page_load_timeout(30)
-                self.driver.set_script_timeout(30)
-                
-                # Anti-detection script
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-                # P0-3: Resource blocking is now DISABLED for listing pages to match normal consumer traffic
-                # It will be enabled ONLY for individual property (PDP) pages in IndividualPropertyScraper
-                # This prevents immediate bot detection on listing pages
-
-                # P1-1: Enable realistic HTTP headers via CDP
-                if self.config.get('realistic_headers', True):
-                    self._enable_realistic_headers()
+                    self.driver = self._create_driver()
 
-                # Test connection
-                self.driver.get("https://www.google.com")
+                    # Test connection
+                    self.driver.get("https://www.google.com")
 
                 # Initialize or update IndividualPropertyScraper with current driver
                 if self.individual_scraper is None:
@@ -461,8 +634,18 @@ class IntegratedMagicBricksScraper:
                         bot_handler=self.bot_handler,
                         individual_tracker=self.individual_tracker if self.incremental_enabled else None,
                         logger=self.logger,
-                        restart_callback=self._restart_browser_session
+                        restart_callback=self._relaunch_browser_session,
+                        recovery=self.session_recovery,
+                        supervisor=self.driver_supervisor,
+                        network_timing=self.network_timing,
+                        interception=self.interception_policy,
+                        pacer=SegmentPacer(
+                            segment_rate=self.config.get('pdp_segment_rate', 0.5),
+                            segment_burst=self.config.get('pdp_segment_burst', 2),
+                            global_rate=self.config.get('pdp_global_rate', 2.0)
+                        )
                     )
+                    self.individual_scraper.max_concurrent_workers = self.config.get('concurrent_pages', 4)
                 else:
                     # IMPORTANT: Do not replace the existing instance while it may be mid-scrape
                     # Just update its driver reference to avoid stale-driver/session issues
@@ -486,61 +669,166 @@ class IntegratedMagicBricksScraper:
                 else:
                     raise Exception(f"Failed to initialize WebDriver after {max_retries} attempts: {str(e)}")
 
-    def _enable_resource_blocking(self):
+    def _lease_warm_driver(self):
+        """Take a pre-launched session from the warm driver pool (None: launch our own)"""
+
+        if self.warm_driver_pool is None:
+            return None
+        try:
+            self._pool_member = self.warm_driver_pool.acquire(timeout=self.config.get('driver_lease_timeout', 120))
+        except Exception as e:
+            self.logger.warning(f"[DRIVER-POOL] No warm browser available ({type(e).__name__}) - launching a new one")
+            return None
+        self._pool_pages_at_lease = self.session_stats['pages_scraped']
+        self.logger.info(f"[DRIVER-POOL] Leased warm browser {self._pool_member.index} "
+                         f"(session {self._pool_member.session_id[:16]}...)")
+        return self._pool_member.driver
+
+    def create_warm_driver_pool(self, size: int) -> DriverPool:
         """
-        P0-3: Enable resource blocking via Chrome DevTools Protocol
-        Blocks analytics, ads, and tracking domains for 20-30% speed improvement
+        Pre-warmed browser pool for scraper instances (one city each) run by this scraper.
+
+        Sessions launch in the background and are recycled by age and page count.
+        A released browser gets a fresh tab and cleared cookies and storage, so the
+        next city does not inherit the previous city's session.
+        """
+        max_age = self.config.get('driver_max_age_minutes', 30)
+        pool = DriverPool(
+            self._create_driver,
+            size=size,
+            logger=self.logger,
+            max_age_seconds=max_age * 60 if max_age else None,
+            reset_session=self.session_recovery.soft_reset,
+            **self._driver_recycle_policy()
+        )
+        pool.start(wait=False)
+        return pool
+
+    def _driver_recycle_policy(self) -> Dict[str, Any]:
+        """DriverPool recycle settings: page budget and supervisor-sampled memory limit"""
+
+        return {
+            'max_pages': self.config.get('driver_max_pages', 500) or None,
+            'max_memory_mb': self.config.get('driver_rss_limit_mb', 1500) or None,
+            'memory_probe': self.driver_supervisor.memory_probe,
+            'on_recycle': self.driver_supervisor.record_recycle
+        }
+
+    def _supervise_driver(self):
+        """Safe point between listing pages: recycle the browser once it is over its memory limit or page budget"""
+
+        if not self.driver:
+            return
+        reason = self.driver_supervisor.page_done(self.driver)
+        if reason is None:
+            return
+        old_driver = self.driver
+        start = time.perf_counter()
+        relaunched = self._relaunch_browser_session()
+        self.driver_supervisor.record_recycle(old_driver, reason, time.perf_counter() - start, relaunched)
+
+    def _create_driver(self):
         """
+        Build one configured Chrome WebDriver (options, UA, viewport, timeouts, headers).
+
+        Shared by setup_driver() and the PDP DriverPool so every session gets its
+        own rotated user agent and randomized viewport.
+        """
+        chrome_options = Options()
+
+        if self.headless:
+            chrome_options.add_argument("--headless")
+
+        # Enhanced stability options
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+
+        # P2-1: Viewport randomization (anti-fingerprinting)
+        if self.config.get('randomize_viewport', True):
+            width = random.randint(1870, 1970)  # 1920 ± 50
+            height = random.randint(1030, 1130)  # 1080 ± 50
+            chrome_options.add_argument(f"--window-size={width},{height}")
+            self.logger.info(f"[P2-1] Randomized viewport: {width}x{height}")
+        else:
+            chrome_options.add_argument("--window-size=1920,1080")
+
+        # P0-2: Eager page load strategy (30-40% speed improvement)
+        page_load_strategy = self.config.get('page_load_strategy', 'eager')
+        chrome_options.page_load_strategy = page_load_strategy
+        self.logger.info(f"[P0-2] Page load strategy: {page_load_strategy}")
+
+        # Enhanced anti-detection measures (CRITICAL for individual property pages)
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+        # User agent rotation (centralized policy)
+        ua = get_next_user_agent()
+        chrome_options.add_argument(f'--user-agent={ua}')
+
+        # Performance optimizations (but keep JavaScript enabled for individual pages)
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-plugins")
+        # NOTE: JavaScript is ENABLED for individual property page compatibility
+        # Images/fonts/media are blocked per page kind by the interception policy (Chrome ignores --disable-images)
+        
+        # Buffer CDP Network/Page events for per-navigation network records
+        if self.config.get('network_timing'):
+            enable_performance_logging(chrome_options)
+
+        # Performance optimizations
+        chrome_options.add_argument("--memory-pressure-off")
+        chrome_options.add_argument("--max_old_space_size=4096")
+        
+        # Create WebDriver with timeout
+        driver = webdriver.Chrome(options=chrome_options)
+
         try:
-            # Conservative list of third-party domains to block
-            blocked_domains = self.config.get('blocked_domains', [
-                '*googletagmanager.com*',
-                '*google-analytics.com*',
-                '*doubleclick.net*',
-                '*facebook.net*',
-                '*facebook.com/tr*',
-                '*hotjar.com*',
-                '*clarity.ms*',
-                '*analytics.google.com*',
-                '*googleadservices.com*',
-                '*googlesyndication.com*',
-                '*adservice.google.com*',
-                '*cdn.segment.com*',
-                '*mixpanel.com*',
-                '*amplitude.com*'
-            ])
-
-            # Enable Network domain in CDP
-            self.driver.execute_cdp_cmd('Network.enable', {})
-
-            # Set blocked URL patterns
-            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_domains})
-
-            self.logger.info(f"[P0-3] Resource blocking enabled: {len(blocked_domains)} domains blocked")
-            self.logger.debug(f"[P0-3] Blocked domains: {', '.join(blocked_domains[:5])}...")
+            # Set timeouts
+            driver.implicitly_wait(10)
+            driver.set_page_load_timeout(30)
+            driver.set_script_timeout(30)
 
-        except Exception as e:
-            self.logger.warning(f"[P0-3] Failed to enable resource blocking: {e}")
-            # Non-fatal - continue without blocking
+            # Anti-detection script
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+            # P0-3: No request blocking at launch; InterceptionPolicy applies the 'listing' or 'pdp'
+            # profile before each navigation (per session, only when it changes; resource_blocking)
 
-    def _enable_realistic_headers(self):
+            # P1-1: Enable realistic HTTP headers via CDP
+            if self.config.get('realistic_headers', True):
+                self._enable_realistic_headers(driver)
+        except Exception:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            raise
+
+        return driver
+
+    def _enable_resource_blocking(self, driver=None, profile: str = 'pdp') -> bool:
+        """
+        P0-3: Apply an interception profile to a browser session via Chrome DevTools Protocol
+        No CDP call when the session already carries the profile
+        """
+        return self.interception_policy.apply(driver or self.driver, profile)
+
+    def _enable_realistic_headers(self, driver=None):
         """
         P1-1: Enable realistic HTTP headers via Chrome DevTools Protocol
         Set only benign headers to avoid UA-Client-Hints inconsistencies.
         """
+        driver = driver or self.driver
         try:
-            headers = {
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            headers = dict(REALISTIC_HEADERS)
 
             # Enable Network domain
-            self.driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.enable', {})
 
             # Set extra HTTP headers (no sec-ch-ua forging)
-            self.driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {'headers': headers})
+            driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {'headers': headers})
 
             self.logger.info("[P1-1] Realistic headers enabled (no sec-ch-ua forging)")
             self.logger.debug("[P1-1] Headers: Accept, Accept-Encoding, Accept-Language, Upgrade-Insecure-Requests")
@@ -632,7 +920,17 @@ class IntegratedMagicBricksScraper:
             consecutive_skipped_pages = 0  # Track consecutive skipped pages
             max_consecutive_skips = 5  # Stop if too many consecutive pages fail
 
+            self._start_extraction_pool()
+
+            # Browser thread only fetches; parse/extract/validate and the incremental
+            # decision run behind it while the inter-page delay elapses
+            pipeline = self._start_listing_pipeline(mode) \
+                if self.config.get('listing_pipeline', True) else None
+
             while True:
+                if pipeline and pipeline.stop_requested:
+                    break
+
                 # Check page limits
                 if max_pages and page_number > max_pages:
                     print(f"[STOP] Reached maximum page limit: {max_pages}")
@@ -666,7 +964,17 @@ class IntegratedMagicBricksScraper:
                     progress_callback(progress_data)
 
                 # Scrape page with bot detection
-                page_result = self.scrape_single_page(page_url, page_number)
+                if pipeline:
+                    page_result = self._fetch_listing_page(page_url)
+                    if page_result['success']:
+                        # Processing happens during the delay; a stop decision cuts the delay short
+                        pipeline.submit(page_number, page_result)
+                        self._enhanced_delay_strategy(page_number, stop_event=pipeline.stop_event)
+                        # Pages that fail processing (e.g. a bot page without cards) get the retry handling below
+                        page_result = pipeline.wait_processed(page_number) or {
+                            'success': False, 'error': 'Page processing failed'}
+                else:
+                    page_result = self.scrape_single_page(page_url, page_number)
 
                 if not page_result['success']:
                     self.consecutive_failures += 1
@@ -709,32 +1017,23 @@ class IntegratedMagicBricksScraper:
                     self.consecutive_failures = 0  # Reset on success
                     page_retry_count = 0  # Reset retry count on success
                     consecutive_skipped_pages = 0  # Reset skipped pages counter on success
-                
-                # Update statistics
-                self.session_stats['pages_scraped'] += 1
-                self.session_stats['properties_found'] += page_result['properties_found']
-                self.session_stats['properties_saved'] += page_result['properties_saved']
-                
-                # Incremental decision making
-                if self.incremental_enabled and mode != ScrapingMode.FULL:
-                    should_stop = self.make_incremental_decision(
-                        page_result['property_texts'],
-                        page_result.get('property_urls', []),
-                        page_number,
-                        posting_date_texts=page_result.get('posting_date_texts', []),
-                        parsed_posting_dates=page_result.get('parsed_posting_dates', [])
-                    )
 
-                    if should_stop['should_stop']:
-                        self.session_stats['incremental_stopped'] = True
-                        self.session_stats['stop_reason'] = should_stop['reason']
-                        print(f"[STOP] Incremental stopping: {should_stop['reason']}")
-                        break
+                if pipeline:
+                    page_number += 1
+                    continue
+
+                # Statistics, URL tracking and incremental decision making
+                if self._commit_listing_page(page_number, page_result, mode):
+                    break
                 
                 # Enhanced delay strategy
                 self._enhanced_delay_strategy(page_number)
                 
                 page_number += 1
+
+            # Drain pages still being processed before the session is finalized
+            self._close_listing_pipeline()
+            self._stop_extraction_pool()
             
             # Finalize session
             self.finalize_scraping_session()
@@ -830,11 +1129,170 @@ class IntegratedMagicBricksScraper:
             return {'success': False, 'error': str(e)}
         
         finally:
+            self._close_listing_pipeline()
+            self._stop_extraction_pool()
             self.close()
+
+    def _start_listing_pipeline(self, mode: ScrapingMode) -> ListingPipeline:
+        """Start the listing pipeline with this session's process and persist stages"""
+
+        def persist(page_number: int, page_result: Dict[str, Any]) -> bool:
+            if not page_result['success']:
+                # The fetch loop retries or skips the page (wait_processed)
+                return False
+            self._store_listing_page(page_number, page_result)
+            return self._commit_listing_page(page_number, page_result, mode)
+
+        self.listing_pipeline = ListingPipeline(
+            process=self._process_listing_page,
+            persist=persist,
+            workers=self.config.get('listing_pipeline_workers', 1),
+            queue_size=self.config.get('listing_queue_size', 2),
+            logger=self.logger
+        ).start()
+        return self.listing_pipeline
+
+    def _close_listing_pipeline(self):
+        """Drain and stop the listing pipeline, keeping its statistics for the session report"""
+
+        if self.listing_pipeline is not None:
+            self.session_stats['listing_pipeline'] = self.listing_pipeline.close()
+            self.listing_pipeline = None
     
+    def _extraction_settings(self) -> Dict[str, Any]:
+        """Picklable settings extraction processes build their extractors from once at startup"""
+
+        return {
+            'premium_selectors': self.premium_selectors,
+            'date_parser': self.date_parser,
+            'parser_engine': self.config.get('parser_engine', 'html.parser'),
+            'listing_html_slicing': self.config.get('listing_html_slicing', True),
+            'card_selectors': LISTING_CARD_SELECTORS,
+            'fallback_selector': LISTING_CARD_FALLBACK_SELECTOR,
+            'min_cards': LISTING_CARD_MIN_COUNT,
+            'validator_config': dict(self.config),
+            'selector_stats': self.selector_ranker.snapshot() if self.selector_ranker else None,
+            'selector_reorder_interval': self.config.get('selector_reorder_interval', 200),
+            'selector_prune_after': self.config.get('selector_prune_after', 50)
+        }
+
+    def _create_extraction_pool(self) -> ProcessExtractionPool:
+        """Extraction process pool built from this scraper's selectors and filters"""
+
+        return ProcessExtractionPool(
+            self._extraction_settings(),
+            workers=self.config.get('extraction_processes', 0),
+            logger=self.logger
+        ).start()
+
+    def _start_extraction_pool(self):
+        """Start an owned extraction pool for the 'process' backend unless one was handed in"""
+
+        if self.extraction_pool is None and self.config.get('listing_extraction_backend') == 'process':
+            self.extraction_pool = self._create_extraction_pool()
+            self._owns_extraction_pool = True
+
+    def _stop_extraction_pool(self):
+        """Keep the pool statistics for the session report and shut down an owned pool"""
+
+        if self.extraction_pool is None:
+            return
+        self.session_stats['extraction_pool'] = self.extraction_pool.get_statistics()
+        if self._owns_extraction_pool:
+            self.extraction_pool.shutdown()
+            self.extraction_pool = None
+            self._owns_extraction_pool = False
+
     def scrape_single_page(self, page_url: str, page_number: int) -> Dict[str, Any]:
         """Scrape a single page and extract properties"""
 
+        fetched = self._fetch_listing_page(page_url)
+        if not fetched['success']:
+            return fetched
+
+        page_result = self._process_listing_page(page_number, fetched)
+        if page_result['success']:
+            self._store_listing_page(page_number, page_result)
+        return page_result
+
+    def _fetch_listing_page(self, page_url: str) -> Dict[str, Any]:
+        """
+        Fetch stage of a listing page
+
+        Returns the raw payload for _process_listing_page - DOM card records when
+        the 'dom' engine extracted them, otherwise the page source. In 'http' fetch
+        mode the page comes from the brokered HTTP session; Chrome serves it instead
+        when no cookies were exported yet, the response is a bot/captcha page or it
+        carries no listing cards, and its fresh cookies go back to the broker.
+        """
+
+        if self.config.get('listing_fetch_mode') == 'http':
+            fetched = self._fetch_listing_page_http(page_url)
+            if fetched is not None:
+                return fetched
+
+        start = time.perf_counter()
+        fetched = self._fetch_listing_page_browser(page_url)
+        if fetched['success']:
+            self.listing_fetcher.record('browser', len(fetched['page_source'] or ''), time.perf_counter() - start)
+            if self._http_session_in_use():
+                self.session_broker.export_from_driver(self.driver, self._listing_user_agent, reason='listing')
+        self._supervise_driver()
+        return fetched
+
+    def _http_session_in_use(self) -> bool:
+        """Whether listing or PDP pages are fetched over the brokered HTTP session"""
+
+        return self.config.get('listing_fetch_mode') == 'http' or self.config.get('pdp_fetch_engine') == 'async'
+
+    def _refresh_browser_credentials(self, url: str):
+        """Session broker refresh: re-navigate Chrome to url; the driver if it passed the bot check"""
+
+        if not self.driver:
+            return None
+        lock = self.individual_scraper.driver_lock if self.individual_scraper else threading.Lock()
+        with lock:
+            self.driver.get(url)
+            if self.bot_handler.detect_bot_detection(self.driver.page_source, self.driver.current_url):
+                self.logger.warning("[SESSION] Browser hit bot detection too - credentials not refreshed")
+                return None
+            return self.driver
+
+    def _fetch_listing_page_http(self, page_url: str) -> Optional[Dict[str, Any]]:
+        """Fetch a listing page over HTTP; None hands the page to the browser"""
+
+        fetcher = self.listing_fetcher
+        if not fetcher.has_cookies:
+            # The first page goes through Chrome, which earns the session cookies
+            fetcher.record_fallback('no_cookies')
+            return None
+
+        result = fetcher.fetch(page_url)
+        if not result['success']:
+            self.logger.debug(f"[FETCH] {page_url}: {result['error']} - using browser")
+            fetcher.record_fallback('http_error')
+            return None
+        if self.bot_handler.detect_bot_detection(result['page_source'], result['url']):
+            self.logger.info(f"[FETCH] Bot page over HTTP for {page_url} - using browser")
+            fetcher.record_fallback('bot_detection')
+            return None
+        if self.listing_slicer.slice(result['page_source']) is None:
+            self.logger.debug(f"[FETCH] No listing cards in HTTP response for {page_url} - using browser")
+            fetcher.record_fallback('no_cards')
+            return None
+
+        fetcher.record('http', result['bytes'], result['seconds'])
+        return {
+            'success': True,
+            'dom_cards': None,
+            'page_source': result['page_source'],
+            'container_wait': None,
+            'fetched_via': 'http'
+        }
+
+    def _fetch_listing_page_browser(self, page_url: str) -> Dict[str, Any]:
+        """Browser fetch of a listing page: navigate, bot check and container wait"""
+
         try:
             # Set rotating user agent for anti-detection
             user_agents = [
@@ -842,11 +1300,17 @@ class IntegratedMagicBricksScraper:
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
                 "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             ]
+            self._listing_user_agent = random.choice(user_agents)
             self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": random.choice(user_agents)
+                "userAgent": self._listing_user_agent
             })
 
+            # Listing profile (blocks nothing by default: listing traffic stays consumer-like)
+            self._enable_resource_blocking(profile='listing')
+
             # Navigate to page
+            if self.network_timing is not None:
+                self.network_timing.drain(self.driver)
             self.driver.get(page_url)
 
             if hasattr(self, 'behavior_mimicry'):
@@ -858,6 +1322,10 @@ class IntegratedMagicBricksScraper:
             # Check for bot detection
             page_source = self.driver.page_source
             current_url = self.driver.current_url
+            network_record = None
+            if self.network_timing is not None:
+                network_record = self.network_timing.capture(self.driver, 'listing', page_url)
+            self.interception_policy.record_navigation('listing', network_record)
 
             if self.bot_handler.detect_bot_detection(page_source, current_url):
                 return {'success': False, 'error': 'Bot detection triggered'}
@@ -867,123 +1335,205 @@ class IntegratedMagicBricksScraper:
             if not has_container:
                 return {'success': False, 'error': 'Listing container not found'}
 
-            # Parse page content
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Extract raw card fields in the browser when enabled (no page_source / re-parse)
+            dom_cards = None
+            if self.config.get('listing_extraction_engine') == 'dom':
+                dom_cards = self.dom_card_extractor.extract_cards(self.driver)
+
+            return {
+                'success': True,
+                'dom_cards': dom_cards,
+                'page_source': self.driver.page_source if dom_cards is None else None,
+                'container_wait': self.listing_wait_stats['last_wait'],
+                'fetched_via': 'browser'
+            }
+
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
 
-            # Find property cards using proven selectors
-            property_cards = self._find_property_cards(soup)
+    def _process_listing_page(self, page_number: int, fetched: Dict[str, Any]) -> Dict[str, Any]:
+        """CPU stage of a listing page: parse, extract, validate and filter (no browser access)"""
+
+        try:
+            property_cards = fetched.get('dom_cards')
+            from_dom = property_cards is not None
+
+            if not from_dom and self.extraction_pool is not None:
+                return self._process_listing_page_in_pool(page_number, fetched)
+
+            listing_parse = None
+            if not from_dom:
+                # Parse the card region (or the whole page) and find cards using proven selectors
+                property_cards = self._parse_listing_cards(fetched['page_source'])
+                listing_parse = self.last_listing_parse
 
             if not property_cards:
                 return {'success': False, 'error': 'No property cards found'}
-            
-            # Extract properties
-            page_properties = []
-            property_texts = []
-            property_urls_page = []
-            posting_date_texts_page = []
-            parsed_posting_dates_page = []
-
-            for i, card in enumerate(property_cards):
-                try:
-                    property_data = self.property_extractor.extract_property_data(card, page_number, i + 1)
-                    if property_data:
-                        # Validate and clean property data
-                        cleaned_property_data = self.data_validator.validate_and_clean_property_data(property_data)
-
-                        # Apply filtering if enabled
-                        if self.data_validator.apply_property_filters(cleaned_property_data):
-                            page_properties.append(cleaned_property_data)
-                            property_texts.append(card.get_text())
-                            if cleaned_property_data.get('property_url'):
-                                property_urls_page.append(cleaned_property_data['property_url'])
-                                posting_date_texts_page.append(cleaned_property_data.get('posting_date_text'))
-                                parsed_posting_dates_page.append(cleaned_property_data.get('parsed_posting_date'))
-                            self.data_validator.update_filter_stats(filtered=True)
-                        else:
-                            # Property was excluded by filters
-                            self.data_validator.update_filter_stats(filtered=False)
-                            self.logger.debug(f"Property {i+1} on page {page_number} excluded by filters")
-                        
-                except Exception as e:
-                    self.logger.error(f"Error extracting property {i+1} on page {page_number}: {str(e)}")
-                    continue
-            
-            # Store properties
-            self.properties.extend(page_properties)
-            
-            print(f"   [SUCCESS] Extracted {len(page_properties)} properties from page {page_number}")
-            
+
+            # Extract, validate and filter properties
+            records = extract_page_records(self.property_extractor, self.data_validator,
+                                           property_cards, page_number, from_dom=from_dom)
+
             return {
                 'success': True,
+                'properties': records['properties'],
                 'properties_found': len(property_cards),
-                'properties_saved': len(page_properties),
-                'property_texts': property_texts,
-                'property_urls': property_urls_page,
-                'posting_date_texts': posting_date_texts_page,
-                'parsed_posting_dates': parsed_posting_dates_page
+                'properties_saved': len(records['properties']),
+                'property_texts': records['property_texts'],
+                'property_urls': records['property_urls'],
+                'posting_date_texts': records['posting_date_texts'],
+                'parsed_posting_dates': records['parsed_posting_dates'],
+                'container_wait': fetched.get('container_wait'),
+                'listing_parse': listing_parse
             }
 
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
-    def _wait_for_listing_container(self) -> bool:
-        """Wait for listing container to load using proven selectors"""
+    def _process_listing_page_in_pool(self, page_number: int, fetched: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the CPU stage in an extraction process and merge its statistics back"""
 
-        selectors = [
-            '[class*="mb-srp"]',
-            '[class*="propertyCard"]',
-            '[class*="property-card"]',
-            '[class*="SRPTuple"]',
-            '[class*="result"]',
-            'div[data-id]',
-        ]
+        records = self.extraction_pool.extract_page(fetched['page_source'], page_number)
 
-        for selector in selectors:
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
+        self._report_listing_parse(records['properties_found'], records['listing_parse'], records['card_selector'])
+        self.data_validator.update_filter_stats(**records['filter_stats'])
+        if self.selector_ranker and records['selector_stats']:
+            self.selector_ranker.merge(records['selector_stats'])
+
+        if not records['properties_found']:
+            return {'success': False, 'error': 'No property cards found'}
+
+        return {
+            'success': True,
+            'properties': records['properties'],
+            'properties_found': records['properties_found'],
+            'properties_saved': len(records['properties']),
+            'property_texts': records['property_texts'],
+            'property_urls': records['property_urls'],
+            'posting_date_texts': records['posting_date_texts'],
+            'parsed_posting_dates': records['parsed_posting_dates'],
+            'container_wait': fetched.get('container_wait'),
+            'listing_parse': records['listing_parse']
+        }
+
+    def _store_listing_page(self, page_number: int, page_result: Dict[str, Any]):
+        """Keep a processed page's properties"""
+
+        self.properties.extend(page_result['properties'])
+        print(f"   [SUCCESS] Extracted {page_result['properties_saved']} properties from page {page_number}")
+
+    def _commit_listing_page(self, page_number: int, page_result: Dict[str, Any], mode: ScrapingMode) -> bool:
+        """
+        Persistence stage of a listing page: session statistics, URL tracking and
+        the incremental stopping decision
+
+        Returns:
+            True when scraping should stop
+        """
+
+        # Update statistics
+        self.session_stats['pages_scraped'] += 1
+        self.session_stats['properties_found'] += page_result['properties_found']
+        self.session_stats['properties_saved'] += page_result['properties_saved']
+
+        # Incremental decision making
+        if self.incremental_enabled and mode != ScrapingMode.FULL:
+            should_stop = self.make_incremental_decision(
+                page_result['property_texts'],
+                page_result.get('property_urls', []),
+                page_number,
+                posting_date_texts=page_result.get('posting_date_texts', []),
+                parsed_posting_dates=page_result.get('parsed_posting_dates', [])
+            )
+
+            if should_stop['should_stop']:
+                self.session_stats['incremental_stopped'] = True
+                self.session_stats['stop_reason'] = should_stop['reason']
+                print(f"[STOP] Incremental stopping: {should_stop['reason']}")
                 return True
-            except TimeoutException:
-                continue
 
         return False
 
-    def _find_property_cards(self, soup) -> List:
-        """Find property cards using proven selectors"""
+    def _wait_for_listing_container(self) -> bool:
+        """
+        Wait for the listing container with one combined probe
 
-        # Updated selectors based on current MagicBricks structure
-        selectors = [
-            '.mb-srp__card',  # Updated: removed div prefix for broader matching
-            '.mb-srp__list',  # Updated: actual class name found in HTML
-            'li.mb-srp__list__item',  # Keep as fallback
-            'div.mb-srp__card',  # Keep as fallback
-            'div.SRPTuple__cardWrap',
-            'div.SRPTuple__card',
-            'div.SRPTuple__tupleWrap',
-            'article[class*="SRPTuple"]',
-            'div[data-id][data-listingid]',
-        ]
+        All configured selectors are checked in a single script call per poll, so the
+        first selector to appear wins and a missing container fails within
+        `listing_wait_timeout` seconds instead of one full timeout per selector.
+        """
 
-        for selector in selectors:
-            cards = soup.select(selector)
-            # Choose the first selector that yields a reasonable number of cards
-            # Lowered threshold from 10 to 5 to be more inclusive
-            if cards and len(cards) >= 5:
-                print(f"   [TARGET] Found {len(cards)} properties using selector: {selector}")
-                return cards
+        selectors = self.config.get('listing_wait_selectors') or []
+        timeout = self.config.get('listing_wait_timeout', 8)
+        poll = self.config.get('listing_wait_poll', 0.2)
 
-        # Last resort: broader query
-        property_cards = soup.select('.mb-srp__card, .mb-srp__list, div.SRPTuple__card, li.mb-srp__list__item')
+        start = time.time()
+        matched = None
+        try:
+            matched = WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
+                lambda d: d.execute_script(LISTING_CONTAINER_PROBE_JS, selectors)
+            )
+        except TimeoutException:
+            matched = None
+        except Exception as e:
+            self.logger.debug(f"Listing container probe failed: {e}")
+            matched = None
+
+        self._record_listing_wait(matched, time.time() - start)
+        return matched is not None
+
+    def _record_listing_wait(self, selector: Optional[str], elapsed: float):
+        """Record wait latency and which selector matched for hit-order tuning"""
+
+        stats = self.listing_wait_stats
+        stats['waits'] += 1
+        stats['total_wait_seconds'] += elapsed
+        stats['max_wait_seconds'] = max(stats['max_wait_seconds'], elapsed)
+        stats['last_wait'] = {'selector': selector, 'seconds': round(elapsed, 3)}
+        if selector is None:
+            stats['timeouts'] += 1
+            self.logger.warning(f"[WAIT] Listing container not found after {elapsed:.2f}s")
+        else:
+            stats['selector_hits'][selector] = stats['selector_hits'].get(selector, 0) + 1
+            self.logger.debug(f"[WAIT] Listing container matched '{selector}' in {elapsed:.2f}s")
 
-        if not property_cards:
-            import re
-            property_cards = soup.find_all("div", class_=re.compile(r"mb-srp|property|card", re.I))
+    def get_listing_wait_statistics(self) -> Dict[str, Any]:
+        """Get listing container wait statistics, selectors ordered by hit count"""
+
+        stats = self.listing_wait_stats
+        waits = stats['waits']
+        return {
+            'waits': waits,
+            'timeouts': stats['timeouts'],
+            'avg_wait_seconds': round(stats['total_wait_seconds'] / waits, 3) if waits else 0.0,
+            'max_wait_seconds': round(stats['max_wait_seconds'], 3),
+            'selector_hits': dict(sorted(stats['selector_hits'].items(), key=lambda kv: -kv[1]))
+        }
+
+    def _parse_listing_cards(self, page_source: str) -> List:
+        """
+        Parse only the card container region of a listing page when possible
+
+        Falls back to a full-page parse when slicing is disabled, no card marker is
+        found, or the slice yields fewer than LISTING_CARD_MIN_COUNT cards.
+        """
+
+        slicer = self.listing_slicer if self.config.get('listing_html_slicing', True) else None
+        cards, parse, selector = parse_listing_cards(
+            page_source, self.property_extractor, slicer,
+            LISTING_CARD_SELECTORS, LISTING_CARD_FALLBACK_SELECTOR, LISTING_CARD_MIN_COUNT)
+        self._report_listing_parse(len(cards), parse, selector)
+        return cards
 
-        if property_cards:
-            print(f"   [TARGET] Found {len(property_cards)} properties using fallback selectors")
+    def _report_listing_parse(self, card_count: int, parse: Dict[str, Any], selector: Optional[str]):
+        """Record parsed bytes for the slicing report and log which selector found the cards"""
 
-        return property_cards
+        self.listing_slicer.record(parse['page_bytes'], parse['parsed_bytes'], sliced=parse['sliced'])
+        self.last_listing_parse = parse
+        if selector == 'fallback':
+            print(f"   [TARGET] Found {card_count} properties using fallback selectors")
+        elif selector:
+            print(f"   [TARGET] Found {card_count} properties using selector: {selector}")
 
     def detect_premium_property_type(self, card) -> Dict[str, Any]:
         """Detect if a property card is a premium/special type"""
@@ -1844,7 +2394,7 @@ class IntegratedMagicBricksScraper:
                 return {}
 
             # Parse page content
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = self.property_extractor.parse_html(self.driver.page_source)
 
             # Extract detailed information
             individual_details = {}
@@ -2087,6 +2637,12 @@ class IntegratedMagicBricksScraper:
             self.logger.error(f"Error in incremental decision: {str(e)}")
             return {'should_stop': False, 'reason': f'Decision error: {str(e)}'}
     
+    def reset_selector_order(self, field: str = None):
+        """Forget the learned selector order (all fields or one) after site markup changes"""
+        if self.selector_ranker:
+            self.selector_ranker.reset(field)
+            print(f"[SELECTORS] Learned selector order reset{' for ' + field if field else ''}")
+
     def finalize_scraping_session(self):
         """Finalize the scraping session"""
         
@@ -2116,6 +2672,107 @@ class IntegratedMagicBricksScraper:
         print(f"[SUCCESS] Properties found: {self.session_stats['properties_found']}")
         print(f"[SUCCESS] Properties saved: {self.session_stats['properties_saved']}")
         print(f"[SUCCESS] Duration: {self.session_stats.get('duration_formatted', 'N/A')}")
+
+        wait_stats = self.get_listing_wait_statistics()
+        self.session_stats['listing_wait'] = wait_stats
+        if wait_stats['waits']:
+            print(f"[WAIT] Listing container: avg {wait_stats['avg_wait_seconds']}s, "
+                  f"max {wait_stats['max_wait_seconds']}s, timeouts {wait_stats['timeouts']}, "
+                  f"hits {wait_stats['selector_hits']}")
+
+        slice_stats = self.listing_slicer.get_statistics()
+        self.session_stats['listing_parse'] = slice_stats
+        if slice_stats['pages']:
+            print(f"[PARSE] Listing HTML parsed: {slice_stats['bytes_parsed']:,} of {slice_stats['bytes_total']:,} chars "
+                  f"({slice_stats['parsed_ratio']:.0%}), full-page fallbacks {slice_stats['fallbacks']}")
+
+        fetch_stats = self.listing_fetcher.get_statistics()
+        self.session_stats['listing_fetch'] = fetch_stats
+        for fetch_mode in ('http', 'browser'):
+            if fetch_stats[fetch_mode]['pages']:
+                print(f"[FETCH] {fetch_mode}: {fetch_stats[fetch_mode]['pages']} pages, "
+                      f"{fetch_stats[fetch_mode]['pages_per_minute']} pages/min, "
+                      f"{fetch_stats[fetch_mode]['bytes_per_page']:,} bytes/page")
+        if fetch_stats['fallbacks'] and self.config.get('listing_fetch_mode') == 'http':
+            print(f"[FETCH] Browser fallbacks: {fetch_stats['fallbacks']}")
+
+        broker_stats = self.session_broker.get_statistics()
+        self.session_stats['session_broker'] = broker_stats
+        if broker_stats['exports']:
+            print(f"[SESSION] {broker_stats['exports']} browser cookie exports {broker_stats['exports_by_reason']}, "
+                  f"{broker_stats['bot_responses']} bot responses, {broker_stats['refreshes']} refreshes "
+                  f"({broker_stats['refresh_failures']} failed, {broker_stats['refreshes_throttled']} throttled)")
+
+        if self.network_timing is not None:
+            network_stats = self.network_timing.get_statistics()
+            self.session_stats['network_timing'] = network_stats
+            for kind in ('listing', 'pdp'):
+                if kind in network_stats:
+                    entry = network_stats[kind]
+                    print(f"[NETWORK] {kind}: {entry['pages']} pages, TTFB p50/p90 {entry['ttfb_ms']['p50']}/"
+                          f"{entry['ttfb_ms']['p90']} ms, DOM ready p50/p90 {entry['dom_ready_ms']['p50']}/"
+                          f"{entry['dom_ready_ms']['p90']} ms, {entry['bytes']['p50']} bytes, "
+                          f"{entry['requests']['p50']} requests ({entry['blocked']['p50']} blocked) at p50")
+
+        interception_stats = self.interception_policy.get_statistics()
+        self.session_stats['interception'] = interception_stats
+        if interception_stats['applications'] or interception_stats['blocked_requests']:
+            print(f"[INTERCEPT] Profiles applied {interception_stats['applications']}x for "
+                  f"{sum(interception_stats['navigations'].values())} navigations, blocked "
+                  f"{interception_stats['blocked_requests'] or 'n/a (network_timing off)'}, "
+                  f"~{interception_stats['estimated_bytes_saved'] / 1024 / 1024:.1f} MB saved (estimate)")
+
+        if isinstance(getattr(self, 'individual_tracker', None), BufferedPropertyTracker):
+            tracking_stats = self.individual_tracker.get_statistics()
+            self.session_stats['tracking_writes'] = tracking_stats
+            if tracking_stats['enqueued']:
+                print(f"[TRACKING] {tracking_stats['written']}/{tracking_stats['enqueued']} writes in "
+                      f"{tracking_stats['transactions']} transactions ({tracking_stats['failed_writes']} failed), "
+                      f"flush avg/p95 {tracking_stats['flush_ms']['avg']}/{tracking_stats['flush_ms']['p95']} ms, "
+                      f"queue depth {tracking_stats['queue_depth']} (max {tracking_stats['max_queue_depth']}, "
+                      f"{tracking_stats['queue_full_waits']} full waits)")
+
+        memory_stats = self.driver_supervisor.get_statistics()
+        self.session_stats['driver_memory'] = memory_stats
+        if memory_stats['samples'] or memory_stats['recycles']:
+            print(f"[MEMORY] Browser RSS peak {memory_stats['peak_rss_mb']} MB, last {memory_stats['last_rss_mb']} MB "
+                  f"({memory_stats['samples']} samples), recycles {memory_stats['recycles']}")
+
+        recovery_stats = self.session_recovery.get_statistics()
+        self.session_stats['session_recovery'] = recovery_stats
+        if recovery_stats['soft_reset']['attempts'] or recovery_stats['relaunch']['attempts']:
+            print(f"[RECOVERY] " + ", ".join(
+                f"{tier} {recovery_stats[tier]['successes']}/{recovery_stats[tier]['attempts']} ok "
+                f"avg {recovery_stats[tier]['avg_seconds']}s" for tier in ('soft_reset', 'relaunch'))
+                + f"; {recovery_stats['relaunches_avoided']} relaunches avoided")
+
+        pool_stats = self.session_stats.get('extraction_pool')
+        if pool_stats and pool_stats['pages']:
+            print(f"[EXTRACT] {pool_stats['pages']} pages extracted by {pool_stats['active_workers']} of "
+                  f"{pool_stats['workers']} worker processes, avg {pool_stats['avg_page_ms']} ms/page, "
+                  f"worker CPU {pool_stats['cpu_seconds']}s")
+
+        pipeline_stats = self.session_stats.get('listing_pipeline')
+        if pipeline_stats and pipeline_stats['submitted']:
+            print(f"[PIPELINE] {pipeline_stats['persisted']} of {pipeline_stats['submitted']} fetched pages committed; "
+                  f"process {pipeline_stats['process_seconds']}s, persist {pipeline_stats['persist_seconds']}s, "
+                  f"fetcher blocked {pipeline_stats['blocked_seconds']}s, discarded {pipeline_stats['discarded']}")
+
+        css_stats = self.property_extractor.css.get_statistics()
+        self.session_stats['selector_matching'] = css_stats
+        if css_stats['matches']:
+            print(f"[CSS] {css_stats['compiled']} selectors compiled in {css_stats['compile_ms']} ms; "
+                  f"{css_stats['matches']:,} matches in {css_stats['match_ms']} ms "
+                  f"(avg {css_stats['avg_match_us']} us)")
+
+        if self.selector_ranker:
+            self.selector_ranker.save()
+            selector_stats = self.selector_ranker.get_statistics()
+            self.session_stats['selector_order'] = selector_stats
+            for field, field_stats in selector_stats['fields'].items():
+                print(f"[SELECTORS] {field}: leader {field_stats['leader']} "
+                      f"({field_stats['leader_hits']}/{field_stats['attempts']} attempts), "
+                      f"pruned {field_stats['pruned']}, avg {field_stats['avg_lookup_ms']} ms")
         
         if self.session_stats.get('incremental_stopped'):
             print(f"[STOP] Stopped by incremental logic: {self.session_stats['stop_reason']}")
@@ -2258,18 +2915,46 @@ class IntegratedMagicBricksScraper:
             time.sleep(delay)
             self._restart_browser_session()
 
-    def _restart_browser_session(self):
-        """Restart browser session with new configuration"""
+    def _restart_browser_session(self, error: Optional[str] = None):
+        """Recover the browser session: soft reset first, full relaunch for dead sessions or repeat offenders"""
+
+        lock = self.individual_scraper.driver_lock if self.individual_scraper else None
+        self.session_recovery.recover(self.driver, self._relaunch_browser_session, error, lock=lock)
+
+    def _prepare_browser_tab(self, driver):
+        """Per-tab CDP setup for the fresh tab a soft reset opens"""
+
+        # Blocked URLs do not carry over to the new tab: re-applied on its next navigation
+        self.interception_policy.forget(driver)
+        if self.config.get('realistic_headers', True):
+            self._enable_realistic_headers(driver)
+
+    def _relaunch_browser_session(self) -> bool:
+        """Restart browser session with new configuration (quit + new Chrome)"""
         try:
             old_session = getattr(self.driver, 'session_id', 'unknown') if self.driver else 'none'
             self.logger.info(f"   [DRIVER-RESTART] Closing old session: {old_session[:16]}...")
 
-            if self.driver:
-                self.driver.quit()
-                time.sleep(2)
+            if self._pool_member is not None:
+                # Relaunch the leased member in place so it stays in the warm pool
+                if self.warm_driver_pool.restart_member(self._pool_member):
+                    self.driver = self._pool_member.driver
+                else:
+                    # Hand the dead member back (the pool retries or drops it) and lease or launch another
+                    self.logger.warning(f"   [DRIVER-RESTART] Warm browser {self._pool_member.index} "
+                                        f"did not relaunch - replacing it")
+                    pages = self.session_stats['pages_scraped'] - self._pool_pages_at_lease
+                    self.warm_driver_pool.release(self._pool_member, pages=max(1, pages))
+                    self._pool_member = None
+                    self.driver = None
+                    self.setup_driver()
+            else:
+                if self.driver:
+                    self.driver.quit()
+                    time.sleep(2)
 
-            # Create new session with rotated user agent
-            self.setup_driver()
+                # Create new session with rotated user agent
+                self.setup_driver()
             new_session = getattr(self.driver, 'session_id', 'unknown') if self.driver else 'none'
             self.logger.info(f"   [DRIVER-RESTART] New session created: {new_session[:16]}...")
 
@@ -2279,12 +2964,14 @@ class IntegratedMagicBricksScraper:
                 self.logger.info("   [DRIVER-UPDATE] IndividualPropertyScraper driver reference updated")
 
             self.logger.info("   [SUCCESS] Browser session restarted successfully")
+            return True
 
         except Exception as e:
             self.logger.error(f"   ❌ Failed to restart browser session: {str(e)}")
+            return False
 
-    def _enhanced_delay_strategy(self, page_number: int):
-        """Enhanced delay strategy based on session health"""
+    def _enhanced_delay_strategy(self, page_number: int, stop_event: Optional[threading.Event] = None):
+        """Enhanced delay strategy based on session health (returns early once stop_event is set)"""
         base_delay = random.uniform(2.0, 5.0)
 
         # Increase delays if we've had recent bot detection
@@ -2306,7 +2993,10 @@ class IntegratedMagicBricksScraper:
         final_delay = min(base_delay, 15.0)  # Cap at 15 seconds
 
         self.logger.info(f"⏱️ Waiting {final_delay:.1f} seconds before next page...")
-        time.sleep(final_delay)
+        if stop_event is not None:
+            stop_event.wait(final_delay)
+        else:
+            time.sleep(final_delay)
 
     def scrape_individual_property_pages(self, property_urls: List[str], batch_size: int = 10,
                                         progress_callback=None, progress_data=None,
@@ -2336,17 +3026,58 @@ class IntegratedMagicBricksScraper:
         quality_threshold = self.config.get('quality_threshold', 60.0)
         ttl_days = self.config.get('ttl_days', 30)
 
-        return self.individual_scraper.scrape_individual_property_pages(
-            property_urls=property_urls,
-            batch_size=batch_size,
-            progress_callback=progress_callback,
-            progress_data=progress_data,
-            force_rescrape=force_rescrape,
-            use_concurrent=use_concurrent,
-            session_id=session_id,
-            smart_filtering=smart_filtering,
-            quality_threshold=quality_threshold,
-            ttl_days=ttl_days
+        # Optional multi-browser pool: each concurrent worker leases its own Chrome session
+        driver_pool = None
+        if use_concurrent and self.config.get('pdp_driver_pool', False):
+            pool_size = min(self.config.get('concurrent_pages', 4), self.config.get('max_concurrent_pages', 8))
+            driver_pool = DriverPool(self._create_driver, size=pool_size, logger=self.logger,
+                                     **self._driver_recycle_policy())
+            if driver_pool.start():
+                self.individual_scraper.driver_pool = driver_pool
+            else:
+                self.logger.warning("[DRIVER-POOL] No pooled sessions started, using shared driver")
+                driver_pool = None
+
+        async_engine = self._create_async_pdp_engine(driver_pool) \
+            if self.config.get('pdp_fetch_engine') == 'async' else None
+
+        try:
+            return self.individual_scraper.scrape_individual_property_pages(
+                property_urls=property_urls,
+                batch_size=batch_size,
+                progress_callback=progress_callback,
+                progress_data=progress_data,
+                force_rescrape=force_rescrape,
+                use_concurrent=use_concurrent,
+                session_id=session_id,
+                smart_filtering=smart_filtering,
+                quality_threshold=quality_threshold,
+                ttl_days=ttl_days,
+                async_engine=async_engine
+            )
+        finally:
+            if async_engine:
+                self.session_stats['async_pdp'] = async_engine.get_statistics()
+            if driver_pool:
+                self.logger.info(f"[DRIVER-POOL] Stats: {driver_pool.get_pool_statistics()}")
+                self.individual_scraper.driver_pool = None
+                driver_pool.close()
+
+    def _create_async_pdp_engine(self, driver_pool: Optional[DriverPool] = None) -> AsyncPdpEngine:
+        """Async PDP engine on the brokered session (the browser's headers, cookies and user agent)"""
+
+        if self.driver:
+            self.session_broker.export_from_driver(self.driver, self._listing_user_agent, reason='pdp_start')
+
+        return AsyncPdpEngine(
+            self.individual_scraper,
+            session_broker=self.session_broker,
+            max_concurrency=self.config.get('pdp_async_concurrency', 8),
+            segment_concurrency=self.config.get('pdp_segment_concurrency', 1),
+            max_retries=self.config.get('max_retries', 3),
+            timeout=self.config.get('http_fetch_timeout', 20),
+            browser_workers=driver_pool.size if driver_pool else 1,
+            logger=self.logger
         )
 
     def _scrape_individual_pages_concurrent_enhanced(self, property_urls: List[str], batch_size: int,
@@ -2503,7 +3234,6 @@ class IntegratedMagicBricksScraper:
                 chrome_options.add_argument("--disable-dev-shm-usage")
                 chrome_options.add_argument("--disable-gpu")
                 chrome_options.add_argument("--window-size=1920,1080")
-                chrome_options.add_argument("--disable-images")
                 chrome_options.add_argument("--disable-javascript")
                 chrome_options.add_argument("--disable-web-security")
                 chrome_options.add_argument("--memory-pressure-off")
@@ -3558,6 +4288,14 @@ class IntegratedMagicBricksScraper:
         progress_lock = threading.Lock()
         completed_cities = 0
 
+        # One extraction process pool serves every city so parsing spreads over all cores
+        shared_pool = None
+        if self.config.get('listing_extraction_backend') == 'process':
+            shared_pool = self._create_extraction_pool()
+
+        # One warm browser per worker, launched now and handed from city to city
+        driver_pool = self.create_warm_driver_pool(max_workers) if self.config.get('warm_driver_pool', True) else None
+
         def scrape_single_city(city: str) -> Tuple[str, Dict[str, Any]]:
             """Scrape a single city in a separate thread"""
             nonlocal completed_cities
@@ -3565,6 +4303,8 @@ class IntegratedMagicBricksScraper:
             try:
                 # Create a separate scraper instance for this thread
                 city_scraper = IntegratedMagicBricksScraper()
+                city_scraper.extraction_pool = shared_pool
+                city_scraper.warm_driver_pool = driver_pool
 
                 self.logger.info(f"   [LIST] Starting {city} scraping...")
 
@@ -3610,6 +4350,16 @@ class IntegratedMagicBricksScraper:
                     results[city] = {'success': False, 'error': str(e)}
                     failed_cities.append(city)
 
+        extraction_stats = None
+        if shared_pool is not None:
+            extraction_stats = shared_pool.get_statistics()
+            shared_pool.shutdown()
+
+        driver_pool_stats = None
+        if driver_pool is not None:
+            driver_pool_stats = driver_pool.get_pool_statistics()
+            driver_pool.close()
+
         # Calculate overall statistics
         total_duration = time.time() - start_time
         successful_cities = len(cities) - len(failed_cities)
@@ -3631,7 +4381,9 @@ class IntegratedMagicBricksScraper:
             'parallel_efficiency': f"{(total_properties / total_duration) / max_workers:.1f} props/min/worker" if total_duration > 0 else "N/A",
             'city_results': results,
             'export_formats': export_formats,
-            'parallel_workers': max_workers
+            'parallel_workers': max_workers,
+            'extraction_pool': extraction_stats,
+            'driver_pool': driver_pool_stats
         }
 
         # Log summary
@@ -3647,9 +4399,19 @@ class IntegratedMagicBricksScraper:
         return summary
 
     def close(self):
-        """Close the WebDriver"""
-
-        if self.driver:
+        """Close the WebDriver (a leased warm browser goes back to its pool instead)"""
+
+        # Queued tracking writes are committed and the writer thread stops (later writes go direct)
+        if isinstance(getattr(self, 'individual_tracker', None), BufferedPropertyTracker):
+            self.individual_tracker.close()
+
+        if self._pool_member is not None:
+            pages = self.session_stats['pages_scraped'] - self._pool_pages_at_lease
+            self.warm_driver_pool.release(self._pool_member, pages=max(1, pages))
+            self._pool_member = None
+            self.driver = None
+            self.logger.info("WebDriver returned to the warm driver pool")
+        elif self.driver:
             self.driver.quit()
             self.logger.info("WebDriver closed")
 
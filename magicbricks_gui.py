@@ -20,6 +20,8 @@ from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
 from user_mode_options import ScrapingMode
 from multi_city_system import MultiCitySystem, CityTier, Region
 from error_handling_system import ErrorHandlingSystem, ErrorSeverity, ErrorCategory
+from sqlite_connection_manager import get_connection
+from property_keys import has_property_key
 
 
 class MagicBricksGUI:
@@ -1127,18 +1129,18 @@ class MagicBricksGUI:
             return {'data': data, 'meta': meta}
 
         try:
-            # Open DB in read-only mode with short busy timeout
+            # Shared read-only connection: in WAL mode it reads alongside a running scraper
             try:
-                con = sqlite3.connect("file:magicbricks_enhanced.db?mode=ro", uri=True, timeout=1.0)
+                con = get_connection(str(db_path), row_factory=sqlite3.Row, read_only=True)
             except sqlite3.OperationalError:
-                # Fallback: if URI not supported, or DB locked; as last resort use normal open
-                con = sqlite3.connect(db_path, timeout=1.0)
-            con.row_factory = sqlite3.Row
+                # Fallback: read-only open refused (e.g. no write access for the -shm file)
+                con = get_connection(str(db_path), row_factory=sqlite3.Row)
             cur = con.cursor()
-            try:
-                cur.execute("PRAGMA busy_timeout=500")
-            except Exception:
-                pass
+            # Cross-table joins use the integer property_key once the scraper has migrated the database
+            key_column = 'property_key' if all(
+                has_property_key(con, table)
+                for table in ('property_urls_seen', 'individual_properties_scraped', 'property_details')
+            ) else 'property_url'
 
             # Collect city codes from configuration and database
             known_cities = {code: info for code, info in self.city_system.cities.items()}
@@ -1228,10 +1230,10 @@ class MagicBricksGUI:
 
                 # PDP coverage and quality
                 cur.execute(
-                    """
-                    SELECT COUNT(DISTINCT s.property_url)
+                    f"""
+                    SELECT COUNT(DISTINCT s.{key_column})
                     FROM individual_properties_scraped s
-                    JOIN property_urls_seen p ON p.property_url = s.property_url
+                    JOIN property_urls_seen p ON p.{key_column} = s.{key_column}
                     WHERE p.city = ?
                     """,
                     (city_code,)
@@ -1241,10 +1243,10 @@ class MagicBricksGUI:
                 city_entry['pdp_pending'] = max(urls_seen_total - pdp_scraped_distinct, 0)
 
                 cur.execute(
-                    """
+                    f"""
                     SELECT COUNT(*)
                     FROM individual_properties_scraped s
-                    JOIN property_urls_seen p ON p.property_url = s.property_url
+                    JOIN property_urls_seen p ON p.{key_column} = s.{key_column}
                     WHERE p.city = ? AND s.extraction_success = 0
                     """,
                     (city_code,)
@@ -1252,10 +1254,10 @@ class MagicBricksGUI:
                 city_entry['pdp_failures'] = cur.fetchone()[0]
 
                 cur.execute(
-                    """
+                    f"""
                     SELECT COUNT(*)
                     FROM individual_properties_scraped s
-                    JOIN property_urls_seen p ON p.property_url = s.property_url
+                    JOIN property_urls_seen p ON p.{key_column} = s.{key_column}
                     WHERE p.city = ? AND s.force_rescrape_after IS NOT NULL AND datetime(s.force_rescrape_after) <= datetime('now')
                     """,
                     (city_code,)
@@ -1263,10 +1265,10 @@ class MagicBricksGUI:
                 city_entry['ttl_due'] = cur.fetchone()[0]
 
                 cur.execute(
-                    """
+                    f"""
                     SELECT AVG(pd.data_quality_score)
                     FROM property_details pd
-                    JOIN property_urls_seen p ON p.property_url = pd.property_url
+                    JOIN property_urls_seen p ON p.{key_column} = pd.{key_column}
                     WHERE p.city = ? AND pd.data_quality_score IS NOT NULL AND pd.data_quality_score > 0
                     """,
                     (city_code,)
@@ -1281,10 +1283,10 @@ class MagicBricksGUI:
 
                 # PDP activity last 7 days
                 cur.execute(
-                    """
+                    f"""
                     SELECT s.scraped_at
                     FROM individual_properties_scraped s
-                    JOIN property_urls_seen p ON p.property_url = s.property_url
+                    JOIN property_urls_seen p ON p.{key_column} = s.{key_column}
                     WHERE p.city = ? AND s.scraped_at IS NOT NULL AND datetime(s.scraped_at) >= datetime('now','-7 day')
                     ORDER BY s.scraped_at
                     """,
@@ -2,6 +2,7 @@
 """
 Multi-city runner for 50 listing pages per city (listing pages only).
 Safe defaults: headless, incremental disabled, no PDP scraping.
+One pre-warmed browser is launched with the first city and handed from city to city.
 
 Outputs:
 - Per-city CSV/JSON files written by the scraper's ExportManager
@@ -41,36 +42,47 @@ def main():
         'cities': {},
     }
 
-    for idx, city in enumerate(cities, 1):
-        city_start = time.time()
-        print("-" * 80)
-        print(f"CITY {idx}/{len(cities)}: {city.upper()}")
-        print("-" * 80)
-        try:
-            scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
-            result = scraper.scrape_properties_with_incremental(
-                city=city,
-                mode=ScrapingMode.FULL,
-                max_pages=max_pages,
-                include_individual_pages=include_individual_pages,
-                export_formats=['csv', 'json']
-            )
-            city_time = round(time.time() - city_start)
-            summary['cities'][city] = {
-                'success': bool(result.get('success')),
-                'pages_scraped': result.get('pages_scraped'),
-                'properties_scraped': result.get('properties_scraped'),
-                'duration_seconds': city_time,
-            }
-            print(f"[DONE] {city} in {city_time}s | pages={result.get('pages_scraped')} props={result.get('properties_scraped')}")
-        except Exception as e:
-            city_time = round(time.time() - city_start)
-            summary['cities'][city] = {
-                'success': False,
-                'error': str(e),
-                'duration_seconds': city_time,
-            }
-            print(f"[ERROR] {city} failed after {city_time}s: {e}")
+    # Warm browser shared by every city, created by the first city's scraper
+    driver_pool = None
+    try:
+        for idx, city in enumerate(cities, 1):
+            city_start = time.time()
+            print("-" * 80)
+            print(f"CITY {idx}/{len(cities)}: {city.upper()}")
+            print("-" * 80)
+            try:
+                scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+                if driver_pool is None:
+                    driver_pool = scraper.create_warm_driver_pool(1)
+                scraper.warm_driver_pool = driver_pool
+                result = scraper.scrape_properties_with_incremental(
+                    city=city,
+                    mode=ScrapingMode.FULL,
+                    max_pages=max_pages,
+                    include_individual_pages=include_individual_pages,
+                    export_formats=['csv', 'json']
+                )
+                city_time = round(time.time() - city_start)
+                summary['cities'][city] = {
+                    'success': bool(result.get('success')),
+                    'pages_scraped': result.get('pages_scraped'),
+                    'properties_scraped': result.get('properties_scraped'),
+                    'duration_seconds': city_time,
+                }
+                print(f"[DONE] {city} in {city_time}s | pages={result.get('pages_scraped')} props={result.get('properties_scraped')}")
+            except Exception as e:
+                city_time = round(time.time() - city_start)
+                summary['cities'][city] = {
+                    'success': False,
+                    'error': str(e),
+                    'duration_seconds': city_time,
+                }
+                print(f"[ERROR] {city} failed after {city_time}s: {e}")
+    finally:
+        # The pre-launched Chrome is quit on Ctrl+C and unexpected errors too
+        if driver_pool is not None:
+            summary['driver_pool'] = driver_pool.get_pool_statistics()
+            driver_pool.close()
 
     summary['finished_at'] = datetime.now().isoformat()
     with open('multi_city_run_summary.json', 'w', encoding='utf-8') as f:
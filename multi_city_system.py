@@ -11,6 +11,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
+from sqlite_connection_manager import get_connection
 
 
 class CityTier(Enum):
@@ -299,7 +300,7 @@ class MultiCitySystem:
         """Save city statistics to database"""
         
         try:
-            connection = sqlite3.connect(self.db_path)
+            connection = get_connection(self.db_path)
             cursor = connection.cursor()
             
             # Create table if not exists
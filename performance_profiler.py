@@ -4,7 +4,7 @@ Performance Profiler module extracted from performance_optimization_system.py
 from __future__ import annotations
 import time
 import threading
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 
 class PerformanceProfiler:
@@ -16,6 +16,7 @@ class PerformanceProfiler:
         """Initialize performance profiler"""
         self.timings: Dict[str, List[float]] = {}
         self.counters: Dict[str, int] = {}
+        self.samples: Dict[str, List[Tuple[float, float]]] = {}
         self.lock = threading.Lock()
         print("⏱️ Performance Profiler initialized")
 
@@ -33,6 +34,15 @@ class PerformanceProfiler:
             if len(self.timings[operation_name]) > 100:
                 self.timings[operation_name] = self.timings[operation_name][-100:]
 
+    def record_sample(self, metric_name: str, value: float):
+        """Record a gauge reading (e.g. browser RSS) as a (timestamp, value) point"""
+        with self.lock:
+            series = self.samples.setdefault(metric_name, [])
+            series.append((time.time(), value))
+            # Keep only last 1000 points
+            if len(series) > 1000:
+                self.samples[metric_name] = series[-1000:]
+
     def increment_counter(self, counter_name: str, amount: int = 1):
         """Increment performance counter"""
         with self.lock:
@@ -44,6 +54,7 @@ class PerformanceProfiler:
             stats: Dict[str, Any] = {
                 'timings': {},
                 'counters': self.counters.copy(),
+                'samples': {},
             }
             for operation, times in self.timings.items():
                 if times:
@@ -54,6 +65,16 @@ class PerformanceProfiler:
                         'max_ms': max(times) * 1000,
                         'total_ms': sum(times) * 1000,
                     }
+            for metric, series in self.samples.items():
+                if series:
+                    values = [value for _, value in series]
+                    stats['samples'][metric] = {
+                        'count': len(values),
+                        'last': values[-1],
+                        'min': min(values),
+                        'max': max(values),
+                        'series': list(series),
+                    }
             return stats
 
     def reset_stats(self):
@@ -61,6 +82,7 @@ class PerformanceProfiler:
         with self.lock:
             self.timings.clear()
             self.counters.clear()
+            self.samples.clear()
 
 
 class OperationTimer:
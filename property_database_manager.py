@@ -5,7 +5,10 @@ Handles database connections, schema setup, and database operations for individu
 """
 
 import sqlite3
+import threading
 from typing import Optional
+from sqlite_connection_manager import get_connection
+from property_keys import migrate_property_keys
 
 
 class PropertyDatabaseManager:
@@ -16,20 +19,29 @@ class PropertyDatabaseManager:
     def __init__(self, db_path: str = 'magicbricks_enhanced.db'):
         """Initialize database manager"""
         self.db_path = db_path
+        # Concurrent PDP workers share this manager: each thread sees its own connection
+        self._local = threading.local()
         self.connection = None
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        return getattr(self._local, 'connection', None)
+
+    @connection.setter
+    def connection(self, value: Optional[sqlite3.Connection]):
+        self._local.connection = value
     
     def connect_db(self) -> bool:
         """Establish database connection"""
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row
+            self.connection = get_connection(self.db_path, row_factory=sqlite3.Row)
             return True
         except Exception as e:
             print(f"[ERROR] Database connection failed: {str(e)}")
             return False
     
     def close_connection(self):
-        """Close database connection"""
+        """Release database connection (the shared connection itself stays open)"""
         if self.connection:
             self.connection.close()
             self.connection = None
@@ -48,6 +60,7 @@ class PropertyDatabaseManager:
                 CREATE TABLE IF NOT EXISTS individual_properties_scraped (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     property_url TEXT UNIQUE NOT NULL,
+                    property_key INTEGER,  -- canonical key (property_keys.property_key)
                     property_id TEXT,
                     url_hash TEXT UNIQUE,
                     scraped_at DATETIME NOT NULL,
@@ -68,6 +81,7 @@ class PropertyDatabaseManager:
                 CREATE TABLE IF NOT EXISTS property_details (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     property_url TEXT NOT NULL,
+                    property_key INTEGER,
                     title TEXT,
                     price TEXT,
                     area TEXT,
@@ -118,6 +132,7 @@ class PropertyDatabaseManager:
                 CREATE TABLE IF NOT EXISTS property_change_history (
                     change_id INTEGER PRIMARY KEY AUTOINCREMENT,
                     property_url TEXT NOT NULL,
+                    property_key INTEGER,
                     field_name TEXT NOT NULL,
                     old_value TEXT,
                     new_value TEXT,
@@ -127,16 +142,12 @@ class PropertyDatabaseManager:
                 )
             ''')
             
-            # Create indexes for performance
+            # Create indexes for performance (property_key indexes come with the key migration)
             indexes = [
-                ('idx_individual_scraped_url', 'individual_properties_scraped', 'property_url'),
-                ('idx_individual_scraped_hash', 'individual_properties_scraped', 'url_hash'),
                 ('idx_individual_scraped_date', 'individual_properties_scraped', 'scraped_at'),
                 ('idx_individual_scraped_quality', 'individual_properties_scraped', 'data_quality_score'),
-                ('idx_property_details_url', 'property_details', 'property_url'),
                 ('idx_property_details_scraped', 'property_details', 'scraped_at'),
                 ('idx_individual_sessions_start', 'individual_scraping_sessions', 'start_timestamp'),
-                ('idx_change_history_url', 'property_change_history', 'property_url'),
                 ('idx_change_history_date', 'property_change_history', 'change_detected_at')
             ]
             
@@ -145,8 +156,15 @@ class PropertyDatabaseManager:
                     cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_name})')
                 except Exception as e:
                     print(f"[WARNING] Could not create index {index_name}: {str(e)}")
-            
+
+            # Lookups and joins go through property_key: the URL/hash copies of the UNIQUE
+            # autoindexes and the per-URL text indexes are no longer used
+            for index_name in ('idx_individual_scraped_url', 'idx_individual_scraped_hash',
+                               'idx_property_details_url', 'idx_change_history_url'):
+                cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
             self.connection.commit()
+            migrate_property_keys(self.connection, ['individual_properties_scraped', 'property_details',
+                                                    'property_change_history'])
             print("[SUCCESS] Individual property tracking database schema created")
             return True
             
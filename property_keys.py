@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Property Key Module
+One canonical integer key per property, shared by every tracking table.
+The key is derived from the `pdpid` (project pages) or `id` (property pages)
+MagicBricks puts in its detail URLs, so slug, case and tracking-parameter
+variants of one page map to the same key; URLs without an ID fall back to a
+canonical form of the URL itself.
+"""
+
+import hashlib
+import re
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+# Listing/detail URL IDs, most specific first: (namespace, pattern on the lowercased URL)
+PROPERTY_KEY_PATTERNS = [
+    ('pdpid', re.compile(r'pdpid-([0-9a-f]{4,})')),
+    ('id', re.compile(r'[?&]id=([0-9a-f]{4,})'))
+]
+
+# Query parameters that do not change the page
+TRACKING_PARAMS = ('utm_', 'ref=', 'source=', 'fbclid=', 'gclid=')
+
+# Tracking tables carrying property_key: table -> column choosing the row that keeps the key
+# when legacy rows of one property collide (None: many rows per property, plain index)
+PROPERTY_KEY_TABLES = {
+    'individual_properties_scraped': 'scraped_at',
+    'property_urls_seen': 'last_seen_date',
+    'property_details': None,
+    'property_change_history': None,
+    'property_posting_dates': None
+}
+
+# Keys per IN (...) query (below SQLite's bound-variable limit)
+KEY_QUERY_CHUNK = 500
+
+
+def canonical_url(url: str) -> str:
+    """Lowercased URL without fragment, trailing slash or tracking parameters (query order ignored)"""
+    url = url.strip().lower().split('#', 1)[0]
+    base, *params = re.split(r'[?&]', url)
+    params = sorted(p for p in params if p and not p.startswith(TRACKING_PARAMS))
+    base = base.rstrip('/')
+    return f"{base}?{'&'.join(params)}" if params else base
+
+
+def property_key(url: str) -> int:
+    """
+    Canonical 64-bit key of a property URL
+
+    The ID (namespaced by the URL kind, project and property IDs are distinct
+    series) or the canonical URL is hashed to a signed 64-bit integer, the
+    range of a SQLite INTEGER.
+    """
+    lowered = url.strip().lower()
+    for namespace, pattern in PROPERTY_KEY_PATTERNS:
+        match = pattern.search(lowered)
+        if match:
+            source = f"{namespace}:{match.group(1)}"
+            break
+    else:
+        source = f"url:{canonical_url(lowered)}"
+    digest = hashlib.blake2b(source.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def has_property_key(connection: sqlite3.Connection, table: str) -> bool:
+    """Whether `table` exists and has the property_key column"""
+    return any(row[1] == 'property_key' for row in connection.execute(f"PRAGMA table_info({table})"))
+
+
+def migrate_property_keys(connection: sqlite3.Connection, tables: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Add, backfill and index property_key on the tracking tables that exist
+
+    Idempotent; only rows without a key are visited. In tables with one row per
+    property the key index is UNIQUE, and when legacy rows of one property
+    collide (URL variants stored separately) the most recent row keeps the key
+    while the others stay unkeyed and drop out of key lookups.
+
+    Args:
+        connection: Database connection (committed on success)
+        tables: Subset of PROPERTY_KEY_TABLES (default: all)
+
+    Returns:
+        Table -> number of rows keyed
+    """
+    keyed: Dict[str, int] = {}
+    try:
+        for table in tables or list(PROPERTY_KEY_TABLES):
+            columns = [row[1] for row in connection.execute(f"PRAGMA table_info({table})")]
+            if not columns:
+                continue
+            if 'property_key' not in columns:
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN property_key INTEGER")
+
+            order_column = PROPERTY_KEY_TABLES[table]
+            rows = connection.execute(
+                f"SELECT rowid, property_url, {order_column or 'NULL'} FROM {table} WHERE property_key IS NULL"
+            ).fetchall()
+            updates = [(property_key(url), rowid, order) for rowid, url, order in rows if url]
+            if order_column:
+                updates = _resolve_collisions(connection, table, order_column, updates)
+            connection.executemany(f"UPDATE {table} SET property_key = ? WHERE rowid = ?",
+                                   [(key, rowid) for key, rowid, _ in updates])
+            keyed[table] = len(updates)
+
+            unique = 'UNIQUE ' if order_column else ''
+            connection.execute(f"CREATE {unique}INDEX IF NOT EXISTS idx_{table}_key ON {table}(property_key)")
+            if len(updates) < len(rows):
+                print(f"[MIGRATION] {table}: {len(rows) - len(updates)} duplicate URL variants left unkeyed")
+
+        connection.commit()
+        return keyed
+
+    except sqlite3.Error:
+        connection.rollback()
+        raise
+
+
+def _resolve_collisions(connection: sqlite3.Connection, table: str, order_column: str,
+                        updates: List[Tuple[int, int, object]]) -> List[Tuple[int, int, object]]:
+    """Keep one row per key: the most recent of the unkeyed rows and an already keyed row"""
+    winners: Dict[int, Tuple[int, object]] = {}
+    for key, rowid, order in updates:
+        current = winners.get(key)
+        if current is None or (str(order or ''), rowid) > (str(current[1] or ''), current[0]):
+            winners[key] = (rowid, order)
+
+    keys = list(winners)
+    for i in range(0, len(keys), KEY_QUERY_CHUNK):
+        chunk = keys[i:i + KEY_QUERY_CHUNK]
+        for key, rowid, order in connection.execute(
+            f"SELECT property_key, rowid, {order_column} FROM {table} "
+            f"WHERE property_key IN ({','.join('?' * len(chunk))})", chunk
+        ).fetchall():
+            if (str(order or ''), rowid) >= (str(winners[key][1] or ''), winners[key][0]):
+                del winners[key]  # the keyed row stays
+            else:
+                connection.execute(f"UPDATE {table} SET property_key = NULL WHERE rowid = ?", (rowid,))
+
+    return [(key, rowid, order) for key, (rowid, order) in winners.items()]
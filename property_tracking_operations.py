@@ -6,10 +6,59 @@ Core tracking logic for individual property scraping including URL filtering and
 
 import hashlib
 import json
+import re
 from datetime import datetime
 from typing import List, Dict, Any
 from property_database_manager import PropertyDatabaseManager
 from property_quality_scorer import PropertyQualityScorer
+from property_keys import property_key
+
+# Query parameters that do not change the page (stripped by normalize_url)
+TRACKING_PARAMS_RE = re.compile(r'[?&](utm_|ref=|source=)[^&]*')
+
+# Tracking writes, shared by the per-call methods and BufferedPropertyTracker's batches
+# (parameters from mark_row / tracking_rows)
+MARK_SCRAPED_SQL = '''
+    INSERT INTO individual_properties_scraped
+    (property_url, property_key, url_hash, scraped_at, scraping_session_id,
+     data_quality_score, extraction_success, retry_count, updated_at)
+    VALUES (?1, ?2, ?3, ?4, ?5, 0.0, 1, 0, ?6)
+    ON CONFLICT(property_key) DO UPDATE SET
+        scraped_at = excluded.scraped_at,
+        scraping_session_id = COALESCE(excluded.scraping_session_id, scraping_session_id),
+        extraction_success = 1, updated_at = excluded.updated_at
+'''
+
+# A failed page keeps its last good scrape time; extraction_success = 0 makes it due again
+MARK_FAILED_SQL = '''
+    INSERT INTO individual_properties_scraped
+    (property_url, property_key, url_hash, scraped_at, scraping_session_id,
+     data_quality_score, extraction_success, retry_count, last_retry_at, updated_at)
+    VALUES (?1, ?2, ?3, ?4, ?5, 0.0, 0, 1, ?4, ?6)
+    ON CONFLICT(property_key) DO UPDATE SET
+        extraction_success = 0, retry_count = retry_count + 1,
+        last_retry_at = excluded.last_retry_at,
+        scraping_session_id = COALESCE(excluded.scraping_session_id, scraping_session_id),
+        updated_at = excluded.updated_at
+'''
+
+# Replaces the record of any URL variant of the property
+TRACK_SCRAPED_SQL = '''
+    INSERT OR REPLACE INTO individual_properties_scraped
+    (property_url, property_key, property_id, url_hash, scraped_at, scraping_session_id,
+     data_quality_score, extraction_success, retry_count, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+'''
+
+PROPERTY_DETAILS_SQL = '''
+    INSERT OR REPLACE INTO property_details
+    (property_url, property_key, title, price, area, locality, society, property_type,
+     bhk, bathrooms, furnishing, floor, age, facing, parking, amenities,
+     description, builder_info, location_details, specifications,
+     contact_info, images, raw_html, scraped_at, data_quality_score,
+     extraction_metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
 
 
 class PropertyTrackingOperations:
@@ -45,11 +94,65 @@ class PropertyTrackingOperations:
         url = url.rstrip('/')
         
         # Remove common parameters that don't affect content
-        import re
-        url = re.sub(r'[?&](utm_|ref=|source=)[^&]*', '', url)
+        url = TRACKING_PARAMS_RE.sub('', url)
         
         return url
     
+    def lookup_scrape_records(self, property_urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Previous scrape records of many URLs in one query
+
+        Candidate property keys go into a temp table that is joined against the
+        UNIQUE property_key index, instead of one query per URL.
+
+        Returns:
+            Original URL -> {'property_url', 'scraped_at', 'data_quality_score',
+            'extraction_success', 'force_rescrape_after'} (URLs never scraped are absent)
+        """
+        if not property_urls:
+            return {}
+        if not self.db_manager.connect_db():
+            raise RuntimeError('Database connection failed')
+
+        connection = self.db_manager.connection
+        connection.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS filter_candidates (
+                position INTEGER PRIMARY KEY,
+                property_key INTEGER
+            )
+        ''')
+        # The candidate rows are undone on their own, leaving any open transaction of other modules alone
+        connection.execute('SAVEPOINT lookup_scrape_records')
+        try:
+            cursor = connection.cursor()
+            cursor.executemany('INSERT INTO filter_candidates VALUES (?, ?)',
+                               [(position, property_key(self.normalize_url(url)))
+                                for position, url in enumerate(property_urls)])
+
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT c.position, s.property_url, s.scraped_at, s.data_quality_score,
+                       s.extraction_success, s.force_rescrape_after
+                FROM filter_candidates c
+                JOIN individual_properties_scraped s ON s.property_key = c.property_key
+            ''')
+
+            records: Dict[str, Dict[str, Any]] = {}
+            for position, property_url, scraped_at, quality, success, rescrape_after in cursor.fetchall():
+                records.setdefault(property_urls[position], {
+                    'property_url': property_url,
+                    'scraped_at': scraped_at,
+                    'data_quality_score': quality,
+                    'extraction_success': success,
+                    'force_rescrape_after': rescrape_after
+                })
+            return records
+
+        finally:
+            connection.execute('ROLLBACK TO lookup_scrape_records')
+            connection.execute('RELEASE lookup_scrape_records')
+            self.db_manager.close_connection()
+
     def create_scraping_session(self, session_name: str, total_urls: int, config: Dict[str, Any] = None) -> int:
         """Create a new individual property scraping session"""
         
@@ -98,11 +201,8 @@ class PropertyTrackingOperations:
             Dictionary with filtered URLs and statistics
         """
         
-        if not self.db_manager.connect_db():
-            return {'success': False, 'error': 'Database connection failed'}
-        
         try:
-            cursor = self.db_manager.connection.cursor()
+            records = self.lookup_scrape_records(property_urls)
             
             quality_threshold = quality_threshold or self.config['quality_threshold']
             current_time = datetime.now()
@@ -126,18 +226,7 @@ class PropertyTrackingOperations:
             }
             
             for url in property_urls:
-                normalized_url = self.normalize_url(url)
-                url_hash = self.generate_url_hash(normalized_url)
-                
-                # Check if URL was previously scraped
-                cursor.execute('''
-                    SELECT property_url, scraped_at, data_quality_score, 
-                           extraction_success, force_rescrape_after
-                    FROM individual_properties_scraped 
-                    WHERE url_hash = ? OR property_url = ?
-                ''', (url_hash, normalized_url))
-                
-                existing_record = cursor.fetchone()
+                existing_record = records.get(url)
                 
                 if not existing_record:
                     # New URL - needs scraping
@@ -202,6 +291,65 @@ class PropertyTrackingOperations:
         finally:
             self.db_manager.close_connection()
 
+    def mark_row(self, property_url: str, session_id: int = None) -> tuple:
+        """Parameters of MARK_SCRAPED_SQL / MARK_FAILED_SQL for one URL"""
+        normalized_url = self.normalize_url(property_url)
+        now = datetime.now()
+        return (normalized_url, property_key(normalized_url), self.generate_url_hash(normalized_url),
+                now, session_id, now)
+
+    def tracking_rows(self, property_url: str, property_data: Dict[str, Any],
+                      session_id: int, quality_score: float = None) -> tuple:
+        """Parameters of TRACK_SCRAPED_SQL and PROPERTY_DETAILS_SQL for one scraped property"""
+        normalized_url = self.normalize_url(property_url)
+        key = property_key(normalized_url)
+        current_time = datetime.now()
+
+        # Calculate quality score if not provided
+        if quality_score is None:
+            quality_score = self.quality_scorer.calculate_quality_score(property_data)
+
+        scraped_row = (
+            normalized_url,
+            key,
+            property_data.get('property_id'),
+            self.generate_url_hash(normalized_url),
+            current_time,
+            session_id,
+            quality_score,
+            True,
+            current_time
+        )
+        details_row = (
+            normalized_url,
+            key,
+            property_data.get('title'),
+            property_data.get('price'),
+            property_data.get('area'),
+            property_data.get('locality'),
+            property_data.get('society'),
+            property_data.get('property_type'),
+            property_data.get('bhk'),
+            property_data.get('bathrooms'),
+            property_data.get('furnishing'),
+            property_data.get('floor'),
+            property_data.get('age'),
+            property_data.get('facing'),
+            property_data.get('parking'),
+            json.dumps(property_data.get('amenities', [])),
+            property_data.get('description'),
+            json.dumps(property_data.get('builder_info', {})),
+            json.dumps(property_data.get('location_details', {})),
+            json.dumps(property_data.get('specifications', {})),
+            json.dumps(property_data.get('contact_info', {})),
+            json.dumps(property_data.get('images', [])),
+            property_data.get('raw_html'),
+            current_time,
+            quality_score,
+            json.dumps(property_data.get('extraction_metadata', {}))
+        )
+        return scraped_row, details_row
+
     def track_scraped_property(self, property_url: str, property_data: Dict[str, Any],
                               session_id: int, quality_score: float = None) -> bool:
         """Track a successfully scraped individual property"""
@@ -209,70 +357,14 @@ class PropertyTrackingOperations:
         if not self.db_manager.connect_db():
             return False
 
+        written = False
         try:
-            cursor = self.db_manager.connection.cursor()
-
-            normalized_url = self.normalize_url(property_url)
-            url_hash = self.generate_url_hash(normalized_url)
-            current_time = datetime.now()
-
-            # Calculate quality score if not provided
-            if quality_score is None:
-                quality_score = self.quality_scorer.calculate_quality_score(property_data)
-
-            # Insert or update tracking record
-            cursor.execute('''
-                INSERT OR REPLACE INTO individual_properties_scraped
-                (property_url, property_id, url_hash, scraped_at, scraping_session_id,
-                 data_quality_score, extraction_success, retry_count, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?)
-            ''', (
-                normalized_url,
-                property_data.get('property_id'),
-                url_hash,
-                current_time,
-                session_id,
-                quality_score,
-                True,
-                current_time
-            ))
+            scraped_row, details_row = self.tracking_rows(property_url, property_data, session_id, quality_score)
 
-            # Store detailed property data
-            cursor.execute('''
-                INSERT OR REPLACE INTO property_details
-                (property_url, title, price, area, locality, society, property_type,
-                 bhk, bathrooms, furnishing, floor, age, facing, parking, amenities,
-                 description, builder_info, location_details, specifications,
-                 contact_info, images, raw_html, scraped_at, data_quality_score,
-                 extraction_metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                normalized_url,
-                property_data.get('title'),
-                property_data.get('price'),
-                property_data.get('area'),
-                property_data.get('locality'),
-                property_data.get('society'),
-                property_data.get('property_type'),
-                property_data.get('bhk'),
-                property_data.get('bathrooms'),
-                property_data.get('furnishing'),
-                property_data.get('floor'),
-                property_data.get('age'),
-                property_data.get('facing'),
-                property_data.get('parking'),
-                json.dumps(property_data.get('amenities', [])),
-                property_data.get('description'),
-                json.dumps(property_data.get('builder_info', {})),
-                json.dumps(property_data.get('location_details', {})),
-                json.dumps(property_data.get('specifications', {})),
-                json.dumps(property_data.get('contact_info', {})),
-                json.dumps(property_data.get('images', [])),
-                property_data.get('raw_html'),
-                current_time,
-                quality_score,
-                json.dumps(property_data.get('extraction_metadata', {}))
-            ))
+            cursor = self.db_manager.connection.cursor()
+            written = True
+            cursor.execute(TRACK_SCRAPED_SQL, scraped_row)
+            cursor.execute(PROPERTY_DETAILS_SQL, details_row)
 
             self.db_manager.connection.commit()
             self.stats['total_urls_processed'] += 1
@@ -280,6 +372,9 @@ class PropertyTrackingOperations:
             return True
 
         except Exception as e:
+            if written:
+                # Neither row of a half-written record stays pending on the shared connection
+                self.db_manager.connection.rollback()
             print(f"[ERROR] Failed to track scraped property {property_url}: {str(e)}")
             return False
 
@@ -8,12 +8,40 @@ from .bot_detection_handler import BotDetectionHandler
 from .export_manager import ExportManager
 from .data_validator import DataValidator
 from .individual_property_scraper import IndividualPropertyScraper
+from .driver_pool import DriverPool
+from .pacing import SegmentPacer
+from .dom_card_extractor import DomCardExtractor
+from .listing_slicer import ListingSlicer
+from .selector_ranker import SelectorRanker
+from .listing_pipeline import ListingPipeline
+from .process_extraction import ProcessExtractionPool
+from .session_broker import SessionBroker
+from .session_recovery import SessionRecovery
+from .driver_supervisor import DriverSupervisor
+from .network_timing import NetworkTimingRecorder
+from .interception_policy import InterceptionPolicy
+from .http_listing_fetcher import HttpListingFetcher
+from .async_pdp_engine import AsyncPdpEngine
 
 __all__ = [
     'PropertyExtractor',
     'BotDetectionHandler',
     'ExportManager',
     'DataValidator',
-    'IndividualPropertyScraper'
+    'IndividualPropertyScraper',
+    'DriverPool',
+    'SegmentPacer',
+    'DomCardExtractor',
+    'ListingSlicer',
+    'SelectorRanker',
+    'ListingPipeline',
+    'ProcessExtractionPool',
+    'SessionBroker',
+    'SessionRecovery',
+    'DriverSupervisor',
+    'NetworkTimingRecorder',
+    'InterceptionPolicy',
+    'HttpListingFetcher',
+    'AsyncPdpEngine'
 ]
 
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Async PDP Engine Module
+Asyncio engine for individual property (PDP) pages.
+Pages are fetched over HTTP with many requests in flight, bounded by a global
+semaphore and one semaphore per segment (locality from the URL), and parsed by
+IndividualPropertyScraper.extract_property_details in an executor. The URL
+failure/skip-after-N policy, segment cooldowns and token-bucket pacing are the
+IndividualPropertyScraper's own, so HTTP and Selenium attempts share them.
+Pages that carry no data without JavaScript go to the Selenium path. With a
+SessionBroker the engine sends the browser's exported credentials and asks the
+broker to refresh them through the browser when a bot page comes back.
+"""
+
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# aiohttp imports with fallback
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Headers the HTTP clients negotiate themselves (only encodings they can decode)
+MANAGED_HEADERS = ('accept-encoding', 'connection', 'host', 'content-length')
+
+# Longest single wait for a cooling segment before the attempt goes ahead (matches the Selenium path)
+MAX_SEGMENT_PAUSE = 15.0
+
+
+def request_headers(headers: Optional[Dict[str, str]], cookies: Optional[List[Dict[str, Any]]] = None,
+                    user_agent: Optional[str] = None) -> Dict[str, str]:
+    """Request headers with browser cookies folded into one Cookie header"""
+    merged = {name: value for name, value in (headers or {}).items() if name.lower() not in MANAGED_HEADERS}
+    if user_agent:
+        merged['User-Agent'] = user_agent
+    cookie_pairs = [f"{c['name']}={c.get('value', '')}" for c in cookies or [] if c.get('name')]
+    if cookie_pairs:
+        merged['Cookie'] = '; '.join(cookie_pairs)
+    return merged
+
+
+class AiohttpTransport:
+    """Non-blocking HTTP client (one aiohttp session per engine run)"""
+
+    def __init__(self, headers: Dict[str, str], timeout: float = 20.0, limit: int = 8,
+                 header_source: Optional[Callable[[], Dict[str, str]]] = None):
+        self.headers = headers
+        self.timeout = timeout
+        self.limit = limit
+        # Called per request for headers that change during a run (broker cookies)
+        self.header_source = header_source
+        self._session = None
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.limit)
+            )
+        if self.header_source is not None:
+            headers = {**self.header_source(), **(headers or {})}
+        async with self._session.get(url, headers=headers) as response:
+            return response.status, str(response.url), await response.text()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class ThreadedRequestsTransport:
+    """Keep-alive requests session driven from the event loop (used when aiohttp is not installed)"""
+
+    def __init__(self, headers: Dict[str, str], timeout: float = 20.0, limit: int = 8,
+                 session: Optional[requests.Session] = None):
+        self.timeout = timeout
+        # A shared session (the broker's) already carries headers and cookies and is not closed here
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=limit, pool_maxsize=limit, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(headers)
+        self.session = session
+        self._executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix='pdp-http')
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]]) -> Tuple[int, str, str]:
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        return response.status_code, response.url, response.text
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._get, url, headers)
+
+    async def close(self):
+        self._executor.shutdown(wait=False)
+        if self._owns_session:
+            self.session.close()
+
+
+def create_transport(headers: Dict[str, str], timeout: float = 20.0, limit: int = 8, broker=None):
+    """aiohttp when installed, otherwise the threaded requests transport (on the broker's session if given)"""
+    if AIOHTTP_AVAILABLE:
+        if broker is not None:
+            return AiohttpTransport({}, timeout, limit, header_source=broker.request_headers)
+        return AiohttpTransport(headers, timeout, limit)
+    if broker is not None:
+        return ThreadedRequestsTransport({}, timeout, limit, session=broker.session)
+    return ThreadedRequestsTransport(headers, timeout, limit)
+
+
+class AsyncPdpEngine:
+    """
+    Asyncio PDP fetcher with global and per-segment concurrency limits (one run per engine)
+
+    For each URL: hold the segment's semaphore, honour the segment cooldown
+    and pacer reservation, take a global slot for the HTTP fetch, and parse in
+    the parse executor. Bot pages and HTTP errors count as URL failures (bot pages
+    also cool the segment, and have the session broker refresh its credentials);
+    a URL that reaches max_url_failures is skipped.
+    A page without title and price (needs JavaScript), or one whose HTTP
+    attempts all failed, is handed to the Selenium path in the browser executor.
+    """
+
+    def __init__(self, individual_scraper, headers: Optional[Dict[str, str]] = None,
+                 cookies: Optional[List[Dict[str, Any]]] = None, user_agent: Optional[str] = None,
+                 max_concurrency: int = 8, segment_concurrency: int = 1, max_retries: int = 3,
+                 timeout: float = 20.0, parse_workers: int = 2, browser_fallback: bool = True,
+                 browser_workers: int = 1, session_broker=None, transport=None, logger=None):
+        """
+        Initialize async PDP engine
+
+        Args:
+            individual_scraper: IndividualPropertyScraper providing parsing, the
+                failure/cooldown policy, pacing and the Selenium fallback
+            headers: Realistic request headers
+            cookies: Browser cookies (driver.get_cookies()) sent with every request
+            user_agent: User agent matching the cookies
+            max_concurrency: Requests in flight across all segments
+            segment_concurrency: Requests in flight per segment
+            max_retries: HTTP attempts per URL
+            timeout: Per-request timeout in seconds
+            parse_workers: Threads parsing pages off the event loop
+            browser_fallback: Send JS-only pages (and exhausted URLs) to Selenium
+            browser_workers: Concurrent Selenium fallbacks (driver pool size, or 1 for the shared driver)
+            session_broker: SessionBroker whose credentials are sent (headers, cookies and
+                user_agent are ignored when given) and refreshed on bot pages
+            transport: HTTP transport (default: aiohttp, or requests in threads without aiohttp)
+            logger: Logger instance
+        """
+        self.scraper = individual_scraper
+        self.max_concurrency = max(1, max_concurrency)
+        self.segment_concurrency = max(1, segment_concurrency)
+        self.max_retries = max(1, max_retries)
+        self.browser_fallback = browser_fallback
+        self.logger = logger or logging.getLogger(__name__)
+        self.session_broker = session_broker
+        self.transport = transport or create_transport(
+            request_headers(headers, cookies, user_agent), timeout, self.max_concurrency, session_broker)
+
+        self._parse_executor = ThreadPoolExecutor(max_workers=max(1, parse_workers), thread_name_prefix='pdp-parse')
+        self._browser_executor = ThreadPoolExecutor(max_workers=max(1, browser_workers), thread_name_prefix='pdp-browser')
+        self._segment_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        # Engine statistics
+        self.stats = {
+            'urls': 0,
+            'http_fetches': 0,
+            'http_successes': 0,
+            'http_errors': 0,
+            'bot_pages': 0,
+            'skipped_cooldown': 0,
+            'skipped_after_n': 0,
+            'browser_fallbacks': 0,
+            'browser_successes': 0,
+            'session_refreshes': 0,
+            'segment_wait_seconds': 0.0,
+            'elapsed_seconds': 0.0,
+            'max_in_flight': 0
+        }
+        self._in_flight = 0
+
+    def run(self, property_urls: List[str], session_id: Optional[int] = None,
+            on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+            on_failure: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Scrape property pages from synchronous code (runs its own event loop)"""
+        return asyncio.run(self.scrape(property_urls, session_id, on_result, on_failure))
+
+    async def scrape(self, property_urls: List[str], session_id: Optional[int] = None,
+                     on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                     on_failure: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape property pages concurrently
+
+        Args:
+            property_urls: Property URLs to scrape
+            session_id: Session ID for tracking (passed to the Selenium fallback)
+            on_result: Called with (url, details) for every page scraped, in completion order
+            on_failure: Called with the url of every page that yielded no data
+
+        Returns:
+            Property details for every page that yielded data
+        """
+        start = time.perf_counter()
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._segment_semaphores = {}
+        results: List[Dict[str, Any]] = []
+
+        async def scrape_one(url: str):
+            details = await self._scrape_url(url, session_id)
+            if details:
+                results.append(details)
+                if on_result:
+                    on_result(url, details)
+            elif on_failure:
+                on_failure(url)
+
+        try:
+            await asyncio.gather(*(scrape_one(url) for url in property_urls))
+        finally:
+            await self.transport.close()
+            self._parse_executor.shutdown(wait=True)
+            self._browser_executor.shutdown(wait=True)
+            self.stats['elapsed_seconds'] += time.perf_counter() - start
+        return results
+
+    def _segment_semaphore(self, segment: str) -> asyncio.Semaphore:
+        semaphore = self._segment_semaphores.get(segment)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.segment_concurrency)
+            self._segment_semaphores[segment] = semaphore
+        return semaphore
+
+    async def _scrape_url(self, url: str, session_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        scraper = self.scraper
+        self.stats['urls'] += 1
+        if scraper.url_cooldowns.get(url, 0) > time.time():
+            self.logger.info(f"⏭️ Skipping (cooldown) {url} until {scraper.url_cooldowns[url]:.0f}")
+            self.stats['skipped_cooldown'] += 1
+            return None
+
+        segment = scraper._segment_key_from_url(url)
+        referer = {'Referer': scraper.last_listing_page_url} if scraper.last_listing_page_url else None
+        needs_browser = False
+
+        async with self._segment_semaphore(segment):
+            for attempt in range(self.max_retries):
+                # Cooling segments wait here without holding a global slot
+                await self._wait_for_segment(segment)
+                async with self._global_semaphore:
+                    self._in_flight += 1
+                    self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self._in_flight)
+                    self.stats['http_fetches'] += 1
+                    session_version = self.session_broker.version if self.session_broker else None
+                    try:
+                        status, final_url, page_source = await self.transport.fetch(url, referer)
+                    except Exception as e:
+                        self.logger.warning(f"   [ASYNC-PDP] Attempt {attempt + 1}/{self.max_retries} failed for {url}: {e}")
+                        self.stats['http_errors'] += 1
+                        scraper._record_url_failure(url, soft=True)
+                        if self._skip_after_n(url):
+                            return None
+                        continue
+                    finally:
+                        self._in_flight -= 1
+
+                if status != 200 or scraper.bot_handler.detect_bot_detection(page_source, final_url):
+                    self.logger.warning(f"   [ASYNC-PDP] Bot detection or HTTP {status} on {url}")
+                    self.stats['bot_pages'] += 1
+                    scraper._record_url_failure(url)
+                    scraper._record_segment_failure(url)
+                    if self._skip_after_n(url):
+                        return None
+                    if self.session_broker is not None:
+                        # The refresh drives Chrome, so it queues with the Selenium fallbacks
+                        refreshed = await asyncio.get_running_loop().run_in_executor(
+                            self._browser_executor, self.session_broker.refresh, session_version)
+                        self.stats['session_refreshes'] += int(refreshed)
+                    continue
+
+                details = await asyncio.get_running_loop().run_in_executor(
+                    self._parse_executor, scraper.extract_property_details, url, page_source)
+                if details.get('title') or details.get('price'):
+                    self.stats['http_successes'] += 1
+                    self.logger.info(f"   ✅ Successfully scraped: {details.get('title', 'N/A')[:50]}")
+                    return details
+
+                # Served, but the data is rendered by JavaScript
+                needs_browser = True
+                break
+
+        if not self.browser_fallback:
+            return None
+        self.logger.info(f"   [ASYNC-PDP] {'Page needs JavaScript' if needs_browser else 'HTTP attempts exhausted'}"
+                         f" - using browser for {url}")
+        self.stats['browser_fallbacks'] += 1
+        details = await asyncio.get_running_loop().run_in_executor(
+            self._browser_executor, scraper._scrape_single_property_enhanced, url, session_id)
+        if details:
+            self.stats['browser_successes'] += 1
+        return details
+
+    async def _wait_for_segment(self, segment: str):
+        """Segment cooldown (capped per attempt) plus the shared pacer's token-bucket reservation"""
+        wait = 0.0
+        cooldown = self.scraper.segment_cooldowns.get(segment, 0) - time.time() if segment else 0
+        if cooldown > 0:
+            self.logger.info(f"   [SEGMENT-PAUSE] {segment} cooling for {cooldown:.0f}s")
+            wait = min(cooldown, MAX_SEGMENT_PAUSE)
+        if self.scraper.pacer is not None:
+            wait = max(wait, self.scraper.pacer.reserve(segment))
+        if wait > 0:
+            self.stats['segment_wait_seconds'] += wait
+            await asyncio.sleep(wait)
+
+    def _skip_after_n(self, url: str) -> bool:
+        failures = self.scraper.url_failures.get(url, 0)
+        if failures >= self.scraper.max_url_failures:
+            self.logger.warning(f"   🚫 Skip-after-N for {url} (failures={failures})")
+            self.stats['skipped_after_n'] += 1
+            return True
+        return False
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Fetch outcomes, fallbacks and throughput (pages scraped per minute)"""
+        stats = dict(self.stats)
+        scraped = stats['http_successes'] + stats['browser_successes']
+        elapsed = stats['elapsed_seconds']
+        stats['pages_per_minute'] = round(scraped / elapsed * 60, 1) if elapsed else 0.0
+        stats['segment_wait_seconds'] = round(stats['segment_wait_seconds'], 3)
+        stats['elapsed_seconds'] = round(elapsed, 3)
+        return stats
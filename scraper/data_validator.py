@@ -5,10 +5,11 @@ Handles property data validation, cleaning, and filtering.
 Extracted from integrated_magicbricks_scraper.py for better maintainability.
 """
 
-import re
 import logging
 from typing import Dict, List, Any, Optional
 
+from .regex_registry import DIGITS, DECIMAL_NUMBER, PRICE_NOISE
+
 
 class DataValidator:
     """
@@ -103,9 +104,9 @@ class DataValidator:
                 value = cleaned_data.get(field, '')
                 if value and isinstance(value, str):
                     # Extract numeric value
-                    numbers = re.findall(r'\d+', value)
-                    if numbers:
-                        cleaned_data[field] = numbers[0]
+                    number = DIGITS.search(value)
+                    if number:
+                        cleaned_data[field] = number.group()
             
             # Clean and validate posting date
             posting_date = cleaned_data.get('posting_date_text', '').strip()
@@ -238,21 +239,20 @@ class DataValidator:
         """
         
         # Remove common currency symbols and text
-        price_text = re.sub(r'[₹,\s]', '', price_text)
+        price_text = PRICE_NOISE.sub('', price_text)
         
-        # Extract numbers and handle units (lakh, crore)
-        if 'crore' in price_text.lower():
-            numbers = re.findall(r'(\d+\.?\d*)', price_text)
-            if numbers:
-                return float(numbers[0]) * 10000000  # Convert crores to actual value
-        elif 'lakh' in price_text.lower():
-            numbers = re.findall(r'(\d+\.?\d*)', price_text)
-            if numbers:
-                return float(numbers[0]) * 100000  # Convert lakhs to actual value
+        # Extract the first number and handle units (lakh, crore)
+        number = DECIMAL_NUMBER.search(price_text)
+        price_lower = price_text.lower()
+        if 'crore' in price_lower:
+            if number:
+                return float(number.group(1)) * 10000000  # Convert crores to actual value
+        elif 'lakh' in price_lower:
+            if number:
+                return float(number.group(1)) * 100000  # Convert lakhs to actual value
         else:
-            numbers = re.findall(r'(\d+\.?\d*)', price_text)
-            if numbers:
-                return float(numbers[0])
+            if number:
+                return float(number.group(1))
         
         return None
     
@@ -267,10 +267,10 @@ class DataValidator:
             Numeric area value or None
         """
         
-        # Extract numbers from area text
-        numbers = re.findall(r'(\d+\.?\d*)', area_text)
-        if numbers:
-            return float(numbers[0])
+        # Extract the first number from area text
+        number = DECIMAL_NUMBER.search(area_text)
+        if number:
+            return float(number.group(1))
         
         return None
     
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+DOM Card Extractor Module
+Single-pass listing card extraction inside the browser.
+Runs one script against the already-built DOM and returns raw card fields as JSON,
+avoiding page_source serialisation and a Python re-parse of the whole document.
+The returned fields match PropertyExtractor.collect_card_fields.
+"""
+
+import time
+import logging
+from typing import Dict, List, Any, Optional
+
+
+# arguments[0]: card selectors in priority order
+# arguments[1]: broad fallback card selector
+# arguments[2]: minimum card count for a priority selector to be accepted
+# arguments[3]: field spec from PropertyExtractor.get_card_field_spec()
+CARD_EXTRACTION_JS = r"""
+const cardSelectors = arguments[0] || [];
+const fallbackSelector = arguments[1];
+const minCards = arguments[2] || 1;
+const spec = arguments[3];
+
+// Equivalent of BeautifulSoup get_text(strip=True): stripped text nodes joined with ''
+function stripText(el) {
+    if (!el) { return null; }
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let out = '';
+    let node;
+    while ((node = walker.nextNode())) {
+        const t = node.nodeValue.trim();
+        if (t) { out += t; }
+    }
+    return out;
+}
+function one(root, sel) {
+    try { return root.querySelector(sel); } catch (e) { return null; }
+}
+function all(root, sel) {
+    try { return Array.from(root.querySelectorAll(sel)); } catch (e) { return []; }
+}
+function firstTexts(root, sels) {
+    return (sels || []).map(s => { const el = one(root, s); return el ? stripText(el) : null; });
+}
+function allTexts(root, sels) {
+    const out = [];
+    for (const s of (sels || [])) { for (const el of all(root, s)) { out.push(stripText(el)); } }
+    return out;
+}
+function summaryMap(root) {
+    const map = [];
+    for (const item of all(root, spec.summary_item)) {
+        const label = one(item, spec.summary_label);
+        const value = one(item, spec.summary_value);
+        if (!label || !value) { continue; }
+        const labelText = stripText(label);
+        if (labelText && !map.some(e => e[0] === labelText)) { map.push([labelText, stripText(value)]); }
+    }
+    return map;
+}
+function structuredValue(root, label, summary) {
+    const needle = label.toLowerCase();
+    for (const [summaryLabel, value] of summary) {
+        if (summaryLabel.toLowerCase().indexOf(needle) !== -1 && value && value !== label) { return value; }
+    }
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        if (!node.nodeValue || node.nodeValue.toLowerCase().indexOf(needle) === -1) { continue; }
+        const parent = node.parentElement;
+        if (!parent) { continue; }
+        const sibling = parent.nextElementSibling;
+        if (sibling) {
+            const value = stripText(sibling);
+            if (value && value !== label) { return value; }
+        }
+        const parentText = stripText(parent);
+        if (parentText.indexOf(':') !== -1) {
+            const value = parentText.split(':')[1].trim();
+            if (value) { return value; }
+        }
+    }
+    return '';
+}
+
+let cards = [];
+let matched = null;
+for (const sel of cardSelectors) {
+    const found = all(document, sel);
+    if (found.length >= minCards) { cards = found; matched = sel; break; }
+}
+if (!cards.length && fallbackSelector) {
+    cards = all(document, fallbackSelector);
+    matched = cards.length ? fallbackSelector : null;
+}
+
+const out = [];
+for (const card of cards) {
+    const summary = summaryMap(card);
+    const structured = {};
+    for (const label of spec.structured_fields) { structured[label] = structuredValue(card, label, summary); }
+    const statusCandidates = [];
+    for (const s of spec.status) {
+        for (const el of all(card, s)) {
+            statusCandidates.push([stripText(el), el.parentElement ? stripText(el.parentElement) : '']);
+        }
+    }
+    const summaryTitle = one(card, spec.summary_title);
+    const mbLink = one(card, spec.magicbricks_link);
+    out.push({
+        classes: Array.from(card.classList),
+        card_text: card.textContent || '',
+        summary: Object.fromEntries(summary),
+        title_candidates: firstTexts(card, spec.title),
+        price_candidates: firstTexts(card, spec.price),
+        area_candidates: firstTexts(card, spec.area),
+        url_candidates: (spec.url || []).map(s => { const el = one(card, s); return el ? el.getAttribute('href') : null; }),
+        all_hrefs: all(card, 'a[href]').map(a => a.getAttribute('href') || ''),
+        posting_date_candidates: firstTexts(card, spec.posting_date),
+        photo_count_candidates: firstTexts(card, spec.photo_count),
+        owner_name_candidates: firstTexts(card, spec.owner_name),
+        structured: structured,
+        status_candidates: statusCandidates,
+        area_type_texts: allTexts(card, spec.area_types),
+        summary_title_text: summaryTitle ? summaryTitle.textContent : null,
+        title_context: stripText(one(card, spec.title_context)),
+        locality_candidates: allTexts(card, spec.locality),
+        society_candidates: allTexts(card, spec.society),
+        magicbricks_href: mbLink ? (mbLink.getAttribute('href') || '') : null,
+        contact_texts: allTexts(card, spec.contact),
+        paragraphs: all(card, 'p').map(p => stripText(p))
+    });
+}
+return {selector: matched, cards: out};
+"""
+
+
+class DomCardExtractor:
+    """
+    Extract raw listing card fields with one execute_script call per page
+    """
+
+    def __init__(self, field_spec: Dict[str, Any], card_selectors: List[str],
+                 fallback_selector: str, min_cards: int = 5, logger=None):
+        """
+        Initialize DOM card extractor
+
+        Args:
+            field_spec: Selector groups from PropertyExtractor.get_card_field_spec()
+            card_selectors: Card selectors in priority order
+            fallback_selector: Broad selector used when no priority selector reaches min_cards
+            min_cards: Minimum cards for a priority selector to be accepted
+            logger: Logger instance
+        """
+        self.field_spec = field_spec
+        self.card_selectors = card_selectors
+        self.fallback_selector = fallback_selector
+        self.min_cards = min_cards
+        self.logger = logger or logging.getLogger(__name__)
+
+        # Extraction statistics
+        self.stats = {
+            'pages': 0,
+            'cards': 0,
+            'fallbacks': 0,
+            'script_seconds': 0.0
+        }
+
+    def extract_cards(self, driver) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run the extraction script in the current page
+
+        Returns:
+            List of raw card field dicts, or None when the caller should fall back
+            to the BeautifulSoup engine (script error or no cards found)
+        """
+        start = time.time()
+        try:
+            result = driver.execute_script(
+                CARD_EXTRACTION_JS, self.card_selectors, self.fallback_selector,
+                self.min_cards, self.field_spec
+            )
+        except Exception as e:
+            self.stats['fallbacks'] += 1
+            self.logger.warning(f"DOM card extraction failed, falling back to HTML parse: {e}")
+            return None
+        finally:
+            self.stats['script_seconds'] += time.time() - start
+
+        cards = (result or {}).get('cards') or []
+        if not cards:
+            self.stats['fallbacks'] += 1
+            return None
+
+        self.stats['pages'] += 1
+        self.stats['cards'] += len(cards)
+        print(f"   [TARGET] Found {len(cards)} properties using selector: {result.get('selector')} (DOM)")
+        return cards
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get DOM extraction statistics"""
+        stats = dict(self.stats)
+        stats['avg_script_seconds'] = round(stats['script_seconds'] / stats['pages'], 4) if stats['pages'] else 0.0
+        return stats
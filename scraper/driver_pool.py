@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Driver Pool Module
+Maintains N independent Selenium sessions for individual property (PDP) scraping
+and, as a pre-warmed pool, for whole city scrapes. Each member owns its driver,
+lock and restart lifecycle so a restart never stalls the other workers. Members
+are health-checked when leased and recycled by age, page count or memory once
+they come back, off the lease path.
+"""
+
+import time
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PooledDriver:
+    """
+    One pool member: a WebDriver plus its own lock and lifecycle counters
+    """
+
+    def __init__(self, index: int, driver: Any):
+        self.index = index
+        self.driver = driver
+        self.lock = threading.Lock()
+        self.created_at = time.time()
+        self.pages_served = 0
+        self.restarts = 0
+
+    @property
+    def session_id(self) -> str:
+        return str(getattr(self.driver, 'session_id', 'unknown') if self.driver else 'none')
+
+
+class DriverPool:
+    """
+    Pool of WebDriver sessions leased one URL at a time (lease) or for a whole
+    city scrape (acquire/release)
+    """
+
+    def __init__(self, driver_factory: Callable[[], Any], size: int = 4, logger=None,
+                 max_age_seconds: Optional[float] = None, max_pages: Optional[int] = None,
+                 max_memory_mb: Optional[float] = None,
+                 memory_probe: Optional[Callable[[PooledDriver], Optional[float]]] = None,
+                 on_recycle: Optional[Callable[[str, str, float, bool], None]] = None,
+                 reset_session: Optional[Callable[[Any], None]] = None):
+        """
+        Initialize driver pool
+
+        Args:
+            driver_factory: Callable returning a fully configured WebDriver
+                (IntegratedMagicBricksScraper._create_driver)
+            size: Number of independent browser sessions
+            logger: Logger instance
+            max_age_seconds: Recycle a member older than this when it is released
+            max_pages: Recycle a member after serving this many pages
+            max_memory_mb: Recycle a member whose memory_probe reading exceeds this
+            memory_probe: Callable returning a member's memory use in MB (None if unknown)
+            on_recycle: Called with (old session id, reason, seconds, success) after a recycle
+            reset_session: Clears a released driver's cookies and site storage before the
+                next acquire (SessionRecovery.soft_reset); a member it fails on is relaunched
+        """
+        self.driver_factory = driver_factory
+        self.size = max(1, int(size))
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_age_seconds = max_age_seconds
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.memory_probe = memory_probe
+        self.on_recycle = on_recycle
+        self.reset_session = reset_session
+        self.members: List[PooledDriver] = []
+        self._available: "queue.Queue[PooledDriver]" = queue.Queue()
+        self._closed = False
+        self._launching = 0
+        self._launch_thread: Optional[threading.Thread] = None
+
+        # Pool statistics
+        self.pool_stats = {
+            'leases': 0,
+            'lease_wait_seconds': 0.0,
+            'restarts': 0,
+            'failed_launches': 0,
+            'launch_seconds': 0.0,
+            'health_check_failures': 0,
+            'dropped_members': 0,
+            'session_resets': 0,
+            'recycles': {}
+        }
+        self._stats_lock = threading.Lock()
+
+    def start(self, wait: bool = True) -> int:
+        """
+        Launch all pool members in parallel
+
+        Args:
+            wait: Block until every launch finished; with False the sessions warm
+                up in the background and each becomes leasable once it is ready
+
+        Returns:
+            Number of sessions that started successfully (0 when not waiting)
+        """
+        with self._stats_lock:
+            self._launching = self.size
+
+        def launch(index: int) -> Optional[PooledDriver]:
+            launch_start = time.time()
+            try:
+                member = PooledDriver(index, self.driver_factory())
+            except Exception as e:
+                self.logger.error(f"[DRIVER-POOL] Failed to launch member {index}: {e}")
+                member = None
+            with self._stats_lock:
+                self._launching -= 1
+                self.pool_stats['launch_seconds'] += time.time() - launch_start
+                if member is None:
+                    self.pool_stats['failed_launches'] += 1
+                elif not self._closed:
+                    self.members.append(member)
+            if member is not None:
+                if self._closed:
+                    self._quit(member)
+                else:
+                    self._available.put(member)
+            return member
+
+        def launch_all():
+            with ThreadPoolExecutor(max_workers=self.size) as executor:
+                list(executor.map(launch, range(self.size)))
+            self.logger.info(f"[DRIVER-POOL] Started {len(self.members)}/{self.size} browser sessions")
+
+        if not wait:
+            self._launch_thread = threading.Thread(target=launch_all, name='driver-pool-warmup', daemon=True)
+            self._launch_thread.start()
+            return 0
+
+        launch_all()
+        return len(self.members)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> int:
+        """Wait for a background start to finish; returns the number of running sessions"""
+        if self._launch_thread is not None:
+            self._launch_thread.join(timeout)
+        return len(self.members)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Take one healthy member exclusively until release()
+
+        Args:
+            timeout: Seconds to wait for a free member (None waits forever)
+
+        Returns:
+            PooledDriver instance (its driver passed the health check or was relaunched)
+
+        Raises:
+            queue.Empty: No member became free within `timeout`
+            RuntimeError: The pool has no running sessions left
+        """
+        wait_start = time.time()
+        while True:
+            member = self._take(wait_start, timeout)
+            if self._is_healthy(member):
+                break
+            with self._stats_lock:
+                self.pool_stats['health_check_failures'] += 1
+            self.logger.warning(f"[DRIVER-POOL] Member {member.index} failed its health check")
+            if self.restart_member(member):
+                break
+            # No session to lease: drop the member and take the next one
+            self._drop(member)
+        with self._stats_lock:
+            self.pool_stats['leases'] += 1
+            self.pool_stats['lease_wait_seconds'] += time.time() - wait_start
+        return member
+
+    def _take(self, wait_start: float, timeout: Optional[float]) -> PooledDriver:
+        """Next free member, waiting at most until wait_start + timeout"""
+        while True:
+            # Poll so a background start whose launches all fail cannot leave callers waiting forever
+            with self._stats_lock:
+                if not self.members and not self._launching:
+                    raise RuntimeError("Driver pool has no running sessions")
+            poll = 0.5 if timeout is None else min(0.5, wait_start + timeout - time.time())
+            try:
+                return self._available.get(timeout=max(0.0, poll))
+            except queue.Empty:
+                if timeout is not None and time.time() - wait_start >= timeout:
+                    raise
+
+    def _drop(self, member: PooledDriver):
+        """Remove a member whose relaunch failed; the pool runs one session short"""
+        with self._stats_lock:
+            if member in self.members:
+                self.members.remove(member)
+            self.pool_stats['dropped_members'] += 1
+        with member.lock:
+            self._quit(member)
+        self.logger.error(f"[DRIVER-POOL] Dropped member {member.index}: relaunch failed "
+                          f"({len(self.members)}/{self.size} sessions left)")
+
+    def release(self, member: PooledDriver, pages: int = 1):
+        """
+        Return a member to the pool after it served `pages` pages
+
+        A member due for recycling is relaunched in the background and only
+        becomes leasable again once its new session is up. With reset_session,
+        any other member is first cleared of the previous holder's cookies and
+        storage, also in the background.
+        """
+        member.pages_served += pages
+        if self._closed:
+            return
+        reason = self._recycle_reason(member)
+        if reason is None:
+            if self.reset_session is None:
+                self._available.put(member)
+            else:
+                threading.Thread(target=self._reset, args=(member,),
+                                 name=f"driver-pool-reset-{member.index}", daemon=True).start()
+            return
+
+        self.logger.info(f"[DRIVER-POOL] Recycling member {member.index} ({reason}, "
+                         f"{member.pages_served} pages, {time.time() - member.created_at:.0f}s old)")
+        with self._stats_lock:
+            self.pool_stats['recycles'][reason] = self.pool_stats['recycles'].get(reason, 0) + 1
+
+        old_session = member.session_id
+
+        def recycle():
+            start = time.time()
+            relaunched = self.restart_member(member)
+            if relaunched:
+                member.pages_served = 0
+            if self.on_recycle is not None:
+                self.on_recycle(old_session, reason, time.time() - start, relaunched)
+            if self._closed:
+                self._quit(member)
+            else:
+                self._available.put(member)
+
+        threading.Thread(target=recycle, name=f"driver-pool-recycle-{member.index}", daemon=True).start()
+
+    def _reset(self, member: PooledDriver):
+        """Clear a released member's session state, relaunching it if that fails"""
+        try:
+            with member.lock:
+                self.reset_session(member.driver)
+            with self._stats_lock:
+                self.pool_stats['session_resets'] += 1
+        except Exception as e:
+            self.logger.warning(f"[DRIVER-POOL] Session reset of member {member.index} failed "
+                                f"({type(e).__name__}) - relaunching it")
+            # A failed relaunch is caught by the health check on the next acquire
+            self.restart_member(member)
+        if self._closed:
+            self._quit(member)
+        else:
+            self._available.put(member)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """
+        Lease one member exclusively for the duration of the block
+
+        Args:
+            timeout: Seconds to wait for a free member (None waits forever)
+
+        Yields:
+            PooledDriver instance
+        """
+        member = self.acquire(timeout)
+        try:
+            yield member
+        finally:
+            self.release(member)
+
+    def _is_healthy(self, member: PooledDriver) -> bool:
+        """Cheap liveness check: one WebDriver round trip, no navigation"""
+        if member.driver is None:
+            return False
+        try:
+            member.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _recycle_reason(self, member: PooledDriver) -> Optional[str]:
+        """Which recycle limit a member crossed, if any"""
+        if self.max_pages and member.pages_served >= self.max_pages:
+            return 'pages'
+        if self.max_age_seconds and time.time() - member.created_at >= self.max_age_seconds:
+            return 'age'
+        if self.max_memory_mb and self.memory_probe is not None:
+            try:
+                memory_mb = self.memory_probe(member)
+            except Exception:
+                memory_mb = None
+            if memory_mb is not None and memory_mb >= self.max_memory_mb:
+                return 'memory'
+        return None
+
+    def restart_member(self, member: PooledDriver) -> bool:
+        """
+        Replace the driver of a single member, leaving the rest of the pool untouched
+
+        Args:
+            member: Pool member to restart (normally the one currently leased)
+
+        Returns:
+            True if a new session was created
+        """
+        old_session = member.session_id
+        self.logger.info(f"[DRIVER-POOL] Restarting member {member.index} (old session: {old_session[:16]}...)")
+        with member.lock:
+            try:
+                if member.driver:
+                    member.driver.quit()
+            except Exception:
+                pass
+            member.driver = None
+            try:
+                member.driver = self.driver_factory()
+            except Exception as e:
+                self.logger.error(f"[DRIVER-POOL] Member {member.index} restart failed: {e}")
+                return False
+            member.created_at = time.time()
+            member.restarts += 1
+        with self._stats_lock:
+            self.pool_stats['restarts'] += 1
+        self.logger.info(f"[DRIVER-POOL] Member {member.index} new session: {member.session_id[:16]}...")
+        return True
+
+    def _quit(self, member: PooledDriver):
+        try:
+            if member.driver:
+                member.driver.quit()
+        except Exception:
+            pass
+        member.driver = None
+
+    def close(self):
+        """Quit every pooled driver (sessions still launching are quit as they come up)"""
+        with self._stats_lock:
+            self._closed = True
+            members, self.members = self.members, []
+        for member in members:
+            with member.lock:
+                self._quit(member)
+        self.logger.info("[DRIVER-POOL] All pooled sessions closed")
+
+    def get_pool_statistics(self) -> Dict[str, Any]:
+        """Get pool usage statistics"""
+        with self._stats_lock:
+            stats = dict(self.pool_stats)
+            stats['recycles'] = dict(self.pool_stats['recycles'])
+        stats['size'] = len(self.members)
+        stats['pages_per_member'] = {m.index: m.pages_served for m in self.members}
+        stats['avg_lease_wait_seconds'] = (
+            stats['lease_wait_seconds'] / stats['leases'] if stats['leases'] else 0.0
+        )
+        return stats
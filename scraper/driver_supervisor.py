@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Driver Supervisor Module
+Tracks browser memory and triggers relaunches before it gets out of hand.
+Every N pages the RSS of a driver's process tree (chromedriver, Chrome and its
+renderers) is sampled with psutil; when it crosses the limit, or the session
+has served its page budget, the caller recycles the browser at a safe point
+between URLs. Samples and recycle events also go to a PerformanceProfiler.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import psutil
+
+
+def process_tree_rss_mb(driver) -> Optional[float]:
+    """RSS of the chromedriver process and all its descendants in MB (None if unknown)"""
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
+
+
+def session_key(driver) -> str:
+    return str(getattr(driver, 'session_id', None) or id(driver))
+
+
+class DriverSupervisor:
+    """
+    Per-session page counting, periodic RSS sampling and recycle bookkeeping
+    """
+
+    def __init__(self, sample_every: int = 10, max_rss_mb: Optional[float] = None,
+                 max_pages: Optional[int] = None, profiler=None, max_samples: int = 1000, logger=None):
+        """
+        Initialize driver supervisor
+
+        Args:
+            sample_every: Pages between RSS samples of one session
+            max_rss_mb: Recycle a session whose process tree RSS reaches this (None disables)
+            max_pages: Recycle a session after this many pages (None disables)
+            profiler: PerformanceProfiler receiving the memory curve and recycle events
+            max_samples: Memory curve points kept
+            logger: Logger instance
+        """
+        self.sample_every = max(1, int(sample_every))
+        self.max_rss_mb = max_rss_mb
+        self.max_pages = max_pages
+        self.profiler = profiler
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.memory_probe_fn = process_tree_rss_mb
+        self._pages: Dict[str, int] = {}
+        self._sampled_at: Dict[str, int] = {}
+        self._last_rss: Dict[str, float] = {}
+        self.memory_curve: Deque[Dict[str, Any]] = deque(maxlen=max_samples)
+        self.recycle_events: List[Dict[str, Any]] = []
+        self.peak_rss_mb = 0.0
+        self._lock = threading.Lock()
+
+    def page_done(self, driver) -> Optional[str]:
+        """
+        Count one page served by a driver and sample its memory when due
+
+        Returns:
+            'pages' or 'memory' when the session should be recycled now, else None
+        """
+        key = session_key(driver)
+        with self._lock:
+            pages = self._pages.get(key, 0) + 1
+            self._pages[key] = pages
+        if self.max_pages and pages >= self.max_pages:
+            return 'pages'
+        if pages - self._sampled_at.get(key, 0) >= self.sample_every:
+            rss = self.sample(driver, pages)
+            if rss is not None and self.max_rss_mb and rss >= self.max_rss_mb:
+                return 'memory'
+        return None
+
+    def sample(self, driver, pages: Optional[int] = None) -> Optional[float]:
+        """Measure a driver's process tree RSS and add it to the memory curve"""
+        key = session_key(driver)
+        rss = self.memory_probe_fn(driver)
+        with self._lock:
+            pages = self._pages.get(key, 0) if pages is None else pages
+            self._sampled_at[key] = pages
+            if rss is None:
+                return None
+            self._last_rss[key] = rss
+            self.peak_rss_mb = max(self.peak_rss_mb, rss)
+            self.memory_curve.append({'time': time.time(), 'session': key[:16], 'pages': pages,
+                                      'rss_mb': round(rss, 1)})
+        if self.profiler is not None:
+            self.profiler.record_sample('driver_rss_mb', rss)
+        return rss
+
+    def memory_probe(self, member) -> Optional[float]:
+        """DriverPool memory_probe: RSS of a pool member, re-sampled every sample_every pages"""
+        key = session_key(member.driver)
+        with self._lock:
+            self._pages[key] = member.pages_served
+            due = member.pages_served - self._sampled_at.get(key, 0) >= self.sample_every
+        if due:
+            return self.sample(member.driver, member.pages_served)
+        with self._lock:
+            return self._last_rss.get(key)
+
+    def record_recycle(self, driver_or_key, reason: str, seconds: float = 0.0, success: bool = True):
+        """Record a recycle event and forget the old session's counters"""
+        key = driver_or_key if isinstance(driver_or_key, str) else session_key(driver_or_key)
+        with self._lock:
+            event = {
+                'time': time.time(),
+                'session': key[:16],
+                'reason': reason,
+                'pages': self._pages.pop(key, 0),
+                'rss_mb': round(self._last_rss.pop(key, 0.0), 1) or None,
+                'seconds': round(seconds, 3),
+                'success': success
+            }
+            self._sampled_at.pop(key, None)
+            self.recycle_events.append(event)
+        self.logger.info(f"[MEMORY] Recycled browser ({reason}: {event['pages']} pages, "
+                         f"{event['rss_mb'] or '?'} MB) in {seconds:.1f}s")
+        if self.profiler is not None:
+            self.profiler.increment_counter(f"driver_recycles_{reason}")
+            self.profiler.record_timing('driver_recycle', seconds)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Memory curve, peak RSS and recycle events"""
+        with self._lock:
+            recycles: Dict[str, int] = {}
+            for event in self.recycle_events:
+                recycles[event['reason']] = recycles.get(event['reason'], 0) + 1
+            curve = list(self.memory_curve)
+            return {
+                'samples': len(curve),
+                'peak_rss_mb': round(self.peak_rss_mb, 1),
+                'last_rss_mb': curve[-1]['rss_mb'] if curve else None,
+                'recycles': recycles,
+                'recycle_events': list(self.recycle_events),
+                'memory_curve': curve
+            }
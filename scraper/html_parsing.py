@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+HTML Parsing Module
+Pluggable parser backends for listing and property detail pages.
+
+Engines:
+    html.parser  - BeautifulSoup with the stdlib parser (slowest, no dependencies)
+    lxml         - BeautifulSoup with the lxml tree builder
+    lxml-native  - lxml.html + cssselect, wrapped in LxmlNode so extractors keep
+                   using the BeautifulSoup calls they already make
+"""
+
+import time
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+# lxml imports with fallback
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+PARSER_ENGINES = ('html.parser', 'lxml', 'lxml-native')
+DEFAULT_PARSER_ENGINE = 'html.parser'
+
+# Elements whose text BeautifulSoup leaves out of get_text()
+NON_TEXT_ELEMENTS = ('script', 'style', 'template')
+
+# Attributes BeautifulSoup returns as lists
+MULTI_VALUED_ATTRIBUTES = ('class', 'rel', 'rev', 'accept-charset', 'headers', 'accesskey', 'dropzone')
+
+_selector_cache: Dict[str, Any] = {}
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_parser_engine(engine: Optional[str]) -> str:
+    """Validate a configured engine name, falling back to html.parser when lxml is missing"""
+    engine = engine or DEFAULT_PARSER_ENGINE
+    if engine not in PARSER_ENGINES:
+        raise ValueError(f"Unknown parser engine '{engine}'. Choose from: {', '.join(PARSER_ENGINES)}")
+    if engine != 'html.parser' and not LXML_AVAILABLE:
+        logger.warning(f"Parser engine '{engine}' needs lxml and cssselect - using html.parser")
+        return 'html.parser'
+    return engine
+
+
+def parse_html(markup: str, engine: str = DEFAULT_PARSER_ENGINE):
+    """
+    Parse markup with the requested engine
+
+    Returns:
+        BeautifulSoup for html.parser/lxml, LxmlNode for lxml-native
+    """
+    if engine == 'lxml-native':
+        if not markup or not markup.strip():
+            return BeautifulSoup(markup or '', 'lxml')
+        return LxmlNode(lxml.html.document_fromstring(markup))
+    return BeautifulSoup(markup, engine)
+
+
+def _compiled(selector: str):
+    compiled = _selector_cache.get(selector)
+    if compiled is None:
+        compiled = CSSSelector(selector, translator='html')
+        _selector_cache[selector] = compiled
+    return compiled
+
+
+def _is_element(node) -> bool:
+    return isinstance(node.tag, str)
+
+
+class LxmlString(str):
+    """Text node result from LxmlNode.find_all(string=...); carries .parent like NavigableString"""
+
+    parent: Optional['LxmlNode'] = None
+
+
+class LxmlNode:
+    """
+    Minimal BeautifulSoup Tag interface over an lxml element
+
+    Covers what PropertyExtractor uses: select, select_one, get_text, get, parent,
+    find_all and find_next_sibling, with BeautifulSoup semantics (select matches
+    descendants only, class is a list, get_text skips comments).
+    """
+
+    __slots__ = ('el',)
+
+    def __init__(self, el):
+        self.el = el
+
+    @property
+    def name(self) -> str:
+        return self.el.tag
+
+    @property
+    def parent(self) -> Optional['LxmlNode']:
+        parent = self.el.getparent()
+        return LxmlNode(parent) if parent is not None else None
+
+    def __eq__(self, other):
+        return isinstance(other, LxmlNode) and other.el is self.el
+
+    def __hash__(self):
+        return hash(self.el)
+
+    def __repr__(self):
+        return f"<LxmlNode {self.el.tag}>"
+
+    # ---- selectors ----
+
+    def select(self, selector: str) -> List['LxmlNode']:
+        el = self.el
+        return [LxmlNode(match) for match in _compiled(selector)(el) if match is not el]
+
+    def select_one(self, selector: str) -> Optional['LxmlNode']:
+        el = self.el
+        for match in _compiled(selector)(el):
+            if match is not el:
+                return LxmlNode(match)
+        return None
+
+    # ---- attributes ----
+
+    def get(self, key: str, default=None):
+        value = self.el.get(key)
+        if value is None:
+            return default
+        if key in MULTI_VALUED_ATTRIBUTES:
+            return value.split()
+        return value
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    # ---- text ----
+
+    def _iter_strings(self, include_hidden: bool = False) -> Iterator[LxmlString]:
+        """
+        Text nodes in document order (element text and tails)
+
+        get_text() skips comments and script/style contents; find_all(string=...)
+        sees every string, which include_hidden reproduces.
+        """
+        stack = [(self.el, False)]
+        while stack:
+            node, tail_only = stack.pop()
+            if tail_only:
+                if node.tail and node is not self.el:
+                    text = LxmlString(node.tail)
+                    parent = node.getparent()
+                    text.parent = LxmlNode(parent) if parent is not None else None
+                    yield text
+                continue
+            # Tail comes after the node's own subtree
+            stack.append((node, True))
+            if not _is_element(node):
+                if include_hidden and node.text:
+                    text = LxmlString(node.text)
+                    text.parent = self.parent if node is self.el else LxmlNode(node.getparent())
+                    yield text
+                continue
+            if node.text and (include_hidden or node.tag not in NON_TEXT_ELEMENTS):
+                text = LxmlString(node.text)
+                text.parent = LxmlNode(node)
+                yield text
+            for child in reversed(node):
+                stack.append((child, False))
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        if strip:
+            return separator.join(s.strip() for s in self._iter_strings() if s.strip())
+        return separator.join(self._iter_strings())
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    # ---- navigation ----
+
+    def find_all(self, name: Union[str, List[str], None] = None, class_=None,
+                 string: Optional[Callable[[str], bool]] = None, **kwargs) -> List[Any]:
+        if string is not None:
+            return [s for s in self._iter_strings(include_hidden=True) if string(s)]
+
+        names = {name} if isinstance(name, str) else set(name) if name else None
+        results = []
+        for node in self.el.iterdescendants():
+            if not _is_element(node):
+                continue
+            if names and node.tag not in names:
+                continue
+            if class_ is not None and not self._class_matches(node, class_):
+                continue
+            results.append(LxmlNode(node))
+        return results
+
+    @staticmethod
+    def _class_matches(node, class_) -> bool:
+        classes = (node.get('class') or '').split()
+        if not classes:
+            return False
+        if hasattr(class_, 'search'):
+            return any(class_.search(c) for c in classes) or bool(class_.search(' '.join(classes)))
+        return class_ in classes or class_ == ' '.join(classes)
+
+    def find_next_sibling(self) -> Optional['LxmlNode']:
+        sibling = self.el.getnext()
+        while sibling is not None and not _is_element(sibling):
+            sibling = sibling.getnext()
+        return LxmlNode(sibling) if sibling is not None else None
+
+
+class CompiledSelectors:
+    """
+    CSS selectors compiled once and reused across cards and pages
+
+    BeautifulSoup trees are matched with soupsieve.compile() matchers instead of
+    handing the selector string to Tag.select on every call; LxmlNode trees use
+    the cached cssselect matchers. Compile and match time are tracked so the
+    extraction statistics can show what the selectors cost.
+    """
+
+    def __init__(self, selectors: Iterable[str] = ()):
+        self._compiled: Dict[str, Any] = {}
+        self.stats = {
+            'compiled': 0,
+            'compile_seconds': 0.0,
+            'matches': 0,
+            'match_seconds': 0.0
+        }
+        self.compile_all(selectors)
+
+    def compile_all(self, selectors: Iterable[str]) -> int:
+        """Compile selectors up front; invalid ones are logged and left to fail at match time"""
+        count = 0
+        for selector in selectors:
+            try:
+                self.compile(selector)
+                count += 1
+            except Exception as e:
+                logger.warning(f"Invalid CSS selector '{selector}': {e}")
+        return count
+
+    def compile(self, selector: str):
+        """soupsieve matcher for a selector (compiled on first use, cssselect matcher warmed too)"""
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            start = time.perf_counter()
+            compiled = soupsieve.compile(selector)
+            if LXML_AVAILABLE:
+                _compiled(selector)
+            self.stats['compile_seconds'] += time.perf_counter() - start
+            self.stats['compiled'] += 1
+            self._compiled[selector] = compiled
+        return compiled
+
+    def select_one(self, node, selector: str):
+        """node.select_one(selector) with the precompiled matcher"""
+        start = time.perf_counter()
+        if isinstance(node, LxmlNode):
+            result = node.select_one(selector)
+        else:
+            result = self.compile(selector).select_one(node)
+        self.stats['match_seconds'] += time.perf_counter() - start
+        self.stats['matches'] += 1
+        return result
+
+    def select(self, node, selector: str) -> List[Any]:
+        """node.select(selector) with the precompiled matcher"""
+        start = time.perf_counter()
+        if isinstance(node, LxmlNode):
+            result = node.select(selector)
+        else:
+            result = self.compile(selector).select(node)
+        self.stats['match_seconds'] += time.perf_counter() - start
+        self.stats['matches'] += 1
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Compile time versus match time"""
+        stats = dict(self.stats)
+        stats['compile_ms'] = round(stats.pop('compile_seconds') * 1000, 2)
+        stats['match_ms'] = round(stats.pop('match_seconds') * 1000, 2)
+        stats['avg_match_us'] = round(stats['match_ms'] * 1000 / stats['matches'], 2) if stats['matches'] else 0.0
+        return stats
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+HTTP Listing Fetcher Module
+Fetches SRP listing pages over a persistent keep-alive HTTP session instead of
+a full Chrome navigation. The session (owned by a SessionBroker) sends the
+browser's realistic headers, its user agent and the cookies exported from the
+Chrome session; callers fall back to Selenium for any page the fetch cannot serve.
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from .session_broker import SessionBroker
+
+
+class HttpListingFetcher:
+    """
+    Keep-alive listing page fetcher with per-mode throughput statistics
+
+    Statistics are kept for both fetch modes ('http' and 'browser') so a run
+    reports pages per minute and bytes per page for each.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: float = 20.0,
+                 pool_size: int = 4, broker: Optional[SessionBroker] = None, logger=None):
+        """
+        Initialize HTTP listing fetcher
+
+        Args:
+            headers: Realistic request headers (the ones Chrome is configured with)
+            timeout: Per-request timeout in seconds
+            pool_size: Keep-alive connections kept per host
+            broker: Shared session broker (headers/pool_size are ignored when given)
+            logger: Logger instance
+        """
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self._owns_broker = broker is None
+        self.broker = broker or SessionBroker(headers=headers, pool_size=pool_size, logger=self.logger)
+
+        self._lock = threading.Lock()
+
+        # Fetch statistics per mode
+        self.stats = {mode: {'pages': 0, 'bytes': 0, 'seconds': 0.0} for mode in ('http', 'browser')}
+        self.stats['fallbacks'] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        return self.broker.session
+
+    @property
+    def has_cookies(self) -> bool:
+        return self.broker.has_credentials
+
+    def set_user_agent(self, user_agent: Optional[str]):
+        """Send the browser's user agent so exported cookies match the client"""
+        self.broker.set_user_agent(user_agent)
+
+    def load_cookies(self, cookies: List[Dict[str, Any]]) -> int:
+        """
+        Replace session cookies with cookies from a WebDriver (driver.get_cookies())
+
+        Returns:
+            Number of cookies loaded
+        """
+        return self.broker.load_cookies(cookies)
+
+    def fetch(self, url: str, referer: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetch one listing page
+
+        Returns:
+            {'success', 'page_source', 'url' (after redirects), 'status', 'bytes',
+            'seconds', 'session_version' (broker version the request was sent with)}
+            or {'success': False, 'error', ...} on transport/HTTP errors
+        """
+        headers = {'Referer': referer} if referer else None
+        version = self.broker.version
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            return {'success': False, 'error': f"HTTP fetch failed: {e}", 'seconds': time.perf_counter() - start}
+
+        elapsed = time.perf_counter() - start
+        result = {
+            'success': response.status_code == 200,
+            'status': response.status_code,
+            'url': response.url,
+            'page_source': response.text,
+            'bytes': len(response.content),
+            'seconds': elapsed,
+            'session_version': version
+        }
+        if not result['success']:
+            result['error'] = f"HTTP {response.status_code}"
+        return result
+
+    def record(self, mode: str, page_bytes: int, seconds: float):
+        """Record one served listing page for a fetch mode ('http' or 'browser')"""
+        with self._lock:
+            entry = self.stats[mode]
+            entry['pages'] += 1
+            entry['bytes'] += page_bytes or 0
+            entry['seconds'] += seconds
+
+    def record_fallback(self, reason: str):
+        """Count a page handed to the browser and why"""
+        with self._lock:
+            self.stats['fallbacks'][reason] = self.stats['fallbacks'].get(reason, 0) + 1
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Pages per minute (of fetch time) and bytes per page for each mode, plus fallback reasons"""
+        with self._lock:
+            report = {'fallbacks': dict(self.stats['fallbacks'])}
+            for mode in ('http', 'browser'):
+                entry = self.stats[mode]
+                pages = entry['pages']
+                report[mode] = {
+                    'pages': pages,
+                    'pages_per_minute': round(pages / entry['seconds'] * 60, 1) if entry['seconds'] else 0.0,
+                    'bytes_per_page': int(entry['bytes'] / pages) if pages else 0,
+                    'seconds': round(entry['seconds'], 3)
+                }
+            return report
+
+    def close(self):
+        if self._owns_broker:
+            self.broker.close()
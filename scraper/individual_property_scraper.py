@@ -8,8 +8,11 @@ Extracted from integrated_magicbricks_scraper.py for better maintainability.
 import time
 import random
 import logging
+import queue
 import threading
+from collections import deque
 from typing import List, Dict, Any, Optional, Callable
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
@@ -17,13 +20,19 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from .pacing import SegmentPacer
+from .session_recovery import SessionRecovery
+from .interception_policy import InterceptionPolicy
+
 
 class IndividualPropertyScraper:
     """
     Handles individual property page scraping with concurrent and sequential modes
     """
 
-    def __init__(self, driver, property_extractor, bot_handler, individual_tracker=None, logger=None, restart_callback=None):
+    def __init__(self, driver, property_extractor, bot_handler, individual_tracker=None, logger=None, restart_callback=None,
+                 driver_pool=None, pacer=None, recovery=None, supervisor=None, network_timing=None,
+                 interception=None):
         """
         Initialize individual property scraper
 
@@ -34,6 +43,12 @@ class IndividualPropertyScraper:
             individual_tracker: IndividualPropertyTracker instance (optional)
             logger: Logger instance
             restart_callback: Callable to restart the browser session (provided by parent)
+            driver_pool: DriverPool instance (optional); when set, each URL leases its own browser
+            pacer: SegmentPacer shared by concurrent workers (default: 0.5 req/s per segment, 2 req/s overall)
+            recovery: SessionRecovery choosing soft reset or full relaunch (shared with the parent)
+            supervisor: DriverSupervisor deciding when the shared driver is recycled (memory / page budget)
+            network_timing: NetworkTimingRecorder capturing one network record per PDP navigation
+            interception: InterceptionPolicy whose 'pdp' profile each driver carries (applied once per session)
         """
         self.driver = driver
         self.property_extractor = property_extractor
@@ -52,9 +67,27 @@ class IndividualPropertyScraper:
         self.last_listing_page_url: Optional[str] = None
         # P2-2: Mouse movement simulation configuration
         self.simulate_mouse_movement: bool = True  # Default enabled
-        # Thread-safe driver access for concurrent mode
-        self.driver_lock = threading.Lock()
+        # Thread-safe driver access for concurrent mode (re-entrant: a recycle holds it
+        # across the parent's relaunch, which calls update_driver)
+        self.driver_lock = threading.RLock()
+        # Set while no restart of the shared driver is in progress (see restart_requested)
+        self._restart_idle = threading.Event()
         self.restart_requested = False
+        self.restart_wait_timeout: float = 180.0  # Longest a worker waits for a relaunch to finish
+        # URLs given up only because a restart was in progress (not failures: they are requeued)
+        self.restart_aborted_urls: set = set()
+        # Multi-browser pool for concurrent mode (None = shared single driver)
+        self.driver_pool = driver_pool
+        # Continuous work queue: worker count without a pool, and shared token-bucket pacing
+        self.max_concurrent_workers: int = 4
+        self.pacer = pacer or SegmentPacer()
+        # P0-3: Declarative request blocking for PDP navigations (shared with the parent)
+        self.interception = interception or InterceptionPolicy(logger=self.logger)
+        # Tiered recovery: fresh tab + cleared storage before a full Chrome relaunch
+        # (the fresh tab has no blocked URLs yet)
+        self.recovery = recovery or SessionRecovery(prepare_tab=self.interception.forget, logger=self.logger)
+        self.supervisor = supervisor
+        self.network_timing = network_timing
 
     def scrape_individual_property_pages(self, property_urls: List[str], batch_size: int = 10,
                                         progress_callback: Optional[Callable] = None,
@@ -64,7 +97,8 @@ class IndividualPropertyScraper:
                                         session_id: Optional[int] = None,
                                         smart_filtering: bool = True,
                                         quality_threshold: float = 60.0,
-                                        ttl_days: int = 30) -> List[Dict[str, Any]]:
+                                        ttl_days: int = 30,
+                                        async_engine=None) -> List[Dict[str, Any]]:
         """
         Enhanced individual property page scraping with duplicate detection and concurrent processing
 
@@ -79,6 +113,7 @@ class IndividualPropertyScraper:
             smart_filtering: Enable smart filtering (only new/changed/missing fields)
             quality_threshold: Minimum quality score to skip re-scraping (default 60%)
             ttl_days: Time-to-live in days before re-scraping (default 30)
+            async_engine: AsyncPdpEngine fetching pages over HTTP (Selenium only as its fallback)
 
         Returns:
             List of detailed property dictionaries
@@ -93,7 +128,7 @@ class IndividualPropertyScraper:
         self.logger.info(f"{'='*60}")
         self.logger.info(f"Total URLs: {len(property_urls)}")
         self.logger.info(f"Batch Size: {batch_size}")
-        self.logger.info(f"Mode: {'Concurrent' if use_concurrent else 'Sequential'}")
+        self.logger.info(f"Mode: {'Async HTTP' if async_engine else 'Concurrent' if use_concurrent else 'Sequential'}")
         self.logger.info(f"Smart Filtering: {'Enabled' if smart_filtering else 'Disabled'}")
 
         # Apply smart filtering if enabled
@@ -117,14 +152,25 @@ class IndividualPropertyScraper:
             return []
 
         # Choose scraping method
-        if use_concurrent:
-            detailed_properties = self._scrape_individual_pages_concurrent_enhanced(
-                urls_to_scrape, batch_size, progress_callback, progress_data, session_id
-            )
-        else:
-            detailed_properties = self._scrape_individual_pages_sequential_enhanced(
-                urls_to_scrape, batch_size, progress_callback, progress_data, session_id
-            )
+        try:
+            if async_engine is not None:
+                detailed_properties = self._scrape_individual_pages_async(
+                    async_engine, urls_to_scrape, batch_size, progress_callback, progress_data, session_id
+                )
+            elif use_concurrent:
+                detailed_properties = self._scrape_individual_pages_concurrent_enhanced(
+                    urls_to_scrape, batch_size, progress_callback, progress_data, session_id
+                )
+            else:
+                detailed_properties = self._scrape_individual_pages_sequential_enhanced(
+                    urls_to_scrape, batch_size, progress_callback, progress_data, session_id
+                )
+        finally:
+            # A write-behind tracker (BufferedPropertyTracker) persists its queued marks
+            # before the caller reads them back, also when the run was aborted
+            flush = getattr(self.individual_tracker, 'flush', None)
+            if flush:
+                flush()
 
         return detailed_properties
 
@@ -157,34 +203,24 @@ class IndividualPropertyScraper:
             'skipped_good': 0
         }
 
-        if not self.individual_tracker or not self.individual_tracker.db_manager.connect_db():
-            self.logger.warning("[SMART-FILTER] Database not available, falling back to simple filtering")
-            return [url for url in property_urls if not self.individual_tracker.is_property_scraped(url, session_id)]
-
         try:
-            cursor = self.individual_tracker.db_manager.connection.cursor()
-            ttl_cutoff = datetime.now() - timedelta(days=ttl_days)
+            # One bulk lookup (temp table join) for all candidates, then a single classification pass
+            records = self.individual_tracker.lookup_scrape_records(property_urls)
+            now = datetime.now()
+            ttl_cutoff = now - timedelta(days=ttl_days)
 
             for url in property_urls:
-                normalized_url = self.individual_tracker.normalize_url(url)
-                url_hash = self.individual_tracker.generate_url_hash(normalized_url)
-
-                # Check if URL exists in database
-                cursor.execute('''
-                    SELECT scraped_at, data_quality_score, extraction_success
-                    FROM individual_properties_scraped
-                    WHERE url_hash = ? OR property_url = ?
-                ''', (url_hash, normalized_url))
-
-                result = cursor.fetchone()
+                record = records.get(url)
 
-                if result is None:
+                if record is None:
                     # Never scraped - definitely scrape it
                     urls_to_scrape.append(url)
                     stats['new'] += 1
                     self.logger.debug(f"[NEW] {url}")
                 else:
-                    scraped_at_str, quality_score, extraction_success = result
+                    scraped_at_str = record['scraped_at']
+                    quality_score = record['data_quality_score']
+                    extraction_success = record['extraction_success']
                     scraped_at = datetime.fromisoformat(scraped_at_str) if scraped_at_str else None
 
                     # Check if extraction failed previously
@@ -205,13 +241,12 @@ class IndividualPropertyScraper:
                     if scraped_at and scraped_at < ttl_cutoff:
                         urls_to_scrape.append(url)
                         stats['stale'] += 1
-                        days_old = (datetime.now() - scraped_at).days
-                        self.logger.debug(f"[STALE] {url} (age: {days_old} days)")
+                        self.logger.debug(f"[STALE] {url} (age: {(now - scraped_at).days} days)")
                         continue
 
                     # Good quality and fresh - skip it
                     stats['skipped_good'] += 1
-                    self.logger.debug(f"[SKIP-GOOD] {url} (quality: {quality_score:.1f}%, age: {(datetime.now() - scraped_at).days if scraped_at else 0} days)")
+                    self.logger.debug(f"[SKIP-GOOD] {url} (quality: {quality_score or 0:.1f}%, age: {(now - scraped_at).days if scraped_at else 0} days)")
 
             # Log summary
             self.logger.info(f"\n[SMART-FILTER] Results:")
@@ -228,77 +263,146 @@ class IndividualPropertyScraper:
             self.logger.error(f"[SMART-FILTER] Error: {e}")
             # Fall back to simple filtering
             return [url for url in property_urls if not self.individual_tracker.is_property_scraped(url, session_id)]
-        finally:
-            self.individual_tracker.db_manager.close_connection()
 
     def _scrape_individual_pages_concurrent_enhanced(self, property_urls: List[str], batch_size: int,
                                                    progress_callback: Optional[Callable] = None,
                                                    progress_data: Optional[Dict] = None,
                                                    session_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Enhanced concurrent scraping with tracking integration"""
-
-        detailed_properties = []
-        total_urls = len(property_urls)
+        """
+        Enhanced concurrent scraping with tracking integration
 
-        # Process in batches
-        for batch_start in range(0, total_urls, batch_size):
-            batch_details: List[Dict[str, Any]] = []
-            batch_end = min(batch_start + batch_size, total_urls)
-            batch_urls = property_urls[batch_start:batch_end]
+        Long-lived workers pull the next URL from a shared queue as soon as they finish,
+        so one slow page never holds up the others. Request pacing comes from the shared
+        per-segment token bucket (self.pacer) instead of inter-batch sleeps, and quality
+        metrics are emitted every `batch_size` completions over a rolling window.
+        """
 
-            self.logger.info(f"\n📦 Processing batch {batch_start//batch_size + 1}: URLs {batch_start+1}-{batch_end}")
+        detailed_properties: List[Dict[str, Any]] = []
+        results_lock = threading.Lock()
+        rolling_window: deque = deque(maxlen=max(1, batch_size))
+        completed = {'count': 0}
+        stop_event = threading.Event()
+
+        work_queue: "queue.Queue[str]" = queue.Queue()
+        for url in property_urls:
+            work_queue.put(url)
+
+        num_workers = self.driver_pool.size if self.driver_pool else self.max_concurrent_workers
+        num_workers = max(1, min(num_workers, len(property_urls)))
+        self.logger.info(f"\n📦 Work queue: {len(property_urls)} URLs, {num_workers} workers")
+
+        def worker():
+            while not stop_event.is_set():
+                # A restart of the shared driver is in progress - pull more work once it finished
+                if self.restart_requested:
+                    self.logger.info(f"[QUEUE-WAIT] Restart in progress, waiting before pulling the next URL")
+                    if not self._restart_idle.wait(self.restart_wait_timeout):
+                        self.logger.warning(f"[QUEUE-ABORT] Restart did not finish in "
+                                            f"{self.restart_wait_timeout:.0f}s, workers stop pulling URLs")
+                        stop_event.set()
+                        return
+                    continue
+                try:
+                    url = work_queue.get_nowait()
+                except queue.Empty:
+                    return
 
-            # Filter batch for cooldowns
-            candidate_urls = []
-            now = time.time()
-            for url in batch_urls:
-                if url in self.url_cooldowns and self.url_cooldowns[url] > now:
+                if url in self.url_cooldowns and self.url_cooldowns[url] > time.time():
                     self.logger.info(f"⏭️ Skipping (cooldown) {url} until {self.url_cooldowns[url]:.0f}")
                     continue
-                candidate_urls.append(url)
 
-            # Use ThreadPoolExecutor for concurrent scraping
-            with ThreadPoolExecutor(max_workers=min(4, len(candidate_urls))) as executor:
-                future_to_url = {
-                    executor.submit(self._scrape_single_property_enhanced, url, session_id): url
-                    for url in candidate_urls
-                }
+                # Shared per-segment pacing replaces batch barriers
+                self.pacer.acquire(self._segment_key_from_url(url))
 
-                for future in as_completed(future_to_url):
-                    # Check if restart was requested - abort batch if so
-                    if self.restart_requested:
-                        self.logger.warning(f"[BATCH-ABORT] Restart requested, aborting current batch")
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        return detailed_properties  # Return what we have so far
+                try:
+                    property_details = self._scrape_single_property_enhanced(url, session_id)
+                except Exception as e:
+                    self.logger.error(f"Error scraping {url}: {str(e)}")
+                    property_details = None
+
+                if not property_details:
+                    if url in self.restart_aborted_urls:
+                        # Abandoned for a driver restart, not failed: back on the queue
+                        self.restart_aborted_urls.discard(url)
+                        work_queue.put(url)
+                    elif self.individual_tracker:
+                        self.individual_tracker.mark_property_failed(url, session_id)
+                    continue
 
-                    url = future_to_url[future]
-                    try:
-                        property_details = future.result()
-                        if property_details:
-                            detailed_properties.append(property_details)
-                            batch_details.append(property_details)
+                # Mark as scraped in tracker
+                if self.individual_tracker:
+                    self.individual_tracker.mark_property_scraped(url, session_id)
 
-                            # Mark as scraped in tracker
-                            if self.individual_tracker:
-                                self.individual_tracker.mark_property_scraped(url, session_id)
+                with results_lock:
+                    detailed_properties.append(property_details)
+                    rolling_window.append(property_details)
+                    completed['count'] += 1
+                    window_snapshot = list(rolling_window) if completed['count'] % batch_size == 0 else None
 
-                            # Progress callback
-                            if progress_callback and progress_data:
-                                progress_callback(progress_data)
+                    # Progress callback
+                    if progress_callback and progress_data:
+                        progress_callback(progress_data)
 
-                    except Exception as e:
-                        self.logger.error(f"Error scraping {url}: {str(e)}")
+                # Rolling-window quality metrics
+                if window_snapshot:
+                    self._log_batch_quality_metrics(window_snapshot)
 
-            # Batch-level quality metrics
-            if batch_details:
-                self._log_batch_quality_metrics(batch_details)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(worker) for _ in range(num_workers)]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error(f"PDP worker failed: {str(e)}")
 
-            # Inter-batch delay
-            if batch_end < total_urls:
-                delay = random.uniform(3.0, 6.0)
-                self.logger.info(f"⏱️ Inter-batch delay: {delay:.1f} seconds")
-                time.sleep(delay)
+        # Flush the tail of the window that did not reach a full batch_size
+        if completed['count'] % batch_size and rolling_window:
+            self._log_batch_quality_metrics(list(rolling_window))
+
+        self.logger.info(f"[PACING] {self.pacer.get_pacing_statistics()}")
+        return detailed_properties
+
+    def _scrape_individual_pages_async(self, async_engine, property_urls: List[str], batch_size: int,
+                                       progress_callback: Optional[Callable] = None,
+                                       progress_data: Optional[Dict] = None,
+                                       session_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Asyncio scraping through AsyncPdpEngine with tracking integration
+
+        The engine bounds requests per segment and overall; results are tracked,
+        reported and quality-checked over a rolling window as they complete.
+        """
+
+        rolling_window: deque = deque(maxlen=max(1, batch_size))
+        completed = {'count': 0}
+
+        def on_result(url: str, property_details: Dict[str, Any]):
+            # Mark as scraped in tracker
+            if self.individual_tracker:
+                self.individual_tracker.mark_property_scraped(url, session_id)
+
+            rolling_window.append(property_details)
+            completed['count'] += 1
+            if completed['count'] % batch_size == 0:
+                self._log_batch_quality_metrics(list(rolling_window))
+
+            # Progress callback
+            if progress_callback and progress_data:
+                progress_callback(progress_data)
+
+        def on_failure(url: str):
+            if self.individual_tracker:
+                self.individual_tracker.mark_property_failed(url, session_id)
+
+        self.logger.info(f"\n📦 Async engine: {len(property_urls)} URLs, "
+                         f"{async_engine.max_concurrency} in flight, {async_engine.segment_concurrency} per segment")
+        detailed_properties = async_engine.run(property_urls, session_id, on_result, on_failure)
+
+        # Flush the tail of the window that did not reach a full batch_size
+        if completed['count'] % batch_size and rolling_window:
+            self._log_batch_quality_metrics(list(rolling_window))
 
+        self.logger.info(f"[ASYNC-PDP] {async_engine.get_statistics()}")
         return detailed_properties
 
     def _scrape_individual_pages_sequential_enhanced(self, property_urls: List[str], batch_size: int,
@@ -334,6 +438,10 @@ class IndividualPropertyScraper:
                     # Progress callback
                     if progress_callback and progress_data:
                         progress_callback(progress_data)
+                elif url in self.restart_aborted_urls:
+                    self.restart_aborted_urls.discard(url)
+                elif self.individual_tracker:
+                    self.individual_tracker.mark_property_failed(url, session_id)
 
                 # Emit metrics every batch_size in sequential mode
                 if (idx % batch_size) == 0 and batch_details:
@@ -369,6 +477,31 @@ class IndividualPropertyScraper:
             Property details dictionary or None if failed
         """
 
+        if self.driver_pool is None:
+            try:
+                return self._scrape_single_property_attempts(property_url, session_id, max_retries)
+            finally:
+                self._supervise_shared_driver()
+
+        # Lease a dedicated browser for this URL (all retries run on the same member)
+        with self.driver_pool.lease() as member:
+            return self._scrape_single_property_attempts(property_url, session_id, max_retries, member)
+
+    def _scrape_single_property_attempts(self, property_url: str, session_id: Optional[int] = None,
+                                         max_retries: int = 3, member=None) -> Optional[Dict[str, Any]]:
+        """
+        Retry loop for one property page on either the shared driver or a leased pool member
+
+        Args:
+            property_url: Property URL to scrape
+            session_id: Session ID for tracking
+            max_retries: Maximum number of retry attempts
+            member: PooledDriver leased from driver_pool (None = shared self.driver)
+
+        Returns:
+            Property details dictionary or None if failed
+        """
+
         for attempt in range(max_retries):
             try:
                 # Pre-request jitter and segment-aware pacing
@@ -381,50 +514,30 @@ class IndividualPropertyScraper:
                     time.sleep(min(extra, 15))  # cap per-attempt extra wait
 
                 # Thread-safe driver access (critical for concurrent mode)
-                # IMPORTANT: Always use self.driver directly, never cache in local variable
+                # IMPORTANT: Always resolve via _driver_for(), never cache in local variable
                 # This ensures we always use the latest driver reference after restarts
-                with self.driver_lock:
+                with self._lock_for(member):
                     if self.restart_requested:
                         self.logger.info(f"   [ABORT] Restart in progress, aborting {property_url}")
+                        self.restart_aborted_urls.add(property_url)
                         return None
                     # Check driver is valid
-                    if not self.driver:
+                    if not self._driver_for(member):
                         self.logger.error(f"   [ERROR] Driver is None, cannot proceed")
                         return None
 
-                # P0-3: Enable resource blocking for PDP pages ONLY (not listing pages)
-                # This speeds up PDP loading by 20-30% without affecting listing page traffic profile
-                try:
-                    with self.driver_lock:
-                        blocked_domains = [
-                            '*googletagmanager.com*',
-                            '*google-analytics.com*',
-                            '*doubleclick.net*',
-                            '*facebook.net*',
-                            '*facebook.com/tr*',
-                            '*hotjar.com*',
-                            '*clarity.ms*',
-                            '*mixpanel.com*',
-                            '*segment.com*',
-                            '*amplitude.com*',
-                            '*intercom.io*',
-                            '*drift.com*',
-                            '*fullstory.com*',
-                            '*logrocket.com*'
-                        ]
-                        self.driver.execute_cdp_cmd('Network.enable', {})
-                        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_domains})
-                    self.logger.debug(f"   [P0-3-PDP] Resource blocking enabled for PDP: {len(blocked_domains)} domains")
-                except Exception as e:
-                    self.logger.debug(f"   [P0-3-PDP] Failed to enable resource blocking: {e}")
+                # P0-3: PDP interception profile (images, fonts, media, trackers); listing pages keep
+                # their own profile. Sent only when this session does not carry it yet
+                with self._lock_for(member):
+                    self.interception.apply(self._driver_for(member), 'pdp')
 
                 # P1-2: Set Referer header before navigation (makes navigation chain look natural)
                 if self.last_listing_page_url:
                     try:
                         # Use CDP to set Referer header for this navigation
-                        # CRITICAL: Use self.driver directly to get latest driver after restart
-                        with self.driver_lock:
-                            self.driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {
+                        # CRITICAL: Resolve the driver on every call to get latest driver after restart
+                        with self._lock_for(member):
+                            self._driver_for(member).execute_cdp_cmd('Network.setExtraHTTPHeaders', {
                                 'headers': {'Referer': self.last_listing_page_url}
                             })
                         self.logger.debug(f"   [P1-2] Referer set: {self.last_listing_page_url[:50]}...")
@@ -435,19 +548,21 @@ class IndividualPropertyScraper:
                 # Sanitize URL to avoid Chrome interpreting as a search and opening Google
                 nav_url = self._sanitize_url(property_url)
                 # Log session and target URL before navigation
-                with self.driver_lock:
-                    sid = getattr(self.driver, 'session_id', 'unknown')
+                with self._lock_for(member):
+                    sid = getattr(self._driver_for(member), 'session_id', 'unknown')
                 self.logger.debug(f"   [NAVIGATE] Session={str(sid)[:16]}... URL={nav_url}")
-                # CRITICAL: Use self.driver directly to get latest driver after restart
-                with self.driver_lock:
-                    self.driver.get(nav_url)
+                # CRITICAL: Resolve the driver on every call to get latest driver after restart
+                with self._lock_for(member):
+                    if self.network_timing is not None:
+                        self.network_timing.drain(self._driver_for(member))
+                    self._driver_for(member).get(nav_url)
 
                 # P0-2: Explicit wait for critical elements instead of unconditional sleep
                 # Wait for title OR price element to be present (whichever loads first)
                 try:
-                    # CRITICAL: Use self.driver directly to get latest driver after restart
-                    with self.driver_lock:
-                        wait = WebDriverWait(self.driver, 3)  # 3 second timeout
+                    # CRITICAL: Resolve the driver on every call to get latest driver after restart
+                    with self._lock_for(member):
+                        wait = WebDriverWait(self._driver_for(member), 3)  # 3 second timeout
                         # Try multiple selectors for robustness
                         wait.until(
                             lambda d: d.find_element(By.CSS_SELECTOR, 'h1, [data-testid*="title"], .mb-ldp__dtls__title') or
@@ -484,19 +599,24 @@ class IndividualPropertyScraper:
                             behavior: 'smooth'
                         });
                         """
-                        # CRITICAL: Use self.driver directly to get latest driver after restart
-                        with self.driver_lock:
-                            self.driver.execute_script(mouse_script)
+                        # CRITICAL: Resolve the driver on every call to get latest driver after restart
+                        with self._lock_for(member):
+                            self._driver_for(member).execute_script(mouse_script)
                         self.logger.debug(f"   [P2-2] Simulated mouse movement and scroll")
                     except Exception as e:
                         self.logger.debug(f"   [P2-2] Failed to simulate mouse: {e}")
 
 
                 # Get page source
-                # CRITICAL: Use self.driver directly to get latest driver after restart
-                with self.driver_lock:
-                    page_source = self.driver.page_source
-                    current_url = self.driver.current_url
+                # CRITICAL: Resolve the driver on every call to get latest driver after restart
+                with self._lock_for(member):
+                    page_source = self._driver_for(member).page_source
+                    current_url = self._driver_for(member).current_url
+                    network_record = None
+                    if self.network_timing is not None:
+                        network_record = self.network_timing.capture(self._driver_for(member), 'pdp', nav_url,
+                                                                     blocking=self.interception.enabled)
+                self.interception.record_navigation('pdp', network_record)
 
                 # Log post-navigation URL for diagnosis
                 dom = (current_url or '').lower()
@@ -513,7 +633,7 @@ class IndividualPropertyScraper:
                     self.logger.warning(f"Bot detection on individual page: {property_url}")
                     # Record failure and maybe cooldown
                     self._record_url_failure(property_url)
-                    self.bot_handler.handle_bot_detection(lambda: self._restart_driver())
+                    self.bot_handler.handle_bot_detection(lambda: self._restart_for(member))
                     # If exceeded failure threshold, skip further attempts for now
                     if self.url_failures.get(property_url, 0) >= self.max_url_failures:
                         self.logger.warning(f"   🚫 Skip-after-N for {property_url} (failures={self.url_failures.get(property_url)})")
@@ -522,21 +642,7 @@ class IndividualPropertyScraper:
 
 
 
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(page_source, 'html.parser')
-
-                # Extract property details using property_extractor
-                property_details = {
-                    'property_url': property_url,
-                    'title': self.property_extractor._safe_extract_property_title(soup),
-                    'price': self.property_extractor._safe_extract_property_price(soup),
-                    'area': self.property_extractor._safe_extract_property_area(soup),
-                    'description': self.property_extractor._safe_extract_description(soup),
-                    'amenities': ', '.join(self.property_extractor._safe_extract_amenities(soup)),
-                    'builder_info': self.property_extractor._safe_extract_builder_info(soup),
-                    'location_details': self.property_extractor._safe_extract_location_details(soup),
-                    'specifications': self.property_extractor._safe_extract_specifications(soup)
-                }
+                property_details = self.extract_property_details(property_url, page_source)
 
                 # Validate extracted data
                 if property_details.get('title') or property_details.get('price'):
@@ -571,8 +677,8 @@ class IndividualPropertyScraper:
 
                 if any(trigger in error_str for trigger in restart_triggers):
                     self.logger.warning(f"   [P0-4] Connection error detected: {error_str[:100]}")
-                    self.logger.warning(f"   [P0-4] Triggering driver restart...")
-                    self._restart_driver()
+                    self.logger.warning(f"   [P0-4] Triggering driver recovery...")
+                    self._restart_for(member, error_str)
                     # After restart, retry this URL
                     if attempt < max_retries - 1:
                         time.sleep(random.uniform(5.0, 8.0))  # Longer wait after restart
@@ -586,6 +692,33 @@ class IndividualPropertyScraper:
 
         return None
 
+    def extract_property_details(self, property_url: str, page_source: str) -> Dict[str, Any]:
+        """
+        Parse a property page and extract its details
+
+        Args:
+            property_url: Property URL the page belongs to
+            page_source: Page HTML (from the browser or an HTTP fetch)
+
+        Returns:
+            Property details dictionary (title/price empty when the page carried no data)
+        """
+        # Parse with the configured parser engine
+        soup = self.property_extractor.parse_html(page_source)
+
+        # Extract property details using property_extractor
+        return {
+            'property_url': property_url,
+            'title': self.property_extractor._safe_extract_property_title(soup),
+            'price': self.property_extractor._safe_extract_property_price(soup),
+            'area': self.property_extractor._safe_extract_property_area(soup),
+            'description': self.property_extractor._safe_extract_description(soup),
+            'amenities': ', '.join(self.property_extractor._safe_extract_amenities(soup)),
+            'builder_info': self.property_extractor._safe_extract_builder_info(soup),
+            'location_details': self.property_extractor._safe_extract_location_details(soup),
+            'specifications': self.property_extractor._safe_extract_specifications(soup)
+        }
+
     def set_listing_page_url(self, url: str):
         """
         P1-2: Set the listing page URL to use as Referer for individual page navigation
@@ -626,6 +759,18 @@ class IndividualPropertyScraper:
             return url
 
 
+    @property
+    def restart_requested(self) -> bool:
+        """True while the shared driver is being restarted (workers hold off until it is done)"""
+        return not self._restart_idle.is_set()
+
+    @restart_requested.setter
+    def restart_requested(self, value: bool):
+        if value:
+            self._restart_idle.clear()
+        else:
+            self._restart_idle.set()
+
     def update_driver(self, new_driver):
         """
         Update the driver reference (called by parent after restart)
@@ -638,24 +783,70 @@ class IndividualPropertyScraper:
             self.logger.info(f"[DRIVER-UPDATE] Session changed: {old_session[:16]}... → {new_session[:16]}...")
             self.restart_requested = False
 
-    def _restart_driver(self):
-        """Restart driver using callback provided by parent class"""
+    def _driver_for(self, member=None):
+        """Return the live driver for a pool member, or the shared driver in single-driver mode"""
+        return member.driver if member is not None else self.driver
+
+    def _lock_for(self, member=None):
+        """Pool members are leased exclusively, so only the shared driver needs the lock"""
+        return nullcontext() if member is not None else self.driver_lock
+
+    def _supervise_shared_driver(self):
+        """
+        Safe point between URLs: recycle the shared driver once the supervisor says
+        it is over its memory limit or page budget (pool members recycle on release)
+        """
+        if self.supervisor is None or self.driver is None or not callable(self.restart_callback):
+            return
+        reason = self.supervisor.page_done(self.driver)
+        if reason is None:
+            return
+
+        # Holding the lock keeps other workers off the old session during the relaunch;
+        # restart_requested stays unset so the work queue keeps going
+        with self.driver_lock:
+            old_driver = self.driver
+            start = time.perf_counter()
+            try:
+                relaunched = self.restart_callback() is not False
+            except Exception as e:
+                self.logger.error(f"[MEMORY] Recycle of the shared driver failed: {e}")
+                relaunched = False
+            self.supervisor.record_recycle(old_driver, reason, time.perf_counter() - start, relaunched)
+
+    def _restart_for(self, member=None, error: Optional[str] = None):
+        """
+        Recover only the leased pool member, or the shared session
+
+        A soft reset (fresh tab, cleared storage) is tried first unless the
+        error shows the session is dead; the full relaunch is the last tier.
+        """
+        if member is not None and self.driver_pool is not None:
+            self.recovery.recover(member.driver, lambda: self.driver_pool.restart_member(member), error)
+        else:
+            self.recovery.recover(self.driver, self._restart_driver, error, lock=self.driver_lock)
+
+    def _restart_driver(self) -> bool:
+        """Restart driver using callback provided by parent class (full relaunch)"""
         try:
             if callable(getattr(self, 'restart_callback', None)):
                 old_session = getattr(self.driver, 'session_id', 'unknown') if self.driver else 'none'
                 self.logger.info(f"[DRIVER-RESTART] Triggering restart (old session: {old_session[:16]}...)")
                 self.restart_requested = True  # Signal concurrent workers to abort
-                self.restart_callback()
+                relaunched = self.restart_callback()
                 # Note: Parent must call update_driver() after creating new driver
                 # Defensive: Ensure flag is reset even if update_driver() wasn't called
                 self.restart_requested = False
                 self.logger.info(f"[DRIVER-RESTART] Restart flag cleared")
+                return relaunched is not False
             else:
                 self.logger.warning("Driver restart requested but no restart_callback provided")
                 self.restart_requested = False  # Reset flag even if no callback
+                return False
         except Exception as e:
             self.logger.error(f"Driver restart failed: {e}")
             self.restart_requested = False  # Reset flag on error too
+            return False
 
 
     def _record_url_failure(self, url: str, soft: bool = False) -> None:
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Interception Policy Module
+Declarative request blocking for browser navigations.
+A profile names resource types (image, font, media, ...) and domains to block;
+it is compiled into Network.setBlockedURLs patterns and sent to a session
+only when its tab does not already carry it, so a driver pays one CDP round trip
+per profile switch instead of one per URL. Selenium cannot answer
+Fetch.requestPaused events, so resource types are matched by URL extension.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from .driver_supervisor import session_key
+
+# URL patterns per resource type (query strings allowed after the extension)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*', '*.ogg*'],
+    'stylesheet': ['*.css*']
+}
+
+# Typical transfer size of one blocked request per CDP resource type (bytes saved estimate)
+ESTIMATED_BYTES = {
+    'Image': 60_000,
+    'Font': 35_000,
+    'Media': 500_000,
+    'Script': 40_000,
+    'Stylesheet': 25_000,
+    'Other': 5_000
+}
+
+# Third-party analytics/ads/session-replay domains (no page data)
+ANALYTICS_DOMAINS = [
+    'googletagmanager.com',
+    'google-analytics.com',
+    'analytics.google.com',
+    'doubleclick.net',
+    'googleadservices.com',
+    'googlesyndication.com',
+    'adservice.google.com',
+    'facebook.net',
+    'facebook.com/tr',
+    'hotjar.com',
+    'clarity.ms',
+    'mixpanel.com',
+    'segment.com',
+    'amplitude.com',
+    'intercom.io',
+    'drift.com',
+    'fullstory.com',
+    'logrocket.com'
+]
+
+# Listing pages keep a normal consumer traffic profile (blocking there triggers bot detection);
+# PDP data comes from the HTML, so images, fonts, media and trackers are skipped
+DEFAULT_PROFILES = {
+    'listing': {'resource_types': [], 'domains': []},
+    'pdp': {'resource_types': ['image', 'font', 'media'], 'domains': ANALYTICS_DOMAINS}
+}
+
+
+def compile_profile(profile: Dict[str, Any]) -> List[str]:
+    """Network.setBlockedURLs patterns of a profile"""
+    patterns: List[str] = []
+    for resource_type in profile.get('resource_types', []):
+        if resource_type not in RESOURCE_TYPE_PATTERNS:
+            raise ValueError(f"Unknown resource type '{resource_type}' "
+                             f"(known: {', '.join(RESOURCE_TYPE_PATTERNS)})")
+        patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+    patterns.extend(f"*{domain}*" for domain in profile.get('domains', []))
+    patterns.extend(profile.get('patterns', []))
+    return list(dict.fromkeys(patterns))
+
+
+class InterceptionPolicy:
+    """
+    Named blocking profiles applied once per browser session
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, Dict[str, Any]]] = None, enabled: bool = True, logger=None):
+        """
+        Initialize interception policy
+
+        Args:
+            profiles: Profile name -> {'resource_types', 'domains', 'patterns'} (merged over DEFAULT_PROFILES)
+            enabled: False applies no blocking at all (A/B measurements)
+            logger: Logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.enabled = enabled
+        self.profiles = {name: dict(profile) for name, profile in DEFAULT_PROFILES.items()}
+        for name, profile in (profiles or {}).items():
+            self.profiles[name] = dict(profile)
+        self.patterns = {name: compile_profile(profile) for name, profile in self.profiles.items()}
+
+        self._applied: Dict[str, str] = {}  # session -> profile name its tab carries
+        self._lock = threading.Lock()
+        self.stats = {
+            'applications': 0,
+            'skipped': 0,
+            'failures': 0,
+            'navigations': {},
+            'blocked_requests': {},
+            'estimated_bytes_saved': 0
+        }
+
+    def apply(self, driver, profile: str) -> bool:
+        """
+        Make a driver block what `profile` names (no CDP call if it already does)
+
+        Returns:
+            True when the tab carries the profile afterwards
+        """
+        if not self.enabled:
+            profile = None
+        elif profile not in self.patterns:
+            raise KeyError(f"Unknown interception profile '{profile}'")
+
+        key = session_key(driver)
+        with self._lock:
+            current = self._applied.get(key)
+        patterns = self.patterns[profile] if profile else []
+        # A tab that never had a profile blocks nothing: an empty profile needs no call either
+        if current == profile or (current is None and not patterns):
+            with self._lock:
+                self.stats['skipped'] += 1
+            return True
+
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except Exception as e:
+            with self._lock:
+                self.stats['failures'] += 1
+                self._applied.pop(key, None)
+            self.logger.debug(f"[INTERCEPT] Failed to apply '{profile}' profile: {e}")
+            return False
+
+        with self._lock:
+            self._applied[key] = profile
+            self.stats['applications'] += 1
+        self.logger.debug(f"[INTERCEPT] Session {key[:16]} now uses '{profile}' profile ({len(patterns)} patterns)")
+        return True
+
+    def forget(self, driver):
+        """
+        Forget what a driver's tab blocks (blocked URLs are per tab: call after
+        a soft reset opens a fresh one, or when the driver quits)
+        """
+        with self._lock:
+            self._applied.pop(session_key(driver), None)
+
+    def record_navigation(self, profile: str, network_record: Optional[Dict[str, Any]] = None):
+        """
+        Count a navigation under a profile and its blocked requests (from a network_timing record)
+        """
+        with self._lock:
+            navigations = self.stats['navigations']
+            navigations[profile] = navigations.get(profile, 0) + 1
+            if not network_record:
+                return
+            for resource_type, count in network_record.get('blocked_by_type', {}).items():
+                blocked = self.stats['blocked_requests']
+                blocked[resource_type] = blocked.get(resource_type, 0) + count
+                self.stats['estimated_bytes_saved'] += count * ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES['Other'])
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """CDP applications vs skips, navigations per profile and the byte-savings estimate"""
+        with self._lock:
+            stats = {key: dict(value) if isinstance(value, dict) else value for key, value in self.stats.items()}
+        stats['enabled'] = self.enabled
+        stats['profiles'] = {name: len(patterns) for name, patterns in self.patterns.items()}
+        return stats
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Listing Pipeline Module
+Producer/consumer stages for listing pages.
+The browser thread only fetches pages and hands raw payloads (HTML or DOM card
+JSON) to a bounded queue; worker threads parse, extract and validate; a single
+persistence thread commits results in page order (URL tracking, stop analysis)
+and signals stop decisions back to the fetcher through an event.
+"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class ListingPipeline:
+    """
+    Bounded fetch -> process -> persist pipeline
+
+    `process(page_number, payload)` runs in the worker pool and returns a page
+    result. `persist(page_number, result)` runs on one thread, strictly in
+    submission order, and returns True to stop the scrape. Once a stop is
+    requested `stop_event` is set, submit() refuses new pages, and results of
+    pages submitted after the stopping page are discarded. The fetcher can
+    wait_processed() for a page's result to retry pages that failed processing.
+    """
+
+    def __init__(self, process: Callable[[int, Any], Any], persist: Callable[[int, Any], bool],
+                 workers: int = 1, queue_size: int = 2, logger=None):
+        """
+        Initialize listing pipeline
+
+        Args:
+            process: Parse/extract/validate stage (called from worker threads)
+            persist: Commit stage, returns True when scraping should stop
+            workers: Worker threads for the process stage
+            queue_size: Fetched pages that may wait for a worker before submit() blocks
+            logger: Logger instance
+        """
+        self.process = process
+        self.persist = persist
+        self.workers = max(1, workers)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.stop_event = threading.Event()
+        self._pages: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size))
+        self._results: Dict[int, Any] = {}
+        self._processed: Dict[int, Any] = {}
+        self._ready = threading.Condition()
+        self._submitted = 0
+        self._closed = False
+        self._threads = []
+
+        # Pipeline statistics
+        self.stats = {
+            'submitted': 0,
+            'processed': 0,
+            'persisted': 0,
+            'discarded': 0,
+            'errors': 0,
+            'process_seconds': 0.0,
+            'persist_seconds': 0.0,
+            'blocked_seconds': 0.0,
+            'max_queue_depth': 0
+        }
+        # Updated from the fetcher, worker and persistence threads
+        self._stats_lock = threading.Lock()
+
+    def start(self) -> 'ListingPipeline':
+        """Start the worker and persistence threads"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"listing-worker-{index + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._persister = threading.Thread(target=self._persist_in_order, name="listing-persist", daemon=True)
+        self._persister.start()
+        return self
+
+    @property
+    def stop_requested(self) -> bool:
+        return self.stop_event.is_set()
+
+    def submit(self, page_number: int, payload: Any) -> bool:
+        """
+        Queue a fetched page for processing (blocks while the queue is full)
+
+        Returns:
+            False when a stop was already requested and the page was not queued
+        """
+        if self.stop_event.is_set() or self._closed:
+            return False
+        with self._ready:
+            sequence = self._submitted
+            self._submitted += 1
+        start = time.perf_counter()
+        self._pages.put((sequence, page_number, payload))
+        blocked = time.perf_counter() - start
+        depth = self._pages.qsize()
+        with self._stats_lock:
+            self.stats['blocked_seconds'] += blocked
+            self.stats['submitted'] += 1
+            self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], depth)
+        return True
+
+    def wait_processed(self, page_number: int, timeout: Optional[float] = None) -> Any:
+        """
+        Wait until the last submitted copy of a page went through the process stage
+
+        Returns:
+            The page's process result (None if processing raised or `timeout` passed)
+        """
+        with self._ready:
+            self._ready.wait_for(lambda: page_number in self._processed, timeout)
+            return self._processed.pop(page_number, None)
+
+    def close(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Let queued pages drain through every stage, stop the threads and return statistics"""
+        if not self._closed:
+            self._closed = True
+            for _ in self._threads:
+                self._pages.put(None)
+            for thread in self._threads:
+                thread.join(timeout)
+            with self._ready:
+                self._ready.notify_all()
+            self._persister.join(timeout)
+        return self.get_statistics()
+
+    def _work(self):
+        while True:
+            item = self._pages.get()
+            if item is None:
+                break
+            sequence, page_number, payload = item
+            start = time.perf_counter()
+            try:
+                result = self.process(page_number, payload)
+                failed = False
+            except Exception as e:
+                self.logger.error(f"Listing page {page_number} processing failed: {e}")
+                result, failed = None, True
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.stats['process_seconds'] += elapsed
+                self.stats['processed'] += 1
+                self.stats['errors'] += 1 if failed else 0
+            with self._ready:
+                self._results[sequence] = (page_number, result, failed)
+                self._processed[page_number] = None if failed else result
+                self._ready.notify_all()
+
+    def _persist_in_order(self):
+        next_sequence = 0
+        while True:
+            with self._ready:
+                while next_sequence not in self._results:
+                    if self._closed and not any(thread.is_alive() for thread in self._threads) \
+                            and next_sequence >= self._submitted:
+                        return
+                    self._ready.wait(0.5)
+                page_number, result, failed = self._results.pop(next_sequence)
+            next_sequence += 1
+
+            if failed:
+                continue
+            if self.stop_event.is_set():
+                with self._stats_lock:
+                    self.stats['discarded'] += 1
+                continue
+
+            start = time.perf_counter()
+            try:
+                should_stop = self.persist(page_number, result)
+            except Exception as e:
+                self.logger.error(f"Listing page {page_number} persistence failed: {e}")
+                with self._stats_lock:
+                    self.stats['errors'] += 1
+                should_stop = False
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.stats['persist_seconds'] += elapsed
+                self.stats['persisted'] += 1
+            if should_stop:
+                self.stop_event.set()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Stage timings: blocked_seconds is time the fetcher waited on a full queue"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        for key in ('process_seconds', 'persist_seconds', 'blocked_seconds'):
+            stats[key] = round(stats[key], 3)
+        stats['stop_requested'] = self.stop_event.is_set()
+        return stats
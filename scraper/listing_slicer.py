@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Listing Slicer Module
+Cuts the SRP card region out of raw page HTML before parsing.
+Headers, footers, inline scripts, ad slots and SEO blocks outside the card list
+are never handed to the parser; callers fall back to a full parse when the slice
+yields fewer cards than expected.
+"""
+
+import re
+import logging
+from typing import Dict, Any, Optional, Tuple
+
+
+# Class tokens that open a listing card (outer list item or the card itself)
+DEFAULT_CARD_MARKERS = ('mb-srp__list', 'mb-srp__card', r'SRPTuple__\w+')
+
+
+class ListingSlicer:
+    """
+    Locate the card container region in raw HTML with string offsets
+
+    The slice runs from the first card's opening tag to the closing tag of the
+    last card, found by counting open/close tags of the same name.
+    """
+
+    def __init__(self, card_markers=DEFAULT_CARD_MARKERS, max_card_bytes: int = 200_000, logger=None):
+        """
+        Initialize listing slicer
+
+        Args:
+            card_markers: Regex fragments for class tokens that start a card
+            max_card_bytes: Give up balancing the last card after this many bytes
+                (the slice then runs to the end of the page)
+            logger: Logger instance
+        """
+        tokens = '|'.join(card_markers)
+        self.card_start_re = re.compile(
+            r'<(div|li|article)\b[^>]*?\bclass="(?:[^"]*\s)?(?:' + tokens + r')(?=[\s"])'
+            r'|<(div)\b[^>]*?\bdata-listingid=',
+            re.IGNORECASE
+        )
+        self.max_card_bytes = max_card_bytes
+        self.logger = logger or logging.getLogger(__name__)
+
+        # Slicing statistics
+        self.stats = {
+            'pages': 0,
+            'sliced_pages': 0,
+            'fallbacks': 0,
+            'bytes_total': 0,
+            'bytes_parsed': 0
+        }
+
+    def slice(self, html: str) -> Optional[Tuple[int, int]]:
+        """
+        Find the card region
+
+        Returns:
+            (start, end) offsets into html, or None when no card marker is present
+        """
+        first = self.card_start_re.search(html)
+        if not first:
+            return None
+
+        last = first
+        for last in self.card_start_re.finditer(html, first.end()):
+            pass
+
+        end = self._find_element_end(html, last.start(), (last.group(1) or last.group(2)).lower())
+        return first.start(), end
+
+    def _find_element_end(self, html: str, start: int, tag: str) -> int:
+        """Offset just past the tag closing the element that opens at `start`"""
+        limit = min(len(html), start + self.max_card_bytes)
+        tag_re = re.compile(r'<(/?)' + tag + r'\b', re.IGNORECASE)
+        depth = 0
+        for match in tag_re.finditer(html, start, limit):
+            depth += -1 if match.group(1) else 1
+            if depth == 0:
+                close = html.find('>', match.end())
+                return len(html) if close == -1 else close + 1
+        return len(html)
+
+    def record(self, page_bytes: int, parsed_bytes: int, sliced: bool):
+        """Record one page's parse size; sliced=False means a full parse was needed"""
+        self.stats['pages'] += 1
+        self.stats['bytes_total'] += page_bytes
+        self.stats['bytes_parsed'] += parsed_bytes
+        if sliced:
+            self.stats['sliced_pages'] += 1
+        else:
+            self.stats['fallbacks'] += 1
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get slicing statistics including the parsed-bytes ratio"""
+        stats = dict(self.stats)
+        total = stats['bytes_total']
+        stats['parsed_ratio'] = round(stats['bytes_parsed'] / total, 3) if total else 0.0
+        return stats
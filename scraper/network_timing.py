@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Network Timing Module
+Per-navigation network records from Chrome's performance log.
+With `goog:loggingPrefs` {'performance': 'ALL'} chromedriver buffers the CDP
+Network/Page events of every navigation; draining the buffer before a
+navigation and summarizing it afterwards gives one compact record per page
+(bytes transferred, request count, blocked count, DNS, TTFB, main document
+download, DOM ready), aggregated into per-session percentiles.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+# Record fields reported as percentiles
+TIMING_FIELDS = ('ttfb_ms', 'dom_ready_ms', 'dns_ms', 'download_ms', 'bytes', 'requests', 'blocked')
+PERCENTILES = (50, 90, 95)
+
+
+def enable_performance_logging(chrome_options):
+    """Ask chromedriver to buffer CDP Network/Page events for get_log('performance')"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def _events(entries: List[Dict[str, Any]]):
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        yield message.get('method'), message.get('params', {})
+
+
+def _elapsed_ms(start: Optional[float], end: Optional[float]) -> Optional[float]:
+    if start is None or end is None or end < start:
+        return None
+    return round((end - start) * 1000, 1)
+
+
+def summarize_performance_log(entries: List[Dict[str, Any]], page_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Summarize the performance log entries of one navigation
+
+    Args:
+        entries: driver.get_log('performance') entries
+        page_url: URL navigated to (picks the main document; default: first document request)
+
+    Returns:
+        {'url', 'requests', 'blocked', 'blocked_by_type', 'bytes', 'status', 'dns_ms', 'connect_ms',
+        'ttfb_ms', 'download_ms', 'dom_ready_ms', 'load_ms'} (timings None when missing)
+    """
+    request_types: Dict[str, str] = {}
+    blocked = 0
+    blocked_by_type: Dict[str, int] = {}
+    bytes_total = 0
+    main_id = None
+    main_matches = False
+    main_start = None
+    response = None
+    main_finished = None
+    dom_ready = None
+    load = None
+
+    for method, params in _events(entries):
+        if method == 'Network.requestWillBeSent':
+            request_id = params.get('requestId')
+            request_types[request_id] = params.get('type') or 'Other'
+            is_document = params.get('type') == 'Document'
+            url = params.get('request', {}).get('url')
+            # Main document: the first document request, or a later one for the navigated URL
+            if is_document and (main_id is None or (page_url and url == page_url and not main_matches)):
+                main_id, main_start = request_id, params.get('timestamp')
+                main_matches = bool(page_url) and url == page_url
+                response = main_finished = None
+        elif method == 'Network.responseReceived' and params.get('requestId') == main_id:
+            response = params.get('response', {})
+        elif method == 'Network.loadingFinished':
+            bytes_total += int(params.get('encodedDataLength') or 0)
+            if params.get('requestId') == main_id:
+                main_finished = params.get('timestamp')
+        elif method == 'Network.loadingFailed':
+            if params.get('blockedReason') or 'ERR_BLOCKED' in (params.get('errorText') or ''):
+                blocked += 1
+                resource_type = params.get('type') or request_types.get(params.get('requestId'), 'Other')
+                blocked_by_type[resource_type] = blocked_by_type.get(resource_type, 0) + 1
+        elif method == 'Page.domContentEventFired' and dom_ready is None:
+            dom_ready = params.get('timestamp')
+        elif method == 'Page.loadEventFired' and load is None:
+            load = params.get('timestamp')
+
+    record = {
+        'url': page_url,
+        'requests': len(request_types),
+        'blocked': blocked,
+        'blocked_by_type': blocked_by_type,
+        'bytes': bytes_total,
+        'status': None,
+        'dns_ms': None,
+        'connect_ms': None,
+        'ttfb_ms': None,
+        'download_ms': None,
+        'dom_ready_ms': _elapsed_ms(main_start, dom_ready),
+        'load_ms': _elapsed_ms(main_start, load)
+    }
+    if response:
+        record['status'] = response.get('status')
+        timing = response.get('timing') or {}
+        # Phase offsets are ms from requestTime; -1 means the phase did not happen (reused connection)
+        if timing.get('dnsStart', -1) >= 0:
+            record['dns_ms'] = round(timing['dnsEnd'] - timing['dnsStart'], 1)
+        if timing.get('connectStart', -1) >= 0:
+            record['connect_ms'] = round(timing['connectEnd'] - timing['connectStart'], 1)
+        if timing.get('sendStart', -1) >= 0 and timing.get('receiveHeadersEnd', -1) >= 0:
+            record['ttfb_ms'] = round(timing['receiveHeadersEnd'] - timing['sendStart'], 1)
+            if main_finished is not None and timing.get('requestTime') is not None:
+                headers_at = timing['requestTime'] + timing['receiveHeadersEnd'] / 1000
+                record['download_ms'] = _elapsed_ms(headers_at, main_finished)
+    return record
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class NetworkTimingRecorder:
+    """
+    Collects one network record per browser navigation, grouped by page kind ('listing', 'pdp')
+    """
+
+    def __init__(self, max_records: int = 5000, logger=None):
+        """
+        Initialize network timing recorder
+
+        Args:
+            max_records: Records kept per page kind for the percentiles
+            logger: Logger instance
+        """
+        self.max_records = max_records
+        self.logger = logger or logging.getLogger(__name__)
+        self.records: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.capture_errors = 0
+        self._lock = threading.Lock()
+
+    def drain(self, driver):
+        """Discard buffered events so the next capture only sees the coming navigation"""
+        try:
+            driver.get_log('performance')
+        except Exception:
+            pass
+
+    def capture(self, driver, kind: str, page_url: Optional[str] = None, **tags) -> Optional[Dict[str, Any]]:
+        """
+        Summarize the events since the last drain as one record
+
+        Args:
+            driver: WebDriver that just navigated
+            kind: Page kind the record is grouped under
+            page_url: URL navigated to
+            tags: Extra fields stored with the record (e.g. blocking=True)
+
+        Returns:
+            The record, or None when the performance log is unavailable
+        """
+        try:
+            entries = driver.get_log('performance')
+        except Exception as e:
+            with self._lock:
+                self.capture_errors += 1
+            self.logger.debug(f"[NETWORK] Performance log unavailable: {e}")
+            return None
+
+        record = summarize_performance_log(entries, page_url)
+        record.update(tags)
+        with self._lock:
+            self.records.setdefault(kind, deque(maxlen=self.max_records)).append(record)
+        self.logger.debug(f"[NETWORK] {kind} {page_url}: ttfb {record['ttfb_ms']} ms, "
+                          f"dom ready {record['dom_ready_ms']} ms, {record['requests']} requests "
+                          f"({record['blocked']} blocked), {record['bytes']:,} bytes")
+        return record
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Per page kind: page count and p50/p90/p95 of each timing field"""
+        with self._lock:
+            groups = {kind: list(records) for kind, records in self.records.items()}
+            report: Dict[str, Any] = {'capture_errors': self.capture_errors}
+
+        for kind, records in groups.items():
+            summary: Dict[str, Any] = {'pages': len(records)}
+            for field in TIMING_FIELDS:
+                values = [r[field] for r in records if r.get(field) is not None]
+                summary[field] = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+            report[kind] = summary
+        return report
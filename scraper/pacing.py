@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Pacing Module
+Token-bucket rate limiting shared by concurrent PDP workers.
+Replaces fixed inter-batch sleeps with per-segment (locality) request budgets.
+"""
+
+import time
+import threading
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills at `rate` tokens/second up to `capacity`
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if necessary
+
+        Returns:
+            Seconds the caller must wait before the reserved token is valid
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1.0
+            if self.tokens >= 0 or self.rate <= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class SegmentPacer:
+    """
+    Per-segment token buckets plus an optional global bucket
+
+    Each segment (e.g. locality parsed from the PDP URL) gets its own bucket so
+    workers spread load across segments instead of waiting at batch barriers.
+    """
+
+    def __init__(self, segment_rate: float = 0.5, segment_burst: float = 2.0,
+                 global_rate: Optional[float] = 2.0, global_burst: float = 4.0):
+        """
+        Args:
+            segment_rate: Requests per second allowed for one segment
+            segment_burst: Bucket capacity per segment
+            global_rate: Requests per second across all segments (None/0 disables)
+            global_burst: Capacity of the global bucket
+        """
+        self.segment_rate = segment_rate
+        self.segment_burst = segment_burst
+        self.global_bucket = TokenBucket(global_rate, global_burst) if global_rate else None
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+        # Pacing statistics
+        self.stats = {
+            'acquired': 0,
+            'waited': 0,
+            'total_wait_seconds': 0.0
+        }
+
+    def _bucket_for(self, segment: str) -> TokenBucket:
+        with self.lock:
+            bucket = self.buckets.get(segment)
+            if bucket is None:
+                bucket = TokenBucket(self.segment_rate, self.segment_burst)
+                self.buckets[segment] = bucket
+            return bucket
+
+    def acquire(self, segment: str = '') -> float:
+        """
+        Block until a request for `segment` is allowed
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(segment)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def reserve(self, segment: str = '') -> float:
+        """
+        Reserve a request slot for `segment` without blocking (for asyncio callers)
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        wait = self._bucket_for(segment or '_default').reserve()
+        if self.global_bucket:
+            wait = max(wait, self.global_bucket.reserve())
+        with self.lock:
+            self.stats['acquired'] += 1
+            if wait > 0:
+                self.stats['waited'] += 1
+                self.stats['total_wait_seconds'] += wait
+        return wait
+
+    def get_pacing_statistics(self) -> Dict[str, float]:
+        """Get pacing statistics"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['segments'] = len(self.buckets)
+        return stats
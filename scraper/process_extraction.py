@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Process Extraction Module
+Process-pool backend for listing page extraction.
+Card extraction is pure CPU (tree traversal, regex), so threads serialize on the
+GIL. Worker processes receive raw page HTML, run slice/parse/extract/validate/
+filter with extractors built once at worker startup, and return plain property
+dicts plus the statistics deltas the parent merges back.
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .property_extractor import PropertyExtractor
+from .data_validator import DataValidator
+from .listing_slicer import ListingSlicer
+from .selector_ranker import SelectorRanker
+
+# Broad class match used when no configured card selector finds anything
+FALLBACK_CARD_CLASS = re.compile(r"mb-srp|property|card", re.I)
+
+
+def find_listing_cards(soup, css, card_selectors: Sequence[str], fallback_selector: str,
+                       min_cards: int) -> Tuple[List, Optional[str]]:
+    """
+    Find property cards using proven selectors
+
+    Returns:
+        (cards, selector) - the first selector yielding at least `min_cards` cards,
+        'fallback' for the broader queries, or None when nothing was found
+    """
+    for selector in card_selectors:
+        cards = css.select(soup, selector)
+        # Choose the first selector that yields a reasonable number of cards
+        if cards and len(cards) >= min_cards:
+            return cards, selector
+
+    # Last resort: broader query
+    cards = css.select(soup, fallback_selector)
+    if not cards:
+        cards = soup.find_all("div", class_=FALLBACK_CARD_CLASS)
+    return cards, ('fallback' if cards else None)
+
+
+def parse_listing_cards(page_source: str, extractor: PropertyExtractor, slicer: Optional[ListingSlicer],
+                        card_selectors: Sequence[str], fallback_selector: str,
+                        min_cards: int) -> Tuple[List, Dict[str, Any], Optional[str]]:
+    """
+    Parse only the card container region of a listing page when possible
+
+    Falls back to a full-page parse when no slicer is given, no card marker is
+    found, or the slice yields fewer than `min_cards` cards.
+
+    Returns:
+        (cards, parse info with page_bytes/parsed_bytes/sliced, matching selector)
+    """
+    page_bytes = len(page_source)
+
+    if slicer is not None:
+        region = slicer.slice(page_source)
+        if region:
+            start, end = region
+            cards, selector = find_listing_cards(extractor.parse_html(page_source[start:end]), extractor.css,
+                                                 card_selectors, fallback_selector, min_cards)
+            if len(cards) >= min_cards:
+                return cards, {'page_bytes': page_bytes, 'parsed_bytes': end - start, 'sliced': True}, selector
+            extractor.logger.debug(f"Listing slice yielded {len(cards)} cards - parsing full page")
+
+    cards, selector = find_listing_cards(extractor.parse_html(page_source), extractor.css,
+                                         card_selectors, fallback_selector, min_cards)
+    return cards, {'page_bytes': page_bytes, 'parsed_bytes': page_bytes, 'sliced': False}, selector
+
+
+def extract_page_records(extractor: PropertyExtractor, validator: DataValidator, cards: List,
+                         page_number: int, from_dom: bool = False) -> Dict[str, List]:
+    """
+    Extract, validate and filter every card of a listing page
+
+    Returns:
+        Lists of kept properties and, for the incremental decision, their card
+        texts, URLs and posting dates
+    """
+    records = {
+        'properties': [],
+        'property_texts': [],
+        'property_urls': [],
+        'posting_date_texts': [],
+        'parsed_posting_dates': []
+    }
+
+    for i, card in enumerate(cards):
+        try:
+            # Card text is read once here and reused by the incremental decision
+            fields = card if from_dom else extractor.collect_card_fields(card)
+            property_data = extractor.extract_property_data_from_fields(fields, page_number, i + 1)
+            if property_data:
+                # Validate and clean property data
+                cleaned_property_data = validator.validate_and_clean_property_data(property_data)
+
+                # Apply filtering if enabled
+                if validator.apply_property_filters(cleaned_property_data):
+                    records['properties'].append(cleaned_property_data)
+                    records['property_texts'].append(fields['card_text'])
+                    if cleaned_property_data.get('property_url'):
+                        records['property_urls'].append(cleaned_property_data['property_url'])
+                        records['posting_date_texts'].append(cleaned_property_data.get('posting_date_text'))
+                        records['parsed_posting_dates'].append(cleaned_property_data.get('parsed_posting_date'))
+                    validator.update_filter_stats(filtered=True)
+                else:
+                    # Property was excluded by filters
+                    validator.update_filter_stats(filtered=False)
+                    extractor.logger.debug(f"Property {i+1} on page {page_number} excluded by filters")
+
+        except Exception as e:
+            extractor.logger.error(f"Error extracting property {i+1} on page {page_number}: {str(e)}")
+            continue
+
+    return records
+
+
+class ListingWorker:
+    """
+    Per-process extraction state, built once from the pool settings
+
+    Settings keys: premium_selectors, date_parser, parser_engine, listing_html_slicing,
+    card_selectors, fallback_selector, min_cards, validator_config and, when
+    selector learning is on, selector_stats (a SelectorRanker snapshot) with
+    selector_reorder_interval / selector_prune_after.
+    """
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.logger = logging.getLogger(__name__)
+        self.settings = settings
+
+        self.selector_ranker = None
+        if settings.get('selector_stats') is not None:
+            self.selector_ranker = SelectorRanker(
+                reorder_interval=settings.get('selector_reorder_interval', 200),
+                prune_after=settings.get('selector_prune_after', 50),
+                logger=self.logger
+            )
+            self.selector_ranker.merge(settings['selector_stats'])
+
+        self.extractor = PropertyExtractor(
+            premium_selectors=settings['premium_selectors'],
+            date_parser=settings.get('date_parser'),
+            logger=self.logger,
+            parser_engine=settings.get('parser_engine', 'html.parser'),
+            selector_ranker=self.selector_ranker
+        )
+        self.extractor.css.compile_all(list(settings['card_selectors']) + [settings['fallback_selector']])
+        self.validator = DataValidator(config=settings.get('validator_config') or {}, logger=self.logger)
+        self.slicer = ListingSlicer(logger=self.logger) if settings.get('listing_html_slicing', True) else None
+
+    def extract(self, page_source: str, page_number: int) -> Dict[str, Any]:
+        """Extract one listing page; statistics are returned as deltas for this page only"""
+        start = time.process_time()
+        self.validator.reset_filter_stats()
+        selector_before = self.selector_ranker.snapshot() if self.selector_ranker else None
+
+        cards, listing_parse, selector = parse_listing_cards(
+            page_source, self.extractor, self.slicer, self.settings['card_selectors'],
+            self.settings['fallback_selector'], self.settings['min_cards'])
+        records = extract_page_records(self.extractor, self.validator, cards, page_number)
+
+        records.update({
+            'properties_found': len(cards),
+            'listing_parse': listing_parse,
+            'card_selector': selector,
+            'filter_stats': self.validator.get_filtered_properties_count(),
+            'selector_stats': (SelectorRanker.difference(self.selector_ranker.snapshot(), selector_before)
+                               if self.selector_ranker else None),
+            'cpu_seconds': time.process_time() - start,
+            'worker_pid': os.getpid()
+        })
+        return records
+
+
+_worker: Optional[ListingWorker] = None
+
+
+def _init_worker(settings: Dict[str, Any]):
+    global _worker
+    _worker = ListingWorker(settings)
+
+
+def _extract_in_worker(page_source: str, page_number: int) -> Dict[str, Any]:
+    return _worker.extract(page_source, page_number)
+
+
+class ProcessExtractionPool:
+    """
+    Pool of extraction processes shared by every scraper that is handed it
+
+    One pool can serve several IntegratedMagicBricksScraper instances (the
+    multi-city runner hands the same pool to each city), so pages from all
+    cities spread across the cores.
+    """
+
+    def __init__(self, settings: Dict[str, Any], workers: int = 0, logger=None):
+        """
+        Initialize process extraction pool
+
+        Args:
+            settings: Picklable worker settings (see ListingWorker)
+            workers: Worker processes (0 uses every core)
+            logger: Logger instance
+        """
+        self.settings = settings
+        self.workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        self.logger = logger or logging.getLogger(__name__)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Pool statistics
+        self.stats = {
+            'pages': 0,
+            'failures': 0,
+            'cpu_seconds': 0.0,
+            'wall_seconds': 0.0,
+            'worker_pids': set()
+        }
+
+    def start(self) -> 'ProcessExtractionPool':
+        """Start the worker processes (spawned, so no browser or thread state is forked)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.settings,)
+            )
+            self.logger.info(f"Process extraction pool started with {self.workers} workers")
+        return self
+
+    def submit(self, page_source: str, page_number: int) -> Future:
+        """Queue a page for extraction in a worker process"""
+        if self._executor is None:
+            self.start()
+        return self._executor.submit(_extract_in_worker, page_source, page_number)
+
+    def extract_page(self, page_source: str, page_number: int) -> Dict[str, Any]:
+        """Extract one page in a worker process and wait for its records"""
+        start = time.perf_counter()
+        try:
+            result = self.submit(page_source, page_number).result()
+        except Exception:
+            with self._lock:
+                self.stats['failures'] += 1
+            raise
+        with self._lock:
+            self.stats['pages'] += 1
+            self.stats['cpu_seconds'] += result['cpu_seconds']
+            self.stats['wall_seconds'] += time.perf_counter() - start
+            self.stats['worker_pids'].add(result['worker_pid'])
+        return result
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Pages extracted, worker CPU time and how many worker processes took part"""
+        with self._lock:
+            pages = self.stats['pages']
+            return {
+                'workers': self.workers,
+                'pages': pages,
+                'failures': self.stats['failures'],
+                'cpu_seconds': round(self.stats['cpu_seconds'], 3),
+                'wall_seconds': round(self.stats['wall_seconds'], 3),
+                'avg_page_ms': round(self.stats['wall_seconds'] / pages * 1000, 1) if pages else 0.0,
+                'active_workers': len(self.stats['worker_pids'])
+            }
@@ -5,20 +5,183 @@ Handles all property data extraction logic from listing pages and individual pro
 Extracted from integrated_magicbricks_scraper.py for better maintainability.
 """
 
-import re
+import time
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 from datetime import datetime
 from bs4 import BeautifulSoup
 
+from .html_parsing import CompiledSelectors, parse_html, resolve_parser_engine
+from . import regex_registry as patterns
+
+
+class CardContext:
+    """
+    Per-card text view built once and shared by every field extractor
+
+    Holds the card text, its lowercase form and the summary-list label -> value
+    map, so extractors stop re-walking the card subtree for each field. Text
+    nodes (for label lookups outside the summary list) are collected lazily,
+    at most once per card.
+    """
+
+    SUMMARY_ITEM_SELECTOR = '.mb-srp__card__summary__list--item'
+    SUMMARY_LABEL_SELECTOR = '.mb-srp__card__summary--label'
+    SUMMARY_VALUE_SELECTOR = '.mb-srp__card__summary--value'
+
+    __slots__ = ('card', 'text', 'text_lower', 'summary', '_strings')
+
+    def __init__(self, text: str = '', summary: Optional[Dict[str, str]] = None, card=None):
+        self.card = card
+        self.text = text or ''
+        self.text_lower = self.text.lower()
+        self.summary = summary or {}
+        self._strings = None
+
+    @classmethod
+    def from_card(cls, card, css: Optional[CompiledSelectors] = None) -> 'CardContext':
+        """Build the context from a parsed card (BeautifulSoup Tag or LxmlNode)"""
+        css = css or CompiledSelectors()
+        summary = {}
+        for item in css.select(card, cls.SUMMARY_ITEM_SELECTOR):
+            label = css.select_one(item, cls.SUMMARY_LABEL_SELECTOR)
+            value = css.select_one(item, cls.SUMMARY_VALUE_SELECTOR)
+            if label and value:
+                label_text = label.get_text(strip=True)
+                if label_text and label_text not in summary:
+                    summary[label_text] = value.get_text(strip=True)
+        return cls(card.get_text(), summary, card)
+
+    @property
+    def strings(self) -> List[Any]:
+        """All text nodes of the card in document order (collected once)"""
+        if self._strings is None:
+            self._strings = self.card.find_all(string=lambda text: bool(text)) if self.card is not None else []
+        return self._strings
+
+    def structured_value(self, field_name: str) -> str:
+        """Value for a label: summary list first, then label text anywhere in the card"""
+        needle = field_name.lower()
+        for label, value in self.summary.items():
+            if needle in label.lower() and value and value != field_name:
+                return value
+        return structured_value_from_strings(self.strings, field_name)
+
+
+def structured_value_from_strings(strings, field_name: str) -> str:
+    """Label/value lookup over text nodes: value in the label's next sibling or after ':'"""
+    needle = field_name.lower()
+    for element in strings:
+        if needle not in element.lower():
+            continue
+        # Get the parent element
+        parent = element.parent
+        if parent:
+            # Look for the next sibling or child that contains the value
+            next_sibling = parent.find_next_sibling()
+            if next_sibling:
+                value = next_sibling.get_text(strip=True)
+                if value and value != field_name and len(value) > 0:
+                    return value
+
+            # Look for value in the same parent element
+            parent_text = parent.get_text(strip=True)
+            if ':' in parent_text:
+                parts = parent_text.split(':')
+                if len(parts) >= 2:
+                    value = parts[1].strip()
+                    if value and len(value) > 0:
+                        return value
+    return ''
+
 
 class PropertyExtractor:
     """
     Comprehensive property data extraction with premium property support
     and intelligent fallback strategies
     """
-    
-    def __init__(self, premium_selectors: Dict[str, List[str]], date_parser=None, logger=None):
+
+    # Selector groups shared by the BeautifulSoup collector and the in-browser
+    # collector (scraper/dom_card_extractor.py) so both engines read the same fields
+    POSTING_DATE_SELECTORS = [
+        '.mb-srp__card__photo__fig--post',
+        'div[class*="post"]',
+        'div[class*="update"]',
+        'div[class*="date"]',
+        '*[class*="ago"]',
+        '*[class*="hours"]',
+        '*[class*="yesterday"]',
+        '*[class*="today"]'
+    ]
+    PHOTO_COUNT_SELECTORS = [
+        '.mb-srp__card__photo__fig--count',
+        '*[class*="photo"][class*="count"]'
+    ]
+    OWNER_NAME_SELECTORS = [
+        '.mb-srp__card__ads--name',
+        '*[class*="owner"]',
+        '*[class*="ads"][class*="name"]'
+    ]
+    CONTACT_SELECTORS = [
+        '.mb-srp__action--btn',
+        '*[class*="action"][class*="btn"]',
+        '*[class*="contact"]',
+        '*[class*="phone"]'
+    ]
+    LOCALITY_SELECTORS = [
+        '.mb-srp__card__ads--locality',
+        '*[class*="locality"]',
+        '*[class*="location"]',
+        '*[class*="address"]',
+        '*[class*="area"]'
+    ]
+    SOCIETY_SELECTORS = [
+        'a[href*="pdpid"]',  # Project detail page links
+        'a[href*="project"]',
+        '*[class*="society"]',
+        '*[class*="project"]',
+        '*[class*="building"]'
+    ]
+    STATUS_SELECTORS = [
+        '.mb-srp__card__summary__list--value',  # Primary selector
+        'span[class*="status"]',
+        'div[class*="status"]',
+        'span[class*="possession"]',
+        'div[class*="possession"]',
+        '*[class*="ready"]',
+        '*[class*="construction"]',
+        '*[data-label*="status" i]',
+        '*[data-label*="possession" i]'
+    ]
+    AREA_TYPE_SELECTORS = [
+        '*[class*="area"]',
+        '*[class*="sqft"]',
+        '*[class*="size"]',
+        '.mb-srp__card__summary__list--item'
+    ]
+    TITLE_CONTEXT_SELECTOR = 'h2, h3, .mb-srp__card__title, *[class*="title"]'
+    SUMMARY_TITLE_SELECTOR = '.mb-srp__card__summary__title'
+    MAGICBRICKS_LINK_SELECTOR = 'a[href*="magicbricks.com"]'
+    STRUCTURED_FIELDS = {
+        'bathrooms': 'Bathroom',
+        'balcony': 'Balcony',
+        'floor_details': 'Floor',
+        'status': 'Status',
+        'furnishing': 'Furnishing',
+        'facing': 'facing',
+        'parking': 'Car Parking',
+        'ownership': 'Ownership',
+        'transaction': 'Transaction',
+        'overlooking': 'overlooking'
+    }
+
+    INVALID_TEXT_VALUES = ['n/a', 'na', 'null', 'none', '--', '...']
+
+    # Card fields read with "first valid selector wins" (ordered by SelectorRanker when set)
+    RANKED_FIELDS = ('title', 'price', 'area', 'url', 'posting_date', 'photo_count', 'owner_name')
+
+    def __init__(self, premium_selectors: Dict[str, List[str]], date_parser=None, logger=None,
+                 parser_engine: str = 'html.parser', selector_ranker=None):
         """
         Initialize property extractor
         
@@ -26,10 +189,17 @@ class PropertyExtractor:
             premium_selectors: Dictionary of premium property selectors
             date_parser: Date parsing system instance
             logger: Logger instance
+            parser_engine: 'html.parser', 'lxml' or 'lxml-native' (see scraper/html_parsing.py)
+            selector_ranker: Optional SelectorRanker that learns the selector order per field
         """
         self.premium_selectors = premium_selectors
         self.date_parser = date_parser
         self.logger = logger or logging.getLogger(__name__)
+        self.parser_engine = resolve_parser_engine(parser_engine)
+        self.selector_ranker = selector_ranker
+
+        # Every configured selector compiled once, reused for all cards and pages
+        self.css = CompiledSelectors(self._configured_selectors())
         
         # Extraction statistics
         self.extraction_stats = {
@@ -40,132 +210,251 @@ class PropertyExtractor:
             'standard_properties': 0
         }
     
+    def _configured_selectors(self) -> List[str]:
+        """Listing selectors known at construction (PDP selectors compile on first use)"""
+        spec = self.get_card_field_spec()
+        selectors = ['a[href]', CardContext.SUMMARY_ITEM_SELECTOR, CardContext.SUMMARY_LABEL_SELECTOR,
+                     CardContext.SUMMARY_VALUE_SELECTOR]
+        for value in spec.values():
+            if isinstance(value, str):
+                selectors.append(value)
+            elif value is not spec['structured_fields']:
+                selectors.extend(value)
+        return list(dict.fromkeys(selectors))
+
+    def parse_html(self, markup: str):
+        """Parse a listing or property page with the configured parser engine"""
+        return parse_html(markup, self.parser_engine)
+
+    def get_card_field_spec(self) -> Dict[str, Any]:
+        """Selector groups a card field collector must read (passed to the in-browser engine)"""
+        return {
+            'title': self.premium_selectors.get('title', []),
+            'price': self.premium_selectors.get('price', []),
+            'area': self.premium_selectors.get('area', []),
+            'url': self.premium_selectors.get('url', []),
+            'posting_date': self.POSTING_DATE_SELECTORS,
+            'photo_count': self.PHOTO_COUNT_SELECTORS,
+            'owner_name': self.OWNER_NAME_SELECTORS,
+            'contact': self.CONTACT_SELECTORS,
+            'locality': self.LOCALITY_SELECTORS,
+            'society': self.SOCIETY_SELECTORS,
+            'status': self.STATUS_SELECTORS,
+            'area_types': self.AREA_TYPE_SELECTORS,
+            'title_context': self.TITLE_CONTEXT_SELECTOR,
+            'summary_title': self.SUMMARY_TITLE_SELECTOR,
+            'magicbricks_link': self.MAGICBRICKS_LINK_SELECTOR,
+            'summary_item': CardContext.SUMMARY_ITEM_SELECTOR,
+            'summary_label': CardContext.SUMMARY_LABEL_SELECTOR,
+            'summary_value': CardContext.SUMMARY_VALUE_SELECTOR,
+            'structured_fields': list(self.STRUCTURED_FIELDS.values())
+        }
+
     def extract_property_data(self, card, page_number: int, property_index: int) -> Optional[Dict[str, Any]]:
         """Enhanced property data extraction with premium property support"""
-        
+
+        try:
+            fields = self.collect_card_fields(card)
+        except Exception as e:
+            self.extraction_stats['total_extracted'] += 1
+            self.extraction_stats['failed_extractions'] += 1
+            self.logger.error(f"Error extracting property data: {str(e)}")
+            return None
+
+        return self.extract_property_data_from_fields(fields, page_number, property_index)
+
+    def collect_card_fields(self, card) -> Dict[str, Any]:
+        """
+        Collect raw card fields from a BeautifulSoup card
+
+        Produces the same structure as the in-browser collector so both engines
+        share extract_property_data_from_fields for normalisation.
+        """
+        spec = self.get_card_field_spec()
+
+        def first_texts(field):
+            return self._first_candidates(card, field, spec[field],
+                                          lambda elem: elem.get_text(strip=True), self._is_valid_text)
+
+        def all_texts(selectors):
+            texts = []
+            for selector in selectors:
+                try:
+                    texts.extend(elem.get_text(strip=True) for elem in self.css.select(card, selector))
+                except Exception:
+                    continue
+            return texts
+
+        url_candidates = self._first_candidates(
+            card, 'url', spec['url'], lambda elem: elem.get('href'),
+            lambda url: bool(url) and self._is_valid_property_url(url)
+        )
+
+        status_candidates = []
+        for selector in spec['status']:
+            try:
+                for elem in self.css.select(card, selector):
+                    parent_text = elem.parent.get_text(strip=True) if elem.parent else ''
+                    status_candidates.append([elem.get_text(strip=True), parent_text])
+            except Exception:
+                continue
+
+        card_classes = card.get('class', []) or []
+        if isinstance(card_classes, str):
+            card_classes = [card_classes]
+
+        context = CardContext.from_card(card, self.css)
+        structured = {}
+        for name in spec['structured_fields']:
+            try:
+                structured[name] = context.structured_value(name)
+            except Exception:
+                structured[name] = ''
+
+        title_context = self.css.select_one(card, spec['title_context'])
+        summary_title = self.css.select_one(card, spec['summary_title'])
+        magicbricks_link = self.css.select_one(card, spec['magicbricks_link'])
+
+        return {
+            'classes': list(card_classes),
+            'card_text': context.text,
+            'summary': context.summary,
+            'title_candidates': first_texts('title'),
+            'price_candidates': first_texts('price'),
+            'area_candidates': first_texts('area'),
+            'url_candidates': url_candidates,
+            'all_hrefs': [link.get('href', '') for link in self.css.select(card, 'a[href]')],
+            'posting_date_candidates': first_texts('posting_date'),
+            'photo_count_candidates': first_texts('photo_count'),
+            'owner_name_candidates': first_texts('owner_name'),
+            'structured': structured,
+            'status_candidates': status_candidates,
+            'area_type_texts': all_texts(spec['area_types']),
+            'summary_title_text': summary_title.get_text() if summary_title else None,
+            'title_context': title_context.get_text(strip=True) if title_context else None,
+            'locality_candidates': all_texts(spec['locality']),
+            'society_candidates': all_texts(spec['society']),
+            'magicbricks_href': magicbricks_link.get('href', '') if magicbricks_link else None,
+            'contact_texts': all_texts(spec['contact']),
+            'paragraphs': [p.get_text(strip=True) for p in card.find_all('p')]
+        }
+
+    def extract_property_data_from_fields(self, fields: Dict[str, Any], page_number: int,
+                                          property_index: int) -> Optional[Dict[str, Any]]:
+        """
+        Normalise raw card fields (from either collector) into a property record
+
+        Args:
+            fields: Output of collect_card_fields or the in-browser card extraction script
+            page_number: Listing page number
+            property_index: 1-based card position on the page
+        """
+
         try:
             # Update extraction stats
             self.extraction_stats['total_extracted'] += 1
-            
+
+            card_text = fields.get('card_text') or ''
+            card_text_lower = card_text.lower()
+
             # Detect premium property type
-            premium_info = self.detect_premium_property_type(card)
-            
+            premium_info = self._premium_info_from(fields.get('classes') or [], card_text, card_text_lower)
+
             if premium_info['is_premium']:
                 self.extraction_stats['premium_properties'] += 1
             else:
                 self.extraction_stats['standard_properties'] += 1
-            
-            # Extract title with enhanced fallback
-            title = self._extract_with_enhanced_fallback(
-                card, 
-                self.premium_selectors['title'], 
-                'title', 
-                'N/A'
-            )
-            
-            # Extract price with enhanced fallback
-            price = self._extract_with_enhanced_fallback(
-                card, 
-                self.premium_selectors['price'], 
-                'price', 
-                'N/A'
-            )
-            
-            # Extract area with enhanced fallback (backward compatible single value)
-            area = self._extract_with_enhanced_fallback(
-                card,
-                self.premium_selectors['area'],
-                'area',
-                'N/A'
-            )
+
+            # Extract title, price and area with enhanced fallback
+            title = self._first_valid_text(fields.get('title_candidates'), 'N/A', self._selector_order('title'))
+            if title == 'N/A':
+                title = self._text_pattern_fallback(card_text, 'title', 'N/A')
+
+            price = self._first_valid_text(fields.get('price_candidates'), 'N/A', self._selector_order('price'))
+            if price == 'N/A':
+                price = self._text_pattern_fallback(card_text, 'price', 'N/A')
+
+            area = self._first_valid_text(fields.get('area_candidates'), 'N/A', self._selector_order('area'))
+            if area == 'N/A':
+                area = self._text_pattern_fallback(card_text, 'area', 'N/A')
 
             # Extract comprehensive area types (new enhancement)
-            area_types = self._extract_area_types(card)
+            area_types = self._area_types_from_texts(
+                fields.get('area_type_texts') or [], card_text, fields.get('summary_title_text')
+            )
 
             # Extract price range information (Priority 1.3)
-            price_range_info = self._extract_price_range(price, card)
+            price_range_info = self._extract_price_range(price, card_text)
 
             # Extract property URL with premium support
-            property_url = self._extract_premium_property_url(card)
-            
+            property_url = self._url_from_hrefs(fields.get('url_candidates') or [], self._selector_order('url'))
+            if not property_url:
+                property_url = self._url_from_hrefs(fields.get('all_hrefs') or [])
+
             # More lenient validation - save properties with partial data
             has_title = title and title != 'N/A' and len(title.strip()) > 3
             has_price = price and price != 'N/A' and len(price.strip()) > 1
             has_area = area and area != 'N/A' and len(area.strip()) > 1
-            
+
             # For premium properties, be very lenient
             if premium_info['is_premium']:
                 is_valid = has_title or has_price or has_area
             else:
                 # For standard properties, require at least title OR (price AND area)
                 is_valid = has_title or (has_price and has_area)
-            
+
             if not is_valid:
                 self.extraction_stats['failed_extractions'] += 1
                 return None
-            
+
             # Extract posting date
-            posting_date_text = self._extract_with_fallback(card, [
-                '.mb-srp__card__photo__fig--post',
-                'div[class*="post"]',
-                'div[class*="update"]',
-                'div[class*="date"]',
-                '*[class*="ago"]',
-                '*[class*="hours"]',
-                '*[class*="yesterday"]',
-                '*[class*="today"]'
-            ], '')
-            
-            # Parse date if parser available
-            if not posting_date_text and self.date_parser:
-                card_text = card.get_text()
-                posting_date_text = self.date_parser.parse_posting_date(card_text)
-            
-            date_parse_result = self.date_parser.parse_posting_date(posting_date_text) if self.date_parser and posting_date_text else None
+            posting_date_text = self._first_valid_text(fields.get('posting_date_candidates'), '', self._selector_order('posting_date'))
+
+            # Parse date if parser available (the whole card text when no posting date element matched)
+            date_parse_result = None
+            if self.date_parser and (posting_date_text or card_text):
+                date_parse_result = self.date_parser.parse_posting_date(posting_date_text or card_text)
             parsed_posting_date = date_parse_result.get('parsed_datetime') if date_parse_result and date_parse_result.get('success') else None
-            
+
             # Extract structured property details
-            bathrooms = self._extract_structured_field(card, 'Bathroom')
-            balcony = self._extract_structured_field(card, 'Balcony')
-            floor_details = self._extract_structured_field(card, 'Floor')
-            status = self._extract_structured_field(card, 'Status')
-            furnishing = self._extract_structured_field(card, 'Furnishing')
-            facing = self._extract_structured_field(card, 'facing')
-            parking = self._extract_structured_field(card, 'Car Parking')
-            ownership = self._extract_structured_field(card, 'Ownership')
-            transaction = self._extract_structured_field(card, 'Transaction')
-            overlooking = self._extract_structured_field(card, 'overlooking')
-            
+            structured = fields.get('structured') or {}
+            details = {}
+            for key, field_name in self.STRUCTURED_FIELDS.items():
+                value = structured.get(field_name) or ''
+                if not value:
+                    if field_name.lower() == 'status':
+                        value = (self._status_from_candidates(fields.get('status_candidates') or [])
+                                 or self._status_from_text(card_text, card_text_lower))
+                    else:
+                        value = self._structured_value_from_text(card_text, field_name)
+                details[key] = value
+
             # Extract property type from title
             property_type = self._extract_property_type_from_title(title)
-            
+
             # Extract society/project name
-            society = self._extract_society_enhanced(card)
-            
+            society = self._society_from_context(
+                fields.get('society_candidates') or [], fields.get('magicbricks_href'), fields.get('title_context')
+            )
+
             # Extract locality
-            locality = self._extract_locality_enhanced(card)
-            
+            locality = self._locality_from_context(
+                fields.get('locality_candidates') or [], fields.get('title_context'), card_text
+            )
+
             # Extract missing high-priority fields
-            photo_count = self._extract_with_fallback(card, [
-                '.mb-srp__card__photo__fig--count',
-                '*[class*="photo"][class*="count"]'
-            ], '')
-            
-            owner_name = self._extract_with_fallback(card, [
-                '.mb-srp__card__ads--name',
-                '*[class*="owner"]',
-                '*[class*="ads"][class*="name"]'
-            ], '')
-            
-            contact_options = self._extract_contact_options(card)
-            description = self._extract_description(card)
-            
+            photo_count = self._first_valid_text(fields.get('photo_count_candidates'), '', self._selector_order('photo_count'))
+            owner_name = self._first_valid_text(fields.get('owner_name_candidates'), '', self._selector_order('owner_name'))
+
+            contact_options = self._contact_options_from_texts(fields.get('contact_texts') or [])
+            description = self._description_from_paragraphs(fields.get('paragraphs') or [])
+
             # Create enhanced description if none found
             if not description or len(description.strip()) == 0:
                 description = self._create_enhanced_description_from_data(
-                    title, price, area, locality, society, status
+                    title, price, area, locality, society, details['status']
                 )
-            
+
             # Build comprehensive property data
             property_data = {
                 # Basic fields
@@ -185,19 +474,19 @@ class PropertyExtractor:
                 'premium_indicators': premium_info['indicators'],
 
                 # Comprehensive fields
-                'bathrooms': bathrooms,
-                'balcony': balcony,
+                'bathrooms': details['bathrooms'],
+                'balcony': details['balcony'],
                 'property_type': property_type,
-                'furnishing': furnishing,
-                'floor_details': floor_details,
+                'furnishing': details['furnishing'],
+                'floor_details': details['floor_details'],
                 'locality': locality,
                 'society': society,
-                'status': status,
-                'facing': facing,
-                'parking': parking,
-                'ownership': ownership,
-                'transaction': transaction,
-                'overlooking': overlooking,
+                'status': details['status'],
+                'facing': details['facing'],
+                'parking': details['parking'],
+                'ownership': details['ownership'],
+                'transaction': details['transaction'],
+                'overlooking': details['overlooking'],
 
                 # Phase 3 Enhancement fields
                 'photo_count': photo_count,
@@ -216,32 +505,40 @@ class PropertyExtractor:
                 'max_price': price_range_info.get('max_price'),
                 'is_price_range': price_range_info.get('is_range', False)
             }
-            
+
             # Update successful extraction stats
             self.extraction_stats['successful_extractions'] += 1
-            
+
             return property_data
-            
+
         except Exception as e:
             self.extraction_stats['failed_extractions'] += 1
             self.logger.error(f"Error extracting property data: {str(e)}")
             return None
-    
+
     def detect_premium_property_type(self, card) -> Dict[str, Any]:
         """Detect if a property card is a premium/special type"""
+        try:
+            # Get all classes from the card
+            card_classes = card.get('class', []) or []
+            if isinstance(card_classes, str):
+                card_classes = [card_classes]
+            return self._premium_info_from(card_classes, card.get_text())
+        except Exception as e:
+            self.logger.warning(f"Error detecting premium property type: {e}")
+            return {'is_premium': False, 'premium_type': 'standard', 'classes': [], 'indicators': []}
+
+    def _premium_info_from(self, card_classes: List[str], card_text: str,
+                           card_text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Premium detection from card classes and card text (lowercase text may be passed in precomputed)"""
         premium_info = {
             'is_premium': False,
             'premium_type': 'standard',
             'classes': [],
             'indicators': []
         }
-        
+
         try:
-            # Get all classes from the card
-            card_classes = card.get('class', [])
-            if isinstance(card_classes, str):
-                card_classes = [card_classes]
-            
             # Check for premium indicators
             premium_indicators = {
                 'preferred-agent': 'preferred_agent',
@@ -254,7 +551,7 @@ class PropertyExtractor:
                 'featured': 'featured',
                 'highlighted': 'highlighted'
             }
-            
+
             for class_name in card_classes:
                 for indicator, type_name in premium_indicators.items():
                     if indicator in class_name:
@@ -262,9 +559,9 @@ class PropertyExtractor:
                         premium_info['premium_type'] = type_name
                         premium_info['classes'].append(class_name)
                         premium_info['indicators'].append(indicator)
-            
+
             # Check for premium text indicators
-            card_text = card.get_text().lower()
+            card_text = card_text_lower if card_text_lower is not None else card_text.lower()
             text_indicators = ['premium', 'luxury', 'featured', 'sponsored', 'preferred']
             for indicator in text_indicators:
                 if indicator in card_text:
@@ -272,148 +569,134 @@ class PropertyExtractor:
                     if not premium_info['is_premium']:
                         premium_info['is_premium'] = True
                         premium_info['premium_type'] = indicator
-            
+
         except Exception as e:
             self.logger.warning(f"Error detecting premium property type: {e}")
 
         return premium_info
 
+    def _first_candidates(self, card, field: str, selectors: Sequence[str], read, is_valid) -> List[Optional[str]]:
+        """
+        Selector results aligned with `selectors`, stopping at the first valid one
+
+        Selectors are tried in the ranker's learned order (configured order when
+        there is no ranker); entries after the winner stay None.
+        """
+        candidates = [None] * len(selectors)
+        ranker = self.selector_ranker
+        order = ranker.order(field, selectors) if ranker else range(len(selectors))
+        for index in order:
+            start = time.perf_counter()
+            try:
+                elem = self.css.select_one(card, selectors[index])
+                value = read(elem) if elem else None
+            except Exception:
+                value = None
+            candidates[index] = value
+            valid = is_valid(value)
+            if ranker:
+                ranker.record(field, selectors[index], valid, time.perf_counter() - start)
+            if valid:
+                break
+        if ranker:
+            ranker.end_lookup(field)
+        return candidates
+
+    def _selector_order(self, field: str) -> Optional[List[int]]:
+        """Learned selector order for a field, or None for the configured order"""
+        if not self.selector_ranker:
+            return None
+        return self.selector_ranker.order(field, self.get_card_field_spec()[field])
+
+    def _is_valid_text(self, text: Optional[str]) -> bool:
+        """Meaningful selector text: not empty, not a single character, not a placeholder"""
+        return bool(text) and len(text) > 1 and text.lower() not in self.INVALID_TEXT_VALUES
+
+    def _first_valid_text(self, texts: Optional[List[Optional[str]]], default: str,
+                          order: Optional[List[int]] = None) -> str:
+        """Return the first meaningful selector hit, mirroring the per-selector fallback loop"""
+        texts = texts or []
+        if order is not None and len(order) == len(texts):
+            texts = [texts[index] for index in order]
+        for text in texts:
+            if text and text != default and len(text) > 1:
+                # Additional validation for meaningful content
+                if not text.lower() in self.INVALID_TEXT_VALUES:
+                    return text
+        return default
+
     def _extract_with_enhanced_fallback(self, card, selectors: List[str], field_type: str = 'text', default: str = 'N/A') -> str:
         """Enhanced extraction with premium property support and intelligent fallback"""
 
         # First try standard selectors
         for selector in selectors:
             try:
-                elem = card.select_one(selector)
+                elem = self.css.select_one(card, selector)
                 if elem:
                     text = elem.get_text(strip=True)
                     if text and text != default and len(text) > 1:
                         # Additional validation for meaningful content
-                        if not text.lower() in ['n/a', 'na', 'null', 'none', '--', '...']:
+                        if not text.lower() in self.INVALID_TEXT_VALUES:
                             return text
             except Exception:
                 continue
 
         # Enhanced fallback extraction based on field type
         try:
-            all_text = card.get_text()
-
-            if field_type == 'price':
-                # Enhanced price pattern matching
-                price_patterns = [
-                    r'₹[\d,.]+ (?:Crore|Lakh|crore|lakh)',
-                    r'₹[\d,.]+\s*(?:Cr|L|cr|l)\b',
-                    r'₹[\d,.]+',
-                    r'\b[\d,.]+ (?:Crore|Lakh|crore|lakh)\b',
-                    r'Price[:\s]*₹[\d,.]+',
-                    r'Cost[:\s]*₹[\d,.]+'
-                ]
-                for pattern in price_patterns:
-                    match = re.search(pattern, all_text)
-                    if match:
-                        return match.group().strip()
-
-            elif field_type == 'area':
-                # Enhanced area pattern matching
-                area_patterns = [
-                    r'\b\d+[\d,.]* (?:sqft|sq ft|Sq\.? ?ft|SQFT)\b',
-                    r'\b\d+[\d,.]* (?:sq\.?m|sqm|Sq\.?M)\b',
-                    r'(?:Carpet|Super|Built)[\s:]*\d+[\d,.]* (?:sqft|sq ft)',
-                    r'Area[:\s]*\d+[\d,.]* (?:sqft|sq ft)',
-                    r'Size[:\s]*\d+[\d,.]* (?:sqft|sq ft)',
-                    r'\d+[\d,.]* (?:Sq\.? ?Ft|SQFT)'
-                ]
-                for pattern in area_patterns:
-                    match = re.search(pattern, all_text, re.I)
-                    if match:
-                        return match.group().strip()
-
-            elif field_type == 'title':
-                # Enhanced title extraction for premium properties
-                title_patterns = [
-                    r'\b\d+ BHK .+',
-                    r'\b\d+ Bedroom .+',
-                    r'(?:Apartment|House|Villa|Plot) .+',
-                    r'[A-Z][a-z]+ [A-Z][a-z]+ .+'
-                ]
-                for pattern in title_patterns:
-                    match = re.search(pattern, all_text)
-                    if match:
-                        return match.group().strip()
-
+            return self._text_pattern_fallback(card.get_text(), field_type, default)
         except Exception:
-            pass
-
-        return default
-
-    def _extract_with_fallback(self, card, selectors: List[str], default: str = 'N/A') -> str:
-        """Extract text using fallback selectors with intelligent filtering"""
-
-        for selector in selectors:
-            try:
-                elem = card.select_one(selector)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    if text and text != default and len(text) > 1:
-                        # Additional validation for meaningful content
-                        if not text.lower() in ['n/a', 'na', 'null', 'none', '--', '...']:
-                            return text
-            except Exception:
-                continue
+            return default
 
-        # If no specific selector works, try intelligent text extraction
+    def _text_pattern_fallback(self, all_text: str, field_type: str, default: str = 'N/A') -> str:
+        """Regex fallback over the full card text for title/price/area"""
         try:
-            all_text = card.get_text()
-
-            # Look for price patterns
-            if any(keyword in selectors[0].lower() for keyword in ['price', 'cost', 'amount']):
-                price_match = re.search(r'₹[\d,.]+ (?:Crore|Lakh|crore|lakh)', all_text)
-                if price_match:
-                    return price_match.group()
-
-            # Look for area patterns
-            if any(keyword in selectors[0].lower() for keyword in ['area', 'sqft', 'size']):
-                area_match = re.search(r'\d+[\d,.]* (?:sqft|sq ft|Sq\.? ?ft)', all_text, re.I)
-                if area_match:
-                    return area_match.group()
-
+            table = {
+                'price': patterns.PRICE_TEXT_PATTERNS,
+                'area': patterns.AREA_TEXT_PATTERNS,
+                'title': patterns.TITLE_TEXT_PATTERNS
+            }.get(field_type)
+            found = table.first(all_text) if table else None
+            if found:
+                return found[1].group().strip()
         except Exception:
             pass
 
         return default
 
+    def _url_from_hrefs(self, hrefs: List[Optional[str]], order: Optional[List[int]] = None) -> str:
+        """First valid property URL from candidate hrefs, made absolute"""
+        if order is not None and len(order) == len(hrefs):
+            hrefs = [hrefs[index] for index in order]
+        for url in hrefs:
+            if url and self._is_valid_property_url(url):
+                # Convert relative URLs to absolute
+                if url.startswith('/'):
+                    url = f"https://www.magicbricks.com{url}"
+                return url
+        return ''
+
     def _extract_premium_property_url(self, card) -> str:
         """Extract property URL with premium property support"""
         url_selectors = self.premium_selectors.get('url', [])
 
         # Try premium selectors first
+        hrefs = []
         for selector in url_selectors:
             try:
-                elem = card.select_one(selector)
+                elem = self.css.select_one(card, selector)
                 if elem and elem.get('href'):
-                    url = elem.get('href')
-                    if self._is_valid_property_url(url):
-                        # Convert relative URLs to absolute
-                        if url.startswith('/'):
-                            url = f"https://www.magicbricks.com{url}"
-                        return url
+                    hrefs.append(elem.get('href'))
             except Exception:
                 continue
+        url = self._url_from_hrefs(hrefs)
+        if url:
+            return url
 
         # Fallback: try any link in the card that might be valid
         try:
-            all_links = card.select('a[href]')
-            for link in all_links:
-                url = link.get('href', '')
-                if url and self._is_valid_property_url(url):
-                    # Convert relative URLs to absolute
-                    if url.startswith('/'):
-                        url = f"https://www.magicbricks.com{url}"
-                    return url
+            return self._url_from_hrefs([link.get('href', '') for link in self.css.select(card, 'a[href]')])
         except Exception:
-            pass
-
-        return ''
+            return ''
 
     def _is_valid_property_url(self, url: str) -> bool:
         """Validate if URL is a valid property URL"""
@@ -447,47 +730,23 @@ class PropertyExtractor:
 
         return any(pattern in url for pattern in valid_patterns)
 
-    def _extract_structured_field(self, card, field_name: str) -> str:
-        """Enhanced structured field extraction with multiple strategies"""
+    def _structured_value_from_dom(self, card, field_name: str) -> str:
+        """Label/value lookup in the card DOM: text node containing the label, value in sibling or after ':'"""
+        try:
+            return structured_value_from_strings(
+                card.find_all(string=lambda text: text and field_name.lower() in text.lower()), field_name
+            )
+        except Exception:
+            return ''
+
+    def _structured_value_from_text(self, all_text: str, field_name: str) -> str:
+        """Pattern: "Field: Value" or "Field - Value" in the card text"""
         try:
-            # Strategy 1: Find all elements that contain the field name
-            field_elements = card.find_all(text=lambda text: text and field_name.lower() in text.lower())
-
-            for element in field_elements:
-                # Get the parent element
-                parent = element.parent
-                if parent:
-                    # Look for the next sibling or child that contains the value
-                    next_sibling = parent.find_next_sibling()
-                    if next_sibling:
-                        value = next_sibling.get_text(strip=True)
-                        if value and value != field_name and len(value) > 0:
-                            return value
-
-                    # Look for value in the same parent element
-                    parent_text = parent.get_text(strip=True)
-                    if ':' in parent_text:
-                        parts = parent_text.split(':')
-                        if len(parts) >= 2:
-                            value = parts[1].strip()
-                            if value and len(value) > 0:
-                                return value
-
-            # Strategy 2: Look for field-specific patterns
-            if field_name.lower() == 'status':
-                return self._extract_status_enhanced(card)
-
-            # Strategy 3: Look in all text for field patterns
-            all_text = card.get_text()
-
-            # Pattern: "Field: Value" or "Field - Value"
-            pattern = rf'{re.escape(field_name)}\s*[:\-]\s*([^\n,]+)'
-            match = re.search(pattern, all_text, re.IGNORECASE)
+            match = patterns.structured_field_pattern(field_name).search(all_text)
             if match:
                 value = match.group(1).strip()
                 if value and len(value) > 0:
                     return value
-
             return ''
         except Exception:
             return ''
@@ -496,7 +755,7 @@ class PropertyExtractor:
         """Extract property type from title (1 BHK, 2 BHK, Studio, etc.)"""
         try:
             # Look for BHK patterns
-            bhk_match = re.search(r'(\d+)\s*BHK', title, re.I)
+            bhk_match = patterns.BHK_COUNT.search(title)
             if bhk_match:
                 return f"{bhk_match.group(1)} BHK"
 
@@ -514,41 +773,19 @@ class PropertyExtractor:
         except Exception:
             return ''
 
-    def _extract_contact_options(self, card) -> str:
-        """Extract contact options (Contact Owner, Get Phone No., etc.)"""
+    def _contact_options_from_texts(self, texts: List[str]) -> str:
+        """Keep contact button labels (Contact Owner, Get Phone No., etc.) in first-seen order"""
+        contact_buttons = []
+        for text in texts:
+            if text and any(keyword in text.lower() for keyword in ['contact', 'phone', 'call', 'get']):
+                if text not in contact_buttons:
+                    contact_buttons.append(text)
+        return ', '.join(contact_buttons) if contact_buttons else ''
+
+    def _description_from_paragraphs(self, paragraphs: List[str]) -> str:
+        """Pick the first paragraph that reads like a property description"""
         try:
-            contact_buttons = []
-
-            # Look for contact action buttons
-            contact_selectors = [
-                '.mb-srp__action--btn',
-                '*[class*="action"][class*="btn"]',
-                '*[class*="contact"]',
-                '*[class*="phone"]'
-            ]
-
-            for selector in contact_selectors:
-                elements = card.select(selector)
-                for elem in elements:
-                    text = elem.get_text(strip=True)
-                    if text and any(keyword in text.lower() for keyword in ['contact', 'phone', 'call', 'get']):
-                        if text not in contact_buttons:
-                            contact_buttons.append(text)
-
-            return ', '.join(contact_buttons) if contact_buttons else ''
-
-        except Exception:
-            return ''
-
-    def _extract_description(self, card) -> str:
-        """Extract property description with enhanced fallback strategies"""
-        try:
-            # Strategy 1: Look for actual description paragraphs
-            all_paragraphs = card.find_all('p')
-
-            for p in all_paragraphs:
-                text = p.get_text(strip=True)
-
+            for text in paragraphs:
                 # Look for meaningful descriptions (longer than 50 characters)
                 if text and len(text) > 50:
                     # Remove "Read more" if present
@@ -580,55 +817,35 @@ class PropertyExtractor:
         except Exception:
             return ''
 
-    def _extract_locality_enhanced(self, card) -> str:
-        """Enhanced locality extraction with multiple strategies"""
+    def _locality_from_context(self, candidates: List[str], title: Optional[str], all_text: str) -> str:
+        """Locality from explicit locality elements, then the title, then card text"""
         try:
             # Strategy 1: Look for explicit locality elements
-            locality_selectors = [
-                '.mb-srp__card__ads--locality',
-                '*[class*="locality"]',
-                '*[class*="location"]',
-                '*[class*="address"]',
-                '*[class*="area"]'
-            ]
-
-            for selector in locality_selectors:
-                elements = card.select(selector)
-                for elem in elements:
-                    text = elem.get_text(strip=True)
-                    if text and len(text) > 3 and len(text) < 100:  # Reasonable locality length
-                        # Skip if it's clearly not a locality
-                        if not any(skip in text.lower() for skip in ['contact', 'phone', 'owner', 'photos', 'bhk', 'sqft']):
-                            return text
+            for text in candidates:
+                if text and len(text) > 3 and len(text) < 100:  # Reasonable locality length
+                    # Skip if it's clearly not a locality
+                    if not any(skip in text.lower() for skip in ['contact', 'phone', 'owner', 'photos', 'bhk', 'sqft']):
+                        return text
 
             # Strategy 2: Extract from title (many titles contain locality info)
-            title_elem = card.select_one('h2, h3, .mb-srp__card__title, *[class*="title"]')
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-
+            if title is not None:
                 # Pattern for "in [Locality] [City]"
-                locality_pattern = r'in\s+([^,]+?)(?:\s+(?:Gurgaon|Noida|Mumbai|Delhi|Bangalore|Pune|Chennai|Hyderabad))'
-                match = re.search(locality_pattern, title, re.IGNORECASE)
+                match = patterns.LOCALITY_IN_CITY.search(title)
                 if match:
                     locality = match.group(1).strip()
                     if len(locality) > 3 and len(locality) < 50:
                         return locality
 
                 # Pattern for "Sector XX" or similar
-                sector_pattern = r'(Sector\s+\d+[A-Z]*)'
-                match = re.search(sector_pattern, title, re.IGNORECASE)
+                match = patterns.SECTOR_NAME.search(title)
                 if match:
                     return match.group(1)
 
             # Strategy 3: Look in all text for locality indicators
-            all_text = card.get_text()
-            locality_indicators = ['Sector', 'Block', 'Phase', 'Extension', 'Colony', 'Nagar', 'Vihar']
-
-            for indicator in locality_indicators:
+            for indicator, pattern in patterns.LOCALITY_INDICATOR_PATTERNS:
                 if indicator in all_text:
                     # Extract surrounding text
-                    pattern = rf'({indicator}\s+[A-Z0-9]+[A-Z]*)'
-                    match = re.search(pattern, all_text, re.IGNORECASE)
+                    match = pattern.search(all_text)
                     if match:
                         return match.group(1)
 
@@ -637,71 +854,31 @@ class PropertyExtractor:
         except Exception:
             return ''
 
-    def _extract_society_enhanced(self, card) -> str:
-        """Enhanced society/project name extraction"""
+    def _society_from_context(self, candidates: List[str], href: Optional[str], title: Optional[str]) -> str:
+        """Society/project name from project links, the listing URL, then the title"""
         try:
             # Strategy 1: Look for project/society links
-            link_selectors = [
-                'a[href*="pdpid"]',  # Project detail page links
-                'a[href*="project"]',
-                '*[class*="society"]',
-                '*[class*="project"]',
-                '*[class*="building"]'
-            ]
-
-            for selector in link_selectors:
-                elements = card.select(selector)
-                for elem in elements:
-                    text = elem.get_text(strip=True)
-                    if text and len(text) > 3 and len(text) < 100:
-                        # Skip if it's clearly not a society name
-                        if not any(skip in text.lower() for skip in ['contact', 'phone', 'owner', 'photos', 'bhk', 'sqft', 'for sale']):
-                            return text
+            for text in candidates:
+                if text and len(text) > 3 and len(text) < 100:
+                    # Skip if it's clearly not a society name
+                    if not any(skip in text.lower() for skip in ['contact', 'phone', 'owner', 'photos', 'bhk', 'sqft', 'for sale']):
+                        return text
 
             # Strategy 2: Extract from URL if available
-            url_elem = card.select_one('a[href*="magicbricks.com"]')
-            if url_elem:
-                href = url_elem.get('href', '')
-                if href:
-                    # Extract society name from URL
-                    url_pattern = r'magicbricks\.com/([^-]+(?:-[^-]+)*)-(?:sector|block|phase)'
-                    match = re.search(url_pattern, href, re.IGNORECASE)
-                    if match:
-                        society_name = match.group(1).replace('-', ' ').title()
-                        if len(society_name) > 3:
-                            return society_name
+            if href:
+                # Extract society name from URL
+                match = patterns.SOCIETY_URL.search(href)
+                if match:
+                    society_name = match.group(1).replace('-', ' ').title()
+                    if len(society_name) > 3:
+                        return society_name
 
             # Strategy 3: Look for society names in title
-            title_elem = card.select_one('h2, h3, .mb-srp__card__title, *[class*="title"]')
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-
-                # Enhanced society name patterns
-                society_patterns = [
-                    # Brand-specific patterns
-                    r'(DLF\s+[A-Za-z0-9\s]+)',
-                    r'(Ansal\s+[A-Za-z0-9\s]+)',
-                    r'(ROF\s+[A-Za-z0-9\s]+)',
-                    r'(Tulip\s+[A-Za-z0-9\s]+)',
-                    r'(Hero\s+[A-Za-z0-9\s]+)',
-                    r'(Southend\s+[A-Za-z0-9\s]+)',
-                    r'(Godrej\s+[A-Za-z0-9\s]+)',
-                    r'(Tata\s+[A-Za-z0-9\s]+)',
-                    r'(Emaar\s+[A-Za-z0-9\s]+)',
-                    r'(M3M\s+[A-Za-z0-9\s]+)',
-
-                    # Generic patterns
-                    r'([A-Z][a-z]+\s+(?:Heights|Towers|Residency|Apartments|Homes|Gardens|Park|Plaza|Complex|Floors|Enclave|City|County|Estate))',
-
-                    # Pattern for "Name Sector" format
-                    r'([A-Z][A-Za-z\s]+)\s+(?:Sector|Block|Phase)\s+\d+',
-
-                    # Pattern for society names before "in"
-                    r'(?:in\s+)?([A-Z][A-Za-z\s]{3,30}?)\s+(?:Sector|Block|Phase)',
-                ]
-
-                for pattern in society_patterns:
-                    match = re.search(pattern, title, re.IGNORECASE)
+            if title is not None:
+                # Enhanced society name patterns, tried in order until one
+                # yields a plausible name
+                for pattern in patterns.SOCIETY_TITLE_PATTERNS:
+                    match = pattern.search(title)
                     if match:
                         society_name = match.group(1).strip()
                         if len(society_name) > 3 and len(society_name) < 50:
@@ -712,73 +889,32 @@ class PropertyExtractor:
         except Exception:
             return ''
 
-    def _extract_status_enhanced(self, card) -> str:
-        """
-        Enhanced multi-level status extraction with comprehensive fallback strategy
-        Target: Improve status extraction from 76% to 92%+
-
-        Strategy:
-        1. Direct selector-based extraction
-        2. Text pattern matching with regex
-        3. Keyword-based inference from description
-        4. Contextual inference from other fields
-        """
-        try:
-            # LEVEL 1: Direct selector-based extraction
-            # Try multiple selector patterns for status field
-            status_selectors = [
-                '.mb-srp__card__summary__list--value',  # Primary selector
-                'span[class*="status"]',
-                'div[class*="status"]',
-                'span[class*="possession"]',
-                'div[class*="possession"]',
-                '*[class*="ready"]',
-                '*[class*="construction"]',
-                '*[data-label*="status" i]',
-                '*[data-label*="possession" i]'
-            ]
-
-            for selector in status_selectors:
-                elements = card.select(selector)
-                for elem in elements:
-                    # Check if this element or its parent contains "status" or "possession"
-                    elem_text = elem.get_text(strip=True).lower()
-                    parent_text = elem.parent.get_text(strip=True).lower() if elem.parent else ''
-
-                    # Look for status-related labels
-                    if any(keyword in parent_text for keyword in ['status', 'possession', 'ready']):
-                        text = elem.get_text(strip=True)
-                        if text and 3 < len(text) < 50:
-                            # Validate it's a status value, not a label
-                            if not any(label in text.lower() for label in ['status:', 'possession:', 'label']):
-                                return self._normalize_status(text)
+    def _status_from_candidates(self, candidates: List[List[str]]) -> str:
+        """Status from [element text, parent text] pairs whose parent carries a status label"""
+        for text, parent_text in candidates:
+            # Look for status-related labels
+            if any(keyword in (parent_text or '').lower() for keyword in ['status', 'possession', 'ready']):
+                if text and 3 < len(text) < 50:
+                    # Validate it's a status value, not a label
+                    if not any(label in text.lower() for label in ['status:', 'possession:', 'label']):
+                        return self._normalize_status(text)
+        return ''
 
+    def _status_from_text(self, all_text: str, all_text_lower: Optional[str] = None) -> str:
+        """Status from card text: regex patterns, keywords, then contextual inference"""
+        try:
             # LEVEL 2: Text pattern matching with comprehensive regex patterns
-            all_text = card.get_text()
-
             # Pattern 1: "Status: Ready to Move" or "Possession: Dec 2024"
-            status_patterns = [
-                r'Status[:\s]+([A-Za-z\s]+(?:to\s+Move|Construction|Launch|Resale))',
-                r'Possession[:\s]+([A-Za-z]+\s+\d{4})',
-                r'Possession[:\s]+(Immediate|Ready|Available)',
-                r'Ready\s+to\s+Move',
-                r'Under\s+Construction',
-                r'New\s+Launch',
-                r'Resale',
-                r'Immediate\s+Possession',
-                r'Possession\s+by\s+([A-Za-z]+\s+\d{4})',
-                r'Available\s+from\s+([A-Za-z]+\s+\d{4})'
-            ]
-
-            for pattern in status_patterns:
-                match = re.search(pattern, all_text, re.IGNORECASE)
-                if match:
-                    status_text = match.group(1) if match.lastindex else match.group(0)
-                    return self._normalize_status(status_text)
+            found = patterns.STATUS_TEXT_PATTERNS.first(all_text)
+            if found:
+                match = found[1]
+                status_text = match.group(1) if match.lastindex else match.group(0)
+                return self._normalize_status(status_text)
 
             # LEVEL 3: Keyword-based inference from description
             # Look for status keywords in the full card text
-            all_text_lower = all_text.lower()
+            if all_text_lower is None:
+                all_text_lower = all_text.lower()
 
             # Define status keywords with priority (most specific first)
             status_keywords = [
@@ -799,11 +935,9 @@ class PropertyExtractor:
 
             # LEVEL 4: Contextual inference from other fields
             # Check for possession date patterns
-            possession_date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}'
-            if re.search(possession_date_pattern, all_text, re.IGNORECASE):
-                match = re.search(possession_date_pattern, all_text, re.IGNORECASE)
-                if match:
-                    return f"Possession: {match.group(0)}"
+            match = patterns.POSSESSION_MONTH_YEAR.search(all_text)
+            if match:
+                return f"Possession: {match.group(0)}"
 
             # Check for "new" indicators
             if any(indicator in all_text_lower for indicator in ['newly built', 'brand new', 'new property']):
@@ -817,8 +951,7 @@ class PropertyExtractor:
             # If no status found, return empty string (will be marked as N/A in final data)
             return ''
 
-        except Exception as e:
-            # Log error but don't fail the extraction
+        except Exception:
             return ''
 
     def _normalize_status(self, status_text: str) -> str:
@@ -848,17 +981,8 @@ class PropertyExtractor:
             # Return as-is if it's a valid status
             return status_text.strip()
 
-    def _extract_area_types(self, card) -> dict:
-        """
-        Extract multiple area types (Carpet, Built-up, Super, Plot)
-        Priority 1.2: Area Type Differentiation
-
-        Returns dict with:
-        - carpet_area: Carpet area value
-        - builtup_area: Built-up area value
-        - super_area: Super area value
-        - plot_area: Plot area value
-        """
+    def _area_types_from_texts(self, elem_texts: List[str], all_text: str, summary_title: Optional[str]) -> dict:
+        """Area types from labelled area elements, card text patterns and the summary title"""
         area_data = {
             'carpet_area': None,
             'builtup_area': None,
@@ -867,46 +991,27 @@ class PropertyExtractor:
         }
 
         try:
-            # Get all text from card
-            all_text = card.get_text()
-
             # Strategy 1: Look for labeled area types in structured elements
-            area_selectors = [
-                '*[class*="area"]',
-                '*[class*="sqft"]',
-                '*[class*="size"]',
-                '.mb-srp__card__summary__list--item'
-            ]
-
-            for selector in area_selectors:
-                elements = card.select(selector)
-                for elem in elements:
-                    elem_text = elem.get_text(strip=True).lower()
-
-                    # Extract numeric value and unit
-                    area_value = self._extract_numeric_area_value(elem_text)
-
-                    if area_value:
-                        # Categorize by area type
-                        if 'carpet' in elem_text:
-                            area_data['carpet_area'] = area_value
-                        elif 'built' in elem_text or 'builtup' in elem_text or 'built-up' in elem_text:
-                            area_data['builtup_area'] = area_value
-                        elif 'super' in elem_text:
-                            area_data['super_area'] = area_value
-                        elif 'plot' in elem_text:
-                            area_data['plot_area'] = area_value
+            for elem_text in elem_texts:
+                elem_text = elem_text.lower()
+
+                # Extract numeric value and unit
+                area_value = self._extract_numeric_area_value(elem_text)
+
+                if area_value:
+                    # Categorize by area type
+                    if 'carpet' in elem_text:
+                        area_data['carpet_area'] = area_value
+                    elif 'built' in elem_text or 'builtup' in elem_text or 'built-up' in elem_text:
+                        area_data['builtup_area'] = area_value
+                    elif 'super' in elem_text:
+                        area_data['super_area'] = area_value
+                    elif 'plot' in elem_text:
+                        area_data['plot_area'] = area_value
 
             # Strategy 2: Text pattern matching for area types
-            area_patterns = [
-                (r'Carpet\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'carpet_area'),
-                (r'Built[-\s]?up\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'builtup_area'),
-                (r'Super\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'super_area'),
-                (r'Plot\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'plot_area'),
-            ]
-
-            for pattern, area_type in area_patterns:
-                match = re.search(pattern, all_text, re.IGNORECASE)
+            for pattern, area_type in patterns.AREA_TYPE_PATTERNS:
+                match = pattern.search(all_text)
                 if match and not area_data[area_type]:
                     # Extract numeric value and unit
                     value = match.group(1).replace(',', '')
@@ -915,31 +1020,27 @@ class PropertyExtractor:
 
             # Strategy 3: If no specific area types found, try to infer from property type
             # For plots, any area is likely plot area
-            if not any(area_data.values()):
+            if not any(area_data.values()) and summary_title:
                 # Check if this is a plot property
-                title_elem = card.select_one('.mb-srp__card__summary__title')
-                if title_elem:
-                    title_text = title_elem.get_text().lower()
-                    if 'plot' in title_text or 'land' in title_text:
-                        # Extract any area value and assign to plot_area
-                        area_match = re.search(r'(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', all_text, re.IGNORECASE)
-                        if area_match:
-                            value = area_match.group(1).replace(',', '')
-                            unit = area_match.group(2).lower().replace('.', '').replace(' ', '')
-                            area_data['plot_area'] = f"{value} {unit}"
+                title_text = summary_title.lower()
+                if 'plot' in title_text or 'land' in title_text:
+                    # Extract any area value and assign to plot_area
+                    area_match = patterns.AREA_VALUE.search(all_text)
+                    if area_match:
+                        value = area_match.group(1).replace(',', '')
+                        unit = area_match.group(2).lower().replace('.', '').replace(' ', '')
+                        area_data['plot_area'] = f"{value} {unit}"
 
             return area_data
 
         except Exception as e:
             # Return empty area data on error
             return area_data
-
     def _extract_numeric_area_value(self, text: str) -> str:
         """Extract numeric area value with unit from text"""
         try:
             # Pattern: number + unit (sqft, sq.ft, sq ft, sqm, sq.m, sq m)
-            pattern = r'(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)'
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = patterns.AREA_VALUE.search(text)
 
             if match:
                 value = match.group(1).replace(',', '')
@@ -958,7 +1059,7 @@ class PropertyExtractor:
 
         Args:
             price_text: Price text from listing
-            card: BeautifulSoup card element for additional context
+            card: BeautifulSoup card element (or its text) for additional context
 
         Returns:
             dict with keys: min_price, max_price, is_range
@@ -975,40 +1076,25 @@ class PropertyExtractor:
 
             # Strategy 1: Direct range pattern matching
             # Pattern: "₹ 1.2 - 1.5 Crore" or "₹ 50 - 60 Lakh"
-            range_patterns = [
-                r'₹\s*([\d.]+)\s*-\s*([\d.]+)\s*(Crore|Lakh|Cr|L)',
-                r'([\d.]+)\s*-\s*([\d.]+)\s*(Crore|Lakh|Cr|L)',
-                r'₹\s*([\d.]+)\s*to\s*([\d.]+)\s*(Crore|Lakh|Cr|L)',
-                r'([\d.]+)\s*to\s*([\d.]+)\s*(Crore|Lakh|Cr|L)'
-            ]
-
-            for pattern in range_patterns:
-                match = re.search(pattern, price_text, re.IGNORECASE)
-                if match:
-                    min_val = match.group(1)
-                    max_val = match.group(2)
-                    unit = match.group(3)
-
-                    price_range_data['min_price'] = f"₹ {min_val} {unit}"
-                    price_range_data['max_price'] = f"₹ {max_val} {unit}"
-                    price_range_data['is_range'] = True
-                    return price_range_data
+            found = patterns.PRICE_RANGE_PATTERNS.first(price_text)
+            if found:
+                match = found[1]
+                price_range_data['min_price'] = f"₹ {match.group(1)} {match.group(3)}"
+                price_range_data['max_price'] = f"₹ {match.group(2)} {match.group(3)}"
+                price_range_data['is_range'] = True
+                return price_range_data
 
             # Strategy 2: Check card text for range patterns
             try:
-                all_text = card.get_text()
+                all_text = card if isinstance(card, str) else card.get_text()
 
-                for pattern in range_patterns:
-                    match = re.search(pattern, all_text, re.IGNORECASE)
-                    if match:
-                        min_val = match.group(1)
-                        max_val = match.group(2)
-                        unit = match.group(3)
-
-                        price_range_data['min_price'] = f"₹ {min_val} {unit}"
-                        price_range_data['max_price'] = f"₹ {max_val} {unit}"
-                        price_range_data['is_range'] = True
-                        return price_range_data
+                found = patterns.PRICE_RANGE_PATTERNS.first(all_text)
+                if found:
+                    match = found[1]
+                    price_range_data['min_price'] = f"₹ {match.group(1)} {match.group(3)}"
+                    price_range_data['max_price'] = f"₹ {match.group(2)} {match.group(3)}"
+                    price_range_data['is_range'] = True
+                    return price_range_data
             except:
                 pass
 
@@ -1075,7 +1161,7 @@ class PropertyExtractor:
 
         for selector in selectors:
             try:
-                element = soup.select_one(selector)
+                element = self.css.select_one(soup, selector)
                 if element:
                     title = element.get_text(strip=True)
                     if title and len(title) > 5:  # Ensure meaningful title
@@ -1099,7 +1185,7 @@ class PropertyExtractor:
 
         for selector in selectors:
             try:
-                element = soup.select_one(selector)
+                element = self.css.select_one(soup, selector)
                 if element:
                     price = element.get_text(strip=True)
                     # Validate price format (should contain numbers and currency indicators)
@@ -1123,7 +1209,7 @@ class PropertyExtractor:
 
         for selector in selectors:
             try:
-                element = soup.select_one(selector)
+                element = self.css.select_one(soup, selector)
                 if element:
                     area = element.get_text(strip=True)
                     # Validate area format (should contain numbers and area units)
@@ -1149,7 +1235,7 @@ class PropertyExtractor:
 
         for selector in amenity_selectors:
             try:
-                elements = soup.select(selector)
+                elements = self.css.select(soup, selector)
                 for element in elements:
                     amenity = element.get_text(strip=True)
                     if amenity and len(amenity) > 2 and amenity not in amenities:
@@ -1172,7 +1258,7 @@ class PropertyExtractor:
 
         for selector in selectors:
             try:
-                element = soup.select_one(selector)
+                element = self.css.select_one(soup, selector)
                 if element:
                     description = element.get_text(strip=True)
                     if description and len(description) > 20:  # Ensure meaningful description
@@ -1196,7 +1282,7 @@ class PropertyExtractor:
 
         for selector in builder_selectors:
             try:
-                element = soup.select_one(selector)
+                element = self.css.select_one(soup, selector)
                 if element:
                     name = element.get_text(strip=True)
                     if name and len(name) > 2:
@@ -1221,7 +1307,7 @@ class PropertyExtractor:
 
         for selector in location_selectors:
             try:
-                element = soup.select_one(selector)
+                element = self.css.select_one(soup, selector)
                 if element:
                     address = element.get_text(strip=True)
                     if address and len(address) > 5:
@@ -1246,7 +1332,7 @@ class PropertyExtractor:
 
         for selector in spec_selectors:
             try:
-                rows = soup.select(selector)
+                rows = self.css.select(soup, selector)
                 for row in rows:
                     cells = row.find_all(['td', 'th'])
                     if len(cells) >= 2:
@@ -1260,9 +1346,11 @@ class PropertyExtractor:
 
         return specifications
 
-    def get_extraction_statistics(self) -> Dict[str, int]:
-        """Get current extraction statistics"""
-        return self.extraction_stats.copy()
+    def get_extraction_statistics(self) -> Dict[str, Any]:
+        """Get current extraction statistics, with selector compile time versus match time"""
+        stats = self.extraction_stats.copy()
+        stats['selectors'] = self.css.get_statistics()
+        return stats
 
     def reset_extraction_statistics(self):
         """Reset extraction statistics"""
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Regex Registry Module
+Precompiled patterns shared by PropertyExtractor, DataValidator and DateParsingSystem.
+Patterns are compiled once at import instead of being looked up by string in
+re's internal cache on every call inside per-card loops.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+
+class PatternTable:
+    """
+    Ordered pattern table: the first pattern (in table order) that matches
+    anywhere in the text wins, exactly like looping re.search over the list
+
+    Optional guards give, per pattern, literals of which at least one must occur
+    in the text for the pattern to match (compared case-folded for IGNORECASE
+    tables). Patterns whose guards are absent are skipped without a scan.
+    """
+
+    __slots__ = ('patterns', 'guards', 'fold')
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0,
+                 guards: Optional[Sequence[Optional[Tuple[str, ...]]]] = None):
+        self.patterns: List[Pattern] = [re.compile(pattern, flags) for pattern in patterns]
+        self.guards = list(guards) if guards is not None else [None] * len(self.patterns)
+        if len(self.guards) != len(self.patterns):
+            raise ValueError("guards must have one entry per pattern")
+        self.fold = bool(flags & re.IGNORECASE)
+
+    def first(self, text: str) -> Optional[Tuple[int, Any]]:
+        """(table index, match) of the first pattern that matches, or None"""
+        haystack = None
+        for index, pattern in enumerate(self.patterns):
+            guard = self.guards[index]
+            if guard:
+                if haystack is None:
+                    haystack = text.casefold() if self.fold else text
+                if not any(literal in haystack for literal in guard):
+                    continue
+            match = pattern.search(text)
+            if match:
+                return index, match
+        return None
+
+    def __iter__(self) -> Iterator[Pattern]:
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
+def findall_item(match) -> Any:
+    """First item re.findall would have returned, built from a single search match"""
+    groups = match.groups('')
+    if not groups:
+        return match.group(0)
+    return groups[0] if len(groups) == 1 else groups
+
+
+# ---- Listing card text fallbacks (PropertyExtractor) ----
+
+PRICE_TEXT_PATTERNS = PatternTable([
+    r'₹[\d,.]+ (?:Crore|Lakh|crore|lakh)',
+    r'₹[\d,.]+\s*(?:Cr|L|cr|l)\b',
+    r'₹[\d,.]+',
+    r'\b[\d,.]+ (?:Crore|Lakh|crore|lakh)\b',
+    r'Price[:\s]*₹[\d,.]+',
+    r'Cost[:\s]*₹[\d,.]+'
+])
+
+AREA_TEXT_PATTERNS = PatternTable([
+    r'\b\d+[\d,.]* (?:sqft|sq ft|Sq\.? ?ft|SQFT)\b',
+    r'\b\d+[\d,.]* (?:sq\.?m|sqm|Sq\.?M)\b',
+    r'(?:Carpet|Super|Built)[\s:]*\d+[\d,.]* (?:sqft|sq ft)',
+    r'Area[:\s]*\d+[\d,.]* (?:sqft|sq ft)',
+    r'Size[:\s]*\d+[\d,.]* (?:sqft|sq ft)',
+    r'\d+[\d,.]* (?:Sq\.? ?Ft|SQFT)'
+], re.IGNORECASE)
+
+TITLE_TEXT_PATTERNS = PatternTable([
+    r'\b\d+ BHK .+',
+    r'\b\d+ Bedroom .+',
+    r'(?:Apartment|House|Villa|Plot) .+',
+    r'[A-Z][a-z]+ [A-Z][a-z]+ .+'
+])
+
+PRICE_CRORE_LAKH = PRICE_TEXT_PATTERNS.patterns[0]
+AREA_SQFT = re.compile(r'\d+[\d,.]* (?:sqft|sq ft|Sq\.? ?ft)', re.IGNORECASE)
+
+BHK_COUNT = re.compile(r'(\d+)\s*BHK', re.IGNORECASE)
+
+# ---- Locality / society ----
+
+LOCALITY_IN_CITY = re.compile(
+    r'in\s+([^,]+?)(?:\s+(?:Gurgaon|Noida|Mumbai|Delhi|Bangalore|Pune|Chennai|Hyderabad))', re.IGNORECASE
+)
+SECTOR_NAME = re.compile(r'(Sector\s+\d+[A-Z]*)', re.IGNORECASE)
+
+LOCALITY_INDICATORS = ('Sector', 'Block', 'Phase', 'Extension', 'Colony', 'Nagar', 'Vihar')
+LOCALITY_INDICATOR_PATTERNS = tuple(
+    (indicator, re.compile(rf'({indicator}\s+[A-Z0-9]+[A-Z]*)', re.IGNORECASE))
+    for indicator in LOCALITY_INDICATORS
+)
+
+SOCIETY_URL = re.compile(r'magicbricks\.com/([^-]+(?:-[^-]+)*)-(?:sector|block|phase)', re.IGNORECASE)
+
+SOCIETY_TITLE_PATTERNS = PatternTable([
+    # Brand-specific patterns
+    r'(DLF\s+[A-Za-z0-9\s]+)',
+    r'(Ansal\s+[A-Za-z0-9\s]+)',
+    r'(ROF\s+[A-Za-z0-9\s]+)',
+    r'(Tulip\s+[A-Za-z0-9\s]+)',
+    r'(Hero\s+[A-Za-z0-9\s]+)',
+    r'(Southend\s+[A-Za-z0-9\s]+)',
+    r'(Godrej\s+[A-Za-z0-9\s]+)',
+    r'(Tata\s+[A-Za-z0-9\s]+)',
+    r'(Emaar\s+[A-Za-z0-9\s]+)',
+    r'(M3M\s+[A-Za-z0-9\s]+)',
+
+    # Generic patterns
+    r'([A-Z][a-z]+\s+(?:Heights|Towers|Residency|Apartments|Homes|Gardens|Park|Plaza|Complex|Floors|Enclave|City|County|Estate))',
+
+    # Pattern for "Name Sector" format
+    r'([A-Z][A-Za-z\s]+)\s+(?:Sector|Block|Phase)\s+\d+',
+
+    # Pattern for society names before "in"
+    r'(?:in\s+)?([A-Z][A-Za-z\s]{3,30}?)\s+(?:Sector|Block|Phase)',
+], re.IGNORECASE)
+
+# ---- Status / possession ----
+
+STATUS_TEXT_PATTERNS = PatternTable([
+    r'Status[:\s]+([A-Za-z\s]+(?:to\s+Move|Construction|Launch|Resale))',
+    r'Possession[:\s]+([A-Za-z]+\s+\d{4})',
+    r'Possession[:\s]+(Immediate|Ready|Available)',
+    r'Ready\s+to\s+Move',
+    r'Under\s+Construction',
+    r'New\s+Launch',
+    r'Resale',
+    r'Immediate\s+Possession',
+    r'Possession\s+by\s+([A-Za-z]+\s+\d{4})',
+    r'Available\s+from\s+([A-Za-z]+\s+\d{4})'
+], re.IGNORECASE, guards=[
+    ('status',), ('possession',), ('possession',), ('ready',), ('under',),
+    ('new',), ('resale',), ('immediate',), ('possession',), ('available',)
+])
+
+POSSESSION_MONTH_YEAR = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}', re.IGNORECASE)
+
+# ---- Areas ----
+
+AREA_VALUE = re.compile(r'(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', re.IGNORECASE)
+
+AREA_TYPE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), area_type) for pattern, area_type in (
+    (r'Carpet\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'carpet_area'),
+    (r'Built[-\s]?up\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'builtup_area'),
+    (r'Super\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'super_area'),
+    (r'Plot\s+Area[:\s]+(\d+[\d,]*\.?\d*)\s*(sq\.?\s*ft|sqft|sq\.?\s*m|sqm)', 'plot_area'),
+))
+
+# ---- Price ranges ----
+
+PRICE_RANGE_PATTERNS = PatternTable([
+    r'₹\s*([\d.]+)\s*-\s*([\d.]+)\s*(Crore|Lakh|Cr|L)',
+    r'([\d.]+)\s*-\s*([\d.]+)\s*(Crore|Lakh|Cr|L)',
+    r'₹\s*([\d.]+)\s*to\s*([\d.]+)\s*(Crore|Lakh|Cr|L)',
+    r'([\d.]+)\s*to\s*([\d.]+)\s*(Crore|Lakh|Cr|L)'
+], re.IGNORECASE)
+
+# ---- Numeric cleanup (DataValidator) ----
+
+DIGITS = re.compile(r'\d+')
+DECIMAL_NUMBER = re.compile(r'(\d+\.?\d*)')
+PRICE_NOISE = re.compile(r'[₹,\s]')
+
+# ---- Posting dates (DateParsingSystem) ----
+
+# (pattern, pattern_type, confidence) in priority order
+DATE_PATTERNS = [
+    # Hours ago patterns
+    (r'(\d+)\s+hours?\s+ago', 'hours_ago', 1.0),
+    (r'Posted:?\s*(\d+)\s+hours?\s+ago', 'posted_hours_ago', 1.0),
+
+    # Days ago patterns
+    (r'(\d+)\s+days?\s+ago', 'days_ago', 1.0),
+    (r'Posted:?\s*(\d+)\s+days?\s+ago', 'posted_days_ago', 1.0),
+
+    # Weeks ago patterns
+    (r'(\d+)\s+weeks?\s+ago', 'weeks_ago', 1.0),
+    (r'Posted:?\s*(\d+)\s+weeks?\s+ago', 'posted_weeks_ago', 1.0),
+
+    # Months ago patterns
+    (r'(\d+)\s+months?\s+ago', 'months_ago', 0.9),
+    (r'Posted:?\s*(\d+)\s+months?\s+ago', 'posted_months_ago', 0.9),
+
+    # Today patterns
+    (r'\btoday\b', 'today', 1.0),
+    (r'Posted:?\s*today', 'posted_today', 1.0),
+
+    # Yesterday patterns
+    (r'\byesterday\b', 'yesterday', 1.0),
+    (r'Posted:?\s*yesterday', 'posted_yesterday', 1.0),
+
+    # Absolute date patterns (lower confidence)
+    (r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})', 'absolute_date', 0.7),
+    (r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{2,4})', 'month_date', 0.8)
+]
+
+
+MONTH_ABBREVIATIONS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+
+# Literal each DATE_PATTERNS entry cannot match without
+DATE_PATTERN_GUARDS = [
+    ('ago',), ('ago',), ('ago',), ('ago',), ('ago',), ('ago',), ('ago',), ('ago',),
+    ('today',), ('today',),
+    ('yesterday',), ('yesterday',),
+    ('/', '-'),
+    MONTH_ABBREVIATIONS
+]
+
+DATE_PATTERN_TABLE = PatternTable([pattern for pattern, _, _ in DATE_PATTERNS], re.IGNORECASE,
+                                  guards=DATE_PATTERN_GUARDS)
+
+
+@lru_cache(maxsize=64)
+def structured_field_pattern(field_name: str) -> Pattern:
+    """"Field: Value" / "Field - Value" pattern for a structured label"""
+    return re.compile(rf'{re.escape(field_name)}\s*[:\-]\s*([^\n,]+)', re.IGNORECASE)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Selector Ranker Module
+Learns which fallback selectors never yield a listing field and stops trying them first.
+Hit counts and lookup latency are kept per field and selector, the order is
+recomputed every few hundred lookups, and the statistics persist in SQLite so a
+new run starts from the learned order.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Sequence
+
+from sqlite_connection_manager import get_connection
+
+
+class SelectorRanker:
+    """
+    Per-field selector ordering from hit statistics
+
+    A hit is a selector producing the field's value (the first valid text); a
+    miss is a selector that was tried and produced nothing usable. Selectors
+    keep their configured priority: one that never hit after `prune_after`
+    attempts is pruned to the end of the list - still tried as a last resort,
+    so a field is never lost, but no longer paid for on every card. Hits never
+    move a selector ahead of a higher-priority one, so a generic fallback that
+    matches every card cannot take over from the specific selector before it.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, reorder_interval: int = 200,
+                 prune_after: int = 50, logger=None):
+        """
+        Initialize selector ranker
+
+        Args:
+            db_path: SQLite database for persisted statistics (None keeps them in memory)
+            reorder_interval: Lookups per field between order recomputations
+            prune_after: Attempts without a hit before a selector is pruned to the end
+            logger: Logger instance
+        """
+        self.db_path = db_path
+        self.reorder_interval = max(1, reorder_interval)
+        self.prune_after = prune_after
+        self.logger = logger or logging.getLogger(__name__)
+
+        # field -> selector -> [attempts, hits, total_seconds]
+        self._stats: Dict[str, Dict[str, List[float]]] = {}
+        # (field, selectors) -> index order currently in use
+        self._orders: Dict[tuple, List[int]] = {}
+        self._lookups_since_reorder: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.reorders = 0
+
+        if self.db_path:
+            self._ensure_table()
+            self.load()
+
+    # ---- ordering ----
+
+    def order(self, field: str, selectors: Sequence[str]) -> List[int]:
+        """Indices into `selectors` in the order they should be tried"""
+        key = (field, tuple(selectors))
+        # end_lookup() and merge() replace orders from other threads
+        with self._lock:
+            ranked = self._orders.get(key)
+            if ranked is None:
+                ranked = self._rank(field, key[1])
+                self._orders[key] = ranked
+        return ranked
+
+    def _rank(self, field: str, selectors: Sequence[str]) -> List[int]:
+        stats = self._stats.get(field, {})
+
+        def sort_key(index):
+            attempts, hits, _ = stats.get(selectors[index], (0, 0, 0.0))
+            return (hits == 0 and attempts >= self.prune_after, index)
+
+        return sorted(range(len(selectors)), key=sort_key)
+
+    def record(self, field: str, selector: str, hit: bool, seconds: float = 0.0):
+        """Record one selector attempt for a field"""
+        with self._lock:
+            entry = self._stats.setdefault(field, {}).setdefault(selector, [0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += 1 if hit else 0
+            entry[2] += seconds
+
+    def end_lookup(self, field: str):
+        """Mark one complete field lookup; recomputes the field's order every reorder_interval lookups"""
+        with self._lock:
+            count = self._lookups_since_reorder.get(field, 0) + 1
+            if count < self.reorder_interval:
+                self._lookups_since_reorder[field] = count
+                return
+            self._lookups_since_reorder[field] = 0
+            changed = False
+            for key in [k for k in self._orders if k[0] == field]:
+                ranked = self._rank(field, key[1])
+                if ranked != self._orders[key]:
+                    self._orders[key] = ranked
+                    changed = True
+            if changed:
+                self.reorders += 1
+                self.logger.debug(f"Selector order for '{field}' updated from hit statistics")
+
+    # ---- sharing with extraction processes ----
+
+    def snapshot(self) -> Dict[str, Dict[str, List[float]]]:
+        """Copy of the statistics (field -> selector -> [attempts, hits, total_seconds])"""
+        with self._lock:
+            return {field: {selector: list(entry) for selector, entry in selectors.items()}
+                    for field, selectors in self._stats.items()}
+
+    @staticmethod
+    def difference(after: Dict[str, Dict[str, List[float]]],
+                   before: Dict[str, Dict[str, List[float]]]) -> Dict[str, Dict[str, List[float]]]:
+        """Statistics recorded between two snapshots"""
+        delta = {}
+        for field, selectors in after.items():
+            previous = before.get(field, {})
+            for selector, entry in selectors.items():
+                old = previous.get(selector, (0, 0, 0.0))
+                if entry[0] != old[0]:
+                    delta.setdefault(field, {})[selector] = [entry[i] - old[i] for i in range(3)]
+        return delta
+
+    def merge(self, stats: Dict[str, Dict[str, List[float]]]):
+        """Add statistics gathered elsewhere (another process) to this ranker"""
+        with self._lock:
+            for field, selectors in stats.items():
+                for selector, counts in selectors.items():
+                    entry = self._stats.setdefault(field, {}).setdefault(selector, [0, 0, 0.0])
+                    for i in range(3):
+                        entry[i] += counts[i]
+            self._orders.clear()
+
+    # ---- persistence ----
+
+    def _ensure_table(self):
+        connection = get_connection(self.db_path)
+        try:
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS selector_stats (
+                    field TEXT NOT NULL,
+                    selector TEXT NOT NULL,
+                    attempts INTEGER DEFAULT 0,
+                    hits INTEGER DEFAULT 0,
+                    total_seconds REAL DEFAULT 0,
+                    updated_at TIMESTAMP,
+                    PRIMARY KEY (field, selector)
+                )
+            ''')
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    def load(self) -> int:
+        """Load persisted statistics; returns the number of selector rows read"""
+        if not self.db_path:
+            return 0
+        try:
+            rows = get_connection(self.db_path).execute(
+                'SELECT field, selector, attempts, hits, total_seconds FROM selector_stats'
+            ).fetchall()
+        except Exception as e:
+            self.logger.warning(f"Could not load selector statistics: {e}")
+            return 0
+
+        with self._lock:
+            for field, selector, attempts, hits, seconds in rows:
+                self._stats.setdefault(field, {})[selector] = [attempts or 0, hits or 0, seconds or 0.0]
+            self._orders.clear()
+        return len(rows)
+
+    def save(self) -> bool:
+        """Persist current statistics (replaces stored rows for the same field/selector)"""
+        if not self.db_path:
+            return False
+        with self._lock:
+            rows = [(field, selector, int(entry[0]), int(entry[1]), float(entry[2]), datetime.now())
+                    for field, selectors in self._stats.items()
+                    for selector, entry in selectors.items()]
+        connection = None
+        try:
+            connection = get_connection(self.db_path)
+            connection.executemany('''
+                INSERT OR REPLACE INTO selector_stats
+                (field, selector, attempts, hits, total_seconds, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+            connection.commit()
+            return True
+        except Exception as e:
+            if connection is not None:
+                connection.rollback()
+            self.logger.warning(f"Could not save selector statistics: {e}")
+            return False
+
+    def reset(self, field: Optional[str] = None):
+        """Forget learned statistics (all fields or one) - use after site markup changes"""
+        with self._lock:
+            if field is None:
+                self._stats.clear()
+                self._orders.clear()
+                self._lookups_since_reorder.clear()
+            else:
+                self._stats.pop(field, None)
+                self._lookups_since_reorder.pop(field, None)
+                for key in [k for k in self._orders if k[0] == field]:
+                    del self._orders[key]
+        if self.db_path:
+            connection = None
+            try:
+                connection = get_connection(self.db_path)
+                if field is None:
+                    connection.execute('DELETE FROM selector_stats')
+                else:
+                    connection.execute('DELETE FROM selector_stats WHERE field = ?', (field,))
+                connection.commit()
+            except Exception as e:
+                if connection is not None:
+                    connection.rollback()
+                self.logger.warning(f"Could not reset selector statistics: {e}")
+
+    # ---- reporting ----
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Per-field leading selector, its hit rate and the number of pruned selectors"""
+        fields = {}
+        with self._lock:
+            for field, selectors in self._stats.items():
+                attempts = sum(entry[0] for entry in selectors.values())
+                leader, entry = max(selectors.items(), key=lambda item: item[1][1])
+                fields[field] = {
+                    'leader': leader if entry[1] else None,
+                    'leader_hits': int(entry[1]),
+                    'attempts': int(attempts),
+                    'avg_lookup_ms': round(sum(e[2] for e in selectors.values()) / attempts * 1000, 3) if attempts else 0.0,
+                    'pruned': sum(1 for e in selectors.values() if e[1] == 0 and e[0] >= self.prune_after)
+                }
+        return {'reorders': self.reorders, 'fields': fields}
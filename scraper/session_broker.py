@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Session Broker Module
+Hands the Chrome session's credentials to lightweight HTTP clients.
+After a successful browser navigation the driver's cookies and user agent are
+exported into one pooled keep-alive requests session, which the listing
+fetcher and the async PDP engine share. When one of them sees a bot-detection
+response the broker re-navigates the browser to the page the credentials came
+from and exports them again (one refresh at a time, rate limited).
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+
+# Headers requests/urllib3 negotiate themselves (only encodings they can decode)
+MANAGED_HEADERS = ('accept-encoding', 'connection', 'host', 'content-length')
+
+
+class SessionBroker:
+    """
+    Owner of the browser-derived HTTP session
+
+    `version` increases with every export, so a client can tell whether the
+    credentials changed since its request went out (and skip a refresh another
+    client already did).
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, pool_size: int = 8,
+                 refresh_callback: Optional[Callable[[str], Any]] = None,
+                 min_refresh_interval: float = 30.0, logger=None):
+        """
+        Initialize session broker
+
+        Args:
+            headers: Realistic request headers (the ones Chrome is configured with)
+            pool_size: Keep-alive connections kept per host
+            refresh_callback: Called with the URL to re-navigate; returns the driver
+                holding fresh credentials, or None when the browser could not pass
+            min_refresh_interval: Minimum seconds between browser refreshes
+            logger: Logger instance
+        """
+        self.refresh_callback = refresh_callback
+        self.min_refresh_interval = min_refresh_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({name: value for name, value in (headers or {}).items()
+                                     if name.lower() not in MANAGED_HEADERS})
+
+        self.cookies: List[Dict[str, Any]] = []
+        self.user_agent: Optional[str] = None
+        self.source_url: Optional[str] = None
+        self.version = 0
+        self.last_export_time = 0.0
+        self.last_refresh_time = 0.0
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        # Broker statistics
+        self.stats = {
+            'exports': 0,
+            'export_failures': 0,
+            'bot_responses': 0,
+            'refreshes': 0,
+            'refresh_failures': 0,
+            'refreshes_throttled': 0,
+            'exports_by_reason': {}
+        }
+
+    @property
+    def has_credentials(self) -> bool:
+        return bool(self.cookies)
+
+    def set_user_agent(self, user_agent: Optional[str]):
+        """Send the browser's user agent so exported cookies match the client"""
+        if user_agent:
+            with self._lock:
+                self.user_agent = user_agent
+                self.session.headers['User-Agent'] = user_agent
+
+    def load_cookies(self, cookies: List[Dict[str, Any]], source_url: Optional[str] = None) -> int:
+        """
+        Replace the session cookies with cookies from a WebDriver (driver.get_cookies())
+
+        The new jar is swapped in whole, so requests in flight on other threads
+        never see a half-loaded session.
+
+        Returns:
+            Number of cookies loaded
+        """
+        jar = RequestsCookieJar()
+        loaded = []
+        for cookie in cookies or []:
+            if not cookie.get('name'):
+                continue
+            jar.set(cookie['name'], cookie.get('value', ''),
+                    domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                    secure=bool(cookie.get('secure')))
+            loaded.append(cookie)
+
+        with self._lock:
+            self.session.cookies = jar
+            self.cookies = loaded
+            if source_url:
+                self.source_url = source_url
+            self.version += 1
+            self.last_export_time = time.time()
+        return len(loaded)
+
+    def export_from_driver(self, driver, user_agent: Optional[str] = None, reason: str = 'navigation') -> int:
+        """
+        Copy the driver's cookies and user agent into the HTTP session after a successful navigation
+
+        Returns:
+            Number of cookies exported (0 when the driver could not be read)
+        """
+        try:
+            cookies = driver.get_cookies()
+            source_url = getattr(driver, 'current_url', None)
+        except Exception as e:
+            self.logger.warning(f"[SESSION] Could not export browser cookies: {e}")
+            self.stats['export_failures'] += 1
+            return 0
+
+        self.set_user_agent(user_agent)
+        loaded = self.load_cookies(cookies, source_url)
+        with self._lock:
+            self.stats['exports'] += 1
+            self.stats['exports_by_reason'][reason] = self.stats['exports_by_reason'].get(reason, 0) + 1
+        self.logger.debug(f"[SESSION] Exported {loaded} browser cookies ({reason}, version {self.version})")
+        return loaded
+
+    def request_headers(self) -> Dict[str, str]:
+        """Session headers with the cookies folded into one Cookie header (for clients without the jar)"""
+        with self._lock:
+            headers = dict(self.session.headers)
+            cookie_pairs = [f"{c['name']}={c.get('value', '')}" for c in self.cookies]
+        if cookie_pairs:
+            headers['Cookie'] = '; '.join(cookie_pairs)
+        return headers
+
+    def refresh(self, seen_version: Optional[int] = None, url: Optional[str] = None) -> bool:
+        """
+        Refresh the credentials through the browser after a bot-detection response
+
+        Args:
+            seen_version: Broker version the blocked request was sent with; if the
+                credentials changed since, the refresh already happened
+            url: Page to re-navigate (default: the page of the last export)
+
+        Returns:
+            True when the session carries credentials newer than seen_version
+        """
+        with self._lock:
+            self.stats['bot_responses'] += 1
+
+        with self._refresh_lock:
+            if seen_version is not None and self.version != seen_version:
+                return True
+            if self.refresh_callback is None:
+                return False
+            if time.time() - self.last_refresh_time < self.min_refresh_interval:
+                self.stats['refreshes_throttled'] += 1
+                return False
+
+            target = url or self.source_url
+            if not target:
+                return False
+            self.last_refresh_time = time.time()
+            self.logger.info(f"[SESSION] Bot response over HTTP - refreshing credentials via browser ({target})")
+            try:
+                driver = self.refresh_callback(target)
+            except Exception as e:
+                self.logger.warning(f"[SESSION] Browser refresh failed: {e}")
+                driver = None
+            if driver is None or not self.export_from_driver(driver, self.user_agent, reason='refresh'):
+                self.stats['refresh_failures'] += 1
+                return False
+            self.stats['refreshes'] += 1
+            return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Exports, refreshes and the current credential state"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['exports_by_reason'] = dict(self.stats['exports_by_reason'])
+            stats['cookies'] = len(self.cookies)
+            stats['version'] = self.version
+        return stats
+
+    def close(self):
+        self.session.close()
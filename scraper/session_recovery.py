@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Session Recovery Module
+Tiered browser recovery for bot detection and connection errors.
+The first tier keeps the Chrome process: it opens a fresh tab, closes the old
+ones and clears cookies, cache and site storage over CDP. A full relaunch
+(quit + new Chrome) is the last tier, used for dead sessions, after a soft
+reset fails, or when soft resets keep repeating on the same session.
+Latency and success rate are recorded per tier.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, Deque, Dict, Optional
+
+# Errors after which the WebDriver session is gone and only a relaunch helps
+DEAD_SESSION_MARKERS = (
+    'invalid session id',
+    'chrome not reachable',
+    'session deleted',
+    'disconnected',
+    'actively refused',
+    'connection refused'
+)
+
+# Origins whose storage a soft reset clears
+RESET_ORIGINS = ('https://www.magicbricks.com',)
+
+TIERS = ('soft_reset', 'relaunch')
+
+
+class SessionRecovery:
+    """
+    Chooses and runs the cheapest recovery tier for a driver
+    """
+
+    def __init__(self, max_soft_resets: int = 2, escalation_window: float = 300.0,
+                 prepare_tab: Optional[Callable[[Any], None]] = None, origins=RESET_ORIGINS, logger=None):
+        """
+        Initialize session recovery
+
+        Args:
+            max_soft_resets: Soft resets of one session within escalation_window
+                before the next recovery relaunches it
+            escalation_window: Seconds a soft reset counts towards escalation
+            prepare_tab: Re-applies per-tab setup (CDP headers) to the fresh tab
+            origins: Origins whose storage is cleared
+            logger: Logger instance
+        """
+        self.max_soft_resets = max_soft_resets
+        self.escalation_window = escalation_window
+        self.prepare_tab = prepare_tab
+        self.origins = tuple(origins)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._recent_resets: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+        # Recovery statistics per tier
+        self.stats = {tier: {'attempts': 0, 'successes': 0, 'seconds': 0.0} for tier in TIERS}
+        self.stats['escalations'] = 0
+
+    @staticmethod
+    def is_dead_session(error: Optional[str]) -> bool:
+        error = (error or '').lower()
+        return any(marker in error for marker in DEAD_SESSION_MARKERS)
+
+    def recover(self, driver, relaunch: Callable[[], Any], error: Optional[str] = None, lock=None) -> str:
+        """
+        Recover a driver with the cheapest tier that applies
+
+        Args:
+            driver: WebDriver to recover (None forces a relaunch)
+            relaunch: Full relaunch (quit + new Chrome); returning False means it failed
+            error: Error text that triggered the recovery (None for bot detection)
+            lock: Lock guarding the driver while the soft reset runs
+
+        Returns:
+            Tier that was used last ('soft_reset' or 'relaunch')
+        """
+        key = str(getattr(driver, 'session_id', id(driver)))
+        if driver is not None and not self.is_dead_session(error) and not self._needs_escalation(key):
+            start = time.perf_counter()
+            try:
+                with lock or nullcontext():
+                    self.soft_reset(driver)
+                self._record('soft_reset', True, time.perf_counter() - start)
+                with self._lock:
+                    self._recent_resets.setdefault(key, deque()).append(time.time())
+                self.logger.info(f"[RECOVERY] Soft reset done in {time.perf_counter() - start:.1f}s (Chrome kept)")
+                return 'soft_reset'
+            except Exception as e:
+                self._record('soft_reset', False, time.perf_counter() - start)
+                self.logger.warning(f"[RECOVERY] Soft reset failed ({e}) - relaunching Chrome")
+
+        start = time.perf_counter()
+        try:
+            ok = relaunch() is not False
+        except Exception as e:
+            self.logger.error(f"[RECOVERY] Relaunch failed: {e}")
+            ok = False
+        self._record('relaunch', ok, time.perf_counter() - start)
+        with self._lock:
+            self._recent_resets.pop(key, None)
+        return 'relaunch'
+
+    def soft_reset(self, driver):
+        """Fresh tab (old tabs closed) plus cleared cookies, cache and site storage"""
+        old_handles = list(driver.window_handles)
+        driver.switch_to.new_window('tab')
+        fresh = driver.current_window_handle
+        for handle in old_handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh)
+
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        for origin in self.origins:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        if self.prepare_tab is not None:
+            self.prepare_tab(driver)
+
+    def _needs_escalation(self, key: str) -> bool:
+        """Too many soft resets of this session recently: go straight to a relaunch"""
+        with self._lock:
+            recent = self._recent_resets.get(key)
+            if not recent:
+                return False
+            cutoff = time.time() - self.escalation_window
+            while recent and recent[0] < cutoff:
+                recent.popleft()
+            if len(recent) >= self.max_soft_resets:
+                self.stats['escalations'] += 1
+                self.logger.info(f"[RECOVERY] {len(recent)} soft resets in {self.escalation_window:.0f}s - escalating")
+                return True
+            return False
+
+    def _record(self, tier: str, success: bool, seconds: float):
+        with self._lock:
+            entry = self.stats[tier]
+            entry['attempts'] += 1
+            entry['successes'] += int(success)
+            entry['seconds'] += seconds
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Attempts, success rate and average latency per tier, plus relaunches avoided"""
+        with self._lock:
+            report = {'escalations': self.stats['escalations']}
+            for tier in TIERS:
+                entry = self.stats[tier]
+                attempts = entry['attempts']
+                report[tier] = {
+                    'attempts': attempts,
+                    'successes': entry['successes'],
+                    'success_rate': round(entry['successes'] / attempts, 3) if attempts else 0.0,
+                    'avg_seconds': round(entry['seconds'] / attempts, 3) if attempts else 0.0
+                }
+            report['relaunches_avoided'] = report['soft_reset']['successes']
+            return report
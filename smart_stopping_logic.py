@@ -11,6 +11,7 @@ from typing import Dict, List, Any, Optional, Tuple
 import json
 from pathlib import Path
 from date_parsing_system import DateParsingSystem
+from sqlite_connection_manager import get_connection
 
 
 class SmartStoppingLogic:
@@ -53,7 +54,7 @@ class SmartStoppingLogic:
         """Connect to database"""
         
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connection = get_connection(self.db_path)
             return True
         except Exception as e:
             print(f"[ERROR] Database connection failed: {str(e)}")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+SQLite Connection Manager Module
+One database access layer shared by the tracking modules, the scraper and the GUI.
+Each thread gets a long-lived connection per database (opened once, reused by
+every module) in WAL mode with synchronous=NORMAL, a busy timeout and larger
+page cache / mmap sizes, so the GUI reader and the scraper writer no longer
+stall each other with "database is locked".
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Connection settings applied when a connection is opened
+DEFAULT_SETTINGS = {
+    'timeout': 30.0,            # Seconds a statement waits on a locked database (busy timeout)
+    'read_only_timeout': 1.0,   # Busy timeout of read-only connections (GUI thread must not hang)
+    'journal_mode': 'WAL',      # Readers do not block the writer and vice versa
+    'synchronous': 'NORMAL',    # fsync at checkpoints only (safe in WAL mode)
+    'cache_size_kb': 16384,     # Page cache per connection
+    'mmap_size_mb': 128,        # Memory-mapped I/O for reads
+    'temp_store': 'MEMORY'      # Temp tables and sort spills in memory
+}
+
+
+class SharedConnection(sqlite3.Connection):
+    """
+    Connection owned by the manager: close() from callers is a no-op
+
+    Other modules on the same thread may have a transaction open on this
+    connection, so closing never rolls back; callers commit or roll back the
+    work they started themselves.
+    """
+
+    def close(self):
+        pass
+
+    def _close(self):
+        sqlite3.Connection.close(self)
+
+
+class SQLiteConnectionManager:
+    """
+    Per-thread, per-database long-lived SQLite connections
+    """
+
+    def __init__(self, **settings):
+        """
+        Initialize connection manager
+
+        Args:
+            settings: Overrides of DEFAULT_SETTINGS
+        """
+        self.settings = dict(DEFAULT_SETTINGS, **settings)
+        # (thread id, absolute path, read only, row factory) -> (connection, inode at open)
+        self._connections: Dict[Tuple, Tuple[SharedConnection, Optional[int]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {'opened': 0, 'reused': 0, 'reopened': 0, 'closed': 0}
+
+    @staticmethod
+    def _inode(path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_ino
+        except OSError:
+            return None
+
+    def get_connection(self, db_path: str, row_factory: Optional[Callable] = None,
+                       read_only: bool = False) -> sqlite3.Connection:
+        """
+        Connection to `db_path` for the calling thread
+
+        Args:
+            db_path: SQLite database path (':memory:' gets a private, unshared connection)
+            row_factory: Row factory of the connection (e.g. sqlite3.Row)
+            read_only: Open the database read-only (GUI readers)
+
+        Returns:
+            Shared connection; callers commit/rollback their own work, close() keeps it open
+        """
+        if str(db_path) in (':memory:', ''):
+            connection = sqlite3.connect(str(db_path))
+            connection.row_factory = row_factory
+            return connection
+
+        path = os.path.abspath(str(db_path))
+        key = (threading.get_ident(), path, read_only, row_factory)
+        with self._lock:
+            entry = self._connections.get(key)
+        if entry is not None:
+            connection, inode = entry
+            # The database file was deleted or replaced: the old connection points at the old file
+            if inode is not None and self._inode(path) == inode:
+                connection.row_factory = row_factory  # a caller may have changed it
+                with self._lock:
+                    self.stats['reused'] += 1
+                return connection
+            self._discard(key)
+            with self._lock:
+                self.stats['reopened'] += 1
+
+        connection = self._open(path, read_only)
+        connection.row_factory = row_factory
+        with self._lock:
+            self._prune_dead_threads()
+            self._connections[key] = (connection, self._inode(path))
+            self.stats['opened'] += 1
+        return connection
+
+    def _open(self, path: str, read_only: bool) -> SharedConnection:
+        settings = self.settings
+        # Not bound to the opening thread so dead threads' connections can be closed from elsewhere;
+        # each connection is still only handed out to its own thread
+        if read_only:
+            connection = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True,
+                                         timeout=settings['read_only_timeout'],
+                                         factory=SharedConnection, check_same_thread=False)
+        else:
+            connection = sqlite3.connect(path, timeout=settings['timeout'],
+                                         factory=SharedConnection, check_same_thread=False)
+            try:
+                connection.execute(f"PRAGMA journal_mode={settings['journal_mode']}")
+            except sqlite3.OperationalError as e:
+                # Another connection holds a lock; WAL is persistent once any writer has set it
+                print(f"[DATABASE] Could not set journal mode on {os.path.basename(path)}: {e}")
+        connection.execute(f"PRAGMA synchronous={settings['synchronous']}")
+        connection.execute(f"PRAGMA cache_size={-int(settings['cache_size_kb'])}")
+        connection.execute(f"PRAGMA mmap_size={int(settings['mmap_size_mb']) * 1024 * 1024}")
+        connection.execute(f"PRAGMA temp_store={settings['temp_store']}")
+        return connection
+
+    def _discard(self, key: Tuple):
+        with self._lock:
+            entry = self._connections.pop(key, None)
+            if entry is not None:
+                self.stats['closed'] += 1
+        if entry is not None:
+            try:
+                entry[0]._close()
+            except sqlite3.Error:
+                pass
+
+    def _prune_dead_threads(self):
+        # Called with self._lock held
+        alive = {thread.ident for thread in threading.enumerate()}
+        for key in [k for k in self._connections if k[0] not in alive]:
+            connection, _ = self._connections.pop(key)
+            self.stats['closed'] += 1
+            try:
+                connection._close()
+            except sqlite3.Error:
+                pass
+
+    def close_thread_connections(self):
+        """Close the calling thread's connections (e.g. at the end of a worker thread)"""
+        ident = threading.get_ident()
+        with self._lock:
+            keys = [k for k in self._connections if k[0] == ident]
+        for key in keys:
+            self._discard(key)
+
+    def close_all(self, db_path: Optional[str] = None):
+        """Close all connections (to one database when db_path is given)"""
+        path = os.path.abspath(str(db_path)) if db_path else None
+        with self._lock:
+            keys = [k for k in self._connections if path is None or k[1] == path]
+        for key in keys:
+            self._discard(key)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Open connections and open/reuse counters"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['open_connections'] = len(self._connections)
+        return stats
+
+
+_default_manager = SQLiteConnectionManager()
+
+
+def get_connection_manager() -> SQLiteConnectionManager:
+    """Process-wide connection manager"""
+    return _default_manager
+
+
+def get_connection(db_path: str, row_factory: Optional[Callable] = None, read_only: bool = False) -> sqlite3.Connection:
+    """Calling thread's shared connection to db_path (see SQLiteConnectionManager.get_connection)"""
+    return _default_manager.get_connection(db_path, row_factory=row_factory, read_only=read_only)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Local fixture HTTP server for offline tests and benchmarks.
+Serves canned MagicBricks-like pages with optional per-request latency.
+"""
+
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Callable, Dict, Optional, Union
+
+
+def make_pdp_html(property_id: str) -> str:
+    """Build a minimal property detail page with the selectors PropertyExtractor reads"""
+    return f"""<!DOCTYPE html>
+<html><head><title>Property {property_id}</title></head>
+<body>
+  <h1 class="mb-ldp__dtls__title">3 BHK Apartment for Sale in Sector {property_id}</h1>
+  <div class="mb-ldp__dtls__price">₹ 1.{property_id} Crore</div>
+  <div class="mb-ldp__dtls__area">1500 sqft</div>
+  <div class="mb-ldp__dtls__desc">Spacious apartment close to metro, schools and market in a gated society.</div>
+  <ul class="mb-ldp__amenities"><li>Lift</li><li>Parking</li><li>Gym</li></ul>
+  <div class="mb-ldp__builder__name">Fixture Builders</div>
+  <div class="mb-ldp__location">Sector {property_id}, Gurgaon</div>
+  <table class="mb-ldp__specs"><tr><td>Floor</td><td>5 of 12</td></tr></table>
+</body></html>"""
+
+
+Route = Union[str, Callable[[str], Optional[str]]]
+
+
+class FixtureServer:
+    """
+    Threaded HTTP server on 127.0.0.1 with an ephemeral port
+
+    Usage:
+        with FixtureServer(latency=0.1) as server:
+            url = server.url('/flat-pdpid-1')
+    """
+
+    def __init__(self, routes: Optional[Dict[str, Route]] = None, latency: float = 0.0,
+                 default_route: Optional[Callable[[str], Optional[str]]] = None):
+        """
+        Args:
+            routes: Mapping of path -> HTML string or callable(path) -> HTML
+            latency: Seconds to delay every response (simulates server think time)
+            default_route: Fallback callable(path) for unmatched paths; by default any
+                path containing 'pdpid' is served a generated PDP
+        """
+        self.routes = routes or {}
+        self.latency = latency
+        self.default_route = default_route or self._default_pdp
+        self.request_count = 0
+        self.bytes_served = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @staticmethod
+    def _default_pdp(path: str) -> Optional[str]:
+        if 'pdpid' not in path:
+            return None
+        return make_pdp_html(path.rstrip('/').rsplit('-', 1)[-1])
+
+    def _resolve(self, path: str) -> Optional[str]:
+        route = self.routes.get(path)
+        if route is None:
+            return self.default_route(path)
+        return route(path) if callable(route) else route
+
+    def start(self) -> 'FixtureServer':
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if fixture.latency:
+                    threading.Event().wait(fixture.latency)
+                body = fixture._resolve(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                payload = body.encode('utf-8')
+                with fixture._lock:
+                    fixture.request_count += 1
+                    fixture.bytes_served += len(payload)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the asyncio PDP engine against a local stand-in server
+"""
+
+import sys
+import time
+import threading
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper import async_pdp_engine
+from scraper.async_pdp_engine import AsyncPdpEngine
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.pacing import SegmentPacer
+from scraper.property_extractor import PropertyExtractor
+
+PDP_HTML = ('<html><head><title>3 BHK Flat</title></head><body>'
+            '<h1 class="mb-ldp__dtls__title">3 BHK Flat for Sale in Andheri West</h1>'
+            '<div class="mb-ldp__dtls__price">₹2.1 Cr</div>'
+            '<div class="mb-ldp__dtls__body__summary">1450 sqft</div></body></html>').encode('utf-8')
+JS_SHELL_HTML = b'<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+BOT_HTML = b'<html><body><h1>Please verify you are human</h1><div class="captcha"></div></body></html>'
+LATENCY = 0.2
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    lock = threading.Lock()
+    in_flight = defaultdict(int)
+    max_in_flight = defaultdict(int)
+    paths = []
+
+    def do_GET(self):
+        segment = self.path.split('-pdpid')[0].rsplit('-', 1)[0]
+        with StandInHandler.lock:
+            StandInHandler.paths.append(self.path)
+            for key in (segment, '*'):
+                StandInHandler.in_flight[key] += 1
+                StandInHandler.max_in_flight[key] = max(StandInHandler.max_in_flight[key], StandInHandler.in_flight[key])
+        time.sleep(LATENCY)
+        with StandInHandler.lock:
+            for key in (segment, '*'):
+                StandInHandler.in_flight[key] -= 1
+
+        body = BOT_HTML if 'captcha' in self.path else JS_SHELL_HTML if 'shell' in self.path else PDP_HTML
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    StandInHandler.in_flight.clear()
+    StandInHandler.max_in_flight.clear()
+    StandInHandler.paths = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _individual_scraper():
+    return IndividualPropertyScraper(
+        driver=None,
+        property_extractor=PropertyExtractor({}),
+        bot_handler=BotDetectionHandler(),
+        pacer=SegmentPacer(segment_rate=1000, segment_burst=1000, global_rate=None)
+    )
+
+
+def test_segments_run_concurrently_but_one_request_each(server):
+    scraper = _individual_scraper()
+    urls = [f"{server}/flat-andheri-mumbai-pdpid-{i}" for i in range(4)] + \
+           [f"{server}/flat-sector-54-gurgaon-pdpid-{i}" for i in range(4)]
+    engine = AsyncPdpEngine(scraper, max_concurrency=8, segment_concurrency=1)
+
+    start = time.perf_counter()
+    results = scraper.scrape_individual_property_pages(urls, batch_size=4, async_engine=engine)
+    elapsed = time.perf_counter() - start
+
+    assert sorted(r['property_url'] for r in results) == sorted(urls)
+    assert all(r['title'] == '3 BHK Flat for Sale in Andheri West' for r in results)
+    assert StandInHandler.max_in_flight['/flat-andheri'] == 1
+    assert StandInHandler.max_in_flight['/flat-sector-54'] == 1
+    assert StandInHandler.max_in_flight['*'] == 2
+    # Two segments in parallel: about half of the 8 x LATENCY a one-at-a-time fetch takes
+    assert elapsed < 8 * LATENCY * 0.75
+    stats = engine.get_statistics()
+    assert stats['http_successes'] == 8 and stats['browser_fallbacks'] == 0
+
+
+def test_bot_pages_follow_skip_after_n_and_cool_the_segment(server, monkeypatch):
+    monkeypatch.setattr(async_pdp_engine, 'MAX_SEGMENT_PAUSE', 0.01)
+    scraper = _individual_scraper()
+    browser_calls = []
+    scraper._scrape_single_property_enhanced = lambda url, session_id=None: browser_calls.append(url)
+    url = f"{server}/captcha-powai-mumbai-pdpid-1"
+    engine = AsyncPdpEngine(scraper, max_retries=5)
+
+    assert engine.run([url]) == []
+    assert scraper.url_failures[url] == scraper.max_url_failures
+    assert len(StandInHandler.paths) == scraper.max_url_failures
+    assert scraper.segment_cooldowns[scraper._segment_key_from_url(url)] > time.time()
+    assert browser_calls == []
+    assert engine.get_statistics()['skipped_after_n'] == 1
+
+
+def test_javascript_pages_fall_back_to_selenium(server):
+    scraper = _individual_scraper()
+    url = f"{server}/shell-bandra-mumbai-pdpid-7"
+    scraper._scrape_single_property_enhanced = \
+        lambda property_url, session_id=None: {'property_url': property_url, 'title': 'From browser', 'price': '1 Cr'}
+    engine = AsyncPdpEngine(scraper)
+
+    results = engine.run([url])
+
+    assert results == [{'property_url': url, 'title': 'From browser', 'price': '1 Cr'}]
+    stats = engine.get_statistics()
+    assert stats['browser_fallbacks'] == 1 and stats['browser_successes'] == 1 and stats['http_successes'] == 0
+
+
+def test_cooling_urls_are_skipped_without_a_request(server):
+    scraper = _individual_scraper()
+    url = f"{server}/flat-juhu-mumbai-pdpid-3"
+    scraper.url_cooldowns[url] = time.time() + 60
+
+    assert AsyncPdpEngine(scraper).run([url]) == []
+    assert StandInHandler.paths == []
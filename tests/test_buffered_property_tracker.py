@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the write-behind buffered property tracker
+"""
+
+import sys
+import time
+import sqlite3
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from individual_property_tracking_system import IndividualPropertyTracker
+from buffered_property_tracker import BufferedPropertyTracker
+
+URL = 'https://www.magicbricks.com/flat-{}-gurgaon-pdpid-4d42{}'
+
+
+def _rows(db):
+    connection = sqlite3.connect(db)
+    rows = connection.execute('''
+        SELECT property_url, extraction_success, retry_count, data_quality_score
+        FROM individual_properties_scraped ORDER BY property_url
+    ''').fetchall()
+    connection.close()
+    return rows
+
+
+def test_writes_are_batched_and_visible_to_reads(tmp_path):
+    db = str(tmp_path / 'tracking.db')
+    tracker = BufferedPropertyTracker(IndividualPropertyTracker(db), batch_size=3, flush_interval_ms=60000)
+
+    tracker.mark_property_scraped(URL.format(1, 1), 7)
+    tracker.mark_property_scraped(URL.format(2, 2), 7)
+    time.sleep(0.05)
+    assert _rows(db) == []  # neither a full batch nor the interval yet
+
+    # Reads flush first
+    assert tracker.is_property_scraped(URL.format(2, 2))
+    assert len(tracker.lookup_scrape_records([URL.format(1, 1), URL.format(3, 3)])) == 1
+
+    for i in range(3, 6):
+        tracker.mark_property_scraped(URL.format(i, i), 7)
+    deadline = time.time() + 5
+    while len(_rows(db)) < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(_rows(db)) == 5  # batch_size reached, no flush needed
+
+    stats = tracker.get_statistics()
+    assert stats['enqueued'] == stats['written'] == 5 and stats['transactions'] == 2
+    assert stats['queue_depth'] == 0 and stats['flush_ms']['max'] > 0
+    tracker.close()
+
+
+def test_interval_flush_and_mixed_writes_keep_their_order(tmp_path):
+    db = str(tmp_path / 'tracking.db')
+    tracker = BufferedPropertyTracker(IndividualPropertyTracker(db), batch_size=100, flush_interval_ms=20)
+    failed_then_tracked, failed = URL.format('a', 10), URL.format('b', 11)
+
+    tracker.mark_property_failed(failed_then_tracked)
+    tracker.track_scraped_property(failed_then_tracked, {'title': 'Flat A', 'price': '1 Cr'}, 7, quality_score=82.0)
+    tracker.mark_property_failed(failed)
+    tracker.mark_property_failed(failed)
+
+    deadline = time.time() + 5
+    while len(_rows(db)) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert _rows(db) == [(failed_then_tracked.lower(), 1, 0, 82.0), (failed.lower(), 0, 2, 0.0)]
+    assert tracker.get_statistics()['transactions'] == 1
+
+    connection = sqlite3.connect(db)
+    assert connection.execute("SELECT title FROM property_details").fetchall() == [('Flat A',)]
+    connection.close()
+    tracker.close()
+
+
+def test_close_flushes_and_failed_batches_do_not_stop_the_writer(tmp_path):
+    db = str(tmp_path / 'tracking.db')
+    tracker = BufferedPropertyTracker(IndividualPropertyTracker(db), batch_size=100, flush_interval_ms=60000)
+
+    connection = sqlite3.connect(db)
+    connection.execute("ALTER TABLE individual_properties_scraped RENAME TO moved")
+    connection.commit()
+    tracker.mark_property_scraped(URL.format(1, 1))
+    assert tracker.flush(timeout=5)
+    assert tracker.get_statistics()['failed_writes'] == 1
+
+    connection.execute("ALTER TABLE moved RENAME TO individual_properties_scraped")
+    connection.commit()
+    connection.close()
+    tracker.mark_property_scraped(URL.format(2, 2))
+    tracker.close()
+    assert [row[0] for row in _rows(db)] == [URL.format(2, 2)]
+
+    # After close, writes go straight to the tracker
+    tracker.mark_property_failed(URL.format(3, 3))
+    assert len(_rows(db)) == 2
+    assert tracker.get_statistics()['enqueued'] == 2
+
+
+def test_scraper_default_config_buffers_tracking_writes(tmp_path, monkeypatch):
+    from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+
+    monkeypatch.chdir(tmp_path)  # default database and log files
+    scraper = IntegratedMagicBricksScraper(headless=True)
+    try:
+        assert isinstance(scraper.individual_tracker, BufferedPropertyTracker)
+        assert scraper.individual_tracker.logger is scraper.logger
+    finally:
+        scraper.close()
+    assert not scraper.individual_tracker._writer.is_alive()
+
+
+def test_one_bad_row_does_not_lose_the_rest_of_its_batch(tmp_path):
+    db = str(tmp_path / 'tracking.db')
+    tracker = BufferedPropertyTracker(IndividualPropertyTracker(db), batch_size=100, flush_interval_ms=60000)
+    bad = URL.format('bad', 99)
+
+    connection = sqlite3.connect(db)
+    connection.execute(f'''
+        CREATE TRIGGER reject_bad_row BEFORE INSERT ON individual_properties_scraped
+        WHEN NEW.property_url = '{bad}' BEGIN SELECT RAISE(ABORT, 'rejected'); END
+    ''')
+    connection.commit()
+    connection.close()
+
+    tracker.mark_property_scraped(URL.format(1, 1))
+    tracker.mark_property_scraped(bad)
+    tracker.track_scraped_property(URL.format(2, 2), {'title': 'Flat B'}, 7, quality_score=70.0)
+    tracker.mark_property_failed(URL.format(3, 3))
+    assert tracker.flush(timeout=5)
+
+    assert [row[0] for row in _rows(db)] == [URL.format(i, i) for i in (1, 2, 3)]
+    stats = tracker.get_statistics()
+    assert stats['written'] == 3 and stats['failed_writes'] == 1
+    tracker.close()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the bulk (temp table join) PDP candidate lookup
+"""
+
+import sys
+import time
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from individual_property_tracking_system import IndividualPropertyTracker
+from property_keys import property_key
+from scraper.individual_property_scraper import IndividualPropertyScraper
+
+URL = 'https://www.magicbricks.com/propertyDetails/flat-{}&id=4d42{}'
+
+
+def _seed(tracker, rows):
+    """rows: (url, days_ago, quality, success); stored the way track_scraped_property stores them"""
+    tracker.db_manager.connect_db()
+    connection = tracker.db_manager.connection
+    connection.executemany('''
+        INSERT INTO individual_properties_scraped
+        (property_url, property_key, url_hash, scraped_at, data_quality_score, extraction_success)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', [(tracker.normalize_url(url), property_key(tracker.normalize_url(url)),
+           tracker.generate_url_hash(tracker.normalize_url(url)),
+           datetime.now() - timedelta(days=days), quality, success) for url, days, quality, success in rows])
+    connection.commit()
+    tracker.db_manager.close_connection()
+
+
+def _scraper(tracker):
+    return IndividualPropertyScraper(driver=None, property_extractor=None, bot_handler=None,
+                                     individual_tracker=tracker, logger=logging.getLogger('test'))
+
+
+def test_lookup_matches_migrated_legacy_rows(tmp_path):
+    db = str(tmp_path / 'tracking.db')
+    good, by_url_only = URL.format('good', 1), URL.format('legacy', 2)
+    # Table from before property_key, rows found by url_hash or by property_url
+    connection = sqlite3.connect(db)
+    connection.execute('''
+        CREATE TABLE individual_properties_scraped (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, property_url TEXT UNIQUE NOT NULL, property_id TEXT,
+            url_hash TEXT UNIQUE, scraped_at DATETIME NOT NULL, scraping_session_id INTEGER,
+            data_quality_score REAL DEFAULT 0.0, extraction_success BOOLEAN DEFAULT 1,
+            retry_count INTEGER DEFAULT 0, last_retry_at DATETIME, force_rescrape_after DATETIME,
+            is_active BOOLEAN DEFAULT 1, created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    connection.executemany('''
+        INSERT INTO individual_properties_scraped (property_url, url_hash, scraped_at, data_quality_score)
+        VALUES (?, ?, ?, ?)
+    ''', [(good.lower(), 'good-hash', datetime.now() - timedelta(days=2), 90.0),
+          (by_url_only.lower(), 'legacy-hash', datetime.now(), 75.0)])
+    connection.commit()
+    connection.close()
+
+    tracker = IndividualPropertyTracker(db)
+
+    records = tracker.lookup_scrape_records([good + '?utm_source=mail', by_url_only, URL.format('new', 3)])
+    assert records[good + '?utm_source=mail']['data_quality_score'] == 90.0
+    assert records[by_url_only]['data_quality_score'] == 75.0
+    assert len(records) == 2
+
+    # The candidate rows do not outlive the lookup
+    tracker.db_manager.connect_db()
+    assert tracker.db_manager.connection.execute("SELECT COUNT(*) FROM filter_candidates").fetchone()[0] == 0
+    tracker.db_manager.close_connection()
+
+
+def test_lookup_leaves_other_work_on_the_shared_connection(tmp_path):
+    tracker = IndividualPropertyTracker(str(tmp_path / 'tracking.db'))
+    _seed(tracker, [(URL.format('good', 1), 1, 90.0, True)])
+
+    # Another module on this thread has an uncommitted write open
+    tracker.db_manager.connect_db()
+    connection = tracker.db_manager.connection
+    connection.execute("INSERT INTO individual_scraping_sessions (session_name, start_timestamp) VALUES ('open', ?)",
+                       (datetime.now(),))
+
+    assert len(tracker.lookup_scrape_records([URL.format('good', 1), URL.format('new', 2)])) == 1
+    assert connection.in_transaction
+    connection.commit()
+    assert connection.execute("SELECT session_name FROM individual_scraping_sessions").fetchall()[0][0] == 'open'
+    assert connection.execute("SELECT COUNT(*) FROM filter_candidates").fetchone()[0] == 0
+
+
+def test_both_filters_classify_in_one_pass(tmp_path):
+    tracker = IndividualPropertyTracker(str(tmp_path / 'tracking.db'))
+    urls = [URL.format(kind, i) for i, kind in enumerate(['new', 'failed', 'low', 'stale', 'good'])]
+    _seed(tracker, [(urls[1], 1, 90.0, False), (urls[2], 1, 40.0, True),
+                    (urls[3], 45, 90.0, True), (urls[4], 1, 90.0, True)])
+
+    assert _scraper(tracker)._smart_filter_urls(urls, quality_threshold=60.0, ttl_days=30) == urls[:4]
+
+    result = tracker.filter_urls_for_scraping(urls, quality_threshold=60.0)
+    assert result['new_urls'] == urls[:1] and result['quality_rescrape_urls'] == urls[2:3]
+    assert result['urls_to_skip'] == urls[3:]  # this filter has no TTL: only force_rescrape_after expires
+
+
+def test_fifty_thousand_candidates_filter_quickly(tmp_path):
+    tracker = IndividualPropertyTracker(str(tmp_path / 'tracking.db'))
+    urls = [URL.format(i, i) for i in range(50000)]
+    _seed(tracker, [(url, i % 60, 50.0 + i % 50, True) for i, url in enumerate(urls[::2])])
+
+    start = time.perf_counter()
+    to_scrape = _scraper(tracker)._smart_filter_urls(urls, quality_threshold=60.0, ttl_days=30)
+    elapsed = time.perf_counter() - start
+
+    assert 25000 < len(to_scrape) < 50000
+    assert elapsed < 5.0, f"smart filter took {elapsed:.1f}s for 50k URLs"
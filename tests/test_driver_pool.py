@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the multi-browser DriverPool and pooled PDP scraping
+Uses fake drivers that fetch from a local fixture server instead of Chrome
+"""
+
+import sys
+import time
+import threading
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.driver_pool import DriverPool
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.property_extractor import PropertyExtractor
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.pacing import SegmentPacer
+from tests.fixture_server import FixtureServer
+
+
+class FixtureDriver:
+    """Minimal WebDriver stand-in that performs real HTTP GETs"""
+
+    _counter = 0
+    _counter_lock = threading.Lock()
+
+    def __init__(self):
+        with FixtureDriver._counter_lock:
+            FixtureDriver._counter += 1
+            self.session_id = f"fixture-session-{FixtureDriver._counter:04d}"
+        self.page_source = ''
+        self.current_url = ''
+        self.quit_called = False
+
+    def get(self, url):
+        with urllib.request.urlopen(url, timeout=10) as resp:
+            self.page_source = resp.read().decode('utf-8')
+        self.current_url = url
+
+    def find_element(self, *args, **kwargs):
+        return True
+
+    def execute_cdp_cmd(self, *args, **kwargs):
+        return {}
+
+    def execute_script(self, *args, **kwargs):
+        return None
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _make_scraper(driver_pool=None):
+    return IndividualPropertyScraper(
+        driver=FixtureDriver(),
+        property_extractor=PropertyExtractor(premium_selectors={}),
+        bot_handler=BotDetectionHandler(),
+        driver_pool=driver_pool,
+        pacer=SegmentPacer(segment_rate=1000, segment_burst=100, global_rate=None)
+    )
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr('scraper.individual_property_scraper.time.sleep', lambda *_: None)
+
+
+def test_pool_starts_independent_sessions():
+    pool = DriverPool(FixtureDriver, size=3)
+    assert pool.start() == 3
+    sessions = {m.session_id for m in pool.members}
+    assert len(sessions) == 3
+    pool.close()
+
+
+def test_lease_is_exclusive():
+    pool = DriverPool(FixtureDriver, size=1)
+    pool.start()
+    with pool.lease() as member:
+        with pytest.raises(Exception):
+            with pool.lease(timeout=0.05):
+                pass
+    with pool.lease(timeout=0.05) as again:
+        assert again is member
+    assert pool.get_pool_statistics()['leases'] == 2
+    pool.close()
+
+
+def test_restart_member_only_replaces_one_session():
+    pool = DriverPool(FixtureDriver, size=3)
+    pool.start()
+    before = [m.driver for m in pool.members]
+    target = pool.members[1]
+    assert pool.restart_member(target)
+    assert before[1].quit_called
+    assert pool.members[1].driver is not before[1]
+    assert pool.members[0].driver is before[0] and not before[0].quit_called
+    assert pool.members[2].driver is before[2] and not before[2].quit_called
+    assert pool.get_pool_statistics()['restarts'] == 1
+    pool.close()
+
+
+def test_failed_launch_is_counted():
+    calls = {'n': 0}
+
+    def flaky_factory():
+        calls['n'] += 1
+        if calls['n'] == 2:
+            raise RuntimeError("chrome failed")
+        return FixtureDriver()
+
+    pool = DriverPool(flaky_factory, size=3)
+    assert pool.start() == 2
+    assert pool.get_pool_statistics()['failed_launches'] == 1
+    pool.close()
+
+
+def test_pooled_scrape_extracts_from_fixture_server(no_sleep):
+    with FixtureServer() as server:
+        urls = [server.url(f"/flat-sector-pdpid-{i}") for i in range(4)]
+        pool = DriverPool(FixtureDriver, size=2)
+        pool.start()
+        scraper = _make_scraper(pool)
+        results = scraper._scrape_individual_pages_concurrent_enhanced(urls, batch_size=10)
+        pool.close()
+
+    assert len(results) == 4
+    assert all('3 BHK Apartment' in r['title'] for r in results)
+    assert {r['property_url'] for r in results} == set(urls)
+
+
+def test_pool_throughput_scales_with_size(no_sleep):
+    latency = 0.15
+    with FixtureServer(latency=latency) as server:
+        urls = [server.url(f"/flat-sector-pdpid-{i}") for i in range(8)]
+
+        shared = _make_scraper()
+        start = time.time()
+        shared_results = shared._scrape_individual_pages_concurrent_enhanced(urls, batch_size=10)
+        shared_elapsed = time.time() - start
+
+        pool = DriverPool(FixtureDriver, size=4)
+        pool.start()
+        pooled = _make_scraper(pool)
+        start = time.time()
+        pooled_results = pooled._scrape_individual_pages_concurrent_enhanced(urls, batch_size=10)
+        pooled_elapsed = time.time() - start
+        pool.close()
+
+    assert len(shared_results) == len(pooled_results) == 8
+    # Shared driver serialises every navigation behind driver_lock
+    assert shared_elapsed >= latency * len(urls) * 0.9
+    assert pooled_elapsed < shared_elapsed * 0.6
+
+
+class DeadDriver(FixtureDriver):
+    """Driver whose browser went away: every WebDriver call fails"""
+
+    @property
+    def current_url(self):
+        raise ConnectionError("chrome not reachable")
+
+    @current_url.setter
+    def current_url(self, value):
+        pass
+
+
+def test_background_start_leases_as_sessions_come_up():
+    def slow_factory():
+        time.sleep(0.2)
+        return FixtureDriver()
+
+    pool = DriverPool(slow_factory, size=2)
+    start = time.time()
+    assert pool.start(wait=False) == 0
+    assert time.time() - start < 0.1
+    member = pool.acquire(timeout=5)
+    assert member.driver is not None
+    pool.release(member)
+    assert pool.wait_ready(timeout=5) == 2
+    pool.close()
+
+
+def test_background_start_with_no_sessions_does_not_hang():
+    def broken_factory():
+        raise RuntimeError("chrome failed")
+
+    pool = DriverPool(broken_factory, size=2)
+    pool.start(wait=False)
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=5)
+
+
+def test_unhealthy_member_is_relaunched_on_acquire():
+    drivers = [DeadDriver(), FixtureDriver()]
+    pool = DriverPool(lambda: drivers.pop(0), size=1)
+    pool.start()
+    member = pool.acquire(timeout=1)
+    assert isinstance(member.driver, FixtureDriver) and not isinstance(member.driver, DeadDriver)
+    stats = pool.get_pool_statistics()
+    assert stats['health_check_failures'] == 1 and stats['restarts'] == 1
+    pool.close()
+
+
+def test_member_whose_relaunch_fails_is_dropped_not_leased():
+    def factory(drivers):
+        def launch():
+            if not drivers:
+                raise RuntimeError("chrome failed")
+            return drivers.pop(0)
+        return launch
+
+    pool = DriverPool(factory([DeadDriver()]), size=1)
+    pool.start()
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=1)
+    assert pool.members == [] and pool.get_pool_statistics()['dropped_members'] == 1
+
+    # With a healthy member left, acquire moves on to it
+    pool = DriverPool(factory([DeadDriver(), FixtureDriver()]), size=2)
+    pool.start()
+    for _ in range(2):
+        member = pool.acquire(timeout=1)
+        assert member.driver is not None and not isinstance(member.driver, DeadDriver)
+        pool.release(member)
+    assert len(pool.members) == 1 and pool.get_pool_statistics()['leases'] == 2
+    pool.close()
+
+
+def test_members_are_recycled_by_page_count():
+    pool = DriverPool(FixtureDriver, size=1, max_pages=3)
+    pool.start()
+    first = pool.acquire()
+    old_driver = first.driver
+    pool.release(first, pages=2)
+    with pool.lease(timeout=1) as member:
+        assert member.driver is old_driver
+    # The third page crossed the budget: the relaunch happens before the next lease
+    again = pool.acquire(timeout=5)
+    assert again.driver is not old_driver and old_driver.quit_called
+    assert again.pages_served == 0
+    assert pool.get_pool_statistics()['recycles'] == {'pages': 1}
+    pool.close()
+
+
+def test_city_scrapers_reuse_one_warm_browser():
+    from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+
+    pool = DriverPool(FixtureDriver, size=1)
+    pool.start()
+    drivers = []
+    for _ in range(2):
+        scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+        scraper.warm_driver_pool = pool
+        scraper._create_driver = lambda: pytest.fail("cold browser launch")
+        scraper.setup_driver()
+        drivers.append(scraper.driver)
+        assert scraper.individual_scraper.driver is scraper.driver
+        scraper.close()
+        assert scraper.driver is None
+
+    assert drivers[0] is drivers[1] and not drivers[0].quit_called
+    assert drivers[0].current_url == ''  # no google.com connection probe on a warm browser
+    assert pool.get_pool_statistics()['leases'] == 2
+    pool.close()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for browser memory supervision and recycling at safe points
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from performance_profiler import PerformanceProfiler
+from scraper.driver_pool import DriverPool
+from scraper.driver_supervisor import DriverSupervisor, process_tree_rss_mb
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.property_extractor import PropertyExtractor
+from scraper.bot_detection_handler import BotDetectionHandler
+
+
+class GrowingDriver:
+    """Driver stand-in whose memory grows 100 MB per page"""
+
+    _counter = 0
+
+    def __init__(self):
+        GrowingDriver._counter += 1
+        self.session_id = f"growing-{GrowingDriver._counter}"
+        self.current_url = 'about:blank'
+        self.pages = 0
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _probe(driver):
+    return 200.0 + 100.0 * driver.pages
+
+
+def test_process_tree_rss_includes_children():
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        driver = SimpleNamespace(service=SimpleNamespace(process=SimpleNamespace(pid=child.pid)))
+        assert process_tree_rss_mb(driver) > 1
+    finally:
+        child.kill()
+        child.wait()
+    assert process_tree_rss_mb(SimpleNamespace()) is None
+
+
+def test_samples_every_n_pages_and_flags_limits():
+    profiler = PerformanceProfiler()
+    supervisor = DriverSupervisor(sample_every=2, max_rss_mb=650, max_pages=10, profiler=profiler)
+    supervisor.memory_probe_fn = _probe
+    driver = GrowingDriver()
+
+    reasons = []
+    for _ in range(5):
+        driver.pages += 1
+        reasons.append(supervisor.page_done(driver))
+
+    # Sampled at pages 2 (400 MB) and 4 (600 MB); page 5 is not a sample point
+    assert reasons == [None, None, None, None, None]
+    driver.pages += 1
+    assert supervisor.page_done(driver) == 'memory'  # page 6: 800 MB
+
+    budget = DriverSupervisor(sample_every=100, max_pages=3)
+    other = GrowingDriver()
+    assert [budget.page_done(other) for _ in range(3)] == [None, None, 'pages']
+
+    samples = profiler.get_stats()['samples']['driver_rss_mb']
+    assert [value for _, value in samples['series']] == [400.0, 600.0, 800.0]
+    assert supervisor.get_statistics()['peak_rss_mb'] == 800.0
+
+
+def test_shared_driver_is_recycled_between_urls_without_aborting():
+    supervisor = DriverSupervisor(sample_every=1, max_rss_mb=450, profiler=PerformanceProfiler())
+    supervisor.memory_probe_fn = _probe
+    scraper = IndividualPropertyScraper(
+        driver=GrowingDriver(),
+        property_extractor=PropertyExtractor(premium_selectors={}),
+        bot_handler=BotDetectionHandler(),
+        supervisor=supervisor
+    )
+
+    def relaunch():
+        scraper.driver.quit()
+        scraper.update_driver(GrowingDriver())  # takes driver_lock, held by the recycle
+
+    scraper.restart_callback = relaunch
+    first = scraper.driver
+    for _ in range(3):
+        scraper.driver.pages += 1
+        scraper._supervise_shared_driver()
+
+    assert first.quit_called and scraper.driver is not first
+    assert scraper.restart_requested is False
+    stats = supervisor.get_statistics()
+    assert stats['recycles'] == {'memory': 1}
+    assert stats['recycle_events'][0]['pages'] == 3 and stats['recycle_events'][0]['rss_mb'] == 500.0
+    assert supervisor.profiler.get_stats()['counters'] == {'driver_recycles_memory': 1}
+
+
+def test_pool_members_are_recycled_on_memory():
+    supervisor = DriverSupervisor(sample_every=2, max_rss_mb=350)
+    supervisor.memory_probe_fn = _probe
+    pool = DriverPool(GrowingDriver, size=1, max_memory_mb=supervisor.max_rss_mb,
+                      memory_probe=supervisor.memory_probe, on_recycle=supervisor.record_recycle)
+    pool.start()
+
+    drivers = []
+    for _ in range(3):
+        with pool.lease(timeout=5) as member:
+            drivers.append(member.driver)
+            member.driver.pages += 1
+
+    # Sampled after the second page (400 MB): relaunched before the third lease
+    assert drivers[0] is drivers[1] is not drivers[2]
+    assert drivers[0].quit_called
+    stats = supervisor.get_statistics()
+    assert stats['recycles'] == {'memory': 1} and stats['recycle_events'][0]['success']
+    pool.close()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the direct HTTP listing fetcher against a local fixture server
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.http_listing_fetcher import HttpListingFetcher
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper, REALISTIC_HEADERS
+
+RECORDED_LISTING = Path(__file__).parent.parent / 'archive' / 'development_and_testing_files' / 'debug_bot_detection.html'
+LISTING_HTML = RECORDED_LISTING.read_bytes()
+BOT_HTML = b'<html><body><h1>Please verify you are human</h1><div class="captcha"></div></body></html>'
+EMPTY_HTML = b'<html><body><div class="no-results">No properties</div></body></html>'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests_seen = []
+
+    def do_GET(self):
+        FixtureHandler.requests_seen.append({
+            'path': self.path,
+            'client_port': self.client_address[1],
+            'cookie': self.headers.get('Cookie'),
+            'user_agent': self.headers.get('User-Agent'),
+            'accept_language': self.headers.get('Accept-Language')
+        })
+        body = BOT_HTML if 'bot' in self.path else EMPTY_HTML if 'empty' in self.path else LISTING_HTML
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    FixtureHandler.requests_seen = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class FakeDriver:
+    """Just enough WebDriver for the browser fetch path"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.page_source = ''
+        self.current_url = ''
+        self.navigations = []
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def get(self, url):
+        self.navigations.append(url)
+        self.current_url = url
+        self.page_source = LISTING_HTML.decode('utf-8')
+
+    def execute_script(self, script, *args):
+        return args[0][0] if args and args[0] else None
+
+    def get_cookies(self):
+        return [{'name': 'PHPSESSID', 'value': 'abc123', 'domain': '127.0.0.1', 'path': '/'}]
+
+
+def test_keep_alive_session_sends_headers_and_cookies(server):
+    fetcher = HttpListingFetcher(headers=REALISTIC_HEADERS)
+    fetcher.set_user_agent('Mozilla/5.0 Test')
+    fetcher.load_cookies([{'name': 'PHPSESSID', 'value': 'abc123', 'domain': '127.0.0.1', 'path': '/'}])
+
+    results = [fetcher.fetch(f"{server}/property-for-sale-in-gurgaon-pppfs?page={n}") for n in (1, 2, 3)]
+
+    assert all(r['success'] and r['bytes'] == len(LISTING_HTML) for r in results)
+    seen = FixtureHandler.requests_seen
+    assert len({r['client_port'] for r in seen}) == 1  # one pooled connection for every page
+    assert all(r['cookie'] == 'PHPSESSID=abc123' for r in seen)
+    assert seen[0]['user_agent'] == 'Mozilla/5.0 Test'
+    assert seen[0]['accept_language'] == REALISTIC_HEADERS['Accept-Language']
+
+
+def test_http_mode_falls_back_to_browser_per_page(server):
+    scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+    scraper.config['listing_fetch_mode'] = 'http'
+    scraper.driver = FakeDriver(server)
+
+    # No cookies yet: Chrome serves the first page and its cookies are harvested
+    first = scraper._fetch_listing_page(f"{server}/listing?page=1")
+    second = scraper._fetch_listing_page(f"{server}/listing?page=2")
+    bot = scraper._fetch_listing_page(f"{server}/bot?page=3")
+    empty = scraper._fetch_listing_page(f"{server}/empty?page=4")
+
+    assert first['fetched_via'] == 'browser'
+    assert second['fetched_via'] == 'http'
+    assert second['page_source'] == LISTING_HTML.decode('utf-8')
+    assert bot['fetched_via'] == 'browser' and empty['fetched_via'] == 'browser'
+    assert scraper.driver.navigations == [f"{server}/listing?page=1", f"{server}/bot?page=3", f"{server}/empty?page=4"]
+    assert FixtureHandler.requests_seen[0]['cookie'] == 'PHPSESSID=abc123'
+
+    stats = scraper.listing_fetcher.get_statistics()
+    assert stats['http']['pages'] == 1 and stats['browser']['pages'] == 3
+    assert stats['http']['bytes_per_page'] == len(LISTING_HTML)
+    assert stats['http']['pages_per_minute'] > 0
+    assert stats['fallbacks'] == {'no_cookies': 1, 'bot_detection': 1, 'no_cards': 1}
+
+    # The HTTP payload goes through the normal processing stage
+    page = scraper._process_listing_page(2, second)
+    assert page['success'] and page['properties_found'] == 30
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for declarative request-interception profiles
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.interception_policy import InterceptionPolicy, compile_profile, ESTIMATED_BYTES
+from scraper.network_timing import summarize_performance_log
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.property_extractor import PropertyExtractor
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.pacing import SegmentPacer
+from tests.fixture_server import FixtureServer
+from tests.test_driver_pool import FixtureDriver, no_sleep  # noqa: F401 (fixture)
+from tests.test_network_timing import _entry
+
+
+class CdpRecordingDriver(FixtureDriver):
+    """Fixture driver keeping the CDP commands it receives"""
+
+    def __init__(self):
+        super().__init__()
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        return {}
+
+    def blocked_url_calls(self):
+        return [params['urls'] for command, params in self.cdp_commands if command == 'Network.setBlockedURLs']
+
+
+def test_profiles_compile_to_blocked_url_patterns():
+    patterns = compile_profile({'resource_types': ['font'], 'domains': ['hotjar.com'], 'patterns': ['*/beacon*']})
+    assert '*.woff2*' in patterns and '*hotjar.com*' in patterns and patterns[-1] == '*/beacon*'
+    assert not any('.jpg' in p for p in patterns)
+
+    with pytest.raises(ValueError):
+        compile_profile({'resource_types': ['video']})
+
+    policy = InterceptionPolicy(profiles={'listing': {'domains': ['doubleclick.net']}})
+    assert policy.patterns['listing'] == ['*doubleclick.net*']
+    assert '*.png*' in policy.patterns['pdp']
+
+
+def test_profile_is_sent_once_per_session():
+    policy = InterceptionPolicy()
+    driver = CdpRecordingDriver()
+
+    assert policy.apply(driver, 'listing')  # empty profile on a fresh tab: nothing to send
+    for _ in range(3):
+        policy.apply(driver, 'pdp')
+    policy.apply(driver, 'listing')  # switching back clears the blocklist
+    assert driver.blocked_url_calls() == [policy.patterns['pdp'], []]
+
+    policy.forget(driver)  # soft reset opened a fresh tab
+    policy.apply(driver, 'pdp')
+    assert len(driver.blocked_url_calls()) == 3
+
+    stats = policy.get_statistics()
+    assert stats['applications'] == 3 and stats['skipped'] == 3
+
+    disabled = InterceptionPolicy(enabled=False)
+    other = CdpRecordingDriver()
+    disabled.apply(other, 'pdp')
+    assert other.cdp_commands == []
+
+
+def test_blocked_requests_feed_the_byte_savings_estimate():
+    entries = [
+        _entry('Network.requestWillBeSent', requestId='img', type='Image', request={'url': 'https://x/a.jpg'}),
+        _entry('Network.loadingFailed', requestId='img', errorText='net::ERR_BLOCKED_BY_CLIENT', blockedReason='inspector'),
+        _entry('Network.requestWillBeSent', requestId='woff', type='Font', request={'url': 'https://x/a.woff2'}),
+        _entry('Network.loadingFailed', requestId='woff', type='Font', blockedReason='inspector'),
+        _entry('Network.loadingFailed', requestId='xhr', errorText='net::ERR_CONNECTION_RESET'),
+    ]
+    record = summarize_performance_log(entries)
+    assert record['blocked_by_type'] == {'Image': 1, 'Font': 1}
+
+    policy = InterceptionPolicy()
+    policy.record_navigation('pdp', record)
+    policy.record_navigation('pdp')
+    stats = policy.get_statistics()
+    assert stats['navigations'] == {'pdp': 2}
+    assert stats['estimated_bytes_saved'] == ESTIMATED_BYTES['Image'] + ESTIMATED_BYTES['Font']
+
+
+def test_pdp_scrape_applies_profile_once(no_sleep):
+    driver = CdpRecordingDriver()
+    scraper = IndividualPropertyScraper(
+        driver=driver,
+        property_extractor=PropertyExtractor(premium_selectors={}),
+        bot_handler=BotDetectionHandler(),
+        pacer=SegmentPacer(segment_rate=1000, segment_burst=100, global_rate=None)
+    )
+    scraper.simulate_mouse_movement = False
+
+    with FixtureServer() as server:
+        for i in range(3):
+            assert scraper._scrape_single_property_enhanced(server.url(f"/flat-sector-pdpid-{i}"))
+
+    assert driver.blocked_url_calls() == [scraper.interception.patterns['pdp']]
+    assert scraper.interception.get_statistics()['navigations'] == {'pdp': 3}
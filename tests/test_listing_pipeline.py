@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the listing fetch/process/persist pipeline
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.listing_pipeline import ListingPipeline
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+from user_mode_options import ScrapingMode
+
+RECORDED_LISTING = Path(__file__).parent.parent / 'archive' / 'development_and_testing_files' / 'debug_bot_detection.html'
+
+
+def test_results_persist_in_page_order():
+    persisted = []
+
+    def process(page_number, payload):
+        # Later pages finish first
+        time.sleep(payload)
+        return page_number
+
+    pipeline = ListingPipeline(process, lambda n, result: persisted.append(result), workers=3, queue_size=3).start()
+    for page_number, delay in enumerate([0.15, 0.05, 0.0, 0.1], start=1):
+        pipeline.submit(page_number, delay)
+    stats = pipeline.close()
+
+    assert persisted == [1, 2, 3, 4]
+    assert stats['processed'] == stats['persisted'] == 4
+
+
+def test_stop_decision_reaches_fetcher_and_discards_later_pages():
+    persisted = []
+    release = threading.Event()
+
+    def process(page_number, payload):
+        if page_number > 2:
+            release.wait(2)
+        return page_number
+
+    def persist(page_number, result):
+        persisted.append(result)
+        return page_number == 2
+
+    pipeline = ListingPipeline(process, persist, queue_size=4).start()
+    for page_number in (1, 2, 3):
+        assert pipeline.submit(page_number, None)
+    assert pipeline.stop_event.wait(2)
+    assert not pipeline.submit(4, None)
+    release.set()
+    stats = pipeline.close()
+
+    assert persisted == [1, 2]
+    assert stats['discarded'] == 1 and stats['stop_requested']
+
+
+def test_processing_hides_inside_inter_page_delay():
+    pages, delay, work = 4, 0.2, 0.15
+    pipeline = ListingPipeline(lambda n, payload: time.sleep(work), lambda n, result: False).start()
+
+    start = time.perf_counter()
+    for page_number in range(1, pages + 1):
+        pipeline.submit(page_number, None)
+        time.sleep(delay)
+    pipeline.close()
+    elapsed = time.perf_counter() - start
+
+    # Sequential would take pages * (delay + work); only waits on a full queue would add to the delay
+    assert elapsed < pages * delay + work + 0.1
+    assert pipeline.get_statistics()['blocked_seconds'] < 0.05
+
+
+def _run_listing_scrape(pipeline_enabled, blank_fetches=()):
+    scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+    scraper.config['listing_pipeline'] = pipeline_enabled
+    page_source = RECORDED_LISTING.read_text(encoding='utf-8')
+    fetched_pages = []
+
+    def fetch(page_url):
+        fetched_pages.append(page_url)
+        # Fetches listed in blank_fetches load, but without property cards
+        source = '<html><body>Please wait</body></html>' if len(fetched_pages) in blank_fetches else page_source
+        return {'success': True, 'dom_cards': None, 'page_source': source, 'container_wait': None}
+
+    scraper.setup_driver = lambda: None
+    scraper.start_scraping_session = lambda city, mode: True
+    scraper.export_data = lambda formats=None: {}
+    scraper.close = lambda: None
+    scraper._fetch_listing_page = fetch
+    scraper._enhanced_delay_strategy = lambda page_number, stop_event=None: None
+
+    result = scraper.scrape_properties_with_incremental('gurgaon', ScrapingMode.FULL, max_pages=3)
+    for record in scraper.properties:
+        record.pop('scraped_at', None)
+    return result, scraper, fetched_pages
+
+
+def test_pipelined_scrape_matches_sequential_scrape():
+    sequential, sequential_scraper, _ = _run_listing_scrape(False)
+    pipelined, pipelined_scraper, fetched = _run_listing_scrape(True)
+
+    assert sequential['success'] and pipelined['success']
+    assert len(fetched) == 3
+    assert pipelined['pages_scraped'] == sequential['pages_scraped'] == 3
+    assert pipelined_scraper.properties == sequential_scraper.properties
+    assert len(pipelined_scraper.properties) == 90
+    assert pipelined_scraper.session_stats['listing_pipeline']['persisted'] == 3
+
+
+def test_pipelined_page_without_cards_is_retried(monkeypatch):
+    monkeypatch.setattr('integrated_magicbricks_scraper.time.sleep', lambda *_: None)
+    result, scraper, fetched = _run_listing_scrape(True, blank_fetches=(2,))
+
+    assert result['success'] and result['pages_scraped'] == 3
+    assert fetched[1] == fetched[2] and len(fetched) == 4  # page 2 fetched again
+    assert len(scraper.properties) == 90
+    stats = scraper.session_stats['listing_pipeline']
+    assert stats['processed'] == 4 and stats['persisted'] == 4
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for listing card-region slicing ahead of parsing
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.listing_slicer import ListingSlicer
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+
+RECORDED_LISTING = Path(__file__).parent.parent / 'archive' / 'development_and_testing_files' / 'debug_bot_detection.html'
+
+
+def _card(i):
+    return (f'<div class="mb-srp__list" id="card{i}"><div class="mb-srp__card">'
+            f'<h2 class="mb-srp__card--title">{i} BHK Flat for Sale in Sector {i} Gurgaon</h2>'
+            f'<div class="mb-srp__card__price--amount">₹{i} Cr</div>'
+            f'<a href="/flat-sector-{i}-gurgaon-pdpid-{i}">x</a></div></div>')
+
+
+def _page(cards):
+    head = '<html><head><script>var mb = 1;</script></head><body><header>nav</header>'
+    return head + '<div id="srp">' + ''.join(cards) + '</div><footer>' + 'f' * 5000 + '</footer></body></html>'
+
+
+def _records(scraper, cards):
+    records = [scraper.property_extractor.extract_property_data(c, 1, i + 1) for i, c in enumerate(cards)]
+    for record in records:
+        record.pop('scraped_at')
+        if isinstance(record['posting_date_text'], dict):
+            record['posting_date_text'].pop('extraction_date', None)
+    return records
+
+
+def test_slice_covers_all_cards_only():
+    html = _page([_card(i) for i in range(1, 7)])
+    start, end = ListingSlicer().slice(html)
+    region = html[start:end]
+    assert region.startswith('<div class="mb-srp__list" id="card1">')
+    # Ends with the last card; the parser closes the still-open outer list item
+    assert region.endswith('pdpid-6">x</a></div>')
+    assert region.count('mb-srp__card"') == 6
+    assert '<footer>' not in region and '<header>' not in region
+
+
+def test_no_marker_returns_none():
+    assert ListingSlicer().slice('<html><body><p>nothing here</p></body></html>') is None
+
+
+def test_sliced_parse_matches_full_parse_and_records_bytes():
+    scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+    html = _page([_card(i) for i in range(1, 7)])
+
+    sliced_cards = scraper._parse_listing_cards(html)
+    assert scraper.last_listing_parse['sliced']
+    assert scraper.last_listing_parse['parsed_bytes'] < scraper.last_listing_parse['page_bytes']
+
+    scraper.config['listing_html_slicing'] = False
+    full_cards = scraper._parse_listing_cards(html)
+    assert not scraper.last_listing_parse['sliced']
+
+    assert _records(scraper, sliced_cards) == _records(scraper, full_cards)
+    stats = scraper.listing_slicer.get_statistics()
+    assert stats['pages'] == 2 and stats['sliced_pages'] == 1 and stats['fallbacks'] == 1
+    assert 0 < stats['parsed_ratio'] < 1
+
+
+def test_short_slice_falls_back_to_full_parse():
+    scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+    # Too few cards in the slice to trust it
+    html = _page([_card(i) for i in range(1, 3)])
+    scraper._parse_listing_cards(html)
+    assert scraper.last_listing_parse == {'page_bytes': len(html), 'parsed_bytes': len(html), 'sliced': False}
+
+
+@pytest.mark.skipif(not RECORDED_LISTING.exists(), reason="recorded listing page not available")
+def test_recorded_page_slice_yields_identical_records():
+    scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False,
+                                           custom_config={'parser_engine': 'lxml-native'})
+    html = RECORDED_LISTING.read_text(encoding='utf-8')
+
+    sliced = _records(scraper, scraper._parse_listing_cards(html))
+    parse = dict(scraper.last_listing_parse)
+    scraper.config['listing_html_slicing'] = False
+    full = _records(scraper, scraper._parse_listing_cards(html))
+
+    assert parse['sliced'] and parse['parsed_bytes'] < parse['page_bytes'] * 0.5
+    assert len(sliced) == 30
+    assert sliced == full
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the combined listing container wait
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+
+
+class ProbeDriver:
+    """Answers the container probe script with a selector after `ready_after` polls"""
+
+    def __init__(self, ready_after=None, present=None):
+        self.ready_after = ready_after
+        self.present = present or []
+        self.calls = 0
+
+    def execute_script(self, script, selectors):
+        self.calls += 1
+        if self.ready_after is None or self.calls < self.ready_after:
+            return None
+        for sel in selectors:
+            if sel in self.present:
+                return sel
+        return None
+
+
+def _make_scraper(**config):
+    config.setdefault('listing_wait_poll', 0.01)
+    scraper = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False, custom_config=config)
+    return scraper
+
+
+def test_first_present_selector_wins_in_priority_order():
+    scraper = _make_scraper()
+    scraper.driver = ProbeDriver(ready_after=3, present=['div[data-id]', '[class*="SRPTuple"]'])
+    assert scraper._wait_for_listing_container()
+    stats = scraper.get_listing_wait_statistics()
+    assert stats['selector_hits'] == {'[class*="SRPTuple"]': 1}
+    assert scraper.listing_wait_stats['last_wait']['selector'] == '[class*="SRPTuple"]'
+
+
+def test_missing_container_fails_within_overall_budget():
+    scraper = _make_scraper(listing_wait_timeout=0.3)
+    scraper.driver = ProbeDriver()
+    start = time.time()
+    assert not scraper._wait_for_listing_container()
+    assert time.time() - start < 1.0
+    stats = scraper.get_listing_wait_statistics()
+    assert stats['timeouts'] == 1 and stats['waits'] == 1
+    assert stats['max_wait_seconds'] >= 0.3
+
+
+def test_custom_selector_set_is_used():
+    scraper = _make_scraper(listing_wait_selectors=['.custom-list'])
+    scraper.driver = ProbeDriver(ready_after=1, present=['.custom-list', '[class*="mb-srp"]'])
+    assert scraper._wait_for_listing_container()
+    assert scraper.get_listing_wait_statistics()['selector_hits'] == {'.custom-list': 1}
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for per-navigation network records from Chrome performance logs
+"""
+
+import sys
+import json
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.network_timing import NetworkTimingRecorder, summarize_performance_log, percentile
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.property_extractor import PropertyExtractor
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.pacing import SegmentPacer
+from tests.fixture_server import FixtureServer
+from tests.test_driver_pool import FixtureDriver, no_sleep  # noqa: F401 (fixture)
+
+
+def _entry(method, **params):
+    return {'level': 'INFO', 'timestamp': 0, 'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def navigation_log(url, ttfb_ms=180.0, blocked=2, start=100.0):
+    """Performance log of one navigation: document, two subresources and `blocked` blocked trackers"""
+    entries = [
+        _entry('Network.requestWillBeSent', requestId='doc', type='Document', timestamp=start, request={'url': url}),
+        _entry('Network.responseReceived', requestId='doc', type='Document', timestamp=start + 0.25, response={
+            'status': 200,
+            'timing': {'requestTime': start, 'dnsStart': 1.0, 'dnsEnd': 21.0, 'connectStart': 21.0,
+                       'connectEnd': 61.0, 'sendStart': 62.0, 'sendEnd': 63.0, 'receiveHeadersEnd': 62.0 + ttfb_ms}
+        }),
+        _entry('Network.requestWillBeSent', requestId='css', type='Stylesheet', timestamp=start + 0.3,
+               request={'url': url + '/app.css'}),
+        _entry('Network.requestWillBeSent', requestId='ad-frame', type='Document', timestamp=start + 0.3,
+               request={'url': 'https://ads.example/frame'}),
+        _entry('Network.loadingFinished', requestId='doc', timestamp=start + 0.4, encodedDataLength=48000),
+        _entry('Network.loadingFinished', requestId='css', timestamp=start + 0.5, encodedDataLength=12000),
+        _entry('Page.domContentEventFired', timestamp=start + 0.9),
+        _entry('Page.loadEventFired', timestamp=start + 1.5),
+    ]
+    for i in range(blocked):
+        entries.append(_entry('Network.requestWillBeSent', requestId=f"ga-{i}", type='Script', timestamp=start + 0.6,
+                              request={'url': 'https://www.google-analytics.com/analytics.js'}))
+        entries.append(_entry('Network.loadingFailed', requestId=f"ga-{i}", timestamp=start + 0.6,
+                              errorText='net::ERR_BLOCKED_BY_CLIENT', blockedReason='inspector'))
+    return entries
+
+
+def test_summary_of_one_navigation():
+    url = 'https://www.magicbricks.com/flat-andheri-pdpid-1'
+    record = summarize_performance_log(navigation_log(url), url)
+
+    assert record['status'] == 200
+    assert record['requests'] == 5 and record['blocked'] == 2
+    assert record['bytes'] == 60000
+    assert record['dns_ms'] == 20.0 and record['connect_ms'] == 40.0
+    assert record['ttfb_ms'] == 180.0
+    assert record['download_ms'] == 158.0  # headers at +242 ms, body finished at +400 ms
+    assert record['dom_ready_ms'] == 900.0 and record['load_ms'] == 1500.0
+
+
+def test_percentiles_per_page_kind():
+    assert percentile([5, 1, 3, 2, 4], 50) == 3
+    assert percentile([5, 1, 3, 2, 4], 90) == 5
+    assert percentile([], 50) is None
+
+    class LogDriver:
+        def __init__(self):
+            self.logs = []
+
+        def get_log(self, kind):
+            logs, self.logs = self.logs, []
+            return logs
+
+    driver = LogDriver()
+    recorder = NetworkTimingRecorder()
+    for ttfb in (100, 200, 300, 400):
+        driver.logs = navigation_log('https://x/listing', ttfb_ms=ttfb, blocked=0)
+        recorder.capture(driver, 'listing', 'https://x/listing')
+    assert recorder.capture(object(), 'listing') is None
+
+    stats = recorder.get_statistics()
+    assert stats['listing']['pages'] == 4 and stats['capture_errors'] == 1
+    assert stats['listing']['ttfb_ms'] == {'p50': 200.0, 'p90': 400.0, 'p95': 400.0}
+    assert stats['listing']['blocked']['p50'] == 0
+
+
+class LoggingFixtureDriver(FixtureDriver):
+    """Fixture driver that also keeps a performance log of its navigations"""
+
+    def __init__(self):
+        super().__init__()
+        self.performance_log = []
+
+    def get(self, url):
+        super().get(url)
+        self.performance_log.extend(navigation_log(url))
+
+    def get_log(self, kind):
+        logs, self.performance_log = self.performance_log, []
+        return logs
+
+
+def test_pdp_navigation_produces_a_record(no_sleep):
+    recorder = NetworkTimingRecorder()
+    driver = LoggingFixtureDriver()
+    driver.performance_log = navigation_log('https://stale.example/previous-page')  # drained before navigating
+    scraper = IndividualPropertyScraper(
+        driver=driver,
+        property_extractor=PropertyExtractor(premium_selectors={}),
+        bot_handler=BotDetectionHandler(),
+        pacer=SegmentPacer(segment_rate=1000, segment_burst=100, global_rate=None),
+        network_timing=recorder
+    )
+    scraper.simulate_mouse_movement = False
+
+    with FixtureServer() as server:
+        url = server.url('/flat-sector-pdpid-1')
+        assert scraper._scrape_single_property_enhanced(url)
+
+    records = list(recorder.records['pdp'])
+    assert len(records) == 1
+    assert records[0]['url'] == url and records[0]['blocking'] is True and records[0]['blocked'] == 2
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Equivalence tests for the pluggable HTML parser engines
+Recorded MagicBricks pages must yield identical records on every engine
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.html_parsing import PARSER_ENGINES, parse_html, resolve_parser_engine
+from scraper.property_extractor import PropertyExtractor
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper, LISTING_CARD_SELECTORS
+
+REPO_ROOT = Path(__file__).parent.parent
+RECORDED_LISTING = REPO_ROOT / 'archive' / 'development_and_testing_files' / 'debug_bot_detection.html'
+RECORDED_PDPS = sorted((REPO_ROOT / 'reports' / 'validation' / 'run_20251004_153050').glob('*.html'))[:3]
+
+PDP_EXTRACTORS = [
+    '_safe_extract_property_title',
+    '_safe_extract_property_price',
+    '_safe_extract_property_area',
+    '_safe_extract_description',
+    '_safe_extract_amenities',
+    '_safe_extract_builder_info',
+    '_safe_extract_location_details',
+    '_safe_extract_specifications'
+]
+
+
+def _listing_records(engine):
+    extractor = PropertyExtractor(IntegratedMagicBricksScraper._setup_premium_selectors(None),
+                                  parser_engine=engine)
+    root = extractor.parse_html(RECORDED_LISTING.read_text(encoding='utf-8'))
+    cards = root.select(LISTING_CARD_SELECTORS[0])
+    records = [extractor.extract_property_data(card, 1, i + 1) for i, card in enumerate(cards)]
+    for record in records:
+        if record:
+            record.pop('scraped_at')
+    return records
+
+
+@pytest.mark.skipif(not RECORDED_LISTING.exists(), reason="recorded listing page not available")
+def test_listing_records_identical_across_engines():
+    baseline = _listing_records('html.parser')
+    assert len(baseline) >= 20 and all(baseline)
+    for engine in ('lxml', 'lxml-native'):
+        assert _listing_records(engine) == baseline, engine
+
+
+@pytest.mark.skipif(not RECORDED_PDPS, reason="recorded property pages not available")
+@pytest.mark.parametrize('page', RECORDED_PDPS, ids=lambda p: p.name)
+def test_pdp_fields_identical_across_engines(page):
+    markup = page.read_text(encoding='utf-8')
+    results = {}
+    for engine in PARSER_ENGINES:
+        extractor = PropertyExtractor({}, parser_engine=engine)
+        root = extractor.parse_html(markup)
+        results[engine] = {name: getattr(extractor, name)(root) for name in PDP_EXTRACTORS}
+    assert results['lxml'] == results['html.parser']
+    assert results['lxml-native'] == results['html.parser']
+
+
+def test_native_node_matches_beautifulsoup_semantics():
+    markup = ('<html><body><div class="card featured">x <!-- Status note --> y'
+              '<script>var Status=1;</script><p>Status<b>:</b> Ready</p><span>next</span></div></body></html>')
+    soup = parse_html(markup, 'html.parser').select_one('div')
+    native = parse_html(markup, 'lxml-native').select_one('div')
+
+    assert native.get('class') == soup.get('class') == ['card', 'featured']
+    assert native.get_text() == soup.get_text()
+    assert native.get_text(strip=True) == soup.get_text(strip=True)
+    # select() never returns the element it is called on
+    assert native.select('div') == [] and soup.select('div') == []
+    assert native.select_one('p').find_next_sibling().get_text() == 'next'
+
+    hits = lambda root: [(str(s), s.parent.name) for s in root.find_all(string=lambda t: 'Status' in t)]
+    assert hits(native) == hits(soup)
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        resolve_parser_engine('html5lib-fast')
+
+
+def test_compiled_selectors_match_string_selects():
+    from scraper.html_parsing import CompiledSelectors
+
+    markup = RECORDED_LISTING.read_text(encoding='utf-8')
+    selectors = [LISTING_CARD_SELECTORS[0], 'h2.mb-srp__card--title', '[class*="price"]', 'a[href]']
+    css = CompiledSelectors(selectors)
+    assert css.get_statistics()['compiled'] == len(selectors)
+
+    for engine in PARSER_ENGINES:
+        root = parse_html(markup, engine)
+        for card in root.select(LISTING_CARD_SELECTORS[0])[:5]:
+            for selector in selectors[1:]:
+                assert css.select_one(card, selector) == card.select_one(selector)
+                assert css.select(card, selector) == card.select(selector)
+
+    stats = css.get_statistics()
+    # Matching never recompiles a configured selector
+    assert stats['compiled'] == len(selectors)
+    assert stats['matches'] == len(PARSER_ENGINES) * 5 * 3 * 2
+    assert stats['match_ms'] > 0
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the continuous PDP work queue and token-bucket pacing
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.pacing import TokenBucket, SegmentPacer
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.property_extractor import PropertyExtractor
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.driver_pool import DriverPool
+from tests.fixture_server import FixtureServer, make_pdp_html
+from tests.test_driver_pool import FixtureDriver
+
+
+def _fast_pacer():
+    return SegmentPacer(segment_rate=1000, segment_burst=100, global_rate=None)
+
+
+def _make_scraper(driver_pool=None, pacer=None):
+    scraper = IndividualPropertyScraper(
+        driver=FixtureDriver(),
+        property_extractor=PropertyExtractor(premium_selectors={}),
+        bot_handler=BotDetectionHandler(),
+        driver_pool=driver_pool,
+        pacer=pacer or _fast_pacer()
+    )
+    scraper.simulate_mouse_movement = False
+    return scraper
+
+
+def test_token_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    wait = bucket.reserve()
+    assert 0.05 < wait <= 0.1
+
+
+def test_segment_pacer_limits_per_segment_only():
+    pacer = SegmentPacer(segment_rate=20, segment_burst=1, global_rate=None)
+    start = time.monotonic()
+    for _ in range(4):
+        pacer.acquire('santacruz')
+    same_segment = time.monotonic() - start
+
+    start = time.monotonic()
+    for seg in ('a', 'b', 'c', 'd'):
+        pacer.acquire(seg)
+    distinct_segments = time.monotonic() - start
+
+    assert same_segment >= 0.14
+    assert distinct_segments < 0.05
+    assert pacer.get_pacing_statistics()['segments'] == 5
+
+
+def test_global_bucket_caps_total_rate():
+    pacer = SegmentPacer(segment_rate=1000, segment_burst=100, global_rate=20, global_burst=1)
+    start = time.monotonic()
+    for seg in ('a', 'b', 'c', 'd'):
+        pacer.acquire(seg)
+    assert time.monotonic() - start >= 0.14
+
+
+def test_slow_url_does_not_block_other_workers(monkeypatch):
+    monkeypatch.setattr('scraper.individual_property_scraper.time.sleep', lambda *_: None)
+
+    def slow(path):
+        threading.Event().wait(0.8)
+        return make_pdp_html('99')
+
+    with FixtureServer(routes={'/slow-sector-pdpid-99': slow}, latency=0.1) as server:
+        urls = [server.url('/slow-sector-pdpid-99')] + [server.url(f"/fast-sector-pdpid-{i}") for i in range(6)]
+        pool = DriverPool(FixtureDriver, size=2)
+        pool.start()
+        scraper = _make_scraper(pool)
+        start = time.time()
+        results = scraper._scrape_individual_pages_concurrent_enhanced(urls, batch_size=10)
+        elapsed = time.time() - start
+        pool.close()
+
+    assert len(results) == 7
+    # Fast URLs complete on the free worker while the slow one is still loading
+    assert elapsed < 1.3
+
+
+def test_rolling_window_metrics_emitted_every_batch_size(monkeypatch):
+    monkeypatch.setattr('scraper.individual_property_scraper.time.sleep', lambda *_: None)
+    with FixtureServer() as server:
+        urls = [server.url(f"/flat-sector-pdpid-{i}") for i in range(5)]
+        scraper = _make_scraper()
+        with patch.object(scraper, '_log_batch_quality_metrics') as metrics:
+            results = scraper._scrape_individual_pages_concurrent_enhanced(urls, batch_size=2)
+
+    assert len(results) == 5
+    # Two full windows plus the trailing partial window
+    assert metrics.call_count == 3
+    assert all(len(call.args[0]) <= 2 for call in metrics.call_args_list)
+
+
+def test_cooldown_urls_are_skipped(monkeypatch):
+    monkeypatch.setattr('scraper.individual_property_scraper.time.sleep', lambda *_: None)
+    with FixtureServer() as server:
+        urls = [server.url(f"/flat-sector-pdpid-{i}") for i in range(3)]
+        scraper = _make_scraper()
+        scraper.url_cooldowns[urls[0]] = time.time() + 600
+        results = scraper._scrape_individual_pages_concurrent_enhanced(urls, batch_size=10)
+
+    assert {r['property_url'] for r in results} == set(urls[1:])
+
+
+def test_url_abandoned_for_a_restart_is_scraped_after_it(monkeypatch):
+    monkeypatch.setattr('scraper.individual_property_scraper.time.sleep', lambda *_: None)
+
+    class Tracker:
+        def __init__(self):
+            self.failed, self.scraped = [], []
+
+        def mark_property_failed(self, url, session_id=None):
+            self.failed.append(url)
+
+        def mark_property_scraped(self, url, session_id=None):
+            self.scraped.append(url)
+
+    class RestartingPacer:
+        """A relaunch of the shared driver (0.3s) starts while the first URL is being set up"""
+        def __init__(self):
+            self.calls = 0
+
+        def acquire(self, segment):
+            self.calls += 1
+            if self.calls == 1:
+                scraper.restart_requested = True
+                threading.Timer(0.3, scraper.update_driver, args=(FixtureDriver(),)).start()
+
+        def get_pacing_statistics(self):
+            return {}
+
+    with FixtureServer() as server:
+        urls = [server.url(f"/flat-sector-pdpid-{i}") for i in range(4)]
+        scraper = _make_scraper(pacer=RestartingPacer())
+        scraper.max_concurrent_workers = 2
+        scraper.individual_tracker = Tracker()
+        results = scraper._scrape_individual_pages_concurrent_enhanced(urls, batch_size=10)
+
+    # The aborted URL is requeued and scraped after the relaunch; the rest of the queue still runs
+    assert {r['property_url'] for r in results} == set(urls)
+    assert sorted(scraper.individual_tracker.scraped) == sorted(urls)
+    assert scraper.individual_tracker.failed == []
+    assert scraper.restart_aborted_urls == set() and not scraper.restart_requested
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the process-pool listing extraction backend
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.selector_ranker import SelectorRanker
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+
+RECORDED_LISTING = Path(__file__).parent.parent / 'archive' / 'development_and_testing_files' / 'debug_bot_detection.html'
+
+
+def _normalized(properties):
+    for record in properties:
+        record.pop('scraped_at', None)
+    return properties
+
+
+def _process_pages(scraper, pages):
+    fetched = {'success': True, 'dom_cards': None, 'page_source': RECORDED_LISTING.read_text(encoding='utf-8')}
+    results = [scraper._process_listing_page(page_number, fetched) for page_number in range(1, pages + 1)]
+    for result in results:
+        _normalized(result['properties'])
+    return results
+
+
+def test_process_backend_matches_in_process_extraction():
+    inline = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+    pooled = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+    pooled.config.update({'listing_extraction_backend': 'process', 'extraction_processes': 2})
+    # A second scraper (another city) shares the first one's pool
+    other_city = IntegratedMagicBricksScraper(headless=True, incremental_enabled=False)
+
+    expected = _process_pages(inline, 2)
+    pooled._start_extraction_pool()
+    other_city.extraction_pool = pooled.extraction_pool
+    try:
+        actual = _process_pages(pooled, 2)
+        shared = _process_pages(other_city, 1)
+        stats = pooled.extraction_pool.get_statistics()
+    finally:
+        pooled._stop_extraction_pool()
+
+    assert [r['properties'] for r in actual] == [r['properties'] for r in expected]
+    assert actual[0]['property_texts'] == expected[0]['property_texts']
+    assert actual[0]['listing_parse'] == expected[0]['listing_parse']
+    assert shared[0]['properties'] == expected[0]['properties']
+    assert stats['pages'] == 3
+    assert pooled.extraction_pool is None
+
+    # Statistics gathered in the workers are merged back into the parent
+    assert pooled.data_validator.get_filtered_properties_count() == inline.data_validator.get_filtered_properties_count()
+    assert pooled.listing_slicer.get_statistics() == inline.listing_slicer.get_statistics()
+    assert pooled.selector_ranker.get_statistics()['fields'].keys() == inline.selector_ranker.get_statistics()['fields'].keys()
+
+
+def test_ranker_snapshot_difference_and_merge():
+    ranker = SelectorRanker()
+    ranker.record('title', 'h2', True, 0.001)
+    before = ranker.snapshot()
+    ranker.record('title', 'h2', True, 0.002)
+    ranker.record('title', '.x', False, 0.001)
+
+    delta = SelectorRanker.difference(ranker.snapshot(), before)
+    assert delta['title']['h2'][:2] == [1, 1]
+    assert delta['title']['.x'][:2] == [1, 0]
+
+    parent = SelectorRanker()
+    parent.merge(before)
+    parent.merge(delta)
+    assert parent.snapshot() == ranker.snapshot()
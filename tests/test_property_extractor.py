@@ -207,6 +207,9 @@ class TestPropertyExtractor(unittest.TestCase):
         self.assertIn('failed_extractions', stats)
         self.assertIn('premium_properties', stats)
         self.assertIn('standard_properties', stats)
+        self.assertGreater(stats['selectors']['compiled'], 0)
+        self.assertIn('compile_ms', stats['selectors'])
+        self.assertIn('match_ms', stats['selectors'])
 
     def test_reset_extraction_statistics(self):
         """Test statistics reset"""
@@ -280,6 +283,141 @@ class TestPropertyExtractor(unittest.TestCase):
         self.assertTrue(any(ch.isdigit() for ch in price))
 
 
+    def test_collected_fields_normalise_like_card_extraction(self):
+        """collect_card_fields + extract_property_data_from_fields matches extract_property_data"""
+        html = """
+        <div class="mb-srp__card">
+            <h2>2 BHK Apartment in Tulip Violet Sector 69 Gurgaon</h2>
+            <div class="mb-srp__card__price">₹ 95 Lac</div>
+            <div class="mb-srp__card__summary__list">1200 sqft</div>
+            <div><span>Status</span><span>Ready to Move</span></div>
+            <a href="/tulip-violet-sector-69-gurgaon-pdpid-4d42">View</a>
+            <div>Transaction: Resale</div>
+        </div>
+        """
+        card = BeautifulSoup(html, 'html.parser').div
+
+        direct = self.extractor.extract_property_data(card, 2, 3)
+        fields = self.extractor.collect_card_fields(card)
+        normalised = self.extractor.extract_property_data_from_fields(fields, 2, 3)
+
+        direct.pop('scraped_at')
+        normalised.pop('scraped_at')
+        self.assertEqual(direct, normalised)
+        self.assertEqual(normalised['status'], 'Ready to Move')
+        self.assertEqual(normalised['transaction'], 'Resale')
+        self.assertTrue(normalised['property_url'].startswith('https://www.magicbricks.com/'))
+
+    def test_extract_from_dom_script_fields(self):
+        """Raw fields shaped like the in-browser script output are normalised"""
+        fields = {
+            'classes': ['mb-srp__card', 'card-luxury'],
+            'card_text': '4 BHK Villa for Sale in Sector 88 ₹3.2 Crore 2400 sqft Possession: Dec 2026',
+            'title_candidates': [None, '4 BHK Villa for Sale in Sector 88', None],
+            'price_candidates': [None, None],
+            'area_candidates': ['2400 sqft', None],
+            'url_candidates': ['https://www.magicbricks.com/villa-sector-88-pdpid-77'],
+            'all_hrefs': [],
+            'structured': {},
+            'status_candidates': [],
+            'paragraphs': []
+        }
+
+        result = self.extractor.extract_property_data_from_fields(fields, 1, 1)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result['title'], '4 BHK Villa for Sale in Sector 88')
+        self.assertEqual(result['price'], '₹3.2 Crore')
+        self.assertEqual(result['property_type'], '4 BHK')
+        self.assertEqual(result['premium_type'], 'luxury')
+        self.assertEqual(result['status'], 'Dec 2026')
+        self.assertEqual(result['property_url'], 'https://www.magicbricks.com/villa-sector-88-pdpid-77')
+
+    def test_dom_script_returns_collector_fields(self):
+        """In-browser script emits the same field names as collect_card_fields"""
+        import re
+        from scraper.dom_card_extractor import CARD_EXTRACTION_JS
+
+        card = BeautifulSoup('<div class="mb-srp__card"><h2>Title</h2></div>', 'html.parser').div
+        collected = set(self.extractor.collect_card_fields(card))
+        push_block = CARD_EXTRACTION_JS.split('out.push({', 1)[1].split('});', 1)[0]
+        scripted = set(re.findall(r'^\s*(\w+):', push_block, re.M))
+        self.assertEqual(collected, scripted)
+
+    def test_dom_card_extractor_falls_back_when_script_fails(self):
+        """DomCardExtractor returns None so callers use the HTML parse path"""
+        from scraper.dom_card_extractor import DomCardExtractor
+
+        class ScriptDriver:
+            def __init__(self, result=None, error=None):
+                self.result, self.error = result, error
+
+            def execute_script(self, *args):
+                if self.error:
+                    raise self.error
+                return self.result
+
+        extractor = DomCardExtractor(self.extractor.get_card_field_spec(), ['.mb-srp__card'], '.mb-srp__card')
+        self.assertIsNone(extractor.extract_cards(ScriptDriver(error=RuntimeError('stale'))))
+        self.assertIsNone(extractor.extract_cards(ScriptDriver(result={'selector': None, 'cards': []})))
+        cards = extractor.extract_cards(ScriptDriver(result={'selector': '.mb-srp__card', 'cards': [{'card_text': 'x'}]}))
+        self.assertEqual(cards, [{'card_text': 'x'}])
+        stats = extractor.get_statistics()
+        self.assertEqual(stats['fallbacks'], 2)
+        self.assertEqual(stats['pages'], 1)
+
+
+    def test_card_context_reads_summary_and_walks_card_once(self):
+        """CardContext answers structured labels from the summary list without re-walking the card"""
+        from scraper.property_extractor import CardContext
+
+        html = """
+        <div class="mb-srp__card">
+            <h2 class="mb-srp__card--title">3 BHK Flat for Sale in Sector 69</h2>
+            <div class="mb-srp__card__summary__list--item">
+                <div class="mb-srp__card__summary--label">Floor</div>
+                <div class="mb-srp__card__summary--value">7 out of 14</div>
+            </div>
+            <div class="mb-srp__card__summary__list--item">
+                <div class="mb-srp__card__summary--label">Bathroom</div>
+                <div class="mb-srp__card__summary--value">3</div>
+            </div>
+            <div>Ownership: Freehold</div>
+        </div>
+        """
+        card = BeautifulSoup(html, 'html.parser').div
+        context = CardContext.from_card(card)
+
+        self.assertEqual(context.summary, {'Floor': '7 out of 14', 'Bathroom': '3'})
+        self.assertEqual(context.text_lower, card.get_text().lower())
+        self.assertEqual(context.structured_value('Floor'), '7 out of 14')
+        self.assertEqual(context.structured_value('Bathroom'), '3')
+        # Summary hits never collect the card's text nodes
+        self.assertIsNone(context._strings)
+        self.assertEqual(context.structured_value('Ownership'), 'Freehold')
+        self.assertIsNotNone(context._strings)
+
+        for field_name in self.extractor.STRUCTURED_FIELDS.values():
+            self.assertEqual(context.structured_value(field_name),
+                             self.extractor._structured_value_from_dom(card, field_name))
+    def test_posting_date_parsed_from_card_text_keeps_text_field(self):
+        """Without a posting date element the card text is parsed; posting_date_text stays text"""
+        from date_parsing_system import DateParsingSystem
+
+        extractor = PropertyExtractor(self.premium_selectors, date_parser=DateParsingSystem(':memory:'))
+        html = """
+        <div class="mb-srp__card">
+            <h2>2 BHK Apartment for Sale in Sector 69 Gurgaon</h2>
+            <div class="mb-srp__card__price">₹ 95 Lac</div>
+            <div class="mb-srp__card__summary__list">1200 sqft</div>
+            <span>Posted yesterday</span>
+        </div>
+        """
+        result = extractor.extract_property_data(BeautifulSoup(html, 'html.parser').div, 1, 1)
+
+        self.assertEqual(result['posting_date_text'], '')
+        self.assertIsInstance(result['parsed_posting_date'], datetime)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for canonical property keys and their migration
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from property_keys import property_key, migrate_property_keys
+from url_tracking_operations import URLTrackingOperations
+
+PDP = 'https://www.magicbricks.com/aspen-park-goregaon-east-mumbai-pdpid-4d4235303838363733'
+DETAIL = 'https://www.magicbricks.com/propertyDetails/2-BHK-Flat-Sector-88A-Gurgaon&id=4d423738363132373635'
+
+
+def _legacy_urls_seen(db, rows):
+    """property_urls_seen as created before property_key; rows: (url, last_seen_date)"""
+    connection = sqlite3.connect(db)
+    connection.execute('''
+        CREATE TABLE property_urls_seen (
+            url_id INTEGER PRIMARY KEY AUTOINCREMENT, property_url TEXT UNIQUE NOT NULL,
+            first_seen_date DATETIME NOT NULL, last_seen_date DATETIME NOT NULL,
+            seen_count INTEGER DEFAULT 1, property_id TEXT, title TEXT, city TEXT,
+            is_active BOOLEAN DEFAULT 1, created_at DATETIME
+        )
+    ''')
+    connection.executemany('''
+        INSERT INTO property_urls_seen (property_url, first_seen_date, last_seen_date, seen_count)
+        VALUES (?, ?, ?, 3)
+    ''', [(url, seen, seen) for url, seen in rows])
+    connection.commit()
+    return connection
+
+
+def test_url_variants_share_one_key():
+    key = property_key(PDP)
+    assert property_key(PDP.upper().replace('HTTPS', 'https') + '?utm_source=mail#photos') == key
+    assert property_key(PDP.replace('aspen-park-goregaon-east', 'aspen-park')) == key
+    assert property_key(DETAIL.lower() + '&from=search') == property_key(DETAIL)
+
+    # Project (pdpid) and property (id) IDs are separate series
+    assert property_key('https://www.magicbricks.com/x-pdpid-4d4235') != property_key(
+        'https://www.magicbricks.com/propertyDetails/x&id=4d4235')
+
+    # URLs without an ID are keyed by their canonical form
+    plain = 'https://www.magicbricks.com/some-project/?b=2&a=1'
+    assert property_key(plain) == property_key('HTTPS://www.magicbricks.com/some-project?a=1&b=2&ref=home')
+    assert property_key(plain) != property_key('https://www.magicbricks.com/other-project')
+    assert all(-2 ** 63 <= k < 2 ** 63 for k in (key, property_key(plain)))
+
+
+def test_migration_keys_rows_and_keeps_latest_variant(tmp_path):
+    db = str(tmp_path / 'legacy.db')
+    connection = _legacy_urls_seen(db, [
+        (PDP.lower(), '2026-01-01T00:00:00'),
+        (PDP.lower().replace('goregaon-east-', ''), '2026-03-01T00:00:00'),  # same pdpid, newer
+        (DETAIL.lower(), '2026-02-01T00:00:00')
+    ])
+
+    assert migrate_property_keys(connection, ['property_urls_seen', 'property_posting_dates']) == {
+        'property_urls_seen': 2}
+    keys = dict(connection.execute("SELECT url_id, property_key FROM property_urls_seen").fetchall())
+    assert keys == {1: None, 2: property_key(PDP), 3: property_key(DETAIL)}
+    assert connection.execute(
+        "SELECT \"unique\" FROM pragma_index_list('property_urls_seen') WHERE name = 'idx_property_urls_seen_key'"
+    ).fetchone() == (1,)
+
+    # Idempotent; an older variant inserted later does not take the key over
+    connection.execute('''
+        INSERT INTO property_urls_seen (property_url, first_seen_date, last_seen_date)
+        VALUES (?, '2025-12-01T00:00:00', '2025-12-01T00:00:00')
+    ''', (PDP.lower().replace('aspen-park', 'aspen'),))
+    connection.commit()
+    assert migrate_property_keys(connection, ['property_urls_seen']) == {'property_urls_seen': 0}
+    assert connection.execute("SELECT url_id FROM property_urls_seen WHERE property_key = ?",
+                              (property_key(PDP),)).fetchone() == (2,)
+    connection.close()
+
+
+def test_tracking_counts_url_variants_as_one_property(tmp_path):
+    db = str(tmp_path / 'legacy.db')
+    _legacy_urls_seen(db, [(PDP.lower(), '2026-01-01T00:00:00')]).close()
+
+    operations = URLTrackingOperations(db)
+    batch = operations.batch_track_urls([
+        {'url': PDP.replace('goregaon-east-', '') + '?utm_source=mail', 'title': 'Aspen Park', 'city': 'mumbai'},
+        {'url': DETAIL, 'title': '2 BHK', 'city': 'gurgaon'},
+        {'url': DETAIL.replace('2-BHK-Flat', '2-BHK-Apartment'), 'title': '2 BHK', 'city': 'gurgaon'}
+    ])
+    assert batch['new_urls'] == 1 and batch['duplicate_urls'] == 2
+    assert [r['seen_count'] for r in batch['url_results']] == [4, 1, 2]
+
+    single = operations.track_property_url(PDP + '#map')
+    assert single['is_duplicate'] and single['seen_count'] == 5
+
+    connection = sqlite3.connect(db)
+    assert connection.execute("SELECT COUNT(*) FROM property_urls_seen").fetchone()[0] == 2
+    connection.close()
+
+
+def test_legacy_rows_with_unparseable_first_seen_dates_are_tracked(tmp_path):
+    db = str(tmp_path / 'legacy.db')
+    _legacy_urls_seen(db, [(PDP.lower(), '15/01/2026 10:30'), (DETAIL.lower(), '')]).close()
+
+    operations = URLTrackingOperations(db)
+    batch = operations.batch_track_urls([{'url': PDP, 'city': 'mumbai'}, {'url': DETAIL, 'city': 'gurgaon'}])
+    assert batch['errors'] == 0 and batch['duplicate_urls'] == 2
+    assert [r['first_seen_date'] for r in batch['url_results']] == [None, None]
+
+    single = operations.track_property_url(DETAIL)
+    assert single['success'] and single['seen_count'] == 5 and single['first_seen_date'] is None
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared precompiled regex registry
+"""
+
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper import regex_registry as patterns
+from scraper.regex_registry import PatternTable, findall_item
+from date_parsing_system import DateParsingSystem
+
+
+DATE_TEXTS = [
+    "10 hours ago", "Posted: 5 hours ago", "2 days ago", "1 week ago", "3 weeks ago",
+    "2 months ago", "today", "Posted: today", "postedtoday", "yesterday", "postedyesterday",
+    "15/01/2024", "3-4-24", "15 Jan 2024", "Posted 2 days ago, 15/01/2024",
+    "yesterday, 3 hours ago", "invalid date text", "Ready to move, 1450 sqft"
+]
+
+
+def _inline_first(table, text):
+    """Reference: loop re.search over the pattern strings"""
+    for index, compiled in enumerate(table):
+        if re.search(compiled.pattern, text, compiled.flags):
+            return index
+    return None
+
+
+def test_table_picks_first_pattern_in_order_not_leftmost_match():
+    table = PatternTable([r'Resale', r'Status[:\s]+(\w+)'], re.IGNORECASE)
+    index, match = table.first("Status: Ready, Resale")
+    assert index == 0
+    assert match.group(0) == 'Resale'
+
+
+@pytest.mark.parametrize('name', ['DATE_PATTERN_TABLE', 'STATUS_TEXT_PATTERNS', 'PRICE_TEXT_PATTERNS',
+                                  'AREA_TEXT_PATTERNS', 'TITLE_TEXT_PATTERNS', 'PRICE_RANGE_PATTERNS'])
+def test_guarded_tables_match_plain_search_loop(name):
+    table = getattr(patterns, name)
+    texts = DATE_TEXTS + [
+        "Status: Under Construction", "Possession by Dec 2026", "New Launch", "Immediate Possession",
+        "₹1.2 - 1.5 Crore 3 BHK Flat in Sector 69", "Available from Mar 2025", "1200 Sq. Ft", ""
+    ]
+    for text in texts + [t.lower() for t in texts]:
+        found = table.first(text)
+        assert (found[0] if found else None) == _inline_first(table, text), text
+
+
+def test_guard_skips_pattern_without_scanning():
+    table = PatternTable([r'(\d+)\s+days?\s+ago', r'\d+'], guards=[('ago',), None])
+    index, match = table.first("3 days")
+    assert index == 1
+
+
+def test_guards_must_cover_every_pattern():
+    with pytest.raises(ValueError):
+        PatternTable([r'a', r'b'], guards=[('a',)])
+
+
+def test_findall_item_matches_findall_shapes():
+    for pattern, text in [(r'\btoday\b', 'posted today'), (r'(\d+) days', '4 days'),
+                          (r'(\d+)/(\d+)(?:/(\d+))?', '1/2')]:
+        assert findall_item(re.search(pattern, text)) == re.findall(pattern, text)[0]
+
+
+def test_date_parser_results_match_findall_loop():
+    parser = DateParsingSystem()
+    reference = datetime(2025, 1, 1, 10)
+    for text in DATE_TEXTS:
+        cleaned = text.strip().lower()
+        expected = None
+        for pattern, pattern_type, _ in parser.date_patterns:
+            matches = re.findall(pattern, cleaned, re.IGNORECASE)
+            if matches:
+                expected = (pattern_type, parser._parse_by_pattern_type(pattern_type, matches[0], reference))
+                break
+        result = parser.parse_posting_date(text, reference)
+        actual = (result['pattern_type'], result['parsed_datetime']) if result['pattern_type'] else None
+        assert actual == expected, text
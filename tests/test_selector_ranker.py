@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for learned selector ordering
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.selector_ranker import SelectorRanker
+from scraper.property_extractor import PropertyExtractor
+
+
+SELECTORS = {
+    'title': ['h2.mb-srp__card--title', '.card-luxury h2', 'h2', 'a[href*="property"]'],
+    'price': ['.mb-srp__card__price--amount', '[class*="price"]'],
+    'area': ['[class*="area"]'],
+    'url': ['a[href*="pdpid"]', 'a[href]']
+}
+
+CARD = """
+<div class="mb-srp__card card-luxury">
+    <h2>4 BHK Villa for Sale in Sector 88 Gurgaon</h2>
+    <div class="price">₹3.2 Crore</div>
+    <div class="area">2400 sqft</div>
+    <a href="/villa-sector-88-gurgaon-pdpid-4d4235">View</a>
+</div>
+"""
+
+
+def _card():
+    return BeautifulSoup(CARD, 'html.parser').div
+
+
+def test_unlearned_order_is_configured_order():
+    ranker = SelectorRanker()
+    assert ranker.order('title', SELECTORS['title']) == [0, 1, 2, 3]
+
+
+def test_winning_selector_is_promoted_and_dead_selectors_pruned():
+    ranker = SelectorRanker(reorder_interval=5, prune_after=5)
+    selectors = SELECTORS['title']
+    ranker.order('title', selectors)
+    for _ in range(5):
+        ranker.record('title', selectors[0], False)
+        ranker.record('title', selectors[1], True)
+        ranker.end_lookup('title')
+    # The winner moves first; the selector that never hit is pruned behind the untried ones
+    assert ranker.order('title', selectors) == [1, 2, 3, 0]
+    assert ranker.reorders == 1
+    stats = ranker.get_statistics()['fields']['title']
+    assert stats['leader'] == selectors[1]
+    assert stats['pruned'] == 1
+
+
+def test_generic_fallback_never_overtakes_a_specific_selector():
+    ranker = SelectorRanker(reorder_interval=1, prune_after=5)
+    selectors = SELECTORS['title']
+    ranker.order('title', selectors)
+    # The specific selector misses on some cards, the generic 'h2' fallback then always hits
+    for i in range(20):
+        ranker.record('title', selectors[0], i % 4 == 0)
+        if i % 4:
+            ranker.record('title', selectors[2], True)
+        ranker.end_lookup('title')
+    assert ranker.get_statistics()['fields']['title']['leader'] == selectors[2]
+    assert ranker.order('title', selectors) == [0, 1, 2, 3]
+
+
+def test_learned_card_lookup_takes_one_select_per_field():
+    ranker = SelectorRanker(reorder_interval=1, prune_after=1)
+    extractor = PropertyExtractor(SELECTORS, selector_ranker=ranker)
+    plain = PropertyExtractor(SELECTORS)
+
+    first = extractor.extract_property_data(_card(), 1, 1)
+    before = {field: sum(e[0] for e in ranker._stats[field].values()) for field in ('title', 'url')}
+    second = extractor.extract_property_data(_card(), 1, 2)
+    after = {field: sum(e[0] for e in ranker._stats[field].values()) for field in ('title', 'url')}
+
+    assert after['title'] - before['title'] == 1
+    assert after['url'] - before['url'] == 1
+    expected = plain.extract_property_data(_card(), 1, 2)
+    for record in (first, second, expected):
+        record.pop('scraped_at')
+    assert second == expected
+    assert second['title'] == '4 BHK Villa for Sale in Sector 88 Gurgaon'
+
+
+def test_collector_stops_at_first_valid_selector():
+    extractor = PropertyExtractor(SELECTORS)
+    fields = extractor.collect_card_fields(_card())
+    assert fields['title_candidates'] == [None, '4 BHK Villa for Sale in Sector 88 Gurgaon', None, None]
+
+
+def test_statistics_persist_and_reset(tmp_path):
+    db_path = str(tmp_path / 'selectors.db')
+    ranker = SelectorRanker(db_path=db_path, reorder_interval=1, prune_after=3)
+    extractor = PropertyExtractor(SELECTORS, selector_ranker=ranker)
+    for i in range(3):
+        extractor.extract_property_data(_card(), 1, i + 1)
+    assert ranker.save()
+
+    restored = SelectorRanker(db_path=db_path, prune_after=3)
+    assert restored.order('title', SELECTORS['title'])[0] == 1
+
+    restored.reset('title')
+    assert restored.order('title', SELECTORS['title']) == [0, 1, 2, 3]
+    connection = sqlite3.connect(db_path)
+    fields = {row[0] for row in connection.execute('SELECT DISTINCT field FROM selector_stats')}
+    connection.close()
+    assert 'title' not in fields and 'url' in fields
+
+    restored.reset()
+    assert SelectorRanker(db_path=db_path).get_statistics()['fields'] == {}
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Chrome-to-HTTP session broker against a local stand-in server
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper import async_pdp_engine
+from scraper.async_pdp_engine import AsyncPdpEngine
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.http_listing_fetcher import HttpListingFetcher
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.pacing import SegmentPacer
+from scraper.property_extractor import PropertyExtractor
+from scraper.session_broker import SessionBroker
+
+PDP_HTML = ('<html><head><title>2 BHK Flat</title></head><body>'
+            '<h1 class="mb-ldp__dtls__title">2 BHK Flat for Sale in Powai</h1>'
+            '<div class="mb-ldp__dtls__price">₹1.4 Cr</div></body></html>').encode('utf-8')
+BOT_HTML = b'<html><body><h1>Please verify you are human</h1><div class="captcha"></div></body></html>'
+
+
+class CookieCheckHandler(BaseHTTPRequestHandler):
+    """Serves the page only to clients presenting the fresh bot-check cookie"""
+    protocol_version = 'HTTP/1.1'
+    cookies_seen = []
+
+    def do_GET(self):
+        cookie = self.headers.get('Cookie') or ''
+        CookieCheckHandler.cookies_seen.append(cookie)
+        body = PDP_HTML if 'bm_sv=fresh' in cookie else BOT_HTML
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    CookieCheckHandler.cookies_seen = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), CookieCheckHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class FakeDriver:
+    """WebDriver stand-in whose cookies change with each navigation"""
+
+    def __init__(self, value='stale'):
+        self.value = value
+        self.current_url = 'https://www.magicbricks.com/property-for-sale-in-mumbai-pppfs'
+        self.navigations = []
+
+    def get(self, url):
+        self.navigations.append(url)
+        self.current_url = url
+        self.value = 'fresh'
+
+    def get_cookies(self):
+        return [{'name': 'bm_sv', 'value': self.value, 'domain': '127.0.0.1', 'path': '/'}]
+
+
+def _refreshing_broker(driver, **kwargs):
+    def refresh(url):
+        driver.get(url)
+        return driver
+    return SessionBroker(refresh_callback=refresh, min_refresh_interval=0, **kwargs)
+
+
+def test_bot_response_refreshes_credentials_once(server):
+    driver = FakeDriver()
+    broker = _refreshing_broker(driver)
+    fetcher = HttpListingFetcher(broker=broker)
+    assert broker.export_from_driver(driver, 'Mozilla/5.0 Test', reason='listing') == 1
+
+    blocked = fetcher.fetch(f"{server}/listing?page=2")
+    assert BotDetectionHandler().detect_bot_detection(blocked['page_source'], blocked['url'])
+
+    # Two clients blocked with the same credentials: only the first drives the browser
+    assert broker.refresh(blocked['session_version'])
+    assert broker.refresh(blocked['session_version'])
+    assert driver.navigations == ['https://www.magicbricks.com/property-for-sale-in-mumbai-pppfs']
+
+    served = fetcher.fetch(f"{server}/listing?page=2")
+    assert served['page_source'] == PDP_HTML.decode('utf-8')
+    assert CookieCheckHandler.cookies_seen == ['bm_sv=stale', 'bm_sv=fresh']
+    assert broker.session.headers['User-Agent'] == 'Mozilla/5.0 Test'
+
+    stats = broker.get_statistics()
+    assert stats['exports_by_reason'] == {'listing': 1, 'refresh': 1}
+    assert stats['refreshes'] == 1 and stats['bot_responses'] == 2 and stats['version'] == 2
+
+
+def test_refreshes_are_throttled():
+    driver = FakeDriver()
+    broker = _refreshing_broker(driver)
+    broker.min_refresh_interval = 60
+    broker.export_from_driver(driver)
+
+    assert broker.refresh(broker.version)
+    assert not broker.refresh(broker.version)
+    assert len(driver.navigations) == 1
+    assert broker.get_statistics()['refreshes_throttled'] == 1
+
+
+def test_async_engine_recovers_through_the_broker(server, monkeypatch):
+    monkeypatch.setattr(async_pdp_engine, 'MAX_SEGMENT_PAUSE', 0.01)
+    driver = FakeDriver()
+    broker = _refreshing_broker(driver)
+    broker.export_from_driver(driver)
+    scraper = IndividualPropertyScraper(
+        driver=None,
+        property_extractor=PropertyExtractor({}),
+        bot_handler=BotDetectionHandler(),
+        pacer=SegmentPacer(segment_rate=1000, segment_burst=1000, global_rate=None)
+    )
+    urls = [f"{server}/flat-powai-mumbai-pdpid-{i}" for i in range(3)]
+    engine = AsyncPdpEngine(scraper, session_broker=broker, browser_fallback=False)
+
+    results = engine.run(urls)
+
+    assert sorted(r['property_url'] for r in results) == urls
+    assert len(driver.navigations) == 1
+    assert engine.get_statistics()['session_refreshes'] >= 1
+    assert CookieCheckHandler.cookies_seen[-1] == 'bm_sv=fresh'
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tiered browser recovery (soft reset before full relaunch)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scraper.driver_pool import DriverPool
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.property_extractor import PropertyExtractor
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.session_recovery import SessionRecovery
+
+
+class TabDriver:
+    """WebDriver stand-in with tabs and a CDP command log"""
+
+    def __init__(self, fail_cdp=False):
+        self.session_id = f"tab-driver-{id(self)}"
+        self.window_handles = ['tab-0']
+        self.current_window_handle = 'tab-0'
+        self.current_url = 'about:blank'
+        self.cdp_commands = []
+        self.fail_cdp = fail_cdp
+        self.quit_called = False
+        self.switch_to = self
+
+    # switch_to API
+    def new_window(self, kind):
+        handle = f"tab-{len(self.cdp_commands) + len(self.window_handles)}"
+        self.window_handles.append(handle)
+        self.current_window_handle = handle
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def execute_cdp_cmd(self, command, params):
+        if self.fail_cdp:
+            raise RuntimeError("cdp unavailable")
+        self.cdp_commands.append(command)
+        return {}
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_bot_detection_gets_a_soft_reset():
+    driver = TabDriver()
+    prepared, relaunches = [], []
+    recovery = SessionRecovery(prepare_tab=prepared.append)
+
+    assert recovery.recover(driver, lambda: relaunches.append(1)) == 'soft_reset'
+
+    assert driver.window_handles == [driver.current_window_handle] != ['tab-0']
+    assert driver.cdp_commands == ['Network.clearBrowserCookies', 'Network.clearBrowserCache',
+                                   'Storage.clearDataForOrigin']
+    assert prepared == [driver] and relaunches == []
+    stats = recovery.get_statistics()
+    assert stats['soft_reset']['successes'] == 1 and stats['relaunch']['attempts'] == 0
+    assert stats['relaunches_avoided'] == 1
+
+
+def test_dead_sessions_and_failed_soft_resets_relaunch():
+    recovery = SessionRecovery()
+    relaunches = []
+
+    dead = TabDriver()
+    assert recovery.recover(dead, lambda: relaunches.append('dead'), error='invalid session id') == 'relaunch'
+    assert dead.cdp_commands == []
+
+    broken = TabDriver(fail_cdp=True)
+    assert recovery.recover(broken, lambda: relaunches.append('broken'), error='timeout: page load') == 'relaunch'
+
+    assert relaunches == ['dead', 'broken']
+    stats = recovery.get_statistics()
+    assert stats['soft_reset'] == {'attempts': 1, 'successes': 0, 'success_rate': 0.0,
+                                   'avg_seconds': stats['soft_reset']['avg_seconds']}
+    assert stats['relaunch']['attempts'] == 2 and stats['relaunch']['success_rate'] == 1.0
+
+
+def test_repeated_soft_resets_escalate_to_relaunch():
+    driver = TabDriver()
+    recovery = SessionRecovery(max_soft_resets=2)
+    relaunch = lambda: False  # relaunch reports failure
+
+    tiers = [recovery.recover(driver, relaunch) for _ in range(4)]
+
+    # The relaunch resets the session's count, so soft resets are tried again
+    assert tiers == ['soft_reset', 'soft_reset', 'relaunch', 'soft_reset']
+    stats = recovery.get_statistics()
+    assert stats['escalations'] == 1 and stats['relaunch']['success_rate'] == 0.0
+
+
+def test_pool_member_timeout_keeps_its_chrome():
+    pool = DriverPool(TabDriver, size=1)
+    pool.start()
+    scraper = IndividualPropertyScraper(
+        driver=None,
+        property_extractor=PropertyExtractor(premium_selectors={}),
+        bot_handler=BotDetectionHandler(),
+        driver_pool=pool
+    )
+    with pool.lease() as member:
+        driver = member.driver
+        scraper._restart_for(member, 'timeout: timed out receiving message from renderer')
+        assert member.driver is driver and not driver.quit_called
+        scraper._restart_for(member, 'chrome not reachable')
+        assert member.driver is not driver and driver.quit_called
+
+    assert pool.get_pool_statistics()['restarts'] == 1
+    assert scraper.recovery.get_statistics()['relaunches_avoided'] == 1
+    pool.close()
+
+
+def test_released_warm_browser_is_reset_before_the_next_city():
+    recovery = SessionRecovery()
+    pool = DriverPool(TabDriver, size=1, reset_session=recovery.soft_reset)
+    pool.start()
+    member = pool.acquire()
+    driver = member.driver
+    pool.release(member, pages=5)
+
+    again = pool.acquire(timeout=5)
+    assert again.driver is driver and not driver.quit_called
+    assert 'Network.clearBrowserCookies' in driver.cdp_commands
+    assert driver.window_handles == [driver.current_window_handle] and 'tab-0' not in driver.window_handles
+    assert pool.get_pool_statistics()['session_resets'] == 1
+
+    # A browser whose reset fails is relaunched instead of handed on
+    driver.fail_cdp = True
+    pool.release(again)
+    relaunched = pool.acquire(timeout=5)
+    assert relaunched.driver is not driver and driver.quit_called
+    assert pool.get_pool_statistics()['restarts'] == 1
+    pool.close()
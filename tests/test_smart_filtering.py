@@ -33,6 +33,13 @@ class TestSmartFiltering(unittest.TestCase):
             individual_tracker=self.mock_tracker,
             logger=self.mock_logger
         )
+
+    def _mock_records(self, urls, rows):
+        """Bulk lookup result: (scraped_at, quality, success) per URL, None for never scraped"""
+        self.mock_tracker.lookup_scrape_records.return_value = {
+            url: {'scraped_at': row[0], 'data_quality_score': row[1], 'extraction_success': row[2]}
+            for url, row in zip(urls, rows) if row is not None
+        }
     
     def test_smart_filter_new_urls(self):
         """Test that new URLs (never scraped) are included"""
@@ -42,18 +49,8 @@ class TestSmartFiltering(unittest.TestCase):
             'https://www.magicbricks.com/property-3'
         ]
         
-        # Mock database connection
-        mock_db = Mock()
-        mock_cursor = Mock()
-        mock_db.connection.cursor.return_value = mock_cursor
-        
         # All URLs return None (never scraped)
-        mock_cursor.fetchone.return_value = None
-        
-        self.mock_tracker.db_manager = mock_db
-        self.mock_tracker.db_manager.connect_db.return_value = True
-        self.mock_tracker.normalize_url = lambda url: url
-        self.mock_tracker.generate_url_hash = lambda url: f"hash_{url}"
+        self._mock_records(test_urls, [None] * len(test_urls))
         
         result = self.scraper._smart_filter_urls(test_urls, quality_threshold=60.0, ttl_days=30)
         
@@ -65,19 +62,9 @@ class TestSmartFiltering(unittest.TestCase):
         """Test that low quality URLs are included for re-scraping"""
         test_urls = ['https://www.magicbricks.com/property-1']
         
-        # Mock database connection
-        mock_db = Mock()
-        mock_cursor = Mock()
-        mock_db.connection.cursor.return_value = mock_cursor
-        
         # URL exists with low quality score (40%)
         scraped_at = datetime.now().isoformat()
-        mock_cursor.fetchone.return_value = (scraped_at, 40.0, True)
-        
-        self.mock_tracker.db_manager = mock_db
-        self.mock_tracker.db_manager.connect_db.return_value = True
-        self.mock_tracker.normalize_url = lambda url: url
-        self.mock_tracker.generate_url_hash = lambda url: f"hash_{url}"
+        self._mock_records(test_urls, [(scraped_at, 40.0, True)])
         
         result = self.scraper._smart_filter_urls(test_urls, quality_threshold=60.0, ttl_days=30)
         
@@ -89,19 +76,9 @@ class TestSmartFiltering(unittest.TestCase):
         """Test that stale URLs (older than TTL) are included"""
         test_urls = ['https://www.magicbricks.com/property-1']
         
-        # Mock database connection
-        mock_db = Mock()
-        mock_cursor = Mock()
-        mock_db.connection.cursor.return_value = mock_cursor
-        
         # URL exists with good quality but old data (45 days ago)
         scraped_at = (datetime.now() - timedelta(days=45)).isoformat()
-        mock_cursor.fetchone.return_value = (scraped_at, 80.0, True)
-        
-        self.mock_tracker.db_manager = mock_db
-        self.mock_tracker.db_manager.connect_db.return_value = True
-        self.mock_tracker.normalize_url = lambda url: url
-        self.mock_tracker.generate_url_hash = lambda url: f"hash_{url}"
+        self._mock_records(test_urls, [(scraped_at, 80.0, True)])
         
         result = self.scraper._smart_filter_urls(test_urls, quality_threshold=60.0, ttl_days=30)
         
@@ -113,19 +90,9 @@ class TestSmartFiltering(unittest.TestCase):
         """Test that good quality + fresh URLs are skipped"""
         test_urls = ['https://www.magicbricks.com/property-1']
         
-        # Mock database connection
-        mock_db = Mock()
-        mock_cursor = Mock()
-        mock_db.connection.cursor.return_value = mock_cursor
-        
         # URL exists with good quality and fresh data (5 days ago)
         scraped_at = (datetime.now() - timedelta(days=5)).isoformat()
-        mock_cursor.fetchone.return_value = (scraped_at, 85.0, True)
-        
-        self.mock_tracker.db_manager = mock_db
-        self.mock_tracker.db_manager.connect_db.return_value = True
-        self.mock_tracker.normalize_url = lambda url: url
-        self.mock_tracker.generate_url_hash = lambda url: f"hash_{url}"
+        self._mock_records(test_urls, [(scraped_at, 85.0, True)])
         
         result = self.scraper._smart_filter_urls(test_urls, quality_threshold=60.0, ttl_days=30)
         
@@ -136,19 +103,9 @@ class TestSmartFiltering(unittest.TestCase):
         """Test that URLs with failed extraction are included"""
         test_urls = ['https://www.magicbricks.com/property-1']
         
-        # Mock database connection
-        mock_db = Mock()
-        mock_cursor = Mock()
-        mock_db.connection.cursor.return_value = mock_cursor
-        
         # URL exists but extraction failed
         scraped_at = datetime.now().isoformat()
-        mock_cursor.fetchone.return_value = (scraped_at, 0.0, False)  # extraction_success = False
-        
-        self.mock_tracker.db_manager = mock_db
-        self.mock_tracker.db_manager.connect_db.return_value = True
-        self.mock_tracker.normalize_url = lambda url: url
-        self.mock_tracker.generate_url_hash = lambda url: f"hash_{url}"
+        self._mock_records(test_urls, [(scraped_at, 0.0, False)])  # extraction_success = False
         
         result = self.scraper._smart_filter_urls(test_urls, quality_threshold=60.0, ttl_days=30)
         
@@ -165,28 +122,13 @@ class TestSmartFiltering(unittest.TestCase):
             'https://www.magicbricks.com/good-fresh-property'
         ]
         
-        # Mock database connection
-        mock_db = Mock()
-        mock_cursor = Mock()
-        mock_db.connection.cursor.return_value = mock_cursor
-        
         # Define different responses for each URL
-        def mock_fetchone_side_effect():
-            responses = [
-                None,  # new-property: never scraped
-                (datetime.now().isoformat(), 45.0, True),  # low-quality: 45% quality
-                ((datetime.now() - timedelta(days=40)).isoformat(), 75.0, True),  # stale: 40 days old
-                ((datetime.now() - timedelta(days=5)).isoformat(), 85.0, True)  # good-fresh: 5 days old, 85% quality
-            ]
-            for response in responses:
-                yield response
-        
-        mock_cursor.fetchone.side_effect = mock_fetchone_side_effect()
-        
-        self.mock_tracker.db_manager = mock_db
-        self.mock_tracker.db_manager.connect_db.return_value = True
-        self.mock_tracker.normalize_url = lambda url: url
-        self.mock_tracker.generate_url_hash = lambda url: f"hash_{url}"
+        self._mock_records(test_urls, [
+            None,  # new-property: never scraped
+            (datetime.now().isoformat(), 45.0, True),  # low-quality: 45% quality
+            ((datetime.now() - timedelta(days=40)).isoformat(), 75.0, True),  # stale: 40 days old
+            ((datetime.now() - timedelta(days=5)).isoformat(), 85.0, True)  # good-fresh: 5 days old, 85% quality
+        ])
         
         result = self.scraper._smart_filter_urls(test_urls, quality_threshold=60.0, ttl_days=30)
         
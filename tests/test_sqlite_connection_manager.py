@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared per-thread SQLite connection manager
+"""
+
+import os
+import sys
+import sqlite3
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlite_connection_manager import SQLiteConnectionManager
+from url_tracking_operations import URLTrackingOperations
+from property_database_manager import PropertyDatabaseManager
+
+
+def test_one_tuned_connection_per_thread(tmp_path):
+    manager = SQLiteConnectionManager()
+    db = str(tmp_path / 'tracking.db')
+
+    connection = manager.get_connection(db)
+    assert manager.get_connection(db) is connection
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+    reader = manager.get_connection(db, read_only=True)
+    assert reader.execute("PRAGMA busy_timeout").fetchone()[0] == 1000  # GUI reads on the UI thread
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(manager.get_connection(db)))
+    worker.start()
+    worker.join()
+    assert other[0] is not connection
+
+    rows = manager.get_connection(db, row_factory=sqlite3.Row)
+    assert rows is not connection and rows.row_factory is sqlite3.Row
+
+    # The dead worker's connection is closed when the next one is opened
+    manager.get_connection(str(tmp_path / 'other.db'))
+    assert manager.get_statistics()['open_connections'] == 4
+    manager.close_all()
+
+
+def test_close_keeps_connection_and_other_modules_work(tmp_path):
+    manager = SQLiteConnectionManager()
+    db = str(tmp_path / 'tracking.db')
+
+    connection = manager.get_connection(db)
+    connection.execute("CREATE TABLE t (v INTEGER)")
+    connection.execute("INSERT INTO t VALUES (1)")
+    connection.commit()
+    connection.execute("INSERT INTO t VALUES (2)")  # one module's open transaction
+
+    # Another module on the same thread is done with the connection
+    other = manager.get_connection(db)
+    other.close()
+
+    assert other is connection and connection.in_transaction
+    connection.commit()
+    assert connection.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+
+    # A replaced database file gets a fresh connection
+    manager.close_all()
+    os.remove(db)
+    sqlite3.connect(db).close()
+    fresh = manager.get_connection(db)
+    assert fresh.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
+    manager.close_all()
+
+
+def test_reader_runs_while_writer_holds_a_transaction(tmp_path):
+    manager = SQLiteConnectionManager(timeout=0.2)
+    db = str(tmp_path / 'tracking.db')
+    writer = manager.get_connection(db)
+    writer.execute("CREATE TABLE t (v INTEGER)")
+    writer.execute("INSERT INTO t VALUES (1)")
+    writer.commit()
+
+    writer.execute("INSERT INTO t VALUES (2)")  # open write transaction
+    counts = []
+
+    def read():
+        reader = manager.get_connection(db, read_only=True)
+        counts.append(reader.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+
+    reader_thread = threading.Thread(target=read)
+    reader_thread.start()
+    reader_thread.join()
+    writer.commit()
+
+    assert counts == [1]  # not "database is locked"
+    manager.close_all()
+
+
+def test_tracking_modules_share_the_thread_connection(tmp_path):
+    db = str(tmp_path / 'tracking.db')
+    operations = URLTrackingOperations(db)
+    first = operations.connect_db()
+    first.close()
+    assert operations.connect_db() is first
+
+    database = PropertyDatabaseManager(db)
+    assert database.connect_db()
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(database.connection))
+    worker.start()
+    worker.join()
+    assert database.connection is not None and seen == [None]
+    database.close_connection()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for set-based URL batch tracking (single-transaction UPSERT)
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from incremental_database_schema import IncrementalDatabaseSchema
+from url_tracking_operations import URLTrackingOperations
+
+BASE = 'https://www.magicbricks.com/propertyDetails/flat-in-sector-{}-gurgaon&id=4d42{}'
+
+
+def _database(path):
+    schema = IncrementalDatabaseSchema(str(path))
+    schema.create_incremental_tables()
+    schema.close()
+    return str(path)
+
+
+def _page(ids, city='gurgaon'):
+    return [{'url': BASE.format(i, i), 'title': f"Flat {i}", 'city': city} for i in ids]
+
+
+def _comparable(results):
+    return [{k: v for k, v in r.items() if k != 'first_seen_date'} for r in results]
+
+
+def _table(db):
+    connection = sqlite3.connect(db)
+    rows = connection.execute('''
+        SELECT property_url, seen_count, property_id, title, city, is_active
+        FROM property_urls_seen ORDER BY property_url
+    ''').fetchall()
+    connection.close()
+    return rows
+
+
+def test_batch_matches_per_url_tracking(tmp_path):
+    batch_db = _database(tmp_path / 'batch.db')
+    single_db = _database(tmp_path / 'single.db')
+    batch_ops = URLTrackingOperations(batch_db)
+    single_ops = URLTrackingOperations(single_db)
+
+    first_page = _page([1, 2, 3])
+    second_page = _page([3, 4, 4, 5]) + [{'url': BASE.format(6, 6) + '?utm_source=x', 'title': 'Flat 6', 'city': 'gurgaon',
+                                          'posting_date_text': 'Posted today'}]
+
+    for page in (first_page, second_page):
+        batch = batch_ops.batch_track_urls(page)
+        single = single_ops._track_urls_individually(page)
+        assert _comparable(batch['url_results']) == _comparable(single)
+
+    assert batch['new_urls'] == 3 and batch['duplicate_urls'] == 2 and batch['errors'] == 0
+    assert [r['seen_count'] for r in batch['url_results']] == [2, 1, 2, 1, 1]
+    assert _table(batch_db) == _table(single_db)
+    assert batch_ops.get_stats() == single_ops.get_stats()
+
+    connection = sqlite3.connect(batch_db)
+    assert connection.execute("SELECT COUNT(*) FROM property_posting_dates").fetchone()[0] == 1
+    connection.close()
+
+
+def test_table_without_unique_constraint_falls_back(tmp_path):
+    db = str(tmp_path / 'legacy.db')
+    connection = sqlite3.connect(db)
+    connection.execute('''
+        CREATE TABLE property_urls_seen (
+            url_id INTEGER PRIMARY KEY AUTOINCREMENT, property_url TEXT NOT NULL,
+            first_seen_date DATETIME NOT NULL, last_seen_date DATETIME NOT NULL,
+            seen_count INTEGER DEFAULT 1, property_id TEXT, title TEXT, city TEXT,
+            is_active BOOLEAN DEFAULT 1, created_at DATETIME
+        )
+    ''')
+    connection.commit()
+    connection.close()
+
+    result = URLTrackingOperations(db).batch_track_urls(_page([1, 1]))
+    assert result['new_urls'] == 1 and result['duplicate_urls'] == 1
+    assert [row[1] for row in _table(db)] == [2]
@@ -0,0 +1,108 @@
+"""
+Async PDP Engine Benchmark
+Serves a recorded property page from a local stand-in server with simulated
+network latency and scrapes N URLs spread over several segments two ways:
+  sequential - one keep-alive request at a time, parsed inline
+  async      - AsyncPdpEngine (global + per-segment semaphores, parsing in an executor)
+
+Usage:
+    python tools/bench_async_pdp.py
+    python tools/bench_async_pdp.py --urls 60 --segments 6 --latency 0.4 --concurrency 8
+"""
+
+import sys
+import os
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from scraper.async_pdp_engine import AsyncPdpEngine, AIOHTTP_AVAILABLE
+from scraper.bot_detection_handler import BotDetectionHandler
+from scraper.individual_property_scraper import IndividualPropertyScraper
+from scraper.pacing import SegmentPacer
+from scraper.property_extractor import PropertyExtractor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PDP = os.path.join(ROOT, 'reports', 'validation', 'run_20251004_153050', '01_mumbai.html')
+
+
+def serve(body: bytes, latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def individual_scraper(parser_engine: str) -> IndividualPropertyScraper:
+    return IndividualPropertyScraper(
+        driver=None,
+        property_extractor=PropertyExtractor({}, parser_engine=parser_engine),
+        bot_handler=BotDetectionHandler(),
+        pacer=SegmentPacer(segment_rate=1000, segment_burst=1000, global_rate=None)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the async PDP engine against sequential fetches")
+    parser.add_argument('--pdp', default=DEFAULT_PDP)
+    parser.add_argument('--urls', type=int, default=24)
+    parser.add_argument('--segments', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.4, help="Simulated server latency in seconds")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--segment-concurrency', type=int, default=2)
+    parser.add_argument('--parser', default='lxml')
+    args = parser.parse_args()
+
+    with open(args.pdp, 'rb') as f:
+        body = f.read()
+    httpd = serve(body, args.latency)
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    urls = [f"{base}/flat-locality{i % args.segments}-mumbai-pdpid-{i}" for i in range(args.urls)]
+
+    print("=" * 72)
+    print(f"PDP ENGINES: {args.urls} URLs, {args.segments} segments, {args.latency}s latency, "
+          f"{len(body):,} bytes/page ({'aiohttp' if AIOHTTP_AVAILABLE else 'requests in threads'})")
+    print("=" * 72)
+
+    scraper = individual_scraper(args.parser)
+    session = requests.Session()
+    start = time.perf_counter()
+    sequential = [scraper.extract_property_details(url, session.get(url).text) for url in urls]
+    sequential_s = time.perf_counter() - start
+    print(f"{'sequential':<12} {sequential_s:>8.2f}s  {len(sequential) / sequential_s * 60:>8.1f} pages/min")
+
+    scraper = individual_scraper(args.parser)
+    engine = AsyncPdpEngine(scraper, max_concurrency=args.concurrency,
+                            segment_concurrency=args.segment_concurrency, browser_fallback=False)
+    start = time.perf_counter()
+    results = engine.run(urls)
+    async_s = time.perf_counter() - start
+    print(f"{'async':<12} {async_s:>8.2f}s  {len(results) / async_s * 60:>8.1f} pages/min  "
+          f"(max in flight {engine.get_statistics()['max_in_flight']})")
+
+    same = sorted(sequential, key=lambda r: r['property_url']) == sorted(results, key=lambda r: r['property_url'])
+    print(f"same records: {same}")
+    httpd.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Card Text Walk Benchmark
+Counts full-subtree text walks per listing card (get_text / find_all(string=...)
+on the card itself) and CPU time for the structured-field lookups, comparing
+the per-extractor walks with the shared CardContext.
+
+Usage:
+    python tools/bench_card_text_walks.py --repeat 3
+    python tools/bench_card_text_walks.py --listing path/to/srp.html --engine lxml
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper, LISTING_CARD_SELECTORS
+from scraper.html_parsing import PARSER_ENGINES
+from scraper.property_extractor import PropertyExtractor, CardContext
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_LISTING = os.path.join(ROOT, 'archive', 'development_and_testing_files', 'debug_bot_detection.html')
+
+
+class WalkCounter:
+    """Proxy around a card that counts whole-card text walks"""
+
+    def __init__(self, card):
+        self._card = card
+        self.walks = 0
+
+    def get_text(self, *args, **kwargs):
+        self.walks += 1
+        return self._card.get_text(*args, **kwargs)
+
+    def find_all(self, *args, **kwargs):
+        if 'string' in kwargs:
+            self.walks += 1
+        return self._card.find_all(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._card, name)
+
+
+def per_extractor(extractor, card):
+    """Previous flow: one walk per structured label plus the card text read twice"""
+    text = card.get_text()
+    structured = {name: extractor._structured_value_from_dom(card, name)
+                  for name in extractor.STRUCTURED_FIELDS.values()}
+    return text, structured, card.get_text()
+
+
+def shared_context(extractor, card):
+    """CardContext flow: card text and summary map built once, reused for every label"""
+    context = CardContext.from_card(card)
+    structured = {name: context.structured_value(name) for name in extractor.STRUCTURED_FIELDS.values()}
+    return context.text, structured, context.text
+
+
+def run(flow, extractor, cards, repeat):
+    walks = 0
+    start = time.process_time()
+    for _ in range(repeat):
+        results = []
+        for card in cards:
+            counter = WalkCounter(card)
+            results.append(flow(extractor, counter))
+            walks += counter.walks
+    elapsed = (time.process_time() - start) / repeat
+    return elapsed, walks / (repeat * max(1, len(cards))), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark card text walks per listing card")
+    parser.add_argument('--listing', default=DEFAULT_LISTING)
+    parser.add_argument('--engine', choices=PARSER_ENGINES, default='html.parser')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.listing, encoding='utf-8') as f:
+        markup = f.read()
+    extractor = PropertyExtractor(IntegratedMagicBricksScraper._setup_premium_selectors(None),
+                                  parser_engine=args.engine)
+    cards = extractor.parse_html(markup).select(LISTING_CARD_SELECTORS[0])
+
+    print("=" * 60)
+    print(f"CARD TEXT WALKS ({args.engine}, {len(cards)} cards)")
+    print("=" * 60)
+    baseline = None
+    for name, flow in (('per-extractor', per_extractor), ('card-context', shared_context)):
+        elapsed, walks, results = run(flow, extractor, cards, args.repeat)
+        baseline = results if baseline is None else baseline
+        print(f"{name:<14} {elapsed * 1000:>8.1f} ms/page  walks/card={walks:<5.1f} "
+              f"identical={results == baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Interception Profile Benchmark
+Loads the same pages in Chrome with no blocking and with each interception
+profile, and reports load time, DOM ready, bytes transferred and blocked
+requests from the performance log (real traffic: keep the URL list short).
+
+Usage:
+    python tools/bench_interception_profiles.py --urls <listing url> <pdp url> --repeat 3
+"""
+
+import sys
+import os
+import argparse
+from statistics import median
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+from scraper import InterceptionPolicy, NetworkTimingRecorder
+
+
+def run_benchmark(urls, profiles, repeat: int, headless: bool = True):
+    """Load every URL `repeat` times per profile (fresh browser each) and summarize the network records"""
+
+    scraper = IntegratedMagicBricksScraper(headless=headless, incremental_enabled=False,
+                                           custom_config={'network_timing': True})
+    results = []
+    for profile in [None] + list(profiles):
+        policy = InterceptionPolicy(enabled=profile is not None)
+        recorder = NetworkTimingRecorder()
+        driver = scraper._create_driver()
+        try:
+            policy.apply(driver, profile or 'pdp')
+            for _ in range(repeat):
+                for url in urls:
+                    recorder.drain(driver)
+                    driver.get(url)
+                    policy.record_navigation(profile or 'none', recorder.capture(driver, 'page', url))
+        finally:
+            driver.quit()
+
+        records = list(recorder.records.get('page', []))
+        values = lambda field: [r[field] for r in records if r.get(field) is not None]
+        results.append({
+            'profile': profile or 'none',
+            'pages': len(records),
+            'load_ms': median(values('load_ms')) if values('load_ms') else None,
+            'dom_ready_ms': median(values('dom_ready_ms')) if values('dom_ready_ms') else None,
+            'bytes': median(values('bytes')) if records else 0,
+            'blocked': median(values('blocked')) if records else 0,
+            'estimated_bytes_saved': policy.get_statistics()['estimated_bytes_saved']
+        })
+
+    scraper.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page loads with and without each interception profile")
+    parser.add_argument('--urls', nargs='+', required=True)
+    parser.add_argument('--profiles', nargs='+', default=['listing', 'pdp'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--headed', action='store_true')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("INTERCEPTION PROFILE BENCHMARK")
+    print("=" * 60)
+    rows = run_benchmark(args.urls, args.profiles, args.repeat, headless=not args.headed)
+    baseline = rows[0]
+    for row in rows:
+        saved = baseline['bytes'] - row['bytes']
+        print(f"profile={row['profile']:<8} pages={row['pages']:<3} load p50={row['load_ms']} ms  "
+              f"dom ready p50={row['dom_ready_ms']} ms  bytes p50={row['bytes']:,.0f} "
+              f"(saved {saved:,.0f} vs none, estimate {row['estimated_bytes_saved']:,})  "
+              f"blocked p50={row['blocked']}")
+
+
+if __name__ == '__main__':
+    main()
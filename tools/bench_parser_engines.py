@@ -0,0 +1,98 @@
+"""
+Parser Engine Benchmark
+Measures CPU time per page for each parser engine on recorded MagicBricks pages
+and confirms the extracted records are identical.
+
+Usage:
+    python tools/bench_parser_engines.py --repeat 3
+    python tools/bench_parser_engines.py --listing path/to/srp.html --pdp path/to/pdp1.html path/to/pdp2.html
+"""
+
+import sys
+import os
+import time
+import glob
+import argparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper, LISTING_CARD_SELECTORS
+from scraper.html_parsing import PARSER_ENGINES
+from scraper.property_extractor import PropertyExtractor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_LISTING = os.path.join(ROOT, 'archive', 'development_and_testing_files', 'debug_bot_detection.html')
+DEFAULT_PDPS = sorted(glob.glob(os.path.join(ROOT, 'reports', 'validation', '*', '*.html')))
+
+PDP_EXTRACTORS = [
+    '_safe_extract_property_title', '_safe_extract_property_price', '_safe_extract_property_area',
+    '_safe_extract_description', '_safe_extract_amenities', '_safe_extract_builder_info',
+    '_safe_extract_location_details', '_safe_extract_specifications'
+]
+
+
+def bench_listing(markup: str, engine: str, repeat: int):
+    """Parse + extract every card; returns (cpu seconds per page, records)"""
+    extractor = PropertyExtractor(IntegratedMagicBricksScraper._setup_premium_selectors(None), parser_engine=engine)
+    start = time.process_time()
+    for _ in range(repeat):
+        root = extractor.parse_html(markup)
+        cards = root.select(LISTING_CARD_SELECTORS[0])
+        records = [extractor.extract_property_data(card, 1, i + 1) for i, card in enumerate(cards)]
+    elapsed = (time.process_time() - start) / repeat
+    for record in records:
+        if record:
+            record.pop('scraped_at')
+    return elapsed, records
+
+
+def bench_pdps(pages, engine: str, repeat: int):
+    """Parse + run PDP field extractors; returns (cpu seconds per page, results)"""
+    extractor = PropertyExtractor({}, parser_engine=engine)
+    start = time.process_time()
+    for _ in range(repeat):
+        results = []
+        for markup in pages:
+            root = extractor.parse_html(markup)
+            results.append({name: getattr(extractor, name)(root) for name in PDP_EXTRACTORS})
+    elapsed = (time.process_time() - start) / (repeat * max(1, len(pages)))
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CPU per page for each parser engine")
+    parser.add_argument('--listing', default=DEFAULT_LISTING)
+    parser.add_argument('--pdp', nargs='*', default=DEFAULT_PDPS)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PARSER ENGINE BENCHMARK (CPU ms/page)")
+    print("=" * 60)
+
+    if os.path.exists(args.listing):
+        with open(args.listing, encoding='utf-8') as f:
+            markup = f.read()
+        baseline = None
+        for engine in PARSER_ENGINES:
+            elapsed, records = bench_listing(markup, engine, args.repeat)
+            baseline = records if baseline is None else baseline
+            print(f"listing  {engine:<12} {elapsed * 1000:>8.1f} ms  cards={len(records):<3} "
+                  f"identical={records == baseline}")
+
+    pages = []
+    for path in args.pdp:
+        with open(path, encoding='utf-8') as f:
+            pages.append(f.read())
+    if pages:
+        baseline = None
+        for engine in PARSER_ENGINES:
+            elapsed, results = bench_pdps(pages, engine, args.repeat)
+            baseline = results if baseline is None else baseline
+            print(f"pdp      {engine:<12} {elapsed * 1000:>8.1f} ms  pages={len(pages):<3} "
+                  f"identical={results == baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+PDP Driver Pool Benchmark
+Measures individual-page throughput for different DriverPool sizes against a
+local fixture server (no MagicBricks traffic).
+
+Usage:
+    python tools/bench_pdp_driver_pool.py --urls 40 --sizes 1 2 4 --latency 0.3
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrated_magicbricks_scraper import IntegratedMagicBricksScraper
+from scraper import DriverPool
+from tests.fixture_server import FixtureServer
+
+
+def run_benchmark(url_count: int, sizes, latency: float, headless: bool = True):
+    """Scrape the same fixture URLs with each pool size and report pages/min"""
+
+    scraper = IntegratedMagicBricksScraper(headless=headless, incremental_enabled=False,
+                                           custom_config={'realistic_headers': False})
+    scraper.setup_driver()
+    individual = scraper.individual_scraper
+    individual.simulate_mouse_movement = False
+
+    results = []
+    with FixtureServer(latency=latency) as server:
+        urls = [server.url(f"/bench-flat-sector-pdpid-{i}") for i in range(url_count)]
+
+        for size in sizes:
+            pool = None
+            if size > 1:
+                pool = DriverPool(scraper._create_driver, size=size, logger=scraper.logger)
+                pool.start()
+            individual.driver_pool = pool
+            individual.url_failures.clear()
+            individual.url_cooldowns.clear()
+
+            start = time.time()
+            scraped = individual._scrape_individual_pages_concurrent_enhanced(urls, batch_size=url_count)
+            elapsed = time.time() - start
+
+            individual.driver_pool = None
+            if pool:
+                pool.close()
+
+            results.append({
+                'pool_size': size,
+                'pages': len(scraped),
+                'seconds': round(elapsed, 2),
+                'pages_per_minute': round(len(scraped) * 60 / elapsed, 1) if elapsed else 0.0
+            })
+
+    scraper.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDP throughput per DriverPool size")
+    parser.add_argument('--urls', type=int, default=40)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--latency', type=float, default=0.3, help="Fixture server latency per request (s)")
+    parser.add_argument('--headed', action='store_true')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PDP DRIVER POOL BENCHMARK")
+    print("=" * 60)
+    for row in run_benchmark(args.urls, args.sizes, args.latency, headless=not args.headed):
+        print(f"pool={row['pool_size']:<3} pages={row['pages']:<4} "
+              f"time={row['seconds']:>7.2f}s  throughput={row['pages_per_minute']:>7.1f} pages/min")
+
+
+if __name__ == '__main__':
+    main()
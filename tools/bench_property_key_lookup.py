@@ -0,0 +1,139 @@
+"""
+Property Key Lookup Benchmark
+Fills the tracking tables with synthetic PDP URLs and compares the integer
+property_key against the URL columns it replaced: index size, per-URL lookups
+(`url_hash = ? OR property_url = ?` vs `property_key = ?`) and the GUI's
+property_urls_seen / individual_properties_scraped join.
+
+Usage:
+    python tools/bench_property_key_lookup.py --rows 200000 --lookups 20000
+"""
+
+import sys
+import os
+import time
+import random
+import hashlib
+import sqlite3
+import argparse
+import tempfile
+import contextlib
+import io
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from incremental_database_schema import IncrementalDatabaseSchema
+from property_database_manager import PropertyDatabaseManager
+from property_keys import property_key
+
+
+def _url(i: int) -> str:
+    return f"https://www.magicbricks.com/propertydetails/2-bhk-flat-sector-{i % 90}-gurgaon&id=4d4235{i:09d}"
+
+
+def _fill(db_path: str, rows: int):
+    with contextlib.redirect_stdout(io.StringIO()):
+        schema = IncrementalDatabaseSchema(db_path)
+        schema.create_incremental_tables()
+        schema.close()
+        PropertyDatabaseManager(db_path).setup_database_schema()
+
+    connection = sqlite3.connect(db_path)
+    now = datetime.now()
+    urls = [_url(i) for i in range(rows)]
+    connection.executemany('''
+        INSERT INTO property_urls_seen (property_url, property_key, first_seen_date, last_seen_date, city)
+        VALUES (?, ?, ?, ?, 'gurgaon')
+    ''', [(url, property_key(url), now, now) for url in urls])
+    connection.executemany('''
+        INSERT INTO individual_properties_scraped (property_url, property_key, url_hash, scraped_at)
+        VALUES (?, ?, ?, ?)
+    ''', [(url, property_key(url), hashlib.md5(url.encode()).hexdigest(), now)
+          for url in urls[::2]])
+    connection.commit()
+    connection.execute("ANALYZE")
+    return connection, urls
+
+
+def _index_bytes(connection: sqlite3.Connection, table: str):
+    sizes = dict(connection.execute(
+        "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"
+    ).fetchall())
+    indexes = connection.execute(
+        "SELECT il.name, ii.name FROM pragma_index_list(?) il JOIN pragma_index_info(il.name) ii", (table,)
+    ).fetchall()
+    by_column = {}
+    for index_name, column in indexes:
+        by_column[column] = by_column.get(column, 0) + sizes.get(index_name, 0)
+    return by_column
+
+
+def _time(fn, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def run_benchmark(rows: int, lookups: int):
+    """Index sizes (bytes) and lookup/join timings (seconds) for URL and key access"""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connection, urls = _fill(os.path.join(tmp, 'bench.db'), rows)
+        sample = random.Random(7).sample(urls, min(lookups, len(urls)))
+        hashes = [(hashlib.md5(url.encode()).hexdigest(), url) for url in sample]
+        keys = [(property_key(url),) for url in sample]
+
+        def by_url():
+            for pair in hashes:
+                connection.execute("SELECT scraped_at FROM individual_properties_scraped "
+                                   "WHERE url_hash = ? OR property_url = ?", pair).fetchone()
+
+        def by_key():
+            for key in keys:
+                connection.execute("SELECT scraped_at FROM individual_properties_scraped "
+                                   "WHERE property_key = ?", key).fetchone()
+
+        def join(column):
+            return lambda: connection.execute(f'''
+                SELECT COUNT(*) FROM individual_properties_scraped s
+                JOIN property_urls_seen p ON p.{column} = s.{column} WHERE p.city = 'gurgaon'
+            ''').fetchone()
+
+        sizes = _index_bytes(connection, 'individual_properties_scraped')
+        result = {
+            'rows': rows,
+            'index_bytes_url_hash_and_url': sizes.get('url_hash', 0) + sizes.get('property_url', 0),
+            'index_bytes_key': sizes.get('property_key', 0),
+            'lookup_seconds_url': round(_time(by_url), 3),
+            'lookup_seconds_key': round(_time(by_key), 3),
+            'join_seconds_url': round(_time(join('property_url'), 3), 3),
+            'join_seconds_key': round(_time(join('property_key'), 3), 3)
+        }
+        connection.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark property_key lookups against URL/hash lookups")
+    parser.add_argument('--rows', type=int, default=200000, help="Property URLs seen (half of them scraped)")
+    parser.add_argument('--lookups', type=int, default=20000)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.rows, args.lookups)
+    print("=" * 60)
+    print("PROPERTY KEY LOOKUP BENCHMARK")
+    print("=" * 60)
+    print(f"Rows: {result['rows']:,}")
+    print(f"Index size   url_hash+url={result['index_bytes_url_hash_and_url']:>12,} B  "
+          f"key={result['index_bytes_key']:>12,} B")
+    print(f"{args.lookups:,} lookups url_hash OR url={result['lookup_seconds_url']:>7.3f}s  "
+          f"key={result['lookup_seconds_key']:>7.3f}s")
+    print(f"City join    property_url={result['join_seconds_url']:>7.3f}s  "
+          f"property_key={result['join_seconds_key']:>7.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Regex Registry Benchmark
+Times the hot pattern tables over 10k listing card texts in three forms:
+  inline    - pattern strings passed to re.search / re.findall on every call
+  registry  - precompiled PatternTable from scraper.regex_registry (what the code uses)
+  fused     - one alternation with a named group per pattern (leftmost match classifies)
+and checks that inline and registry agree on every card.
+
+Usage:
+    python tools/bench_regex_registry.py
+    python tools/bench_regex_registry.py --cards 10000 --listing path/to/srp.html
+"""
+
+import sys
+import os
+import re
+import time
+import argparse
+from itertools import cycle, islice
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from scraper import regex_registry as patterns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_LISTING = os.path.join(ROOT, 'archive', 'development_and_testing_files', 'debug_bot_detection.html')
+
+TABLES = {
+    'date': patterns.DATE_PATTERN_TABLE,
+    'status': patterns.STATUS_TEXT_PATTERNS,
+    'price': patterns.PRICE_TEXT_PATTERNS,
+    'area': patterns.AREA_TEXT_PATTERNS,
+    'title': patterns.TITLE_TEXT_PATTERNS,
+    'price_range': patterns.PRICE_RANGE_PATTERNS,
+}
+
+
+def inline_first(table, text):
+    """Previous form: string patterns through re's module-level cache"""
+    for index, compiled in enumerate(table):
+        matches = re.findall(compiled.pattern, text, compiled.flags) if table is patterns.DATE_PATTERN_TABLE \
+            else re.search(compiled.pattern, text, compiled.flags)
+        if matches:
+            return index
+    return None
+
+
+def registry_first(table, text):
+    found = table.first(text)
+    return found[0] if found else None
+
+
+def fuse(table):
+    flags = table.patterns[0].flags if len(table) else 0
+    return re.compile('|'.join(f'(?P<p{i}>{p.pattern})' for i, p in enumerate(table)), flags)
+
+
+def fused_first(fused, text):
+    match = fused.search(text)
+    return int(match.lastgroup[1:]) if match else None
+
+
+def time_it(fn, texts):
+    start = time.perf_counter()
+    results = [fn(text) for text in texts]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark precompiled regex tables over card texts")
+    parser.add_argument('--listing', default=DEFAULT_LISTING)
+    parser.add_argument('--cards', type=int, default=10000)
+    args = parser.parse_args()
+
+    with open(args.listing, encoding='utf-8') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser')
+    card_texts = [card.get_text() for card in soup.select('.mb-srp__card')]
+    texts = list(islice(cycle(card_texts), args.cards))
+
+    print("=" * 72)
+    print(f"REGEX TABLES over {len(texts)} card texts (ms total)")
+    print("=" * 72)
+    print(f"{'table':<12} {'inline':>10} {'registry':>10} {'fused':>10}  same-as-inline  fused-agrees")
+    for name, table in TABLES.items():
+        # Date parsing runs on lowercased text
+        run_texts = [t.lower() for t in texts] if name == 'date' else texts
+        inline_s, inline_r = time_it(lambda t: inline_first(table, t), run_texts)
+        registry_s, registry_r = time_it(lambda t: registry_first(table, t), run_texts)
+        fused = fuse(table)
+        fused_s, fused_r = time_it(lambda t: fused_first(fused, t), run_texts)
+        print(f"{name:<12} {inline_s * 1000:>10.1f} {registry_s * 1000:>10.1f} {fused_s * 1000:>10.1f}  "
+              f"{str(inline_r == registry_r):<15} {fused_r == inline_r}")
+
+    numeric = [t[:40] for t in texts]
+    inline_s, inline_r = time_it(lambda t: re.findall(r'(\d+\.?\d*)', re.sub(r'[₹,\s]', '', t)), numeric)
+    registry_s, registry_r = time_it(
+        lambda t: patterns.DECIMAL_NUMBER.search(patterns.PRICE_NOISE.sub('', t)), numeric)
+    same = [r[0] if r else None for r in inline_r] == [m.group(1) if m else None for m in registry_r]
+    print(f"{'numeric':<12} {inline_s * 1000:>10.1f} {registry_s * 1000:>10.1f} {'-':>10}  {same}")
+
+
+if __name__ == '__main__':
+    main()
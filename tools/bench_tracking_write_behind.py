@@ -0,0 +1,103 @@
+"""
+Tracking Write-Behind Benchmark
+PDP-worker threads mark synthetic property URLs as scraped (every tenth one as
+failed) through IndividualPropertyTracker directly and through
+BufferedPropertyTracker, on fresh databases. Reports the time workers spend
+inside the tracking calls and the time until every mark is committed.
+
+Usage:
+    python tools/bench_tracking_write_behind.py --workers 4 --urls 5000
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+import threading
+import contextlib
+import io
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from individual_property_tracking_system import IndividualPropertyTracker
+from buffered_property_tracker import BufferedPropertyTracker
+
+
+def _mark_all(tracker, worker_urls):
+    """Per-call latencies of all workers, wall time until the last call returned"""
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(urls):
+        own = []
+        for i, url in enumerate(urls):
+            start = time.perf_counter()
+            if i % 10 == 9:
+                tracker.mark_property_failed(url, 1)
+            else:
+                tracker.mark_property_scraped(url, 1)
+            own.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(own)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(urls,)) for urls in worker_urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies), time.perf_counter() - start
+
+
+def run_benchmark(workers: int, url_count: int, batch_size: int, flush_ms: float):
+    """Caller-side call latency and time to durability for direct and write-behind tracking"""
+
+    urls = [f"https://www.magicbricks.com/flat-sector-{i % 90}-gurgaon-pdpid-4d4235{i:09d}" for i in range(url_count)]
+    worker_urls = [urls[w::workers] for w in range(workers)]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ('direct', 'write_behind'):
+            with contextlib.redirect_stdout(io.StringIO()):
+                tracker = IndividualPropertyTracker(os.path.join(tmp, f"{name}.db"))
+            if name == 'write_behind':
+                tracker = BufferedPropertyTracker(tracker, batch_size=batch_size, flush_interval_ms=flush_ms)
+
+            latencies, calls_seconds = _mark_all(tracker, worker_urls)
+            start = time.perf_counter()
+            if name == 'write_behind':
+                tracker.close()
+            durable_seconds = calls_seconds + time.perf_counter() - start
+
+            results.append({
+                'path': name,
+                'call_p50_ms': round(latencies[len(latencies) // 2] * 1000, 3),
+                'call_p99_ms': round(latencies[int(len(latencies) * 0.99)] * 1000, 3),
+                'calls_seconds': round(calls_seconds, 2),
+                'durable_seconds': round(durable_seconds, 2),
+                'marks_per_second': round(url_count / durable_seconds),
+                'transactions': tracker.get_statistics()['transactions'] if name == 'write_behind' else url_count
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark write-behind PDP tracking against direct writes")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--urls', type=int, default=5000)
+    parser.add_argument('--batch-size', type=int, default=50)
+    parser.add_argument('--flush-ms', type=float, default=500)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("TRACKING WRITE-BEHIND BENCHMARK")
+    print("=" * 60)
+    for row in run_benchmark(args.workers, args.urls, args.batch_size, args.flush_ms):
+        print(f"{row['path']:<13} call p50/p99={row['call_p50_ms']:>7.3f}/{row['call_p99_ms']:>7.3f} ms  "
+              f"calls={row['calls_seconds']:>6.2f}s  durable={row['durable_seconds']:>6.2f}s  "
+              f"{row['marks_per_second']:>7,} marks/s  transactions={row['transactions']:,}")
+
+
+if __name__ == '__main__':
+    main()
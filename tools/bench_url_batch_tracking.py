@@ -0,0 +1,85 @@
+"""
+URL Batch Tracking Benchmark
+Tracks synthetic listing pages of property URLs with the set-based UPSERT path
+of batch_track_urls and with the per-URL path it replaced, on fresh databases.
+The second pass re-tracks half of the URLs so both inserts and updates are timed.
+
+Usage:
+    python tools/bench_url_batch_tracking.py --urls 100000 --page-size 30
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+import contextlib
+import io
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from incremental_database_schema import IncrementalDatabaseSchema
+from url_tracking_operations import URLTrackingOperations
+
+
+def _pages(start: int, count: int, page_size: int):
+    urls = [{'url': f"https://www.magicbricks.com/propertyDetails/2-BHK-flat-sector-{i % 90}-gurgaon&id=4d4235{i:09d}",
+             'title': f"2 BHK Flat {i}", 'city': 'gurgaon'} for i in range(start, start + count)]
+    return [urls[i:i + page_size] for i in range(0, len(urls), page_size)]
+
+
+def _run(track, pages) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # per-page progress prints
+        for page in pages:
+            track(page)
+    return time.perf_counter() - start
+
+
+def run_benchmark(url_count: int, page_size: int):
+    """URLs/second of each tracking path for a fresh pass and a half-overlapping pass"""
+
+    first = _pages(0, url_count, page_size)
+    second = _pages(url_count // 2, url_count, page_size)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ('batch_upsert', 'per_url'):
+            db_path = os.path.join(tmp, f"{name}.db")
+            with contextlib.redirect_stdout(io.StringIO()):
+                schema = IncrementalDatabaseSchema(db_path)
+                schema.create_incremental_tables()
+                schema.close()
+            operations = URLTrackingOperations(db_path)
+            track = operations.batch_track_urls if name == 'batch_upsert' else operations._track_urls_individually
+
+            fresh = _run(track, first)
+            overlap = _run(track, second)
+            stats = operations.get_stats()
+            results.append({
+                'path': name,
+                'fresh_seconds': round(fresh, 2),
+                'overlap_seconds': round(overlap, 2),
+                'urls_per_second': round(2 * url_count / (fresh + overlap)),
+                'new': stats['new_urls_found'],
+                'duplicates': stats['duplicate_urls_found']
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch_track_urls against per-URL tracking")
+    parser.add_argument('--urls', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=30, help="URLs per listing page (one batch call each)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("URL BATCH TRACKING BENCHMARK")
+    print("=" * 60)
+    for row in run_benchmark(args.urls, args.page_size):
+        print(f"{row['path']:<13} fresh={row['fresh_seconds']:>7.2f}s  overlap={row['overlap_seconds']:>7.2f}s  "
+              f"{row['urls_per_second']:>8,} URLs/s  new={row['new']:,} duplicates={row['duplicates']:,}")
+
+
+if __name__ == '__main__':
+    main()
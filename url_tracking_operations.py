@@ -6,16 +6,32 @@ Handles tracking, batch processing, and database operations.
 """
 
 import sqlite3
+import hashlib
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from url_normalization import URLNormalizer
+from sqlite_connection_manager import get_connection
+from property_keys import property_key, migrate_property_keys
+
+
+def _parse_seen_date(value: Any) -> Optional[datetime]:
+    """first_seen_date as stored (legacy rows may hold NULL or non-ISO text: None)"""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
 
 
 class URLTrackingOperations:
     """
     Core URL tracking operations
     """
-    
+
+    # URLs per IN (...) pre-query of batch_track_urls (below SQLite's bound-variable limit)
+    BATCH_QUERY_CHUNK = 500
+
     def __init__(self, db_path: str, normalizer: URLNormalizer = None):
         """
         Initialize URL tracking operations
@@ -26,6 +42,7 @@ class URLTrackingOperations:
         """
         self.db_path = db_path
         self.normalizer = normalizer or URLNormalizer()
+        self._property_keys_ready = False
         
         # Tracking statistics
         self.stats = {
@@ -43,10 +60,19 @@ class URLTrackingOperations:
             Database connection or None if failed
         """
         try:
-            return sqlite3.connect(self.db_path)
+            connection = get_connection(self.db_path)
         except Exception as e:
             print(f"[ERROR] Database connection failed: {str(e)}")
             return None
+
+        if not self._property_keys_ready:
+            # Databases created before property_key get it on first use
+            try:
+                migrate_property_keys(connection, ['property_urls_seen', 'property_posting_dates'])
+                self._property_keys_ready = True
+            except sqlite3.Error as e:
+                print(f"[WARNING] Could not add property keys to {self.db_path}: {e}")
+        return connection
     
     def track_property_url(
         self, 
@@ -86,15 +112,16 @@ class URLTrackingOperations:
             # Normalize and process URL
             normalized_url = self.normalizer.normalize_url(url)
             url_hash = self.normalizer.generate_url_hash(url)
+            key = property_key(normalized_url)
             property_id = self.normalizer.extract_property_id_from_url(url)
             current_time = datetime.now()
             
-            # Check if URL already exists
+            # Check if the property was already seen (under any URL variant)
             cursor.execute('''
                 SELECT url_id, first_seen_date, seen_count, is_active 
                 FROM property_urls_seen 
-                WHERE property_url = ?
-            ''', (normalized_url,))
+                WHERE property_key = ?
+            ''', (key,))
             
             existing_record = cursor.fetchone()
             
@@ -114,7 +141,7 @@ class URLTrackingOperations:
             if existing_record:
                 # URL already exists - update it
                 url_id, first_seen_date, seen_count, is_active = existing_record
-                new_seen_count = seen_count + 1
+                new_seen_count = (seen_count or 0) + 1
                 
                 cursor.execute('''
                     UPDATE property_urls_seen 
@@ -123,13 +150,13 @@ class URLTrackingOperations:
                         title = ?, 
                         city = ?, 
                         is_active = 1
-                    WHERE property_url = ?
-                ''', (current_time, new_seen_count, title, city, normalized_url))
+                    WHERE url_id = ?
+                ''', (current_time, new_seen_count, title, city, url_id))
                 
                 tracking_result.update({
                     'is_duplicate': True,
                     'seen_count': new_seen_count,
-                    'first_seen_date': datetime.fromisoformat(first_seen_date),
+                    'first_seen_date': _parse_seen_date(first_seen_date),
                     'action_taken': 'updated_existing'
                 })
                 
@@ -140,11 +167,11 @@ class URLTrackingOperations:
                 # New URL - insert it
                 cursor.execute('''
                     INSERT INTO property_urls_seen 
-                    (property_url, first_seen_date, last_seen_date, seen_count, 
+                    (property_url, property_key, first_seen_date, last_seen_date, seen_count, 
                      property_id, title, city, is_active, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
-                    normalized_url, current_time, current_time, 1, 
+                    normalized_url, key, current_time, current_time, 1, 
                     property_id, title, city, 1, current_time
                 ))
                 
@@ -201,7 +228,170 @@ class URLTrackingOperations:
         }
         
         start_time = datetime.now()
+
+        try:
+            url_results = self._upsert_url_batch(url_data)
+        except sqlite3.Error as e:
+            # e.g. a property_urls_seen table whose UNIQUE property_key index could not be created
+            print(f"[WARNING] Set-based URL tracking failed ({e}), tracking URLs one by one")
+            url_results = self._track_urls_individually(url_data, session_id)
+
+        for result in url_results:
+            if result['success']:
+                if result['is_new_url']:
+                    batch_results['new_urls'] += 1
+                elif result['is_duplicate']:
+                    batch_results['duplicate_urls'] += 1
+            else:
+                batch_results['errors'] += 1
+        batch_results['url_results'] = url_results
+
+        batch_results['processing_time'] = (
+            datetime.now() - start_time
+        ).total_seconds()
+        
+        print(
+            f"   [STATS] Batch tracking complete: "
+            f"{batch_results['new_urls']} new, "
+            f"{batch_results['duplicate_urls']} duplicates"
+        )
         
+        return batch_results
+    
+    def _upsert_url_batch(self, url_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Track a batch of URLs in one transaction
+
+        URLs are normalized and keyed once, one pre-query finds the already-seen
+        properties, and a single executemany UPSERT on property_key inserts new ones /
+        bumps seen counts. Results match track_property_url (a property repeated
+        within the batch counts as a duplicate).
+
+        Raises:
+            sqlite3.Error: The batch was rolled back
+        """
+        current_time = datetime.now()
+        url_results: List[Dict[str, Any]] = []
+        rows = []
+        posting_rows = []
+
+        for url_info in url_data:
+            url = url_info.get('url', '')
+            try:
+                normalized_url = self.normalizer.normalize_url(url)
+                rows.append((url_info, normalized_url, property_key(normalized_url),
+                             self.normalizer.extract_property_id_from_url(url), None))
+            except Exception as e:
+                rows.append((url_info, None, None, None, str(e)))
+
+        connection = self.connect_db()
+        if not connection:
+            raise sqlite3.OperationalError('Database connection failed')
+
+        try:
+            cursor = connection.cursor()
+
+            # One pre-query (chunked under SQLite's bound-variable limit) for the existing properties
+            unique_keys = list(dict.fromkeys(key for _, _, key, _, error in rows if error is None))
+            seen: Dict[int, Any] = {}
+            for i in range(0, len(unique_keys), self.BATCH_QUERY_CHUNK):
+                chunk = unique_keys[i:i + self.BATCH_QUERY_CHUNK]
+                cursor.execute(f'''
+                    SELECT property_key, first_seen_date, seen_count
+                    FROM property_urls_seen
+                    WHERE property_key IN ({','.join('?' * len(chunk))})
+                ''', chunk)
+                for key, first_seen_date, seen_count in cursor.fetchall():
+                    seen[key] = (_parse_seen_date(first_seen_date), seen_count or 0)
+
+            upserts = []
+            for url_info, normalized_url, key, property_id, error in rows:
+                if error is not None:
+                    url_results.append({'success': False, 'error': error})
+                    continue
+
+                title = url_info.get('title', '')
+                city = url_info.get('city', '')
+                result = {
+                    'success': True,
+                    'url': normalized_url,
+                    'url_hash': hashlib.md5(normalized_url.encode()).hexdigest(),
+                    'property_id': property_id,
+                    'is_new_url': False,
+                    'is_duplicate': False,
+                    'seen_count': 1,
+                    'first_seen_date': current_time,
+                    'action_taken': None
+                }
+                if key in seen:
+                    first_seen_date, seen_count = seen[key]
+                    result.update({
+                        'is_duplicate': True,
+                        'seen_count': seen_count + 1,
+                        'first_seen_date': first_seen_date,
+                        'action_taken': 'updated_existing'
+                    })
+                else:
+                    result.update({'is_new_url': True, 'action_taken': 'inserted_new'})
+                seen[key] = (result['first_seen_date'], result['seen_count'])
+                url_results.append(result)
+                upserts.append((normalized_url, key, current_time, current_time, property_id, title, city, current_time))
+
+                posting_text = url_info.get('posting_date_text')
+                parsed_posting = url_info.get('parsed_posting_date')
+                if posting_text or parsed_posting:
+                    posting_rows.append((
+                        normalized_url,
+                        key,
+                        posting_text or '',
+                        parsed_posting if isinstance(parsed_posting, str) else (parsed_posting.isoformat() if parsed_posting else None),
+                        current_time,
+                        1.0,
+                        'extractor'
+                    ))
+
+            cursor.executemany('''
+                INSERT INTO property_urls_seen
+                (property_url, property_key, first_seen_date, last_seen_date, seen_count,
+                 property_id, title, city, is_active, created_at)
+                VALUES (?, ?, ?, ?, 1, ?, ?, ?, 1, ?)
+                ON CONFLICT(property_key) DO UPDATE SET
+                    last_seen_date = excluded.last_seen_date,
+                    seen_count = COALESCE(property_urls_seen.seen_count, 0) + 1,
+                    title = excluded.title,
+                    city = excluded.city,
+                    is_active = 1
+            ''', upserts)
+
+            # Persist posting dates when available
+            if posting_rows:
+                cursor.executemany('''
+                    INSERT INTO property_posting_dates
+                    (property_url, property_key, posting_date_text, parsed_posting_date, extraction_date,
+                     confidence_score, parsing_method)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', posting_rows)
+
+            connection.commit()
+
+        except sqlite3.Error:
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
+
+        new_urls = sum(1 for r in url_results if r.get('is_new_url'))
+        duplicates = sum(1 for r in url_results if r.get('is_duplicate'))
+        self.stats['urls_processed'] += new_urls + duplicates
+        self.stats['new_urls_found'] += new_urls
+        self.stats['duplicate_urls_found'] += duplicates
+        self.stats['urls_updated'] += duplicates
+        return url_results
+
+    def _track_urls_individually(self, url_data: List[Dict[str, Any]], session_id: int = None) -> List[Dict[str, Any]]:
+        """Per-URL tracking (one transaction per URL), the fallback of batch_track_urls"""
+        url_results = []
         for i, url_info in enumerate(url_data):
             url = url_info.get('url', '')
             title = url_info.get('title', '')
@@ -219,10 +409,12 @@ class URLTrackingOperations:
                         cur2 = conn2.cursor()
                         cur2.execute('''
                             INSERT INTO property_posting_dates
-                            (property_url, posting_date_text, parsed_posting_date, extraction_date, confidence_score, parsing_method)
-                            VALUES (?, ?, ?, ?, ?, ?)
+                            (property_url, property_key, posting_date_text, parsed_posting_date, extraction_date,
+                             confidence_score, parsing_method)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
                         ''', (
                             result.get('url') or url,
+                            property_key(result.get('url') or url),
                             posting_text or '',
                             parsed_posting if isinstance(parsed_posting, str) else (parsed_posting.isoformat() if parsed_posting else None),
                             datetime.now(),
@@ -234,32 +426,14 @@ class URLTrackingOperations:
                 except Exception:
                     pass
 
-            if result['success']:
-                if result['is_new_url']:
-                    batch_results['new_urls'] += 1
-                elif result['is_duplicate']:
-                    batch_results['duplicate_urls'] += 1
-            else:
-                batch_results['errors'] += 1
-
-            batch_results['url_results'].append(result)
+            url_results.append(result)
 
             # Progress reporting every 100 URLs
             if (i + 1) % 100 == 0:
                 print(f"   [SUCCESS] Processed {i + 1}/{len(url_data)} URLs")
 
-        batch_results['processing_time'] = (
-            datetime.now() - start_time
-        ).total_seconds()
-        
-        print(
-            f"   [STATS] Batch tracking complete: "
-            f"{batch_results['new_urls']} new, "
-            f"{batch_results['duplicate_urls']} duplicates"
-        )
-        
-        return batch_results
-    
+        return url_results
+
     def get_stats(self) -> Dict[str, int]:
         """
         Get current tracking statistics
@@ -19,6 +19,7 @@ from typing import Dict, List, Any, Optional
 from url_normalization import URLNormalizer
 from url_tracking_operations import URLTrackingOperations
 from url_validation import URLValidator
+from sqlite_connection_manager import get_connection
 
 
 class URLTrackingSystem:
@@ -76,7 +77,7 @@ class URLTrackingSystem:
             True if connection successful, False otherwise
         """
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connection = get_connection(self.db_path)
             return True
         except Exception as e:
             print(f"[ERROR] Database connection failed: {str(e)}")
@@ -9,6 +9,8 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from url_normalization import URLNormalizer
+from sqlite_connection_manager import get_connection
+from property_keys import property_key
 
 
 class URLValidator:
@@ -41,7 +43,7 @@ class URLValidator:
             Database connection or None if failed
         """
         try:
-            return sqlite3.connect(self.db_path)
+            return get_connection(self.db_path)
         except Exception as e:
             print(f"[ERROR] Database connection failed: {str(e)}")
             return None
@@ -96,8 +98,8 @@ class URLValidator:
                 cursor.execute('''
                     SELECT first_seen_date, last_seen_date, seen_count 
                     FROM property_urls_seen 
-                    WHERE property_url = ?
-                ''', (normalized_url,))
+                    WHERE property_key = ?
+                ''', (property_key(normalized_url),))
                 
                 result = cursor.fetchone()
                 
@@ -11,6 +11,7 @@ from typing import Dict, List, Any, Optional, Tuple
 import json
 from pathlib import Path
 from enum import Enum
+from sqlite_connection_manager import get_connection
 
 
 class ScrapingMode(Enum):
@@ -103,7 +104,7 @@ class UserModeOptions:
         """Connect to database"""
         
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connection = get_connection(self.db_path)
             return True
         except Exception as e:
             print(f"[ERROR] Database connection failed: {str(e)}")